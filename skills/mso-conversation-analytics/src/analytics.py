@@ -3,9 +3,12 @@ mso-conversation-analytics CLI
 사용:
   python src/analytics.py --query all --days 7 --output table
   python src/analytics.py --query reprompt_rate --days 3 --output json
+  python src/analytics.py --query funnel --days 90 --aligned
+  python src/analytics.py --query stage_latency --days 7     # ground 단계별 p50/p95/p99
   python src/analytics.py --feedback --days 7
 환경변수:
-  MSO_TURNS_PATH  turns.jsonl 경로
+  MSO_TURNS_PATH       turns.jsonl 경로
+  MSO_TURN_SPANS_PATH  stage span sidecar 경로 (기본: turns.jsonl 옆 turns_spans.jsonl)
 """
 from __future__ import annotations
 
@@ -17,6 +20,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from transitions import load_turns, transition_matrix, factored, funnel, reprompt_rate, unresolved
+from latency     import stage_latency
+from batch       import run_all
 from feedback    import generate_feedback
 
 QUERIES = {
@@ -27,6 +32,11 @@ QUERIES = {
     "unresolved":        unresolved,
 }
 
+# turns 테이블이 아니라 stage span sidecar(TEMP VIEW turn_spans) 를 읽는 분석
+SPAN_QUERIES = {
+    "stage_latency":     stage_latency,
+}
+
 
 def _print_table(name: str, rows: list[dict]) -> None:
     print(f"\n{'─'*60}")
@@ -47,12 +57,14 @@ def _print_table(name: str, rows: list[dict]) -> None:
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="MSO Conversation Analytics")
-    parser.add_argument("--query",    choices=[*QUERIES, "all"],
+    parser.add_argument("--query",    choices=[*QUERIES, *SPAN_QUERIES, "all"],
                         help="실행할 분석 함수")
     parser.add_argument("--feedback", action="store_true",
                         help="환류 보고서 생성 (JSON 출력)")
     parser.add_argument("--days",     type=int, default=7,
                         help="분석 기간 (일, 기본값: 7)")
+    parser.add_argument("--aligned",  action="store_true",
+                        help="오늘(UTC) 포함 최근 N일의 일 경계 window — 일 단위 rollup 합산")
     parser.add_argument("--output",   choices=["json", "table"], default="table",
                         help="출력 형식")
     args = parser.parse_args()
@@ -69,17 +81,21 @@ def main() -> None:
                          default=str))
         return
 
-    targets = (list(QUERIES.items()) if args.query == "all"
-               else [(args.query, QUERIES[args.query])])
+    # all: 기간 window 를 한 번만 스캔하는 배치 엔진 (aligned 는 rollup 합산이라 함수별로)
+    if args.query == "all" and not args.aligned:
+        result = run_all(con, days=args.days)
+    else:
+        queries = {**QUERIES, **SPAN_QUERIES}
+        names = QUERIES if args.query == "all" else [args.query]
+        result = {name: queries[name](con, days=args.days, aligned=args.aligned) for name in names}
+    if args.query == "all":
+        result.update({name: fn(con, days=args.days, aligned=args.aligned) for name, fn in SPAN_QUERIES.items()})
 
     if args.output == "json":
-        result = {}
-        for name, fn in targets:
-            result[name] = fn(con, days=args.days)
         print(json.dumps(result, ensure_ascii=False, indent=2, default=str))
     else:
-        for name, fn in targets:
-            _print_table(name, fn(con, days=args.days))
+        for name, rows in result.items():
+            _print_table(name, rows)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,139 @@
+"""
+배치 분석 엔진 — 5개 분석을 한 번의 window 스캔으로.
+`analytics.py --query all` / `--feedback` 는 같은 기간에 5개 함수를 각각 호출해
+`turns` 전체 스캔과 prev_turn_id self-join 을 반복했다. 여기서는 기간 window 를
+TEMP TABLE 로 한 번 materialize 하고 prev 조인도 한 번만 계산한 뒤 5개 결과를 뽑는다.
+결과는 transitions.py 의 개별 함수와 같다.
+"""
+from __future__ import annotations
+
+import duckdb
+
+QUERY_NAMES = ("transition_matrix", "factored", "funnel", "reprompt_rate", "unresolved")
+
+
+def materialize_window(con: duckdb.DuckDBPyConnection, days: int = 7) -> None:
+    """
+    turns_window : timestamp >= NOW() - days 인 turn (분석에 쓰는 컬럼만)
+    turn_pairs   : turns_window × prev turn 의 성공·intent 확정 쌍
+                   (prev 는 기간 밖일 수 있음 → prev_in_window, factored 만 기간 안 prev 사용)
+    """
+    cutoff = con.execute(f"SELECT NOW() - INTERVAL '{days} days'").fetchone()[0]
+    con.execute(
+        """
+        CREATE OR REPLACE TEMP TABLE turns_window AS
+        SELECT
+            prev_turn_id, session_id, timestamp, utterance, resolved_intent_id,
+            resolved_target_concepts, success, reprompt_count, duration_ms
+        FROM turns
+        WHERE timestamp >= ?
+        """,
+        [cutoff],
+    )
+    con.execute("""
+        CREATE OR REPLACE TEMP TABLE turn_pairs AS
+        SELECT
+            cur.resolved_intent_id          AS to_intent,
+            cur.resolved_target_concepts    AS to_concepts,
+            prev.resolved_intent_id         AS from_intent,
+            prev.resolved_target_concepts   AS from_concepts,
+            prev.timestamp >= ?             AS prev_in_window
+        FROM turns_window cur
+        JOIN turns prev ON cur.prev_turn_id = prev.turn_id
+        WHERE cur.success  = TRUE
+          AND prev.success = TRUE
+          AND cur.resolved_intent_id  IS NOT NULL
+          AND prev.resolved_intent_id IS NOT NULL
+    """, [cutoff])
+
+
+# name → (SQL, 결과 key). turns_window / turn_pairs 위에서 실행한다.
+_QUERIES = {
+    "transition_matrix": ("""
+        WITH pairs AS (
+            SELECT from_intent, to_intent, COUNT(*) AS cnt
+            FROM turn_pairs
+            GROUP BY 1, 2
+        ),
+        totals AS (
+            SELECT from_intent, SUM(cnt) AS total FROM pairs GROUP BY 1
+        )
+        SELECT
+            p.from_intent,
+            p.to_intent,
+            p.cnt,
+            ROUND(p.cnt * 100.0 / t.total, 1) AS pct
+        FROM pairs p
+        JOIN totals t USING (from_intent)
+        ORDER BY p.from_intent, p.cnt DESC
+    """, ["from_intent", "to_intent", "cnt", "pct"]),
+    "factored": ("""
+        WITH to_unnested AS (
+            SELECT
+                from_intent,
+                from_concepts,
+                to_intent,
+                COALESCE(UNNEST(to_concepts), '_no_concept') AS to_target_concept
+            FROM turn_pairs
+            WHERE prev_in_window
+        ),
+        unnested AS (
+            SELECT
+                from_intent,
+                COALESCE(UNNEST(from_concepts), '_no_concept') AS from_target_concept,
+                to_intent,
+                to_target_concept
+            FROM to_unnested
+        )
+        SELECT from_intent, from_target_concept, to_intent, to_target_concept, COUNT(*) AS cnt
+        FROM unnested
+        GROUP BY 1, 2, 3, 4
+        ORDER BY from_intent, cnt DESC
+    """, ["from_intent", "from_target_concept", "to_intent", "to_target_concept", "cnt"]),
+    "funnel": ("""
+        SELECT
+            resolved_intent_id                        AS intent_id,
+            COUNT(*)                                  AS total,
+            SUM(success::INTEGER)                     AS success_cnt,
+            ROUND(AVG(success::INTEGER) * 100, 1)     AS success_rate,
+            ROUND(AVG(reprompt_count), 2)             AS avg_reprompt,
+            ROUND(AVG(duration_ms))                   AS avg_duration_ms
+        FROM turns_window
+        WHERE resolved_intent_id IS NOT NULL
+        GROUP BY 1
+        ORDER BY total DESC
+    """, ["intent_id", "total", "success_cnt", "success_rate", "avg_reprompt", "avg_duration_ms"]),
+    "reprompt_rate": ("""
+        SELECT
+            resolved_intent_id                AS intent_id,
+            ROUND(AVG(reprompt_count), 2)     AS avg_reprompt,
+            MAX(reprompt_count)               AS max_reprompt,
+            ROUND(
+                SUM(CASE WHEN reprompt_count >= 1 THEN 1 ELSE 0 END)
+                * 100.0 / COUNT(*),
+            1)                                AS pct_over_1
+        FROM turns_window
+        WHERE resolved_intent_id IS NOT NULL
+        GROUP BY 1
+        HAVING AVG(reprompt_count) > 0
+        ORDER BY avg_reprompt DESC
+    """, ["intent_id", "avg_reprompt", "max_reprompt", "pct_over_1"]),
+    "unresolved": ("""
+        SELECT utterance, timestamp, session_id
+        FROM turns_window
+        WHERE resolved_intent_id IS NULL
+        ORDER BY timestamp DESC
+    """, ["utterance", "timestamp", "session_id"]),
+}
+
+
+def run_all(
+    con: duckdb.DuckDBPyConnection, days: int = 7, names: tuple[str, ...] = QUERY_NAMES
+) -> dict[str, list[dict]]:
+    """기간 window 를 한 번 materialize 하고 names 분석 결과를 {name: rows} 로 반환."""
+    materialize_window(con, days)
+    return {name: _rows(con, *_QUERIES[name]) for name in names}
+
+
+def _rows(con: duckdb.DuckDBPyConnection, sql: str, keys: list[str]) -> list[dict]:
+    return [dict(zip(keys, r)) for r in con.execute(sql).fetchall()]
@@ -12,14 +12,17 @@ def check_escalation_candidates(
     days: int = 7,
     min_turns: int = 200,
     min_accuracy: float = 0.85,
+    rows: list[dict] | None = None,
 ) -> list[dict]:
     """
     Lv30→Lv20 전환 후보 반환.
     조건: turn_count >= min_turns AND success_rate >= min_accuracy*100
+    rows: 이미 계산한 funnel 결과 (batch.run_all) — 없으면 funnel 을 직접 조회
 
     Returns: [{"intent_id","turn_count","lv30_accuracy_7d","signal"}, ...]
     """
-    rows = funnel(con, days=days)
+    if rows is None:
+        rows = funnel(con, days=days)
     candidates = []
     for row in rows:
         if (row["total"] >= min_turns
@@ -3,16 +3,19 @@ Closed-loop 환류 보고서 생성.
 분석 결과 → intent_matrix priority 재조정 / SlotSpec 튜닝 / 신규 intent 후보 제안.
 """
 from __future__ import annotations
-import re
 
-from transitions import transition_matrix, factored, reprompt_rate, unresolved
+from batch       import run_all
 from escalation  import check_escalation_candidates
+from mining      import mine_candidates
 
 # 환류 판정 임계값
 _REPROMPT_THRESHOLD   = 1.5   # avg_reprompt > 이 값 → SlotSpec 튜닝 제안
 _SUCCESSOR_MIN_PCT    = 40.0  # top_successor pct > 이 값 → matrix priority 올리기
 _UNRESOLVED_MIN_COUNT = 3     # 동일 패턴 ≥ 이 건수 → 신규 intent 후보
 
+# unresolved 행은 Python 으로 가져오지 않고 turns_window 위에서 mining 한다
+_FEEDBACK_QUERIES = ("transition_matrix", "funnel", "reprompt_rate")
+
 
 def generate_feedback(con, days: int = 7) -> dict:
     """
@@ -22,20 +25,23 @@ def generate_feedback(con, days: int = 7) -> dict:
         "new_intent_candidates":       [...],
         "tier_escalation_candidates":  [...],
     }
+    4개 환류는 batch.run_all 의 단일 window 스캔 결과를 공유한다.
     """
+    results = run_all(con, days=days, names=_FEEDBACK_QUERIES)
     return {
-        "matrix_priority_suggestions": _matrix_suggestions(con, days),
-        "slotspec_tuning":             _slotspec_tuning(con, days),
-        "new_intent_candidates":       _new_intent_candidates(con, days),
-        "tier_escalation_candidates":  check_escalation_candidates(con, days=days),
+        "matrix_priority_suggestions": _matrix_suggestions(results["transition_matrix"]),
+        "slotspec_tuning":             _slotspec_tuning(results["reprompt_rate"]),
+        "new_intent_candidates":       _new_intent_candidates(con),
+        "tier_escalation_candidates":  check_escalation_candidates(
+            con, days=days, rows=results["funnel"]
+        ),
     }
 
 
 # ─── 개별 환류 생성 ──────────────────────────────────────────
 
-def _matrix_suggestions(con, days: int) -> list[dict]:
+def _matrix_suggestions(tm: list[dict]) -> list[dict]:
     """top_successor pct 높은 셀 → intent_matrix planned priority 올리기 제안."""
-    tm = transition_matrix(con, days=days)
     seen: set[str] = set()
     suggestions = []
     for row in tm:
@@ -57,9 +63,8 @@ def _matrix_suggestions(con, days: int) -> list[dict]:
     return suggestions
 
 
-def _slotspec_tuning(con, days: int) -> list[dict]:
+def _slotspec_tuning(rr: list[dict]) -> list[dict]:
     """avg_reprompt 높은 intent → SlotSpec 개선 제안."""
-    rr = reprompt_rate(con, days=days)
     tuning = []
     for row in rr:
         avg = row.get("avg_reprompt") or 0
@@ -76,34 +81,18 @@ def _slotspec_tuning(con, days: int) -> list[dict]:
     return tuning
 
 
-def _new_intent_candidates(con, days: int) -> list[dict]:
-    """unresolved 발화에서 반복 키워드 클러스터 추출 → 신규 intent 후보."""
-    rows = unresolved(con, days=days)
-    if not rows:
-        return []
-
-    # 단순 키워드 빈도 집계 (v0.3.1 — embedding 클러스터링은 v0.4.x)
-    word_count: dict[str, int] = {}
-    word_utterances: dict[str, list[str]] = {}
-    for row in rows:
-        utt = (row.get("utterance") or "").lower()
-        words = re.findall(r"[a-z가-힣]+", utt)
-        for w in set(words):
-            if len(w) < 2:
-                continue
-            word_count[w] = word_count.get(w, 0) + 1
-            word_utterances.setdefault(w, []).append(row["utterance"])
-
-    candidates = []
-    for word, count in sorted(word_count.items(), key=lambda x: -x[1]):
-        if count >= _UNRESOLVED_MIN_COUNT:
-            candidates.append({
-                "pattern":           word,
-                "count":             count,
-                "sample_utterances": word_utterances[word][:3],
-                "suggestion": (
-                    f"'{word}' 키워드가 {count}회 미분류 — "
-                    f"새 intent trigger_keyword 또는 신규 intent 추가 검토"
-                ),
-            })
+def _new_intent_candidates(con) -> list[dict]:
+    """turns_window 의 unresolved 발화에서 keyword·phrase·근사 중복 cluster 추출 → 신규 intent 후보."""
+    candidates = mine_candidates(con, min_count=_UNRESOLVED_MIN_COUNT)
+    for candidate in candidates:
+        if candidate["kind"] == "cluster":
+            candidate["suggestion"] = (
+                f"'{candidate['pattern']}' 유사 발화가 {candidate['count']}회 미분류 — "
+                f"신규 intent 추가 또는 기존 intent 예문 보강 검토"
+            )
+        else:
+            candidate["suggestion"] = (
+                f"'{candidate['pattern']}' 키워드가 {candidate['count']}회 미분류 — "
+                f"새 intent trigger_keyword 또는 신규 intent 추가 검토"
+            )
     return candidates
@@ -0,0 +1,113 @@
+"""
+ground 단계별 latency — mso-intent-analytics turn_writer 의 stage span sidecar 분석.
+
+dispatch 는 turn 마다 {turn_id, intent_id, timestamp, spans_ms: {stage: ms}} 를
+`<turns stem>_spans.jsonl` (기본 turns_spans.jsonl, 봉인 구간 `turns_spans.<stamp>.jsonl` 포함)
+에 남긴다. load_turns 가 이 파일들을 TEMP VIEW `turn_spans` 로 붙이고, stage_latency 가
+intent × 단계 p50/p95/p99 를 계산한다. SlotSpec·SHACL shapes 변경 뒤 어느 intent 의 어느
+단계가 느려졌는지 보는 용도다. span 은 영속 turns 테이블에 ingest 하지 않는다 (매번 파일 스캔).
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import duckdb
+
+import rollup
+
+# mso-intent-analytics pipeline.STAGES 순서
+SPAN_STAGES = ("lookup", "normalize", "fill_slots", "resolve", "validate", "append")
+
+_SPAN_COLUMNS = """{
+    type:       'VARCHAR',
+    turn_id:    'VARCHAR',
+    intent_id:  'VARCHAR',
+    timestamp:  'TIMESTAMPTZ',
+    spans_ms:   'MAP(VARCHAR, DOUBLE)'
+}"""
+
+
+def spans_path(turns_path: Path) -> Path | None:
+    """turn_writer 계약: MSO_TURN_SPANS_PATH (off 면 None) > turns.jsonl 옆 `<stem>_spans.jsonl`."""
+    env = os.environ.get("MSO_TURN_SPANS_PATH")
+    if env:
+        return None if env.lower() == "off" else Path(env)
+    return turns_path.with_name(f"{turns_path.stem}_spans{turns_path.suffix}")
+
+
+def attach_spans(con: duckdb.DuckDBPyConnection, turns_path: Path) -> int:
+    """TEMP VIEW `turn_spans` (봉인 구간 + 활성 sidecar) 를 만들고 파일 수를 돌려준다."""
+    path = spans_path(turns_path)
+    files = []
+    if path is not None:
+        files = sorted(path.parent.glob(f"{path.stem}.*{path.suffix}"))
+        if path.exists() and path.stat().st_size:
+            files.append(path)
+    if not files:
+        con.execute("""
+            CREATE OR REPLACE TEMP VIEW turn_spans AS
+            SELECT
+                NULL::VARCHAR               AS type,
+                NULL::VARCHAR               AS turn_id,
+                NULL::VARCHAR               AS intent_id,
+                NULL::TIMESTAMPTZ           AS timestamp,
+                NULL::MAP(VARCHAR, DOUBLE)  AS spans_ms
+            WHERE 1=0
+        """)
+        return 0
+    listed = ", ".join("'" + str(f).replace("'", "''") + "'" for f in files)
+    con.execute(f"""
+        CREATE OR REPLACE TEMP VIEW turn_spans AS
+        SELECT * FROM read_json(
+            [{listed}],
+            columns={_SPAN_COLUMNS},
+            format='newline_delimited',
+            ignore_errors=true
+        )
+        WHERE type = 'spans'
+    """)
+    return len(files)
+
+
+def stage_latency(
+    con: duckdb.DuckDBPyConnection, days: int = 7, aligned: bool = False
+) -> list[dict]:
+    """
+    intent × ground 단계 latency percentile (ms). intent_id="*" 행은 전체 intent 합산.
+    Returns: [{"intent_id","stage","n","p50_ms","p95_ms","p99_ms"}, ...]
+             (intent_id, SPAN_STAGES 순서; 모르는 단계는 뒤에)
+    """
+    if aligned:
+        cutoff = f"TIMESTAMPTZ '{rollup.window_start(days).isoformat()} 00:00:00+00'"
+    else:
+        cutoff = f"NOW() - INTERVAL '{days} days'"
+    order = ", ".join(f"'{stage}'" for stage in SPAN_STAGES)
+    rows = con.execute(f"""
+        WITH spans AS (
+            SELECT intent_id, entry.key AS stage, entry.value AS ms
+            FROM (
+                SELECT intent_id, UNNEST(map_entries(spans_ms)) AS entry
+                FROM turn_spans
+                WHERE timestamp >= {cutoff}
+            )
+        ),
+        stats AS (
+            SELECT
+                CASE WHEN grouping(intent_id) = 1 THEN '*' ELSE intent_id END  AS intent_id,
+                stage,
+                COUNT(*)                                                      AS n,
+                quantile_cont(ms, [0.5, 0.95, 0.99])                          AS q
+            FROM spans
+            GROUP BY GROUPING SETS ((intent_id, stage), (stage))
+        )
+        SELECT intent_id, stage, n, ROUND(q[1], 3), ROUND(q[2], 3), ROUND(q[3], 3)
+        FROM stats
+        ORDER BY
+            intent_id <> '*',
+            intent_id NULLS LAST,
+            COALESCE(list_position([{order}], stage), {len(SPAN_STAGES) + 1}),
+            stage
+    """).fetchall()
+    keys = ["intent_id", "stage", "n", "p50_ms", "p95_ms", "p99_ms"]
+    return [dict(zip(keys, r)) for r in rows]
@@ -0,0 +1,182 @@
+"""
+미분류 발화 → 신규 intent 후보 mining.
+미분류 turn 을 Python 으로 가져오지 않고 DuckDB 안에서
+  1) 발화 단위 dedupe (같은 발화는 turn 수 n 으로 합침)
+  2) keyword(토큰) · phrase(인접 bigram) 빈도 + 패턴별 최근 발화 top-k 샘플 (max_by, 고정 크기)
+  3) 토큰·bigram shingle 의 MinHash 서명 → LSH band bucket → 근사 중복 발화 cluster
+를 계산한다. cluster 는 검증된 (발화, bucket 대표) edge 위의 연결 요소다.
+embedding 서비스 없이 오프라인으로 돌고, Python 으로는 최종 후보만 가져온다.
+"""
+from __future__ import annotations
+
+import duckdb
+
+_TOKEN_RE = "[a-z가-힣]+"
+_MIN_TOKEN_LEN = 2
+
+# 32 permutation = 8 band × 4 row → LSH S-curve 문턱 ≈ (1/8)^(1/4) ≈ 0.59
+_MINHASH_PERMUTATIONS = 32
+_MINHASH_BANDS = 8
+_NEAR_DUP_JACCARD = 0.5   # bucket 후보 쌍 중 추정 Jaccard ≥ 이 값만 같은 cluster
+
+
+def mine_candidates(
+    con: duckdb.DuckDBPyConnection,
+    source: str = "turns_window",
+    min_count: int = 3,
+    samples: int = 3,
+) -> list[dict]:
+    """
+    source 의 미분류 turn (resolved_intent_id IS NULL) 에서 신규 intent 후보를 뽑는다.
+    source 는 utterance / timestamp / resolved_intent_id 컬럼을 가진 relation
+    (기본: batch.materialize_window 가 만든 turns_window).
+    Returns: [{"kind","pattern","count","sample_utterances"}, ...]  (count 내림차순)
+      kind: keyword | phrase | cluster — cluster 는 서로 다른 발화 2개 이상이 묶인 근사 중복군,
+            pattern 은 가장 잦은 대표 발화
+    """
+    _materialize_docs(con, source)
+    candidates = _pattern_candidates(con, min_count, samples) + _cluster_candidates(con, min_count, samples)
+    candidates.sort(key=lambda c: (-c["count"], c["kind"], c["pattern"]))
+    return candidates
+
+
+def _materialize_docs(con: duckdb.DuckDBPyConnection, source: str) -> None:
+    """unresolved_docs : 발화별 (id, n, 최근 timestamp, 토큰 list, shingle list)."""
+    con.execute(f"""
+        CREATE OR REPLACE TEMP TABLE unresolved_docs AS
+        WITH grouped AS (
+            SELECT
+                utterance,
+                COUNT(*)        AS n,
+                MAX(timestamp)  AS last_ts,
+                list_filter(
+                    regexp_extract_all(lower(utterance), '{_TOKEN_RE}'),
+                    w -> length(w) >= {_MIN_TOKEN_LEN}
+                )               AS tokens
+            FROM {source}
+            WHERE resolved_intent_id IS NULL
+              AND utterance IS NOT NULL
+            GROUP BY utterance
+        ),
+        with_bigrams AS (
+            SELECT
+                *,
+                list_transform(range(1, len(tokens)), i -> tokens[i] || ' ' || tokens[i + 1]) AS bigrams
+            FROM grouped
+        )
+        SELECT
+            row_number() OVER (ORDER BY utterance)::INTEGER  AS id,
+            utterance,
+            n,
+            last_ts,
+            list_distinct(tokens)                            AS keywords,
+            list_distinct(bigrams)                           AS phrases,
+            list_distinct(list_concat(tokens, bigrams))      AS shingles
+        FROM with_bigrams
+    """)
+
+
+def _pattern_candidates(con: duckdb.DuckDBPyConnection, min_count: int, samples: int) -> list[dict]:
+    rows = con.execute(f"""
+        WITH grams AS (
+            SELECT 'keyword' AS kind, UNNEST(keywords) AS pattern, n, utterance, last_ts FROM unresolved_docs
+            UNION ALL
+            SELECT 'phrase'  AS kind, UNNEST(phrases)  AS pattern, n, utterance, last_ts FROM unresolved_docs
+        )
+        SELECT kind, pattern, SUM(n) AS cnt, max_by(utterance, (last_ts, utterance), {int(samples)})
+        FROM grams
+        GROUP BY 1, 2
+        HAVING SUM(n) >= ?
+    """, [min_count]).fetchall()
+    return [
+        {"kind": kind, "pattern": pattern, "count": int(cnt), "sample_utterances": list(sample)}
+        for kind, pattern, cnt, sample in rows
+    ]
+
+
+def _cluster_candidates(con: duckdb.DuckDBPyConnection, min_count: int, samples: int) -> list[dict]:
+    rows_per_band = _MINHASH_PERMUTATIONS // _MINHASH_BANDS
+    # seed 별 hash(seed, shingle) 의 최솟값 = permutation 하나의 MinHash (행 단위 lambda, 중간 집계 없음)
+    con.execute(f"""
+        CREATE OR REPLACE TEMP TABLE unresolved_signatures AS
+        SELECT
+            id,
+            list_transform(
+                range({_MINHASH_PERMUTATIONS}),
+                seed -> list_min(list_transform(shingles, shingle -> hash(seed, shingle)))
+            ) AS sig
+        FROM unresolved_docs
+        WHERE len(shingles) > 0
+    """)
+    # 같은 band bucket 의 발화는 bucket 최소 id 와 후보 쌍 → 서명 일치율로 검증
+    con.execute(f"""
+        CREATE OR REPLACE TEMP TABLE unresolved_edges AS
+        WITH bands AS (
+            SELECT
+                id,
+                band,
+                hash(sig[band * {rows_per_band} + 1 : (band + 1) * {rows_per_band}]) AS bucket
+            FROM unresolved_signatures
+            CROSS JOIN range({_MINHASH_BANDS}) AS bands(band)
+        ),
+        pairs AS (
+            SELECT DISTINCT id, MIN(id) OVER (PARTITION BY band, bucket) AS rep
+            FROM bands
+        )
+        SELECT p.id, p.rep
+        FROM pairs p
+        JOIN unresolved_signatures s ON s.id = p.id
+        JOIN unresolved_signatures r ON r.id = p.rep
+        WHERE p.id <> p.rep
+          AND list_sum(list_transform(
+                  range(1, {_MINHASH_PERMUTATIONS + 1}), i -> (s.sig[i] = r.sig[i])::INTEGER
+              )) >= {_NEAR_DUP_JACCARD * _MINHASH_PERMUTATIONS}
+    """)
+
+    # 연결 요소 = 최소 id label 전파 + pointer jumping, 바뀌는 label 이 없을 때까지
+    con.execute("""
+        CREATE OR REPLACE TEMP TABLE unresolved_clusters AS
+        SELECT id, MIN(rep) AS cluster
+        FROM (SELECT id, rep FROM unresolved_edges UNION ALL SELECT rep, rep FROM unresolved_edges)
+        GROUP BY id
+    """)
+    changed = 1
+    while changed:
+        con.execute("""
+            CREATE OR REPLACE TEMP TABLE unresolved_labels AS
+            WITH neighbours AS (
+                SELECT e.id, c.cluster FROM unresolved_edges e JOIN unresolved_clusters c ON c.id = e.rep
+                UNION ALL
+                SELECT e.rep, c.cluster FROM unresolved_edges e JOIN unresolved_clusters c ON c.id = e.id
+                UNION ALL
+                SELECT id, cluster FROM unresolved_clusters
+            ),
+            spread AS (
+                SELECT id, MIN(cluster) AS cluster FROM neighbours GROUP BY id
+            )
+            SELECT s.id, LEAST(s.cluster, j.cluster) AS cluster
+            FROM spread s
+            JOIN unresolved_clusters j ON j.id = s.cluster
+        """)
+        changed = con.execute("""
+            SELECT count(*)
+            FROM unresolved_labels n
+            JOIN unresolved_clusters c USING (id)
+            WHERE n.cluster <> c.cluster
+        """).fetchone()[0]
+        con.execute("CREATE OR REPLACE TEMP TABLE unresolved_clusters AS SELECT * FROM unresolved_labels")
+
+    rows = con.execute(f"""
+        SELECT
+            arg_max(d.utterance, (d.n, d.last_ts, d.utterance))              AS representative,
+            SUM(d.n)                                                        AS cnt,
+            max_by(d.utterance, (d.last_ts, d.utterance), {int(samples)})   AS sample
+        FROM unresolved_clusters c
+        JOIN unresolved_docs d USING (id)
+        GROUP BY c.cluster
+        HAVING SUM(d.n) >= ?
+    """, [min_count]).fetchall()
+    return [
+        {"kind": "cluster", "pattern": rep, "count": int(cnt), "sample_utterances": list(sample)}
+        for rep, cnt, sample in rows
+    ]
@@ -0,0 +1,275 @@
+"""
+일 단위 rollup — ingest 시점에 증분 유지하는 사전 집계.
+5개 분석 함수는 매번 `timestamp >= NOW() - N days` 로 원본 turn 을 다시 집계한다.
+여기서는 새로 ingest 된 turn 만 UTC 일자별로 집계해 rollup 테이블에 더해 두고,
+일 경계에 맞춘 window (aligned=True) 는 rollup 행을 합산해 답한다.
+90일 window 도 intent 수 × 일수 만큼의 행만 읽는다.
+
+turns_daily        : (day, intent)                       count · success · reprompt · duration 합계
+transitions_daily  : (day, from_intent, to_intent)        전이 수 (day = 도착 turn 기준)
+factored_daily     : (day, prev_day, from × target, to × target) 전이 수
+rollup_meta        : backfill watermark — rollup 이 `turns` 전체를 반영한다는 표시
+
+rollup 도입 전에 만든 DB 는 `turns` 에 이미 행이 있어도 rollup 테이블이 비어 있다.
+watermark 가 없으면 ingest 가 `turns` 전체로 rollup 을 한 번 다시 채우고(backfill_rollups)
+watermark 를 남기며, has_rollups 는 테이블 존재가 아니라 이 watermark 를 본다.
+"""
+from __future__ import annotations
+
+import datetime as dt
+
+import duckdb
+
+ROLLUP_TABLES = ("turns_daily", "transitions_daily", "factored_daily")
+_BACKFILL_KEY = "backfill_turns"
+
+_DAY = "CAST(timezone('UTC', {alias}timestamp) AS DATE)"
+
+ROLLUP_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS turns_daily (
+        day                 DATE,
+        intent_id           VARCHAR,
+        total               BIGINT,
+        success_sum         BIGINT,
+        success_n           BIGINT,
+        reprompt_sum        BIGINT,
+        reprompt_n          BIGINT,
+        reprompt_max        INTEGER,
+        reprompt_over_1     BIGINT,
+        duration_sum        BIGINT,
+        duration_n          BIGINT,
+        PRIMARY KEY (day, intent_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS transitions_daily (
+        day                 DATE,
+        from_intent         VARCHAR,
+        to_intent           VARCHAR,
+        cnt                 BIGINT,
+        PRIMARY KEY (day, from_intent, to_intent)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS factored_daily (
+        day                 DATE,
+        prev_day            DATE,
+        from_intent         VARCHAR,
+        from_target_concept VARCHAR,
+        to_intent           VARCHAR,
+        to_target_concept   VARCHAR,
+        cnt                 BIGINT,
+        PRIMARY KEY (day, prev_day, from_intent, from_target_concept, to_intent, to_target_concept)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS rollup_meta (
+        key                 VARCHAR PRIMARY KEY,
+        value               VARCHAR
+    )
+    """,
+]
+
+
+def window_start(days: int, today: dt.date | None = None) -> dt.date:
+    """aligned window 의 첫 UTC 일자 — 오늘을 포함한 최근 days 일."""
+    today = today or dt.datetime.now(dt.timezone.utc).date()
+    return today - dt.timedelta(days=days - 1)
+
+
+def has_rollups(con: duckdb.DuckDBPyConnection) -> bool:
+    """rollup 테이블이 있고 backfill watermark 가 기록되어 있는지 (= `turns` 전체를 반영)."""
+    tables = [*ROLLUP_TABLES, "rollup_meta"]
+    row = con.execute(
+        "SELECT count(*) FROM duckdb_tables() WHERE NOT temporary AND table_name IN ?",
+        [tables],
+    ).fetchone()
+    if row[0] != len(tables):
+        return False
+    return con.execute("SELECT 1 FROM rollup_meta WHERE key = ?", [_BACKFILL_KEY]).fetchone() is not None
+
+
+def backfill_rollups(con: duckdb.DuckDBPyConnection) -> bool:
+    """
+    watermark 가 없으면 rollup 을 비우고 `turns` 전체로 다시 채운 뒤 watermark 를 남긴다.
+    ingest 가 새 turn 을 `turns` 에 넣기 전에 같은 transaction 안에서 호출한다.
+    Returns: backfill 했으면 True
+    """
+    if has_rollups(con):
+        return False
+    clear_rollups(con)
+    update_rollups(con, "turns")
+    (count,) = con.execute("SELECT count(*) FROM turns").fetchone()
+    con.execute("INSERT OR REPLACE INTO rollup_meta VALUES (?, ?)", [_BACKFILL_KEY, str(count)])
+    return True
+
+
+def clear_rollups(con: duckdb.DuckDBPyConnection) -> None:
+    for table in ROLLUP_TABLES:
+        con.execute(f"DELETE FROM {table}")
+
+
+def update_rollups(con: duckdb.DuckDBPyConnection, source: str) -> None:
+    """
+    source (새로 ingest 된 turn, 이미 `turns` 에 들어간 상태) 를 rollup 에 더한다.
+    prev turn 은 `turns` 전체에서 찾는다 — append 순서상 prev 는 먼저 들어와 있다.
+    """
+    con.execute(f"""
+        INSERT INTO turns_daily
+        SELECT
+            {_DAY.format(alias='')}                                AS day,
+            resolved_intent_id,
+            COUNT(*),
+            COALESCE(SUM(success::INTEGER), 0),
+            COUNT(success),
+            COALESCE(SUM(reprompt_count), 0),
+            COUNT(reprompt_count),
+            MAX(reprompt_count),
+            SUM(CASE WHEN reprompt_count >= 1 THEN 1 ELSE 0 END),
+            COALESCE(SUM(duration_ms), 0),
+            COUNT(duration_ms)
+        FROM {source}
+        WHERE resolved_intent_id IS NOT NULL
+          AND timestamp IS NOT NULL
+        GROUP BY 1, 2
+        ON CONFLICT DO UPDATE SET
+            total           = total + EXCLUDED.total,
+            success_sum     = success_sum + EXCLUDED.success_sum,
+            success_n       = success_n + EXCLUDED.success_n,
+            reprompt_sum    = reprompt_sum + EXCLUDED.reprompt_sum,
+            reprompt_n      = reprompt_n + EXCLUDED.reprompt_n,
+            reprompt_max    = GREATEST(reprompt_max, EXCLUDED.reprompt_max),
+            reprompt_over_1 = reprompt_over_1 + EXCLUDED.reprompt_over_1,
+            duration_sum    = duration_sum + EXCLUDED.duration_sum,
+            duration_n      = duration_n + EXCLUDED.duration_n
+    """)
+    con.execute(f"""
+        INSERT INTO transitions_daily
+        SELECT
+            {_DAY.format(alias='cur.')}      AS day,
+            prev.resolved_intent_id          AS from_intent,
+            cur.resolved_intent_id           AS to_intent,
+            COUNT(*)
+        FROM {source} cur
+        JOIN turns prev ON cur.prev_turn_id = prev.turn_id
+        WHERE cur.success  = TRUE
+          AND prev.success = TRUE
+          AND cur.resolved_intent_id  IS NOT NULL
+          AND prev.resolved_intent_id IS NOT NULL
+          AND cur.timestamp IS NOT NULL
+        GROUP BY 1, 2, 3
+        ON CONFLICT DO UPDATE SET cnt = cnt + EXCLUDED.cnt
+    """)
+    con.execute(f"""
+        INSERT INTO factored_daily
+        WITH cur AS (
+            SELECT
+                prev_turn_id,
+                resolved_intent_id,
+                timestamp,
+                COALESCE(UNNEST(resolved_target_concepts), '_no_concept') AS target_concept
+            FROM {source}
+            WHERE resolved_intent_id IS NOT NULL
+              AND success = TRUE
+              AND timestamp IS NOT NULL
+        ),
+        prev AS (
+            SELECT
+                turn_id,
+                resolved_intent_id,
+                timestamp,
+                COALESCE(UNNEST(resolved_target_concepts), '_no_concept') AS target_concept
+            FROM turns
+            WHERE resolved_intent_id IS NOT NULL
+              AND success = TRUE
+              AND timestamp IS NOT NULL
+        )
+        SELECT
+            {_DAY.format(alias='cur.')}      AS day,
+            {_DAY.format(alias='prev.')}     AS prev_day,
+            prev.resolved_intent_id,
+            prev.target_concept,
+            cur.resolved_intent_id,
+            cur.target_concept,
+            COUNT(*)
+        FROM cur
+        JOIN prev ON cur.prev_turn_id = prev.turn_id
+        GROUP BY 1, 2, 3, 4, 5, 6
+        ON CONFLICT DO UPDATE SET cnt = cnt + EXCLUDED.cnt
+    """)
+
+
+# ─── rollup 합산 조회 (transitions.py 의 같은 이름 함수와 같은 모양) ──────
+
+def transition_matrix(con: duckdb.DuckDBPyConnection, start: dt.date) -> list[dict]:
+    rows = con.execute("""
+        WITH pairs AS (
+            SELECT from_intent, to_intent, SUM(cnt)::BIGINT AS cnt
+            FROM transitions_daily
+            WHERE day >= ?
+            GROUP BY 1, 2
+        ),
+        totals AS (
+            SELECT from_intent, SUM(cnt) AS total FROM pairs GROUP BY 1
+        )
+        SELECT
+            p.from_intent,
+            p.to_intent,
+            p.cnt,
+            ROUND(p.cnt * 100.0 / t.total, 1) AS pct
+        FROM pairs p
+        JOIN totals t USING (from_intent)
+        ORDER BY p.from_intent, p.cnt DESC
+    """, [start]).fetchall()
+    keys = ["from_intent", "to_intent", "cnt", "pct"]
+    return [dict(zip(keys, r)) for r in rows]
+
+
+def factored(con: duckdb.DuckDBPyConnection, start: dt.date) -> list[dict]:
+    rows = con.execute("""
+        SELECT
+            from_intent, from_target_concept, to_intent, to_target_concept,
+            SUM(cnt)::BIGINT AS cnt
+        FROM factored_daily
+        WHERE day >= ? AND prev_day >= ?
+        GROUP BY 1, 2, 3, 4
+        ORDER BY from_intent, cnt DESC
+    """, [start, start]).fetchall()
+    keys = ["from_intent", "from_target_concept", "to_intent", "to_target_concept", "cnt"]
+    return [dict(zip(keys, r)) for r in rows]
+
+
+def funnel(con: duckdb.DuckDBPyConnection, start: dt.date) -> list[dict]:
+    rows = con.execute("""
+        SELECT
+            intent_id,
+            SUM(total)::BIGINT                                        AS total,
+            CASE WHEN SUM(success_n) > 0 THEN SUM(success_sum) END     AS success_cnt,
+            ROUND(SUM(success_sum) / SUM(success_n) * 100, 1)          AS success_rate,
+            ROUND(SUM(reprompt_sum) / SUM(reprompt_n), 2)              AS avg_reprompt,
+            ROUND(SUM(duration_sum) / SUM(duration_n))                 AS avg_duration_ms
+        FROM turns_daily
+        WHERE day >= ?
+        GROUP BY 1
+        ORDER BY total DESC
+    """, [start]).fetchall()
+    keys = ["intent_id","total","success_cnt","success_rate","avg_reprompt","avg_duration_ms"]
+    return [dict(zip(keys, r)) for r in rows]
+
+
+def reprompt_rate(con: duckdb.DuckDBPyConnection, start: dt.date) -> list[dict]:
+    rows = con.execute("""
+        SELECT
+            intent_id,
+            ROUND(SUM(reprompt_sum) / SUM(reprompt_n), 2)             AS avg_reprompt,
+            MAX(reprompt_max)                                         AS max_reprompt,
+            ROUND(SUM(reprompt_over_1) * 100.0 / SUM(total), 1)       AS pct_over_1
+        FROM turns_daily
+        WHERE day >= ?
+        GROUP BY 1
+        HAVING SUM(reprompt_sum) / SUM(reprompt_n) > 0
+        ORDER BY avg_reprompt DESC
+    """, [start]).fetchall()
+    keys = ["intent_id","avg_reprompt","max_reprompt","pct_over_1"]
+    return [dict(zip(keys, r)) for r in rows]
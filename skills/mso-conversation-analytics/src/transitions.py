@@ -1,15 +1,32 @@
 """
-mso-conversation-analytics — 5개 분석 함수 (DuckDB in-memory)
+mso-conversation-analytics — 5개 분석 함수 (DuckDB)
 PCA tools/conversation/transitions.py 이식 + MSO 도메인 적용.
+
+`turns` 는 영속 DuckDB 테이블이다 (기본: <root>/.mso-cache/turns.duckdb, timestamp 정렬·색인).
+turns.jsonl 은 append-only 이므로 load_turns 는 마지막 ingest offset 이후 줄만 추가한다.
+turn_writer 가 rotate 해 둔 봉인 구간(`turns.<stamp>.jsonl`)은 이름 순으로 한 번씩만 읽고,
+rotate 직전까지 읽은 활성 파일은 봉인 구간에서 남은 꼬리만 이어 읽는다.
+처음 만들 때 mso-graph-observability runtime_store 가 압축해 둔 봉인 구간이 있으면
+그 테이블을 복사하고 나머지 tail 만 읽는다.
+ingest 된 turn 은 rollup.py 의 일 단위 rollup 에도 더해진다 — aligned=True 조회는
+원본 turn 대신 rollup 을 합산한다 (rollup 도입 전 DB 는 첫 ingest 에서 backfill). dispatch 의 stage span sidecar 는 TEMP VIEW
+`turn_spans` 로 붙는다 (latency.stage_latency).
 """
 from __future__ import annotations
 
+import json
 import os
+import tempfile
 from pathlib import Path
 
 import duckdb
 
+import latency
+import rollup
+
 _DEFAULT_TURNS_PATH = Path("workspace/.mso-context/conversation/turns.jsonl")
+_STORE_NAME = "runtime.duckdb"
+_TURNS_DB_NAME = "turns.duckdb"
 
 # DuckDB은 JSON 배열을 VARCHAR[]로 읽을 때 버전별 차이 있음 — 명시 컬럼 지정
 _COLUMNS = """{
@@ -28,20 +45,57 @@ _COLUMNS = """{
     prev_turn_id:                 'VARCHAR'
 }"""
 
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS turns (
+        type                        VARCHAR,
+        turn_id                     VARCHAR,
+        session_id                  VARCHAR,
+        timestamp                   TIMESTAMPTZ,
+        utterance                   VARCHAR,
+        resolved_intent_id          VARCHAR,
+        resolved_target_entity_id   VARCHAR,
+        resolved_target_concepts    VARCHAR[],
+        slots_filled                VARCHAR,
+        reprompt_count              INTEGER,
+        success                     BOOLEAN,
+        duration_ms                 INTEGER,
+        prev_turn_id                VARCHAR
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS turns_timestamp ON turns (timestamp)",
+    """
+    CREATE TABLE IF NOT EXISTS turns_ingest (
+        path      VARCHAR,
+        inode     BIGINT,
+        "offset"  BIGINT
+    )
+    """,
+    "CREATE TABLE IF NOT EXISTS turns_segments (name VARCHAR PRIMARY KEY)",
+    *rollup.ROLLUP_SCHEMA,
+]
+
 
 # ─── 로더 ─────────────────────────────────────────────────────
 
-def load_turns(path: str | Path | None = None) -> duckdb.DuckDBPyConnection:
+def load_turns(
+    path: str | Path | None = None,
+    store: str | Path | None = None,
+    db: str | Path | None = None,
+) -> duckdb.DuckDBPyConnection:
     """
-    turns.jsonl → DuckDB in-memory `turns` VIEW.
+    turns.jsonl → DuckDB `turns` 테이블 (마지막 offset 이후 append 분만 ingest).
     파일 없거나 비어 있으면 빈 VIEW 반환 (exception 없음).
+    db:    영속 DB 경로 (기본: MSO_TURNS_DB 또는 turns.jsonl 루트의 .mso-cache/turns.duckdb,
+           기본 레이아웃 밖의 파일은 in-memory)
+    store: runtime_store 경로 (기본: MSO_RUNTIME_STORE 또는 turns.jsonl 루트의 .mso-cache)
     """
     if path is None:
         path = os.environ.get("MSO_TURNS_PATH", str(_DEFAULT_TURNS_PATH))
     path = Path(path)
-    con = duckdb.connect()
 
-    if not path.exists() or path.stat().st_size == 0:
+    if (not path.exists() or path.stat().st_size == 0) and not _sealed_segments(path):
+        con = duckdb.connect()
         # 빈 스키마로 VIEW 생성
         con.execute("""
             CREATE VIEW turns AS
@@ -61,27 +115,209 @@ def load_turns(path: str | Path | None = None) -> duckdb.DuckDBPyConnection:
                 NULL::VARCHAR       AS prev_turn_id
             WHERE 1=0
         """)
+        latency.attach_spans(con, path)
         return con
 
-    con.execute(f"""
-        CREATE VIEW turns AS
-        SELECT * FROM read_json(
-            '{path}',
-            columns={_COLUMNS},
-            ignore_errors=true
-        )
-        WHERE type = 'turn'
-    """)
+    db = Path(db) if db else _cache_file(path, "MSO_TURNS_DB", _TURNS_DB_NAME)
+    con = None
+    if db is not None:
+        try:
+            db.parent.mkdir(parents=True, exist_ok=True)
+            con = duckdb.connect(str(db))
+        except (OSError, duckdb.IOException):
+            # 다른 프로세스가 ingest 중이면 이번 실행은 in-memory 로 전체를 읽는다.
+            con = None
+    if con is None:
+        con = duckdb.connect()
+    for statement in _SCHEMA:
+        con.execute(statement)
+    ingest_turns(con, path, store)
+    latency.attach_spans(con, path)
     return con
 
 
+def ingest_turns(
+    con: duckdb.DuckDBPyConnection, path: Path, store: str | Path | None = None
+) -> int:
+    """
+    마지막 ingest 이후 완결된 줄을 `turns` 에 추가하고 새로 읽은 byte 수를 돌려준다.
+      - 아직 읽지 않은 봉인 구간은 통째로, 지난번 활성 파일이 rotate 된 봉인 구간은 offset 이후만
+      - 활성 파일은 offset 이후 (rotate 되었으면 처음부터)
+    다른 파일이거나 rotate 로 설명되지 않는 교체(inode)·truncate 면 테이블을 비우고 처음부터 다시 읽는다.
+    새 turn 은 TEMP `turns_staged` 를 거쳐 들어가고, 같은 transaction 에서 rollup 에 더해진다.
+    """
+    stat = path.stat() if path.exists() else None
+    inode, size = (stat.st_ino, stat.st_size) if stat else (None, 0)
+    key = str(path.resolve())
+    segments = _sealed_segments(path)
+    con.execute("CREATE OR REPLACE TEMP TABLE turns_staged AS SELECT * FROM turns LIMIT 0")
+    row = con.execute('SELECT path, inode, "offset" FROM turns_ingest').fetchone()
+    done = {name for (name,) in con.execute("SELECT name FROM turns_segments").fetchall()}
+
+    rotated = None
+    if row is not None and row[0] == key and row[1] is not None and row[1] != inode:
+        rotated = next((seg for seg in segments if seg.stat().st_ino == row[1]), None)
+        if rotated is not None and (rotated.name in done or rotated.stat().st_size < row[2]):
+            rotated = None
+    if (
+        row is None or row[0] != key
+        or (row[1] is not None and row[1] != inode and rotated is None)
+        or (row[1] == inode and size < row[2])
+    ):
+        con.execute("DELETE FROM turns")
+        con.execute("DELETE FROM turns_ingest")
+        con.execute("DELETE FROM turns_segments")
+        rollup.clear_rollups(con)
+        done = set()
+        offset = _seed_from_store(con, path, store) if stat else 0
+    elif row[1] == inode:
+        offset = row[2]
+    else:
+        offset = 0
+
+    read = 0
+    con.begin()
+    rollup.backfill_rollups(con)
+    for seg in segments:
+        if seg.name in done:
+            continue
+        seg_size = seg.stat().st_size
+        start = row[2] if seg == rotated else 0
+        _insert_segment(con, seg, start, seg_size, seg_size)
+        con.execute("INSERT INTO turns_segments VALUES (?)", [seg.name])
+        read += seg_size - start
+    end = _complete_end(path, offset, size) if stat else 0
+    if end > offset:
+        _insert_segment(con, path, offset, end, size)
+    read += end - offset
+    con.execute("INSERT INTO turns SELECT * FROM turns_staged ORDER BY timestamp")
+    rollup.update_rollups(con, "turns_staged")
+    con.execute("DELETE FROM turns_ingest")
+    con.execute("INSERT INTO turns_ingest VALUES (?, ?, ?)", [key, inode, end])
+    con.commit()
+    con.execute("DROP TABLE turns_staged")
+    return read
+
+
+def _sealed_segments(path: Path) -> list[Path]:
+    """turn_writer rotation 계약: `<stem>.<UTC stamp>.jsonl` 봉인 구간 (오래된 순)."""
+    return sorted(path.parent.glob(f"{path.stem}.*{path.suffix}"))
+
+
+def _cache_file(path: Path, env: str, name: str) -> Path | None:
+    """env > MSO_CACHE_DIR/name > <root>/.mso-cache/name (기본 레이아웃일 때) > None."""
+    override = os.environ.get(env)
+    if override:
+        return Path(override)
+    cache = os.environ.get("MSO_CACHE_DIR")
+    if cache:
+        return Path(cache) / name
+    parent = path.resolve().parent
+    if parent.name == "conversation" and parent.parent.name == ".mso-context":
+        return parent.parent.parent / ".mso-cache" / name
+    return None
+
+
+def _complete_end(path: Path, offset: int, size: int) -> int:
+    """offset 이후 마지막 완결 줄의 끝 byte. 개행 없는 꼬리는 완결된 JSON 일 때만 포함."""
+    end = offset
+    with path.open("rb") as handle:
+        pos = size
+        while pos > offset:
+            step = min(1 << 16, pos - offset)
+            handle.seek(pos - step)
+            newline = handle.read(step).rfind(b"\n")
+            if newline >= 0:
+                end = pos - step + newline + 1
+                break
+            pos -= step
+        handle.seek(end)
+        rest = handle.read(size - end)
+    if rest.strip():
+        try:
+            json.loads(rest)
+            end = size
+        except ValueError:
+            pass
+    return end
+
+
+def _insert_segment(con: duckdb.DuckDBPyConnection, path: Path, start: int, end: int, size: int) -> None:
+    def insert(source: Path) -> None:
+        con.execute(f"""
+            INSERT INTO turns_staged
+            SELECT * FROM read_json(
+                ?,
+                columns={_COLUMNS},
+                format='newline_delimited',
+                ignore_errors=true
+            )
+            WHERE type = 'turn'
+        """, [str(source)])
+
+    if start == 0 and end == size:
+        insert(path)
+        return
+    with path.open("rb") as handle, tempfile.TemporaryDirectory(prefix="mso-turns-") as tmp:
+        handle.seek(start)
+        segment = Path(tmp) / "segment.jsonl"
+        segment.write_bytes(handle.read(end - start))
+        insert(segment)
+
+
+def _seed_from_store(con: duckdb.DuckDBPyConnection, path: Path, store: str | Path | None) -> int:
+    """runtime_store 에 압축된 봉인 구간을 turns_staged 로 복사하고 그 offset 을 돌려준다 (없으면 0)."""
+    store = Path(store) if store else _cache_file(path, "MSO_RUNTIME_STORE", _STORE_NAME)
+    if store is None or not store.is_file():
+        return 0
+    try:
+        # ATTACH 는 경로를 bind 할 수 없어 literal 로 escape 한다
+        con.execute("ATTACH '" + str(store).replace("'", "''") + "' AS store (READ_ONLY)")
+    except duckdb.Error:
+        return 0
+    try:
+        row = con.execute(
+            'SELECT inode, "offset" FROM store.runtime_sources WHERE path = ? AND scope = ?',
+            [str(path.resolve()), "intent"],
+        ).fetchone()
+        stat = path.stat()
+        if row is None or row[0] != stat.st_ino or stat.st_size < row[1]:
+            return 0
+        con.execute(
+            "INSERT INTO turns_staged SELECT * EXCLUDE (_path) FROM store.turns WHERE _path = ?",
+            [str(path.resolve())],
+        )
+        return row[1]
+    except duckdb.Error:
+        con.execute("DELETE FROM turns_staged")
+        return 0
+    finally:
+        con.execute("DETACH store")
+
+
 # ─── 5개 분석 함수 ────────────────────────────────────────────
+# days 기간은 기본적으로 NOW() 기준 rolling window 다. aligned=True 면 오늘(UTC)을 포함한
+# 최근 days 일의 일 경계 window 이고, rollup 테이블이 있으면 원본 turn 대신 rollup 을 합산한다.
+
+def _cutoff(days: int, aligned: bool) -> str:
+    if aligned:
+        return f"TIMESTAMPTZ '{rollup.window_start(days).isoformat()} 00:00:00+00'"
+    return f"NOW() - INTERVAL '{days} days'"
+
+
+def _use_rollups(con: duckdb.DuckDBPyConnection, aligned: bool) -> bool:
+    return aligned and rollup.has_rollups(con)
+
 
-def transition_matrix(con: duckdb.DuckDBPyConnection, days: int = 7) -> list[dict]:
+def transition_matrix(
+    con: duckdb.DuckDBPyConnection, days: int = 7, aligned: bool = False
+) -> list[dict]:
     """
     intent → intent 전이 빈도 + 비율.
     Returns: [{"from_intent","to_intent","cnt","pct"}, ...]
     """
+    if _use_rollups(con, aligned):
+        return rollup.transition_matrix(con, rollup.window_start(days))
     rows = con.execute(f"""
         WITH pairs AS (
             SELECT
@@ -94,7 +330,7 @@ def transition_matrix(con: duckdb.DuckDBPyConnection, days: int = 7) -> list[dic
               AND prev.success = TRUE
               AND cur.resolved_intent_id  IS NOT NULL
               AND prev.resolved_intent_id IS NOT NULL
-              AND cur.timestamp >= NOW() - INTERVAL '{days} days'
+              AND cur.timestamp >= {_cutoff(days, aligned)}
             GROUP BY 1, 2
         ),
         totals AS (
@@ -113,12 +349,16 @@ def transition_matrix(con: duckdb.DuckDBPyConnection, days: int = 7) -> list[dic
     return [dict(zip(keys, r)) for r in rows]
 
 
-def factored(con: duckdb.DuckDBPyConnection, days: int = 7) -> list[dict]:
+def factored(
+    con: duckdb.DuckDBPyConnection, days: int = 7, aligned: bool = False
+) -> list[dict]:
     """
     (intent × target_concept) → (intent × target_concept) 전이.
     PRD 부록 10.2 SQL 이식.
     Returns: [{"from_intent","from_target","to_intent","to_target","cnt"}, ...]
     """
+    if _use_rollups(con, aligned):
+        return rollup.factored(con, rollup.window_start(days))
     rows = con.execute(f"""
         WITH unnested AS (
             SELECT
@@ -132,7 +372,7 @@ def factored(con: duckdb.DuckDBPyConnection, days: int = 7) -> list[dict]:
                 ) AS target_concept
             FROM turns
             WHERE resolved_intent_id IS NOT NULL
-              AND timestamp >= NOW() - INTERVAL '{days} days'
+              AND timestamp >= {_cutoff(days, aligned)}
         ),
         pairs AS (
             SELECT
@@ -153,12 +393,16 @@ def factored(con: duckdb.DuckDBPyConnection, days: int = 7) -> list[dict]:
     return [dict(zip(keys, r)) for r in rows]
 
 
-def funnel(con: duckdb.DuckDBPyConnection, days: int = 7) -> list[dict]:
+def funnel(
+    con: duckdb.DuckDBPyConnection, days: int = 7, aligned: bool = False
+) -> list[dict]:
     """
     intent별 성공률·reprompt·latency funnel.
     Returns: [{"intent_id","total","success_cnt","success_rate",
                "avg_reprompt","avg_duration_ms"}, ...]
     """
+    if _use_rollups(con, aligned):
+        return rollup.funnel(con, rollup.window_start(days))
     rows = con.execute(f"""
         SELECT
             resolved_intent_id                        AS intent_id,
@@ -169,7 +413,7 @@ def funnel(con: duckdb.DuckDBPyConnection, days: int = 7) -> list[dict]:
             ROUND(AVG(duration_ms))                   AS avg_duration_ms
         FROM turns
         WHERE resolved_intent_id IS NOT NULL
-          AND timestamp >= NOW() - INTERVAL '{days} days'
+          AND timestamp >= {_cutoff(days, aligned)}
         GROUP BY 1
         ORDER BY total DESC
     """).fetchall()
@@ -177,11 +421,15 @@ def funnel(con: duckdb.DuckDBPyConnection, days: int = 7) -> list[dict]:
     return [dict(zip(keys, r)) for r in rows]
 
 
-def reprompt_rate(con: duckdb.DuckDBPyConnection, days: int = 7) -> list[dict]:
+def reprompt_rate(
+    con: duckdb.DuckDBPyConnection, days: int = 7, aligned: bool = False
+) -> list[dict]:
     """
     reprompt_count 높은 intent → SlotSpec 튜닝 후보.
     Returns: [{"intent_id","avg_reprompt","max_reprompt","pct_over_1"}, ...]
     """
+    if _use_rollups(con, aligned):
+        return rollup.reprompt_rate(con, rollup.window_start(days))
     rows = con.execute(f"""
         SELECT
             resolved_intent_id                AS intent_id,
@@ -193,7 +441,7 @@ def reprompt_rate(con: duckdb.DuckDBPyConnection, days: int = 7) -> list[dict]:
             1)                                AS pct_over_1
         FROM turns
         WHERE resolved_intent_id IS NOT NULL
-          AND timestamp >= NOW() - INTERVAL '{days} days'
+          AND timestamp >= {_cutoff(days, aligned)}
         GROUP BY 1
         HAVING AVG(reprompt_count) > 0
         ORDER BY avg_reprompt DESC
@@ -202,7 +450,9 @@ def reprompt_rate(con: duckdb.DuckDBPyConnection, days: int = 7) -> list[dict]:
     return [dict(zip(keys, r)) for r in rows]
 
 
-def unresolved(con: duckdb.DuckDBPyConnection, days: int = 7) -> list[dict]:
+def unresolved(
+    con: duckdb.DuckDBPyConnection, days: int = 7, aligned: bool = False
+) -> list[dict]:
     """
     resolved_intent_id IS NULL 발화 목록 — 신규 intent 후보.
     Returns: [{"utterance","timestamp","session_id"}, ...]
@@ -211,7 +461,7 @@ def unresolved(con: duckdb.DuckDBPyConnection, days: int = 7) -> list[dict]:
         SELECT utterance, timestamp, session_id
         FROM turns
         WHERE resolved_intent_id IS NULL
-          AND timestamp >= NOW() - INTERVAL '{days} days'
+          AND timestamp >= {_cutoff(days, aligned)}
         ORDER BY timestamp DESC
     """).fetchall()
     keys = ["utterance","timestamp","session_id"]
@@ -175,3 +175,310 @@ def test_analytics_module_importable():
     import analytics  # type: ignore  # noqa
     assert hasattr(analytics, "QUERIES")
     assert len(analytics.QUERIES) == 5
+
+
+# ════════════════════════════════════════════════════════════
+# 영속 turns 테이블 — offset 증분 ingest + runtime_store seed
+# ════════════════════════════════════════════════════════════
+
+def _snapshot(path) -> dict:
+    con = load_turns(path)
+    result = {fn.__name__: fn(con, days=36500)
+              for fn in (transition_matrix, factored, funnel, reprompt_rate, unresolved)}
+    result["feedback"] = generate_feedback(con, days=36500)
+    con.close()
+    return result
+
+
+def _live_turn(turn_id: str, prev: str) -> str:
+    import json
+    return json.dumps({"type": "turn", "turn_id": turn_id, "session_id": "s",
+                       "timestamp": "2026-10-17T01:00:00+00:00", "utterance": "rollback again",
+                       "resolved_intent_id": None, "success": False, "prev_turn_id": prev}) + "\n"
+
+
+def test_persistent_turns_table_ingests_only_appended_lines(tmp_path):
+    turns = tmp_path / ".mso-context" / "conversation" / "turns.jsonl"
+    turns.parent.mkdir(parents=True)
+    turns.write_text(Path(_SAMPLE).read_text(encoding="utf-8"), encoding="utf-8")
+    db = tmp_path / ".mso-cache" / "turns.duckdb"
+
+    assert _snapshot(turns) == _snapshot(_SAMPLE)
+    assert db.exists()
+
+    appended = _live_turn("t7", "t6")
+    with turns.open("a", encoding="utf-8") as handle:
+        handle.write(appended + _live_turn("t8", "t7")[:20])
+    con = load_turns(turns)
+    assert con.execute("SELECT count(*) FROM turns").fetchone() == (7,)
+    offset = con.execute('SELECT "offset" FROM turns_ingest').fetchone()[0]
+    assert offset == turns.stat().st_size - 20
+    con.close()
+
+    # 교체된 파일은 처음부터 다시 ingest 한다.
+    replacement = turns.with_suffix(".new")
+    replacement.write_text(Path(_SAMPLE).read_text(encoding="utf-8"), encoding="utf-8")
+    replacement.replace(turns)
+    assert _snapshot(turns) == _snapshot(_SAMPLE)
+
+
+def test_compacted_store_seeds_persistent_turns_table(tmp_path):
+    import datetime as dt
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "mso-graph-observability" / "scripts"))
+    import runtime_store  # type: ignore
+
+    root = tmp_path / "it's a project"  # 따옴표가 든 경로도 ATTACH·read_json 에 그대로 넘어간다
+    content = Path(_SAMPLE).read_text(encoding="utf-8") + _live_turn("t7", "t6")
+    plain = tmp_path / "plain.jsonl"
+    plain.write_text(content, encoding="utf-8")
+    turns = root / ".mso-context" / "conversation" / "turns.jsonl"
+    turns.parent.mkdir(parents=True)
+    turns.write_text(content, encoding="utf-8")
+
+    runtime_store.compact(root, store=root / ".mso-cache" / "runtime.duckdb", today=dt.date(2026, 10, 17))
+    import duckdb
+    import transitions
+
+    with duckdb.connect() as seed:
+        for statement in transitions._SCHEMA:
+            seed.execute(statement)
+        seed.execute("CREATE TEMP TABLE turns_staged AS SELECT * FROM turns LIMIT 0")
+        assert transitions._seed_from_store(seed, turns, None) > 0
+    con = load_turns(turns)
+    assert con.execute("SELECT count(*) FROM turns").fetchone() == (7,)
+    con.close()
+    assert _snapshot(turns) == _snapshot(plain)
+
+
+def test_sealed_segments_ingest_incrementally_across_rotation(tmp_path):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "mso-intent-analytics" / "src"))
+    from turn_writer import sealed_segments, write_locked  # type: ignore
+
+    turns = tmp_path / ".mso-context" / "conversation" / "turns.jsonl"
+    turns.parent.mkdir(parents=True)
+    turns.write_text(Path(_SAMPLE).read_text(encoding="utf-8"), encoding="utf-8")
+    plain = tmp_path / "plain.jsonl"
+    plain.write_text(Path(_SAMPLE).read_text(encoding="utf-8"), encoding="utf-8")
+    load_turns(turns).close()
+
+    def append(turn_id: str, prev: str, rotate: bool) -> None:
+        line = _live_turn(turn_id, prev)
+        write_locked(turns, line.encode("utf-8"), rotate_bytes=1 if rotate else 0)
+        with plain.open("a", encoding="utf-8") as handle:
+            handle.write(line)
+
+    # t7 은 ingest 된 활성 파일 꼬리에 붙은 뒤 rotate 로 봉인된다 — 봉인 구간에서 이어 읽는다.
+    append("t7", "t6", rotate=False)
+    append("t8", "t7", rotate=True)
+    con = load_turns(turns)
+    assert con.execute("SELECT count(*) FROM turns").fetchone() == (8,)
+    assert con.execute("SELECT count(*) FROM turns_segments").fetchone() == (1,)
+    con.close()
+
+    # ingest 사이에 두 번 rotate — 처음 보는 봉인 구간은 통째로 읽는다.
+    append("t9", "t8", rotate=True)
+    append("t10", "t9", rotate=True)
+    assert len(sealed_segments(turns)) == 3
+    con = load_turns(turns)
+    assert con.execute("SELECT count(*) FROM turns").fetchone() == (10,)
+    assert con.execute("SELECT count(DISTINCT turn_id) FROM turns").fetchone() == (10,)
+    con.close()
+    assert _snapshot(turns) == _snapshot(plain)
+
+
+def test_stage_latency_percentiles_per_intent_and_stage(tmp_path, monkeypatch):
+    import json
+
+    from latency import stage_latency  # type: ignore
+
+    monkeypatch.delenv("MSO_TURN_SPANS_PATH", raising=False)
+    turns = tmp_path / "turns.jsonl"
+    turns.write_text(Path(_SAMPLE).read_text(encoding="utf-8"), encoding="utf-8")
+    now = "2099-01-01T00:00:00+00:00"
+    lines = [json.dumps({"type": "schema", "spans_schema": "turn_spans/0.1.0"})]
+    for i in range(1, 101):
+        for intent, scale in (("dispatch_ticket", 1.0), ("query_run_status", 10.0)):
+            lines.append(json.dumps({"type": "spans", "turn_id": f"{intent}-{i}", "intent_id": intent,
+                                     "timestamp": now,
+                                     "spans_ms": {"validate": i * scale, "lookup": 0.5}}))
+    sealed = tmp_path / "turns_spans.20990101T000000000000Z.jsonl"
+    sealed.write_text("\n".join(lines[:101]) + "\n", encoding="utf-8")
+    (tmp_path / "turns_spans.jsonl").write_text("\n".join(lines[:1] + lines[101:]) + "\n", encoding="utf-8")
+
+    con = load_turns(turns)
+    rows = {(r["intent_id"], r["stage"]): r for r in stage_latency(con, days=36500)}
+    assert [k for k in rows if k[0] == "dispatch_ticket"] == [("dispatch_ticket", "lookup"), ("dispatch_ticket", "validate")]
+    v = rows[("dispatch_ticket", "validate")]
+    assert (v["n"], v["p50_ms"], v["p95_ms"], v["p99_ms"]) == (100, 50.5, 95.05, 99.01)
+    assert rows[("query_run_status", "validate")]["p99_ms"] == 990.1
+    assert rows[("*", "validate")]["n"] == 200
+    assert rows[("*", "lookup")]["p95_ms"] == 0.5
+    assert len(stage_latency(con, days=1, aligned=True)) == len(rows)
+    con.close()
+
+    monkeypatch.setenv("MSO_TURN_SPANS_PATH", "off")
+    con = load_turns(turns)
+    assert stage_latency(con, days=36500) == []
+    con.close()
+
+
+# ════════════════════════════════════════════════════════════
+# batch.run_all — 단일 window 스캔 결과 = 개별 함수 결과
+# ════════════════════════════════════════════════════════════
+
+def _random_turns(count: int, seed: int = 7, hours: int = 24 * 20) -> list[dict]:
+    import random
+    from datetime import datetime, timedelta, timezone
+
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    intents = ["dispatch_ticket", "query_audit_log", "rollback", None]
+    concepts = [["TicketEvent"], ["TicketEvent", "FailedTicket"], [], None, ["RunManifest"]]
+    return [
+        {
+            "type": "turn",
+            "turn_id": f"t{i}",
+            "session_id": f"s{i % 7}",
+            "timestamp": (now - timedelta(hours=rng.randint(0, hours))).isoformat(),
+            "utterance": f"utt {rng.choice(['rollback', 'retry', 'status'])} {i}",
+            "resolved_intent_id": rng.choice(intents),
+            "resolved_target_concepts": rng.choice(concepts),
+            "reprompt_count": rng.randint(0, 2),
+            "success": rng.random() < 0.8,
+            "duration_ms": rng.randint(10, 500),
+            "prev_turn_id": f"t{rng.randint(0, i - 1)}" if i else None,
+        }
+        for i in range(count)
+    ]
+
+
+def _canonical(rows: list[dict]) -> list[str]:
+    import json
+    return sorted(json.dumps(row, sort_keys=True, default=str) for row in rows)
+
+
+def test_batch_run_all_matches_individual_queries(tmp_path):
+    import json
+
+    from batch import run_all
+
+    path = tmp_path / "turns.jsonl"
+    path.write_text("\n".join(json.dumps(t) for t in _random_turns(400)) + "\n", encoding="utf-8")
+
+    con = load_turns(path)
+    individual = {fn.__name__: fn(con, days=7)
+                  for fn in (transition_matrix, factored, funnel, reprompt_rate, unresolved)}
+    batched = run_all(con, days=7)
+
+    assert batched.keys() == individual.keys()
+    for name in individual:
+        assert individual[name], name
+        assert _canonical(batched[name]) == _canonical(individual[name]), name
+
+
+def test_daily_rollups_match_aligned_raw_queries(tmp_path):
+    import json
+
+    import rollup
+
+    turns = _random_turns(600, seed=11, hours=24 * 45)
+    for i, turn in enumerate(turns):
+        if i % 17 == 0:
+            turn["reprompt_count"] = None
+            turn["duration_ms"] = None
+        if i % 23 == 0:
+            turn["success"] = None
+    path = tmp_path / ".mso-context" / "conversation" / "turns.jsonl"
+    path.parent.mkdir(parents=True)
+    lines = [json.dumps(t) + "\n" for t in turns]
+    path.write_text("".join(lines[:400]), encoding="utf-8")
+    load_turns(path).close()
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write("".join(lines[400:]))
+
+    con = load_turns(path)
+    queries = (transition_matrix, factored, funnel, reprompt_rate)
+    windows = (1, 7, 30)
+    rolled = {(fn.__name__, days): fn(con, days=days, aligned=True) for fn in queries for days in windows}
+    assert rollup.has_rollups(con)
+    for table in rollup.ROLLUP_TABLES:
+        con.execute(f"DROP TABLE {table}")
+    for fn in queries:
+        for days in windows:
+            raw = fn(con, days=days, aligned=True)
+            assert _canonical(rolled[fn.__name__, days]) == _canonical(raw), (fn.__name__, days)
+    assert rolled["funnel", 30]
+
+
+def test_rollups_backfill_database_created_before_rollups(tmp_path):
+    import json
+
+    import duckdb
+    import rollup
+
+    turns = _random_turns(300, seed=5, hours=24 * 20)
+    path = tmp_path / ".mso-context" / "conversation" / "turns.jsonl"
+    path.parent.mkdir(parents=True)
+    lines = [json.dumps(t) + "\n" for t in turns]
+    path.write_text("".join(lines[:200]), encoding="utf-8")
+    load_turns(path).close()
+
+    # rollup 도입 전 DB: turns 만 있고 rollup 테이블·watermark 가 없다
+    db = tmp_path / ".mso-cache" / "turns.duckdb"
+    con = duckdb.connect(str(db))
+    for table in (*rollup.ROLLUP_TABLES, "rollup_meta"):
+        con.execute(f"DROP TABLE {table}")
+    for statement in rollup.ROLLUP_SCHEMA:
+        con.execute(statement)
+    assert not rollup.has_rollups(con)  # 빈 테이블만으로는 rollup 으로 답하지 않는다
+    con.close()
+
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write("".join(lines[200:]))
+    con = load_turns(path)
+    assert rollup.has_rollups(con)
+    assert con.execute("SELECT value FROM rollup_meta").fetchone() == ("200",)
+    queries = (transition_matrix, factored, funnel, reprompt_rate)
+    rolled = {fn.__name__: fn(con, days=30, aligned=True) for fn in queries}
+    for table in rollup.ROLLUP_TABLES:
+        con.execute(f"DROP TABLE {table}")
+    for fn in queries:
+        assert _canonical(rolled[fn.__name__]) == _canonical(fn(con, days=30, aligned=True)), fn.__name__
+    assert rolled["funnel"]
+
+def test_new_intent_candidates_mine_phrases_and_near_duplicates(tmp_path):
+    import json
+    from datetime import datetime, timedelta, timezone
+
+    now = datetime.now(timezone.utc)
+    utterances = [
+        "rollback the last deploy please",
+        "rollback the last deploy now",
+        "please rollback the last deploy",
+        "rollback the last deploy please",
+        "show failed tickets",
+        "weather today",
+    ]
+    path = tmp_path / "turns.jsonl"
+    path.write_text("".join(
+        json.dumps({"type": "turn", "turn_id": f"u{i}", "session_id": "s",
+                    "timestamp": (now - timedelta(minutes=i)).isoformat(),
+                    "utterance": utt, "resolved_intent_id": None, "success": False}) + "\n"
+        for i, utt in enumerate(utterances)
+    ), encoding="utf-8")
+
+    con = load_turns(path)
+    candidates = generate_feedback(con, days=1)["new_intent_candidates"]
+    by_kind = {(c["kind"], c["pattern"]): c for c in candidates}
+
+    assert by_kind["keyword", "rollback"]["count"] == 4
+    assert by_kind["phrase", "last deploy"]["count"] == 4
+    assert ("keyword", "weather") not in by_kind
+    cluster = by_kind["cluster", "rollback the last deploy please"]
+    assert cluster["count"] == 4
+    assert cluster["sample_utterances"] == [
+        "rollback the last deploy please", "rollback the last deploy now", "please rollback the last deploy",
+    ]
+    assert all(len(c["sample_utterances"]) <= 3 and "suggestion" in c for c in candidates)
+    assert generate_feedback(con, days=1)["new_intent_candidates"] == candidates
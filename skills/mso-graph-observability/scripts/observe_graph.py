@@ -16,16 +16,26 @@ import argparse
 import datetime as dt
 import hashlib
 import json
+import os
 import re
 import shutil
+import sqlite3
 import sys
-from collections import Counter, defaultdict
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, Iterable
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 import observe_v07  # noqa: E402 - v0.7 Rail/Stream native renderer (A-phase)
 
+# 파싱 그래프 캐시는 mso-workflow-design 소유 (TBox와 같은 sibling skill 경로).
+sys.path.append(str(Path(__file__).resolve().parents[2] / "mso-workflow-design" / "scripts"))
+try:
+    import graph_cache
+except ImportError:  # pragma: no cover - standalone install without mso-workflow-design
+    graph_cache = None
+
 try:
     import yaml
 except ImportError:  # pragma: no cover - optional index registry support
@@ -43,6 +53,9 @@ except ImportError as exc:  # pragma: no cover - user environment guard
 WF = Namespace("https://mso.dev/ontology/workflow#")
 SKOS = Namespace("http://www.w3.org/2004/02/skos/core#")
 MERMAID_LINE_BREAK = "<br/>"
+# 증분 렌더 manifest: 입력 해시(TTL/data_registry/renderer)와 출력별 fingerprint.
+MANIFEST_NAME = ".observe-manifest.json"
+MANIFEST_VERSION = 1
 
 CLASS_TYPES = {OWL.Class, RDFS.Class}
 PROPERTY_TYPES = {OWL.ObjectProperty, OWL.DatatypeProperty, RDF.Property}
@@ -144,7 +157,7 @@ TABLE_MARKERS = {
 }
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Generate graph observability views for MSO repositories."
     )
@@ -181,7 +194,18 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Exit non-zero when legacy workflow YAML files remain after TTL migration.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=f"Re-render only the views whose inputs changed since the last run (tracked in <output-dir>/{MANIFEST_NAME}).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Render per-scope views in N worker processes (0 = CPU count). Output is identical to the serial run.",
+    )
+    return parser.parse_args(argv)
 
 
 def default_tbox_path() -> Path:
@@ -224,13 +248,75 @@ def resolve_paths(args: argparse.Namespace) -> tuple[Path, Path, list[Path]]:
     return workflow_dir, output_dir, unique_paths
 
 
+def parse_ttl_file(graph: Graph, path: Path) -> Graph:
+    if graph_cache is not None:
+        return graph_cache.parse_ttl(graph, path)
+    graph.parse(path, format="turtle")
+    return graph
+
+
 def parse_graph(ttl_paths: Iterable[Path]) -> Graph:
     graph = Graph()
     for path in ttl_paths:
-        graph.parse(path, format="turtle")
+        parse_ttl_file(graph, path)
     return graph
 
 
+def file_digest(path: Path) -> str:
+    if graph_cache is not None and graph_cache.enabled():
+        return graph_cache.content_hash(path)
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def json_digest(value: Any) -> str:
+    payload = json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def source_scopes(graph: Graph) -> list[str]:
+    """Workflow scopes an input file touches (any scoped URI term, plus v0.7 workflows).
+
+    A file without any scoped term (TBox, shapes, unscoped legacy TTL) returns an
+    empty list and is treated as an input of every view.
+    """
+    scopes = {
+        scope
+        for triple in graph
+        for term in (triple[0], triple[2])
+        if isinstance(term, URIRef)
+        for scope in [workflow_scope(term)]
+        if scope
+    }
+    scopes.update(observe_v07.v07_workflows(graph).values())
+    return sorted(scopes)
+
+
+def parse_sources(
+    ttl_paths: Iterable[Path],
+    known: dict[str, dict[str, Any]] | None = None,
+) -> tuple[Graph, dict[str, dict[str, Any]]]:
+    """Parse TTL inputs and record `{path: {sha256, scopes}}` for the render manifest.
+
+    Every file parses straight into the merged graph so triple order (and thus
+    rendered output) matches `parse_graph`. Files whose hash matches `known` reuse
+    the recorded scopes; new or changed files are parsed once more on their own
+    to derive them.
+    """
+    known = known or {}
+    graph = Graph()
+    sources: dict[str, dict[str, Any]] = {}
+    for path in ttl_paths:
+        digest = file_digest(path)
+        parse_ttl_file(graph, path)
+        entry = known.get(str(path))
+        if entry and entry.get("sha256") == digest:
+            scopes = list(entry.get("scopes") or [])
+        else:
+            scopes = source_scopes(parse_ttl_file(Graph(), path))
+        sources[str(path)] = {"sha256": digest, "scopes": scopes}
+    return graph, sources
+
+
 def is_workflow_abox(path: Path) -> bool:
     return path.name.endswith(".abox.ttl")
 
@@ -356,6 +442,82 @@ def locator_lookup_keys(value: str) -> set[str]:
     return {key for key in keys if key}
 
 
+class DataRegistry(dict):
+    """`load_data_registry` 결과. 일반 dict 와 같고 locator 색인을 함께 들고 다닌다."""
+
+    locator_index: dict[str, Any] | None = None
+
+
+def build_locator_index(data_registry: dict[str, dict[str, str]]) -> dict[str, Any]:
+    """registry locator의 prefix trie(경로 segment)와 suffix trie(역순 문자)를 만든다.
+
+    `data_ref_for_locator`의 선형 스캔과 같은 결과를 낸다 — prefix는 가장 긴
+    `locator/` 접두, suffix는 가장 긴 문자 단위 접미이며 길이가 같으면 registry
+    순회 순서상 먼저 나온 ref가 이긴다.
+    """
+    prefix_root: list[Any] = [{}, None]  # [children, ref]
+    suffix_root: list[Any] = [{}, None]  # [children, (len, ref)] — subtree 최장
+    seen: set[int] = set()
+    for ref in data_registry.values():
+        ref_locator = ref.get("locator", "")
+        if not ref_locator or id(ref) in seen:
+            continue
+        seen.add(id(ref))
+
+        prefix = ref_locator if ref_locator.endswith("/") else f"{ref_locator}/"
+        node = prefix_root
+        for segment in prefix.split("/")[:-1]:
+            node = node[0].setdefault(segment, [{}, None])
+        if node[1] is None:
+            node[1] = ref
+
+        norm_ref = normalize_locator(ref_locator)
+        if not norm_ref:
+            continue
+        node = suffix_root
+        for char in (None, *reversed(norm_ref)):
+            if char is not None:
+                node = node[0].setdefault(char, [{}, None])
+            if node[1] is None or len(norm_ref) > node[1][0]:
+                node[1] = (len(norm_ref), ref)
+    return {"prefix": prefix_root, "suffix": suffix_root}
+
+
+def locator_index_for(data_registry: dict[str, dict[str, str]]) -> dict[str, Any]:
+    index = getattr(data_registry, "locator_index", None)
+    if index is None:
+        index = build_locator_index(data_registry)
+        if isinstance(data_registry, DataRegistry):
+            data_registry.locator_index = index
+    return index
+
+
+def longest_prefix_ref(index: dict[str, Any], normalized: str) -> dict[str, str] | None:
+    """`normalized`가 `<locator>/`로 시작하는 가장 긴 registry ref."""
+    segments = normalized.split("/")
+    node = index["prefix"]
+    best = None
+    for segment in segments:
+        if node[1] is not None:
+            best = node[1]
+        node = node[0].get(segment)
+        if node is None:
+            return best
+    return best
+
+
+def longest_suffix_ref(index: dict[str, Any], normalized: str) -> dict[str, str] | None:
+    """`normalized`로 끝나면서 더 긴 registry locator 중 가장 긴 ref."""
+    node = index["suffix"]
+    for char in reversed(normalized):
+        node = node[0].get(char)
+        if node is None:
+            return None
+    if node[1] is not None and node[1][0] > len(normalized):
+        return node[1][1]
+    return None
+
+
 def _contains_any(text: str, markers: set[str]) -> bool:
     return any(marker in text for marker in markers)
 
@@ -504,8 +666,8 @@ def register_data_ref(
         registry.setdefault(key, ref)
 
 
-def load_data_registry(root: Path) -> dict[str, dict[str, str]]:
-    registry: dict[str, dict[str, str]] = {}
+def load_data_registry(root: Path) -> DataRegistry:
+    registry = DataRegistry()
     index_path = next((path for path in index_candidates(root) if path.exists()), None)
     if index_path is None:
         return registry
@@ -574,6 +736,7 @@ def load_data_registry(root: Path) -> dict[str, dict[str, str]]:
                 resource_kind=str(subdir.get("resource_kind") or subdir.get("kind") or "").strip(),
                 role=str(subdir.get("role") or "").strip(),
             )
+    registry.locator_index = build_locator_index(registry)
     return registry
 
 
@@ -784,21 +947,43 @@ def build_workflow_ssot_report(workflow_dir: Path, graph: Graph | None = None) -
     return body, len(state["yaml"]) + len(legacy_refs)
 
 
-def iter_jsonl(path: Path) -> Iterable[dict[str, Any]]:
-    with path.open("r", encoding="utf-8") as handle:
-        for line_number, line in enumerate(handle, start=1):
-            stripped = line.strip()
+def iter_jsonl_tail(
+    path: Path, offset: int = 0, line_number: int = 0
+) -> Iterable[tuple[dict[str, Any] | None, int, int]]:
+    """`offset` 바이트부터 완결된 줄을 읽어 `(record, 다음 offset, 줄 번호)` 를 낸다.
+
+    빈 줄·dict 가 아닌 값은 record 가 None 이다. 개행 없는 마지막 줄은 쓰기 도중일 수 있으므로
+    JSON 으로 완결될 때만 소비하고, 아니면 offset 을 그 앞에 멈춰 다음 실행으로 넘긴다.
+    """
+    with path.open("rb") as handle:
+        handle.seek(offset)
+        for raw in handle:
+            if not raw.endswith(b"\n"):
+                try:
+                    json.loads(raw.decode("utf-8"))
+                except ValueError:
+                    return
+            offset += len(raw)
+            line_number += 1
+            stripped = raw.strip()
             if not stripped:
+                yield None, offset, line_number
                 continue
             try:
-                value = json.loads(stripped)
-            except json.JSONDecodeError:
-                yield {"_parse_error": True, "_path": str(path), "_line": line_number}
+                value = json.loads(stripped.decode("utf-8"))
+            except ValueError:
+                yield {"_parse_error": True, "_path": str(path), "_line": line_number}, offset, line_number
                 continue
-            if isinstance(value, dict):
-                value.setdefault("_path", str(path))
-                value.setdefault("_line", line_number)
-                yield value
+            yield (value if isinstance(value, dict) else None), offset, line_number
+
+
+def iter_jsonl(path: Path) -> Iterable[dict[str, Any]]:
+    for record, _, line_number in iter_jsonl_tail(path):
+        if record is None:
+            continue
+        record.setdefault("_path", str(path))
+        record.setdefault("_line", line_number)
+        yield record
 
 
 def nested_get(record: dict[str, Any], keys: Iterable[str]) -> Any:
@@ -826,7 +1011,9 @@ def normalized_value(value: Any) -> str | None:
 
 
 def discover_runtime_sources(root: Path) -> dict[str, list[Path]]:
+    """scope 별 runtime JSONL. intent 는 turns.jsonl 의 봉인 구간(오래된 순) + 활성 파일."""
     work_memory = root / "agent-context" / "work-memory"
+    turns = root / ".mso-context" / "conversation" / "turns.jsonl"
     return {
         "memory": sorted(
             p
@@ -841,12 +1028,44 @@ def discover_runtime_sources(root: Path) -> dict[str, list[Path]]:
         "worklog": sorted((work_memory / "worklog").rglob("*.jsonl"))
         if (work_memory / "worklog").exists()
         else [],
-        "intent": [root / ".mso-context" / "conversation" / "turns.jsonl"]
-        if (root / ".mso-context" / "conversation" / "turns.jsonl").exists()
-        else [],
+        "intent": sealed_turn_segments(turns)
+        + ([turns] if turns.exists() else []),
     }
 
 
+def sealed_turn_segments(path: Path) -> list[Path]:
+    """turn_writer rotation 계약: `<stem>.<UTC stamp>.jsonl` 봉인 구간 (오래된 순)."""
+    return sorted(path.parent.glob(f"{path.stem}.*{path.suffix}")) if path.parent.is_dir() else []
+
+
+def follow_renames(files: dict[str, dict[str, Any]], candidates: Iterable[Path]) -> dict[str, str]:
+    """추적하던 파일이 봉인 구간으로 rename 되었으면 `{이전 경로: 봉인 구간 경로}` 를 돌려준다.
+
+    이전 경로의 현재 inode 가 기록과 다르고(새 활성 파일) 같은 디렉터리의 아직 추적하지 않은
+    `<stem>.*` 파일이 기록된 inode 를 가지면 rotate 된 것이다 — 읽은 offset 을 그 파일에서 이어 간다.
+    """
+    by_inode: dict[int, Path] = {}
+    for path in candidates:
+        if str(path) in files:
+            continue
+        try:
+            by_inode[path.stat().st_ino] = path
+        except OSError:
+            continue
+    renames: dict[str, str] = {}
+    for key, entry in files.items():
+        old = Path(key)
+        try:
+            inode = old.stat().st_ino
+        except OSError:
+            inode = None
+        new = by_inode.get(entry.get("inode")) if inode != entry.get("inode") else None
+        if new is not None and new.parent == old.parent and new.name.startswith(f"{old.stem}."):
+            renames[key] = str(new)
+            del by_inode[entry["inode"]]
+    return renames
+
+
 def is_failure_like(record: dict[str, Any]) -> bool:
     fields = [
         nested_get(record, ["status", "result.status", "metadata.status"]),
@@ -860,7 +1079,9 @@ def is_failure_like(record: dict[str, Any]) -> bool:
 def top_items(counter: Counter[str], limit: int = 10) -> str:
     if not counter:
         return "- _No data._"
-    return "\n".join(f"- `{key}`: {count}" for key, count in counter.most_common(limit))
+    # 동률은 키 순서로 고정한다 — 증분 병합과 전체 재집계의 키 삽입 순서가 달라도 같은 리포트.
+    ranked = sorted(counter.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    return "\n".join(f"- `{key}`: {count}" for key, count in ranked)
 
 
 def table_rows(rows: list[tuple[str, str, int]], limit: int = 12) -> str:
@@ -872,80 +1093,333 @@ def table_rows(rows: list[tuple[str, str, int]], limit: int = 12) -> str:
     return "\n".join(lines)
 
 
-def build_runtime_analysis(root: Path) -> str:
+RUNTIME_ID_KEYS = ["id", "entry_id", "metadata.id", "run_id", "ticket_id", "intent_id"]
+RUNTIME_HOTSPOT_KEYS = {
+    "workflow": ["workflow", "workflow_id", "metadata.workflow", "metadata.workflow_id"],
+    "phase": ["phase", "phase_id", "metadata.phase", "metadata.phase_id"],
+    "node": ["node", "node_id", "metadata.node", "metadata.node_id"],
+    "tool": ["tool", "tool_name", "tool.name", "metadata.tool", "command"],
+    "intent": ["intent_id", "intent.id", "metadata.intent_id"],
+}
+RUNTIME_PARSE_ERROR_LIMIT = 10
+RUNTIME_ID_PREFIX_RE = re.compile(r"^([A-Z]{2})[-_]")
+# 증분 runtime 분석 checkpoint: 파일별 (inode, size, offset, lines) + 누적 Counter.
+RUNTIME_CHECKPOINT_NAME = "runtime-analysis.sqlite"
+RUNTIME_CHECKPOINT_VERSION = 2
+RUNTIME_COUNTERS = (
+    "record_counts",
+    "status_counts",
+    "event_counts",
+    "workflow_counts",
+    "intent_counts",
+    "failure_hotspots",
+    "memory_prefixes",
+)
+
+
+def runtime_dimensions(record: dict[str, Any]) -> dict[str, Any]:
+    """runtime 레코드 하나를 집계 차원(status/event/hotspot/id/failure)으로 정규화한다.
+
+    `RuntimeAggregate` 와 runtime_store 압축이 같은 정규화를 쓰도록 한 곳에 둔다.
+    """
+    record_id = normalized_value(nested_get(record, RUNTIME_ID_KEYS))
+    prefix_match = RUNTIME_ID_PREFIX_RE.match(record_id) if record_id else None
+    dims: dict[str, Any] = {
+        "status": normalized_value(nested_get(record, ["status", "result.status", "metadata.status"])),
+        "event": normalized_value(nested_get(record, ["event_type", "type", "entry_type", "kind"])),
+        "record_id": record_id,
+        "id_prefix": prefix_match.group(1) if prefix_match else None,
+        "failure": is_failure_like(record),
+    }
+    for dimension, keys in RUNTIME_HOTSPOT_KEYS.items():
+        dims[dimension] = normalized_value(nested_get(record, keys))
+    return dims
+
+
+class RuntimeAggregate:
+    """Single-pass runtime JSONL 집계기.
+
+    레코드를 보관하지 않고 한 줄씩 Counter 에 누적한다. 메모리는 레코드 총량이 아니라
+    서로 다른 키(status/event/workflow/intent/id) 수에 비례한다. 파스 에러는 파일마다
+    리포트에 노출될 수 있는 앞쪽 위치만 보관한다. `to_state`/`from_state` 로 checkpoint 에
+    직렬화되어 다음 실행이 새로 덧붙은 줄만 병합한다.
+
+    record id 는 대부분 한 번만 나오므로(auditlog 는 줄마다 고유) `repeated_signals` 는 state 에
+    count > 1 인 id 만 남긴다. 한 번만 본 id 는 checkpoint 의 `seen` 테이블에 두고
+    `settle_signals` 가 이번 실행에 새로 센 id 만 조회·갱신한다.
+    """
+
+    def __init__(self) -> None:
+        self.record_counts: Counter[str] = Counter()
+        self.status_counts: Counter[str] = Counter()
+        self.event_counts: Counter[str] = Counter()
+        self.workflow_counts: Counter[str] = Counter()
+        self.intent_counts: Counter[str] = Counter()
+        self.failure_hotspots: Counter[str] = Counter()
+        self.repeated_signals: Counter[tuple[str, str]] = Counter()
+        # checkpoint 에서 불러온(이미 seen 과 맞춰진) repeated_signals 키
+        self.settled_signals: set[tuple[str, str]] = set()
+        self.memory_prefixes: Counter[str] = Counter()
+        self.parse_errors: dict[str, list[int]] = {}
+
+    def add(self, scope: str, record: dict[str, Any]) -> None:
+        self.record_counts[scope] += 1
+        if record.get("_parse_error"):
+            lines = self.parse_errors.setdefault(record["_path"], [])
+            if len(lines) < RUNTIME_PARSE_ERROR_LIMIT:
+                lines.append(record["_line"])
+            return
+
+        dims = runtime_dimensions(record)
+        if dims["status"]:
+            self.status_counts[f"{scope}:{dims['status']}"] += 1
+        if dims["event"]:
+            self.event_counts[f"{scope}:{dims['event']}"] += 1
+        if dims["workflow"]:
+            self.workflow_counts[dims["workflow"]] += 1
+        if dims["intent"]:
+            self.intent_counts[dims["intent"]] += 1
+        if dims["record_id"]:
+            self.repeated_signals[(scope, dims["record_id"])] += 1
+        if dims["id_prefix"]:
+            self.memory_prefixes[dims["id_prefix"]] += 1
+        if dims["failure"]:
+            hotspots = [f"{dimension}:{dims[dimension]}" for dimension in RUNTIME_HOTSPOT_KEYS if dims[dimension]]
+            for hotspot in hotspots or [f"{scope}:unknown"]:
+                self.failure_hotspots[hotspot] += 1
+
+    def add_file(self, scope: str, path: Path, offset: int = 0, line_number: int = 0) -> tuple[int, int]:
+        """`offset` 이후 줄을 누적하고 다음 실행이 이어 읽을 `(offset, line_number)` 를 돌려준다."""
+        for record, offset, line_number in iter_jsonl_tail(path, offset, line_number):
+            if record is not None:
+                self.add(scope, record)
+        return offset, line_number
+
+    def settle_signals(self, seen: sqlite3.Connection) -> None:
+        """이번 실행에 센 id 를 checkpoint 의 `seen`(한 번만 본 id) 과 합친다.
+
+        seen 에 있던 id 는 그 1회를 더하고 seen 에서 뺀다. 합계가 1 인 id 는 seen 으로 옮기고
+        Counter 에서 지운다 — 이후 `repeated_signals` 에는 count > 1 인 id 만 남는다.
+        비용은 새로 센 id 수에 비례한다.
+        """
+        fresh = [key for key in self.repeated_signals if key not in self.settled_signals]
+        singles = []
+        for key in fresh:
+            scope, value = key
+            if seen.execute("DELETE FROM seen WHERE scope = ? AND record_id = ?", (scope, value)).rowcount:
+                self.repeated_signals[key] += 1
+            if self.repeated_signals[key] == 1:
+                del self.repeated_signals[key]
+                singles.append(key)
+        seen.executemany("INSERT OR IGNORE INTO seen VALUES (?, ?)", singles)
+        self.settled_signals.update(self.repeated_signals)
+
+    def to_state(self) -> dict[str, Any]:
+        state: dict[str, Any] = {name: sorted(getattr(self, name).items()) for name in RUNTIME_COUNTERS}
+        state["repeated_signals"] = sorted(
+            [scope, value, count] for (scope, value), count in self.repeated_signals.items() if count > 1
+        )
+        state["parse_errors"] = self.parse_errors
+        return state
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> "RuntimeAggregate":
+        aggregate = cls()
+        for name in RUNTIME_COUNTERS:
+            getattr(aggregate, name).update({key: count for key, count in state[name]})
+        aggregate.repeated_signals.update({(scope, value): count for scope, value, count in state["repeated_signals"]})
+        aggregate.settled_signals = set(aggregate.repeated_signals)
+        aggregate.parse_errors = {path: list(lines) for path, lines in state["parse_errors"].items()}
+        return aggregate
+
+
+def runtime_checkpoint_path(root: Path) -> Path | None:
+    """runtime 분석 checkpoint 위치. `MSO_RUNTIME_CHECKPOINT=0` 이면 None (매번 전체 집계)."""
+    if os.environ.get("MSO_RUNTIME_CHECKPOINT", "1") == "0":
+        return None
+    override = os.environ.get("MSO_CACHE_DIR")
+    return (Path(override) if override else root / ".mso-cache") / RUNTIME_CHECKPOINT_NAME
+
+
+_RUNTIME_CHECKPOINT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS seen (
+    scope TEXT NOT NULL, record_id TEXT NOT NULL, PRIMARY KEY (scope, record_id)
+) WITHOUT ROWID;
+"""
+
+
+def open_runtime_checkpoint(path: Path) -> sqlite3.Connection | None:
+    """checkpoint DB (state JSON 1행 + 한 번만 본 id `seen` 테이블). 열 수 없으면 None."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        con = sqlite3.connect(str(path), timeout=30, isolation_level=None)
+        con.execute("PRAGMA journal_mode=WAL")
+        con.execute("PRAGMA synchronous=NORMAL")
+        con.executescript(_RUNTIME_CHECKPOINT_SCHEMA)
+    except (OSError, sqlite3.Error):
+        return None
+    return con
+
+
+def load_runtime_checkpoint(
+    con: sqlite3.Connection, root: Path, sources: dict[str, list[Path]]
+) -> tuple[RuntimeAggregate, dict[str, dict[str, Any]]] | None:
+    """이어 읽을 수 있는 checkpoint 면 `(aggregate, files)` 를, 아니면 None 을 돌려준다.
+
+    추적하던 파일이 사라졌거나 scope 가 바뀌었거나, inode 가 달라졌거나(교체),
+    크기가 읽은 offset 보다 작아졌으면(truncate) 누적 Counter 를 믿을 수 없으므로 전체 재집계한다.
+    rotate 로 봉인 구간이 된 파일(`follow_renames`)은 교체가 아니다.
+    """
+    try:
+        row = con.execute("SELECT value FROM meta WHERE key = 'state'").fetchone()
+        state = json.loads(row[0]) if row else None
+    except (sqlite3.Error, json.JSONDecodeError):
+        return None
+    if (
+        not isinstance(state, dict)
+        or state.get("version") != RUNTIME_CHECKPOINT_VERSION
+        or state.get("root") != str(root.resolve())
+    ):
+        return None
+    current = {str(p): scope for scope, paths in sources.items() for p in paths}
+    files = state.get("files") or {}
+    # turns.jsonl rotation — 봉인 구간으로 rename 된 파일은 그 경로에서 이어 읽는다.
+    renames = follow_renames(files, [Path(p) for p in current])
+    for old, new in renames.items():
+        files[new] = files.pop(old)
+    for file_path, entry in files.items():
+        if current.get(file_path) != entry.get("scope"):
+            return None
+        try:
+            stat = Path(file_path).stat()
+        except OSError:
+            return None
+        if stat.st_ino != entry.get("inode") or stat.st_size < entry.get("offset", 0):
+            return None
+    try:
+        aggregate = RuntimeAggregate.from_state(state["counters"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    for old, new in renames.items():
+        if old in aggregate.parse_errors:
+            aggregate.parse_errors[new] = aggregate.parse_errors.pop(old)
+    return aggregate, files
+
+
+def write_runtime_checkpoint(
+    con: sqlite3.Connection,
+    root: Path,
+    aggregate: RuntimeAggregate,
+    files: dict[str, dict[str, Any]],
+    resumed: bool,
+) -> None:
+    """`seen` 갱신과 state 기록을 한 transaction 으로 한다.
+
+    resumed 가 아니면(전체 재집계) `seen` 을 비우고 다시 채운다. 기록 실패는 rollback 하고
+    다음 실행의 재집계로 흡수한다 — 이번 리포트는 메모리의 Counter 로 그대로 만든다.
+    """
+    state = {
+        "version": RUNTIME_CHECKPOINT_VERSION,
+        "root": str(root.resolve()),
+        "files": files,
+    }
+    try:
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            if not resumed:
+                con.execute("DELETE FROM seen")
+            aggregate.settle_signals(con)
+            state["counters"] = aggregate.to_state()
+            con.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('state', ?)", (json.dumps(state, ensure_ascii=False),)
+            )
+            con.execute("COMMIT")
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+    except sqlite3.Error:
+        # checkpoint 는 가속용이다. 기록 실패는 다음 실행의 전체 재집계로 흡수한다.
+        pass
+
+
+def build_runtime_analysis(root: Path, checkpoint: Path | None = None) -> str:
+    """runtime JSONL 을 집계해 리포트를 만든다.
+
+    JSONL 소스는 append-only 이므로 checkpoint 의 파일별 offset 이후 덧붙은 줄만 읽어
+    저장된 Counter 에 병합한다. checkpoint 가 없으면 runtime_store 압축 구간에서 시작한다.
+    출력은 매번 전체 재집계한 결과와 같다.
+    """
     sources = discover_runtime_sources(root)
     source_counts = {scope: len(paths) for scope, paths in sources.items()}
-    records_by_scope: dict[str, list[dict[str, Any]]] = defaultdict(list)
-    parse_errors: list[dict[str, Any]] = []
-
-    for scope, paths in sources.items():
-        for path in paths:
-            for record in iter_jsonl(path):
-                if record.get("_parse_error"):
-                    parse_errors.append(record)
-                records_by_scope[scope].append(record)
-
-    status_counts: Counter[str] = Counter()
-    event_counts: Counter[str] = Counter()
-    workflow_counts: Counter[str] = Counter()
-    intent_counts: Counter[str] = Counter()
-    failure_hotspots: Counter[str] = Counter()
-    repeated_signals: Counter[tuple[str, str]] = Counter()
-    memory_prefixes: Counter[str] = Counter()
-
-    id_keys = ["id", "entry_id", "metadata.id", "run_id", "ticket_id", "intent_id"]
-    hotspot_keys = {
-        "workflow": ["workflow", "workflow_id", "metadata.workflow", "metadata.workflow_id"],
-        "phase": ["phase", "phase_id", "metadata.phase", "metadata.phase_id"],
-        "node": ["node", "node_id", "metadata.node", "metadata.node_id"],
-        "tool": ["tool", "tool_name", "tool.name", "metadata.tool", "command"],
-        "intent": ["intent_id", "intent.id", "metadata.intent_id"],
-    }
+    checkpoint = checkpoint or runtime_checkpoint_path(root)
+    con = open_runtime_checkpoint(checkpoint) if checkpoint else None
+    try:
+        resumed = load_runtime_checkpoint(con, root, sources) if con is not None else None
+        aggregate, files = resumed or (RuntimeAggregate(), {})
+        previous = json.dumps(files, sort_keys=True) if resumed else None
+        if resumed is None:
+            # 처음부터 집계할 때는 runtime_store 에 압축된 봉인 구간을 SQL 집계로 채우고 tail 만 읽는다.
+            # duckdb 를 끌어오므로 이 경로에서만 import 한다 (hook 의 no-op 실행은 비용을 내지 않는다).
+            try:
+                import runtime_store
+            except ImportError:  # pragma: no cover - duckdb 미설치 시 JSONL 만 읽는다
+                pass
+            else:
+                files = runtime_store.seed_runtime_analysis(runtime_store.store_path(root), aggregate, sources)
+
+        for scope, paths in sources.items():
+            for path in paths:
+                stat = path.stat()
+                entry = files.get(str(path), {})
+                offset, line_number = aggregate.add_file(scope, path, entry.get("offset", 0), entry.get("lines", 0))
+                files[str(path)] = {
+                    "scope": scope,
+                    "inode": stat.st_ino,
+                    "size": stat.st_size,
+                    "offset": offset,
+                    "lines": line_number,
+                }
+
+        # 이어 읽었는데 어느 파일의 offset·크기도 그대로면 기록할 것이 없다.
+        if con is not None and json.dumps(files, sort_keys=True) != previous:
+            write_runtime_checkpoint(con, root, aggregate, files, resumed is not None)
+    finally:
+        if con is not None:
+            con.close()
+    return render_runtime_analysis(source_counts, sources, aggregate)
 
-    for scope, records in records_by_scope.items():
-        for record in records:
-            status = normalized_value(nested_get(record, ["status", "result.status", "metadata.status"]))
-            event = normalized_value(nested_get(record, ["event_type", "type", "entry_type", "kind"]))
-            workflow = normalized_value(nested_get(record, hotspot_keys["workflow"]))
-            intent = normalized_value(nested_get(record, hotspot_keys["intent"]))
-
-            if status:
-                status_counts[f"{scope}:{status}"] += 1
-            if event:
-                event_counts[f"{scope}:{event}"] += 1
-            if workflow:
-                workflow_counts[workflow] += 1
-            if intent:
-                intent_counts[intent] += 1
-
-            record_id = normalized_value(nested_get(record, id_keys))
-            if record_id:
-                repeated_signals[(scope, record_id)] += 1
-                prefix_match = re.match(r"^([A-Z]{2})[-_]", record_id)
-                if prefix_match:
-                    memory_prefixes[prefix_match.group(1)] += 1
-
-            if is_failure_like(record):
-                for dimension, keys in hotspot_keys.items():
-                    value = normalized_value(nested_get(record, keys))
-                    if value:
-                        failure_hotspots[f"{dimension}:{value}"] += 1
-                if not any(normalized_value(nested_get(record, keys)) for keys in hotspot_keys.values()):
-                    failure_hotspots[f"{scope}:unknown"] += 1
+
+def render_runtime_analysis(
+    source_counts: dict[str, int], sources: dict[str, list[Path]], aggregate: RuntimeAggregate
+) -> str:
+    repeated_signals = aggregate.repeated_signals
+    failure_hotspots = aggregate.failure_hotspots
+    workflow_counts = aggregate.workflow_counts
+    intent_counts = aggregate.intent_counts
+    status_counts = aggregate.status_counts
+    event_counts = aggregate.event_counts
+    memory_prefixes = aggregate.memory_prefixes
 
     repeated_rows = [
         (dimension, value, count)
         for (dimension, value), count in repeated_signals.items()
         if count > 1
     ]
-    repeated_rows.sort(key=lambda item: item[2], reverse=True)
+    repeated_rows.sort(key=lambda item: (-item[2], item[0], item[1]))
 
     source_lines = "\n".join(f"- `{scope}`: {count} files" for scope, count in source_counts.items())
     record_lines = "\n".join(
-        f"- `{scope}`: {len(records)} records" for scope, records in sorted(records_by_scope.items())
+        f"- `{scope}`: {count} records" for scope, count in sorted(aggregate.record_counts.items())
     )
+    parse_errors = [
+        (str(path), line)
+        for paths in sources.values()
+        for path in paths
+        for line in aggregate.parse_errors.get(str(path), [])
+    ]
     parse_error_lines = "\n".join(
-        f"- `{error.get('_path')}` line {error.get('_line')}" for error in parse_errors[:10]
+        f"- `{path}` line {line}" for path, line in parse_errors[:RUNTIME_PARSE_ERROR_LIMIT]
     )
 
     return "\n".join(
@@ -1164,16 +1638,8 @@ def data_ref_for_locator(
             "location": normalized,
             "locator": normalized,
         }
-    prefix_ref: dict[str, str] | None = None
-    prefix_len = -1
-    for ref in data_registry.values():
-        ref_locator = ref.get("locator", "")
-        if not ref_locator:
-            continue
-        prefix = ref_locator if ref_locator.endswith("/") else f"{ref_locator}/"
-        if normalized.startswith(prefix) and len(prefix) > prefix_len:
-            prefix_ref = ref
-            prefix_len = len(prefix)
+    index = locator_index_for(data_registry)
+    prefix_ref = longest_prefix_ref(index, normalized)
     if prefix_ref:
         enriched = enrich_artifact_ref(prefix_ref, data_type=data_type, locator=normalized)
         return {
@@ -1189,17 +1655,7 @@ def data_ref_for_locator(
     # Suffix match: TTL may store module-relative paths (e.g. "data/") while
     # the index registers root-relative paths (e.g. "04.modules/.../data/").
     # Pick the longest registry locator that ends with the query locator.
-    suffix_ref: dict[str, str] | None = None
-    suffix_match_len = -1
-    for ref in data_registry.values():
-        ref_locator = ref.get("locator", "")
-        if not ref_locator:
-            continue
-        norm_ref = normalize_locator(ref_locator)
-        if norm_ref.endswith(normalized) and len(norm_ref) > len(normalized):
-            if len(norm_ref) > suffix_match_len:
-                suffix_ref = ref
-                suffix_match_len = len(norm_ref)
+    suffix_ref = longest_suffix_ref(index, normalized)
     if suffix_ref:
         enriched = enrich_artifact_ref(suffix_ref, data_type=data_type, locator=normalized)
         return {
@@ -1985,168 +2441,193 @@ def build_process_flow(
     )
 
 
-def build_workflow_topology(
-    graph: Graph,
-    scope: str | None = None,
-    data_registry: dict[str, dict[str, str]] | None = None,
-    view: str = "integrated",
-) -> str:
-    data_registry = data_registry or {}
-    stream_view_names = {"artifact-stream", "data-stream"}
-    display_view = "artifact-stream" if view == "data-stream" else view
-    intro = "> Generated from MSO workflow TTL. Edit the TTL source, then regenerate this view."
-    notes: list[str] = []
-    if scope:
-        intro = f"> `{display_view}` view for workflow scope `{scope}`. Generated from MSO workflow TTL."
-        if view in stream_view_names:
-            notes.append("> Artifact stream view: `artifact --consumes--> actor/tool --produces--> artifact` supply chain only.")
-        elif view == "workflow":
-            notes.append("> Workflow view: `((start)) --next--> node --next--> node --next--> ((end))` spine rendered from TTL control edges only.")
-        else:
-            notes.append("> Integrated view: artifact stream supply chain plus the derived task workflow spine.")
-    include_internal = scope is not None
-    show_data_stream = include_internal and view in {"integrated", *stream_view_names}
-    show_workflow_spine = include_internal and view in {"integrated", "workflow"}
-    lines: list[str] = [
-        intro,
-        *notes,
-        "",
-        "```mermaid",
-        "flowchart LR",
-    ]
-    declared: set[str] = set()
-    emitted_edges: set[str] = set()
-    emitted_styles: set[str] = set()
-    data_refs: dict[str, dict[str, str]] = {}
-
-    def declare(
-        term: URIRef,
-        prefix: str,
-        cls: str | None = None,
-        suffix: str = "",
-        shape: str = "rect",
-    ) -> str:
-        node_id = (
-            process_unit_mermaid_id(prefix, term)
-            if prefix == "workflow" and is_process_unit(graph, term)
-            else mermaid_id(prefix, term)
-        )
-        if node_id not in declared:
-            if prefix == "workflow" and is_process_unit(graph, term):
-                lines.append(f"  {mermaid_shape(node_id, mermaid_node_label(graph, term, suffix), shape)}")
-            else:
-                lines.append(f"  {mermaid_node(graph, term, prefix, suffix, shape)}")
-            if cls:
-                lines.append(f"  class {node_id} {cls}")
-                if cls == "decision":
-                    style_node(node_id, decision_style(term))
-            declared.add(node_id)
-        return node_id
+class ScopeTopology:
+    """scope 하나의 관측 모델 — integrated/workflow/artifact-stream view가 공유한다.
 
-    def declare_data(logical_id: str, label: str, artifact_type: str) -> str:
-        node_id = data_id(logical_id)
-        if node_id not in declared:
-            if artifact_type in MACHINE_NATIVE_ARTIFACTS:
-                shape = "database"
-            elif artifact_type == "media":
-                shape = "stadium"
-            elif artifact_type == "tool":
-                shape = "subroutine"
-            else:
-                shape = "document"
-            css_class = artifact_type
-            lines.append(f"  {mermaid_shape(node_id, label, shape)}")
-            lines.append(f"  class {node_id} {css_class}")
-            declared.add(node_id)
-        return node_id
+    process unit, scope 소속, 노드 타입, 제어 edge, 노드별 공급망 data ref를 한 번만
+    계산한다. `build_workflow_topology(..., topology=)`에 넘기면 같은 scope의 세 view가
+    그래프 재순회 없이 이 모델을 필터링해 렌더한다. 다른 도구도 import해 쓸 수 있다.
+    """
 
-    def task_tool_node_id(task: URIRef) -> str | None:
-        tool_value = first_literal(graph, task, WF.usesTool)
-        if not tool_value:
-            return None
-        ref = tool_data_ref(data_registry, tool_value)
-        if show_data_stream:
-            data_refs.setdefault(ref["id"], ref)
-            tool_node_id = declare_data(
-                ref["id"],
-                data_label(
-                    ref["data_type"],
-                    ref["location"],
-                    node_id=ref["id"],
-                    locator=ref["locator"],
-                    artifact_type=ref.get("artifact_type", "tool"),
-                ),
-                ref.get("artifact_type", "tool"),
-            )
-            data_node_ids.add(tool_node_id)
-            return tool_node_id
-        return data_id(ref["id"])
+    NODE_CLASSES = (
+        (WF.Step, "step"),
+        (WF.Decision, "decision"),
+        (WF.Eval, "eval"),
+        (WF.Event, "event"),
+        (WF.Group, "group"),
+    )
 
-    def edge(source_id: str, arrow: str, label: str, target_id: str) -> None:
-        label_part = f"|{mermaid_edge_label(label)}|" if label else ""
-        line = f"  {source_id} {arrow}{label_part} {target_id}"
-        if line not in emitted_edges:
-            lines.append(line)
-            emitted_edges.add(line)
+    def __init__(
+        self,
+        graph: Graph,
+        scope: str | None = None,
+        data_registry: dict[str, dict[str, str]] | None = None,
+    ) -> None:
+        self.graph = graph
+        self.scope = scope
+        self.data_registry = data_registry or {}
+        self._visual_kinds: dict[URIRef, tuple[str, str | None, str, str]] = {}
+        self._supply_chain: dict[URIRef, bool] = {}
+
+        all_units = process_units(graph)
+        self.phases = filter_scope(all_units, scope)
+        # Build node→scope reverse map: flat-URI nodes (e.g. node/cd-s-001) have no
+        # workflow-id segment, so workflow_scope() returns None for them.
+        # Infer scope from the scoped phase that owns the node via wf:hasNode.
+        self.node_to_scope: dict[URIRef, str] = {}
+        for _phase_uri in all_units:
+            _phase_scope = workflow_scope(_phase_uri)
+            if _phase_scope:
+                for _node_uri in graph.objects(_phase_uri, WF.hasNode):
+                    if isinstance(_node_uri, URIRef) and _node_uri not in self.node_to_scope:
+                        self.node_to_scope[_node_uri] = _phase_scope
+        self.modules = filter_scope(subjects_of_type(graph, WF.Module), scope)
+        self.milestones = filter_scope(subjects_of_type(graph, WF.Milestone), scope)
+
+        self.phase_nodes: dict[URIRef, list[URIRef]] = {}
+        self.typed_nodes: list[tuple[URIRef, str]] = []
+        self.process_nodes: list[URIRef] = []
+        self.control_edges: list[tuple[URIRef, str, str, URIRef]] = []
+        self.terminal_branch_edges: list[tuple[URIRef, str]] = []
+        self.control_incoming: set[URIRef] = set()
+        self.control_outgoing: set[URIRef] = set()
+        self.node_data: dict[URIRef, dict[str, Any]] = {}
+        if scope is None:
+            return  # repository-level view는 내부 노드를 그리지 않는다
+
+        for phase in self.phases:
+            self.phase_nodes[phase] = [
+                node
+                for node in sorted(graph.objects(phase, WF.hasNode), key=str)
+                if isinstance(node, URIRef) and self.in_scope(node)
+            ]
+        for cls, css_class in self.NODE_CLASSES:
+            for node in subjects_of_type(graph, cls):
+                if self.in_scope(node):
+                    self.typed_nodes.append((node, css_class))
+        # Use in_scope so flat-URI nodes inferred from wf:hasNode are included
+        self.process_nodes = [n for n in workflow_node_terms(graph) if self.in_scope(n)]
 
-    def style_node(node_id: str, style: str | None) -> None:
-        if not style:
-            return
-        line = f"  style {node_id} {style}"
-        if line not in emitted_styles:
-            lines.append(line)
-            emitted_styles.add(line)
+        branch_sources = sorted(
+            set(filter_scope(subjects_of_type(graph, WF.Decision), scope))
+            | set(filter_scope(subjects_of_type(graph, WF.Eval), scope)),
+            key=str,
+        )
+        for decision in branch_sources:
+            for branch in sorted(graph.objects(decision, WF.hasBranch), key=str):
+                if isinstance(branch, URIRef) and workflow_scope(branch) == scope:
+                    branch_label = self.decision_branch_label(decision, branch)
+                    has_target = False
+                    for target in sorted(graph.objects(branch, WF.gotoNode), key=str):
+                        if isinstance(target, URIRef) and workflow_scope(target) == scope:
+                            has_target = True
+                            self.control_edges.append((decision, "-.->", branch_label, target))
+                            self.control_incoming.add(target)
+                            self.control_outgoing.add(decision)
+                    if not has_target:
+                        self.terminal_branch_edges.append((decision, branch_label))
+                        self.control_outgoing.add(decision)
 
-    def declare_boundary(kind: str) -> str:
-        node_id = mermaid_id(f"boundary_{kind}", f"{scope}:{kind}")
-        if node_id not in declared:
-            lines.append(f"  {mermaid_shape(node_id, kind, 'circle')}")
-            lines.append(f"  class {node_id} boundary")
-            declared.add(node_id)
-        return node_id
+        for node in self.process_nodes:
+            branch_targets = {
+                target
+                for branch in graph.objects(node, WF.hasBranch)
+                if isinstance(branch, URIRef)
+                for target in graph.objects(branch, WF.gotoNode)
+                if isinstance(target, URIRef)
+            }
+            for target in sorted(graph.objects(node, WF.next), key=str):
+                if isinstance(target, URIRef) and self.in_scope(target):
+                    if target in branch_targets:
+                        continue
+                    self.control_edges.append((node, "-->", "next", target))
+                    self.control_incoming.add(target)
+                    self.control_outgoing.add(node)
+
+        for node in self.process_nodes:
+            self.node_data[node] = self._resolve_node_data(node)
+
+    def _resolve_node_data(self, node: URIRef) -> dict[str, Any]:
+        """노드의 tool / directory / deliverable / produces / consumes data ref (view 무관)."""
+        graph = self.graph
+        tool_value = first_literal(graph, node, WF.usesTool)
+        directories = []
+        for role, path, _, dir_artifact_type in directory_data_for_node(graph, node):
+            produces, consumes, label_suffix = data_edge_labels(role)
+            if not produces and not consumes:
+                continue
+            ref = apply_explicit_artifact_type(
+                data_ref_for_locator(self.data_registry, data_type="local_file", locator=path),
+                dir_artifact_type,
+            )
+            directories.append((produces, consumes, label_suffix, ref))
+        return {
+            "tool": tool_data_ref(self.data_registry, tool_value) if tool_value else None,
+            "directories": directories,
+            "deliverables": [
+                (deliverable, deliverable_data_ref(deliverable))
+                for deliverable, _ in deliverable_data_for_node(graph, node)
+            ],
+            "produces": [
+                artifact_node_data_ref(graph, artifact)
+                for artifact in graph.objects(node, WF.produces)
+                if isinstance(artifact, URIRef)
+            ],
+            "consumes": [
+                (label, artifact_node_data_ref(graph, artifact))
+                for pred, label in ((WF.consumes, "consumes"), (WF.check, "check"))
+                for artifact in graph.subjects(pred, node)
+                if isinstance(artifact, URIRef)
+            ],
+        }
 
-    def process_unit_id(term: URIRef) -> str:
-        return process_unit_mermaid_id("workflow", term)
+    def in_scope(self, term: URIRef) -> bool:
+        return workflow_scope(term) == self.scope or self.node_to_scope.get(term) == self.scope
 
-    def rendered_outgoing_targets(term: URIRef) -> set[str]:
+    def has_supply_chain(self, node: URIRef) -> bool:
+        if node not in self._supply_chain:
+            self._supply_chain[node] = has_supply_chain(self.graph, node)
+        return self._supply_chain[node]
+
+    def rendered_outgoing_targets(self, term: URIRef) -> set[str]:
         targets: set[str] = set()
-        for target in graph.objects(term, WF.next):
-            if isinstance(target, URIRef) and in_scope(target):
+        for target in self.graph.objects(term, WF.next):
+            if isinstance(target, URIRef) and self.in_scope(target):
                 targets.add(f"next:{target}")
-        for branch in graph.objects(term, WF.hasBranch):
+        for branch in self.graph.objects(term, WF.hasBranch):
             if isinstance(branch, URIRef):
-                for target in graph.objects(branch, WF.gotoNode):
-                    if isinstance(target, URIRef) and in_scope(target):
+                for target in self.graph.objects(branch, WF.gotoNode):
+                    if isinstance(target, URIRef) and self.in_scope(target):
                         targets.add(f"goto:{target}")
         return targets
 
-    def is_multi_outgoing_step(term: URIRef) -> bool:
+    def is_multi_outgoing_step(self, term: URIRef) -> bool:
         """Step 인데 제어 edge 2개 이상 — TTL 정본의 shape 결함 신호 (렌더는 위반 표기만)."""
-        if (term, RDF.type, WF.Step) not in graph:
+        if (term, RDF.type, WF.Step) not in self.graph:
             return False
-        targets = rendered_outgoing_targets(term)
+        targets = self.rendered_outgoing_targets(term)
         return len(targets) >= 2
 
-    def decision_style(term: URIRef) -> str | None:
-        subject = decision_subject(term)
+    def decision_style(self, term: URIRef) -> str | None:
+        subject = self.decision_subject(term)
         if subject == "user":
             return "fill:#ffedd5,stroke:#ea580c,color:#111827"
         if subject == "agent":
             return "fill:#dbeafe,stroke:#2563eb,color:#111827"
         return None
 
-    def decision_subject(term: URIRef) -> str | None:
-        explicit = (first_literal(graph, term, WF.decisionSubject) or "").strip().lower()
+    def decision_subject(self, term: URIRef) -> str | None:
+        explicit = (first_literal(self.graph, term, WF.decisionSubject) or "").strip().lower()
         if explicit in {"user", "agent"}:
             return explicit
-        legacy_judge = (first_literal(graph, term, WF.judge) or "").strip().upper()
+        legacy_judge = (first_literal(self.graph, term, WF.judge) or "").strip().upper()
         if legacy_judge in {"HITL", "HITLFE"}:
             return "user"
         if legacy_judge in {"HOTL", "HOOTL"}:
             return "agent"
         return None
 
-    def first_decision_criterion(term: URIRef) -> str | None:
+    def first_decision_criterion(self, term: URIRef) -> str | None:
         for predicate in (
             WF.decisionCriteria,
             WF.threshold,
@@ -2155,34 +2636,34 @@ def build_workflow_topology(
             WF.criteria,
             WF.description,
         ):
-            value = first_literal(graph, term, predicate)
+            value = first_literal(self.graph, term, predicate)
             if value:
                 return value
         return None
 
-    def decision_branch_label(decision: URIRef, branch: URIRef) -> str:
-        branch_condition = first_literal(graph, branch, WF.on)
+    def decision_branch_label(self, decision: URIRef, branch: URIRef) -> str:
+        branch_condition = first_literal(self.graph, branch, WF.on)
         label = f"on: {branch_condition}" if branch_condition else "goto"
-        if (decision, RDF.type, WF.Eval) in graph:
+        if (decision, RDF.type, WF.Eval) in self.graph:
             return mermaid_label(label, 56)
-        criterion = first_literal(graph, branch, WF.decisionCriteria) or first_literal(graph, branch, WF.criteria)
+        criterion = first_literal(self.graph, branch, WF.decisionCriteria) or first_literal(self.graph, branch, WF.criteria)
         if not criterion and branch_condition:
-            decision_criterion = first_decision_criterion(decision)
+            decision_criterion = self.first_decision_criterion(decision)
             if decision_criterion:
                 criterion = decision_criterion
         if criterion:
             label = f"{label} / {criterion}"
         return mermaid_label(label, 56)
 
-    def is_workflow_boundary_node(term: URIRef) -> bool:
+    def is_workflow_boundary_node(self, term: URIRef) -> bool:
         return (
-            (term, RDF.type, WF.Task) in graph
-            or (term, RDF.type, WF.Step) in graph
-            or (term, RDF.type, WF.Decision) in graph
-            or (term, RDF.type, WF.Event) in graph
+            (term, RDF.type, WF.Task) in self.graph
+            or (term, RDF.type, WF.Step) in self.graph
+            or (term, RDF.type, WF.Decision) in self.graph
+            or (term, RDF.type, WF.Event) in self.graph
         )
 
-    def visual_kind(term: URIRef) -> tuple[str, str | None, str, str]:
+    def _visual_kind(self, term: URIRef) -> tuple[str, str | None, str, str]:
         for rdf_type, css_class in (
             (WF.Step, "step"),
             (WF.Decision, "decision"),
@@ -2191,12 +2672,12 @@ def build_workflow_topology(
             (WF.Validation, "validation"),
             (WF.Group, "group"),
         ):
-            if (term, RDF.type, rdf_type) in graph:
+            if (term, RDF.type, rdf_type) in self.graph:
                 suffix = local_name(rdf_type)
-                status = first_literal(graph, term, WF.status)
+                status = first_literal(self.graph, term, WF.status)
                 if status:
                     suffix = f"{suffix} / {status}"
-                if rdf_type == WF.Step and is_multi_outgoing_step(term):
+                if rdf_type == WF.Step and self.is_multi_outgoing_step(term):
                     # 관측기는 TTL에 없는 타입을 창작하지 않는다. Step이 제어 edge를
                     # 2개 이상 가지면 Decision으로 승격해 그리지 않고 shape-violation으로
                     # 표기한다. 분기 모델링은 validate_abox.py 가 설계 게이트에서 경고한다.
@@ -2204,15 +2685,15 @@ def build_workflow_topology(
                     return "step", "shape_violation", suffix, "rect"
                 if rdf_type == WF.Decision:
                     shape = "hexagon"
-                    subject = decision_subject(term)
+                    subject = self.decision_subject(term)
                     if subject:
                         suffix = f"{suffix}{MERMAID_LINE_BREAK}subject: {subject}"
                 elif rdf_type == WF.Eval:
                     shape = "trapezoid"
-                    judge = first_literal(graph, term, WF.judge)
+                    judge = first_literal(self.graph, term, WF.judge)
                     oracle_subj = (
-                        first_literal(graph, term, WF.oracle)
-                        or first_literal(graph, term, WF.oracleType)
+                        first_literal(self.graph, term, WF.oracle)
+                        or first_literal(self.graph, term, WF.oracleType)
                     )
                     if not oracle_subj and judge:
                         judge_norm = judge.strip().upper()
@@ -2224,7 +2705,7 @@ def build_workflow_topology(
                         suffix = f"{suffix}{MERMAID_LINE_BREAK}oracle: {oracle_subj}"
                 elif rdf_type == WF.Event:
                     shape = "stadium"
-                    event_kind = first_literal(graph, term, WF.eventKind)
+                    event_kind = first_literal(self.graph, term, WF.eventKind)
                     if event_kind:
                         suffix = f"{suffix}{MERMAID_LINE_BREAK}kind: {event_kind}"
                 elif rdf_type == WF.Validation:
@@ -2234,24 +2715,142 @@ def build_workflow_topology(
                 return local_name(rdf_type).lower(), css_class, suffix, shape
         return "node", None, "", "rect"
 
-    phases = filter_scope(process_units(graph), scope)
+    def visual_kind(self, term: URIRef) -> tuple[str, str | None, str, str]:
+        if term not in self._visual_kinds:
+            self._visual_kinds[term] = self._visual_kind(term)
+        return self._visual_kinds[term]
+
+
+def build_workflow_topology(
+    graph: Graph,
+    scope: str | None = None,
+    data_registry: dict[str, dict[str, str]] | None = None,
+    view: str = "integrated",
+    topology: ScopeTopology | None = None,
+) -> str:
+    if topology is None:
+        topology = ScopeTopology(graph, scope, data_registry)
+    data_registry = topology.data_registry
+    in_scope = topology.in_scope
+    visual_kind = topology.visual_kind
+    decision_style = topology.decision_style
+    stream_view_names = {"artifact-stream", "data-stream"}
+    display_view = "artifact-stream" if view == "data-stream" else view
+    intro = "> Generated from MSO workflow TTL. Edit the TTL source, then regenerate this view."
+    notes: list[str] = []
+    if scope:
+        intro = f"> `{display_view}` view for workflow scope `{scope}`. Generated from MSO workflow TTL."
+        if view in stream_view_names:
+            notes.append("> Artifact stream view: `artifact --consumes--> actor/tool --produces--> artifact` supply chain only.")
+        elif view == "workflow":
+            notes.append("> Workflow view: `((start)) --next--> node --next--> node --next--> ((end))` spine rendered from TTL control edges only.")
+        else:
+            notes.append("> Integrated view: artifact stream supply chain plus the derived task workflow spine.")
+    include_internal = scope is not None
+    show_data_stream = include_internal and view in {"integrated", *stream_view_names}
+    show_workflow_spine = include_internal and view in {"integrated", "workflow"}
+    lines: list[str] = [
+        intro,
+        *notes,
+        "",
+        "```mermaid",
+        "flowchart LR",
+    ]
+    declared: set[str] = set()
+    emitted_edges: set[str] = set()
+    emitted_styles: set[str] = set()
+    data_refs: dict[str, dict[str, str]] = {}
+
+    def declare(
+        term: URIRef,
+        prefix: str,
+        cls: str | None = None,
+        suffix: str = "",
+        shape: str = "rect",
+    ) -> str:
+        node_id = (
+            process_unit_mermaid_id(prefix, term)
+            if prefix == "workflow" and is_process_unit(graph, term)
+            else mermaid_id(prefix, term)
+        )
+        if node_id not in declared:
+            if prefix == "workflow" and is_process_unit(graph, term):
+                lines.append(f"  {mermaid_shape(node_id, mermaid_node_label(graph, term, suffix), shape)}")
+            else:
+                lines.append(f"  {mermaid_node(graph, term, prefix, suffix, shape)}")
+            if cls:
+                lines.append(f"  class {node_id} {cls}")
+                if cls == "decision":
+                    style_node(node_id, decision_style(term))
+            declared.add(node_id)
+        return node_id
+
+    def declare_data(logical_id: str, label: str, artifact_type: str) -> str:
+        node_id = data_id(logical_id)
+        if node_id not in declared:
+            if artifact_type in MACHINE_NATIVE_ARTIFACTS:
+                shape = "database"
+            elif artifact_type == "media":
+                shape = "stadium"
+            elif artifact_type == "tool":
+                shape = "subroutine"
+            else:
+                shape = "document"
+            css_class = artifact_type
+            lines.append(f"  {mermaid_shape(node_id, label, shape)}")
+            lines.append(f"  class {node_id} {css_class}")
+            declared.add(node_id)
+        return node_id
 
-    # Build node→scope reverse map: flat-URI nodes (e.g. node/cd-s-001) have no
-    # workflow-id segment, so workflow_scope() returns None for them.
-    # Infer scope from the scoped phase that owns the node via wf:hasNode.
-    node_to_scope: dict[URIRef, str] = {}
-    for _phase_uri in process_units(graph):
-        _phase_scope = workflow_scope(_phase_uri)
-        if _phase_scope:
-            for _node_uri in graph.objects(_phase_uri, WF.hasNode):
-                if isinstance(_node_uri, URIRef) and _node_uri not in node_to_scope:
-                    node_to_scope[_node_uri] = _phase_scope
+    def task_tool_node_id(task: URIRef) -> str | None:
+        ref = topology.node_data[task]["tool"]
+        if ref is None:
+            return None
+        if show_data_stream:
+            data_refs.setdefault(ref["id"], ref)
+            tool_node_id = declare_data(
+                ref["id"],
+                data_label(
+                    ref["data_type"],
+                    ref["location"],
+                    node_id=ref["id"],
+                    locator=ref["locator"],
+                    artifact_type=ref.get("artifact_type", "tool"),
+                ),
+                ref.get("artifact_type", "tool"),
+            )
+            data_node_ids.add(tool_node_id)
+            return tool_node_id
+        return data_id(ref["id"])
 
-    def in_scope(term: URIRef) -> bool:
-        return workflow_scope(term) == scope or node_to_scope.get(term) == scope
+    def edge(source_id: str, arrow: str, label: str, target_id: str) -> None:
+        label_part = f"|{mermaid_edge_label(label)}|" if label else ""
+        line = f"  {source_id} {arrow}{label_part} {target_id}"
+        if line not in emitted_edges:
+            lines.append(line)
+            emitted_edges.add(line)
+
+    def style_node(node_id: str, style: str | None) -> None:
+        if not style:
+            return
+        line = f"  style {node_id} {style}"
+        if line not in emitted_styles:
+            lines.append(line)
+            emitted_styles.add(line)
+
+    def declare_boundary(kind: str) -> str:
+        node_id = mermaid_id(f"boundary_{kind}", f"{scope}:{kind}")
+        if node_id not in declared:
+            lines.append(f"  {mermaid_shape(node_id, kind, 'circle')}")
+            lines.append(f"  class {node_id} boundary")
+            declared.add(node_id)
+        return node_id
+
+    def process_unit_id(term: URIRef) -> str:
+        return process_unit_mermaid_id("workflow", term)
 
     if include_internal:
-        for phase in phases:
+        for phase in topology.phases:
             phase_id = process_unit_id(phase)
             status = first_literal(graph, phase, WF.status)
             if view in stream_view_names:
@@ -2266,73 +2865,61 @@ def build_workflow_topology(
                 lines.append(f'  subgraph {phase_id}["{label}"]')
                 lines.append("    direction LR")
                 declared.add(phase_id)
-                for node in sorted(graph.objects(phase, WF.hasNode), key=str):
-                    if isinstance(node, URIRef) and in_scope(node):
-                        if view in stream_view_names and not has_supply_chain(graph, node):
-                            continue  # 공급망 연결 없는 노드는 artifact-stream 뷰에서 제외
-                        node_prefix, node_cls, node_suffix, node_shape = visual_kind(node)
-                        if view in stream_view_names and node_cls not in {"decision", "eval"}:
-                            node_suffix = ""  # artifact-stream: label + id only, no type/status
-                        declare(node, node_prefix, node_cls, node_suffix, node_shape)
+                for node in topology.phase_nodes[phase]:
+                    if view in stream_view_names and not topology.has_supply_chain(node):
+                        continue  # 공급망 연결 없는 노드는 artifact-stream 뷰에서 제외
+                    node_prefix, node_cls, node_suffix, node_shape = visual_kind(node)
+                    if view in stream_view_names and node_cls not in {"decision", "eval"}:
+                        node_suffix = ""  # artifact-stream: label + id only, no type/status
+                    declare(node, node_prefix, node_cls, node_suffix, node_shape)
                 lines.append("  end")
     else:
-        for phase in phases:
+        for phase in topology.phases:
             status = first_literal(graph, phase, WF.status)
             phase_cls = f"status_{status}" if status in {"completed", "active", "pending"} else "workflow"
             suffix = f"Workflow / {status}" if status else "Workflow"
             declare(phase, "workflow", phase_cls, suffix)
 
     if include_internal:
-        node_classes = [
-            (WF.Step, "step"),
-            (WF.Decision, "decision"),
-            (WF.Eval, "eval"),
-            (WF.Event, "event"),
-            (WF.Group, "group"),
-        ]
-        for cls, css_class in node_classes:
-            for node in subjects_of_type(graph, cls):
-                if scope is not None and not in_scope(node):
-                    continue
-                status = first_literal(graph, node, WF.status)
-                if view in stream_view_names:
-                    if not has_supply_chain(graph, node):
-                        continue  # 공급망 연결 없는 노드는 artifact-stream 뷰에서 제외
-                    # artifact-stream: label only for ordinary nodes; eval gates
-                    # keep oracle metadata because it is routing signal.
-                    node_prefix, node_cls, node_suffix, node_shape = visual_kind(node)
-                    node_id = mermaid_id(node_prefix, node)
-                    if node_id not in declared:
-                        _lbl = preferred_label(graph, node) or display_id(node)
-                        if node_cls in {"decision", "eval"}:
-                            _lbl_short = mermaid_node_label(graph, node, node_suffix)
-                        else:
-                            _lbl_short = f"{mermaid_label(_lbl, 52)}{MERMAID_LINE_BREAK}id: {display_id(node)}"
-                        lines.append(f"  {mermaid_shape(node_id, _lbl_short, node_shape)}")
-                        node_class = node_cls or css_class
-                        lines.append(f"  class {node_id} {node_class}")
-                        if node_class == "decision":
-                            style_node(node_id, decision_style(node))
-                        declared.add(node_id)
-                else:
-                    node_prefix, node_cls, node_suffix, node_shape = visual_kind(node)
-                    declare(node, node_prefix, node_cls or css_class, node_suffix, node_shape)
+        for node, css_class in topology.typed_nodes:
+            status = first_literal(graph, node, WF.status)
+            if view in stream_view_names:
+                if not topology.has_supply_chain(node):
+                    continue  # 공급망 연결 없는 노드는 artifact-stream 뷰에서 제외
+                # artifact-stream: label only for ordinary nodes; eval gates
+                # keep oracle metadata because it is routing signal.
+                node_prefix, node_cls, node_suffix, node_shape = visual_kind(node)
+                node_id = mermaid_id(node_prefix, node)
+                if node_id not in declared:
+                    _lbl = preferred_label(graph, node) or display_id(node)
+                    if node_cls in {"decision", "eval"}:
+                        _lbl_short = mermaid_node_label(graph, node, node_suffix)
+                    else:
+                        _lbl_short = f"{mermaid_label(_lbl, 52)}{MERMAID_LINE_BREAK}id: {display_id(node)}"
+                    lines.append(f"  {mermaid_shape(node_id, _lbl_short, node_shape)}")
+                    node_class = node_cls or css_class
+                    lines.append(f"  class {node_id} {node_class}")
+                    if node_class == "decision":
+                        style_node(node_id, decision_style(node))
+                    declared.add(node_id)
+            else:
+                node_prefix, node_cls, node_suffix, node_shape = visual_kind(node)
+                declare(node, node_prefix, node_cls or css_class, node_suffix, node_shape)
 
-    for module in filter_scope(subjects_of_type(graph, WF.Module), scope):
+    for module in topology.modules:
         declare(module, "module", "module", "Module")
 
-    for milestone in filter_scope(subjects_of_type(graph, WF.Milestone), scope):
+    for milestone in topology.milestones:
         status = first_literal(graph, milestone, WF.status)
         suffix = f"Milestone / {status}" if status else "Milestone"
         declare(milestone, "milestone", "milestone", suffix)
 
     if include_internal:
-        # Use in_scope so flat-URI nodes inferred from wf:hasNode are included
-        process_nodes = [n for n in workflow_node_terms(graph) if in_scope(n)]
-        control_edges: list[tuple[URIRef, str, str, URIRef]] = []
-        terminal_branch_edges: list[tuple[URIRef, str]] = []
-        control_incoming: set[URIRef] = set()
-        control_outgoing: set[URIRef] = set()
+        process_nodes = topology.process_nodes
+        control_edges = topology.control_edges
+        terminal_branch_edges = topology.terminal_branch_edges
+        control_incoming = topology.control_incoming
+        control_outgoing = topology.control_outgoing
         data_node_ids: set[str] = set()
         produced_data_node_ids: set[str] = set()
         consumed_data_node_ids: set[str] = set()
@@ -2340,42 +2927,6 @@ def build_workflow_topology(
         data_producers: dict[str, set[URIRef]] = {}
         data_consumers: dict[str, set[URIRef]] = {}
 
-        branch_sources = sorted(
-            set(filter_scope(subjects_of_type(graph, WF.Decision), scope))
-            | set(filter_scope(subjects_of_type(graph, WF.Eval), scope)),
-            key=str,
-        )
-        for decision in branch_sources:
-            for branch in sorted(graph.objects(decision, WF.hasBranch), key=str):
-                if isinstance(branch, URIRef) and workflow_scope(branch) == scope:
-                    branch_label = decision_branch_label(decision, branch)
-                    has_target = False
-                    for target in sorted(graph.objects(branch, WF.gotoNode), key=str):
-                        if isinstance(target, URIRef) and workflow_scope(target) == scope:
-                            has_target = True
-                            control_edges.append((decision, "-.->", branch_label, target))
-                            control_incoming.add(target)
-                            control_outgoing.add(decision)
-                    if not has_target:
-                        terminal_branch_edges.append((decision, branch_label))
-                        control_outgoing.add(decision)
-
-        for node in process_nodes:
-            branch_targets = {
-                target
-                for branch in graph.objects(node, WF.hasBranch)
-                if isinstance(branch, URIRef)
-                for target in graph.objects(branch, WF.gotoNode)
-                if isinstance(target, URIRef)
-            }
-            for target in sorted(graph.objects(node, WF.next), key=str):
-                if isinstance(target, URIRef) and in_scope(target):
-                    if target in branch_targets:
-                        continue
-                    control_edges.append((node, "-->", "next", target))
-                    control_incoming.add(target)
-                    control_outgoing.add(node)
-
         if show_workflow_spine:
             for source, arrow, label, target in control_edges:
                 if arrow not in ("-.->",) and label not in ("next",):  # decision branch / workflow next
@@ -2387,19 +2938,13 @@ def build_workflow_topology(
                 edge(source_id, arrow, label, target_id)
 
         for node in process_nodes:
-            if view in stream_view_names and not has_supply_chain(graph, node):
+            if view in stream_view_names and not topology.has_supply_chain(node):
                 continue  # artifact-stream: 공급망 없는 노드 선언 제외
             source_prefix, source_cls, source_suffix, source_shape = visual_kind(node)
             source_id = declare(node, source_prefix, source_cls, source_suffix, source_shape)
             stream_actor_id = task_tool_node_id(node) or source_id
-            for role, path, _, dir_artifact_type in directory_data_for_node(graph, node):
-                produces, consumes, label_suffix = data_edge_labels(role)
-                if not produces and not consumes:
-                    continue
-                ref = apply_explicit_artifact_type(
-                data_ref_for_locator(data_registry, data_type="local_file", locator=path),
-                dir_artifact_type,
-            )
+            node_data = topology.node_data[node]
+            for produces, consumes, label_suffix, ref in node_data["directories"]:
                 if show_data_stream:
                     data_refs.setdefault(ref["id"], ref)
                     artifact_type = ref.get("artifact_type", "document")
@@ -2428,8 +2973,7 @@ def build_workflow_topology(
                     if show_data_stream:
                         edge(data_node_id, "-.->", f"consumes{label_suffix}", stream_actor_id)
 
-            for deliverable, _ in deliverable_data_for_node(graph, node):
-                ref = deliverable_data_ref(deliverable)
+            for deliverable, ref in node_data["deliverables"]:
                 if show_data_stream:
                     data_refs.setdefault(ref["id"], ref)
                     artifact_type = ref.get("artifact_type", "document")
@@ -2453,10 +2997,7 @@ def build_workflow_topology(
                 if show_data_stream:
                     edge(stream_actor_id, "-.->", "produces", data_node_id)
 
-            for artifact in graph.objects(node, WF.produces):
-                if not isinstance(artifact, URIRef):
-                    continue
-                ref = artifact_node_data_ref(graph, artifact)
+            for ref in node_data["produces"]:
                 if show_data_stream:
                     data_refs.setdefault(ref["id"], ref)
                     artifact_type = ref.get("artifact_type", "document")
@@ -2480,33 +3021,29 @@ def build_workflow_topology(
                 if show_data_stream:
                     edge(stream_actor_id, "-.->", "produces", data_node_id)
 
-            for pred, label in ((WF.consumes, "consumes"), (WF.check, "check")):
-                for artifact in graph.subjects(pred, node):
-                    if not isinstance(artifact, URIRef):
-                        continue
-                    ref = artifact_node_data_ref(graph, artifact)
-                    if show_data_stream:
-                        data_refs.setdefault(ref["id"], ref)
-                        artifact_type = ref.get("artifact_type", "document")
-                        data_node_id = declare_data(
-                            ref["id"],
-                            data_label(
-                                ref["data_type"],
-                                ref["location"],
-                                detail=ref.get("detail"),
-                                node_id=ref["id"],
-                                locator=ref["locator"],
-                                artifact_type=artifact_type,
-                            ),
-                            artifact_type,
-                        )
-                    else:
-                        data_node_id = data_id(ref["id"])
-                    data_node_ids.add(data_node_id)
-                    consumed_data_node_ids.add(data_node_id)
-                    data_consumers.setdefault(data_node_id, set()).add(node)
-                    if show_data_stream:
-                        edge(data_node_id, "-.->", label, stream_actor_id)
+            for label, ref in node_data["consumes"]:
+                if show_data_stream:
+                    data_refs.setdefault(ref["id"], ref)
+                    artifact_type = ref.get("artifact_type", "document")
+                    data_node_id = declare_data(
+                        ref["id"],
+                        data_label(
+                            ref["data_type"],
+                            ref["location"],
+                            detail=ref.get("detail"),
+                            node_id=ref["id"],
+                            locator=ref["locator"],
+                            artifact_type=artifact_type,
+                        ),
+                        artifact_type,
+                    )
+                else:
+                    data_node_id = data_id(ref["id"])
+                data_node_ids.add(data_node_id)
+                consumed_data_node_ids.add(data_node_id)
+                data_consumers.setdefault(data_node_id, set()).add(node)
+                if show_data_stream:
+                    edge(data_node_id, "-.->", label, stream_actor_id)
 
         if show_workflow_spine and process_nodes:
             start_id = declare_boundary("start")
@@ -2518,7 +3055,7 @@ def build_workflow_topology(
             else:
                 rendered_sources = set()
                 rendered_targets = set()
-            boundary_nodes = {node for node in process_nodes if is_workflow_boundary_node(node)}
+            boundary_nodes = {node for node in process_nodes if topology.is_workflow_boundary_node(node)}
             rendered_sources.update(
                 node for node in boundary_nodes
                 if any(isinstance(target, URIRef) and in_scope(target) for target in graph.objects(node, WF.evolves))
@@ -2783,14 +3320,14 @@ def build_workflow_topology(
         # next/on:. Eval lifecycle and tool delegation edges above remain visible
         # because they explain artifact validation and revision flow.
 
-    for module in filter_scope(subjects_of_type(graph, WF.Module), scope):
+    for module in topology.modules:
         module_id = declare(module, "module")
         for dep in sorted(graph.objects(module, WF.criticalDep), key=str):
             if isinstance(dep, URIRef) and (scope is None or workflow_scope(dep) == scope):
                 dep_id = declare(dep, "module")
                 edge(dep_id, "-->", "criticalDep", module_id)
 
-    for milestone in filter_scope(subjects_of_type(graph, WF.Milestone), scope):
+    for milestone in topology.milestones:
         milestone_id = declare(milestone, "milestone")
         phase = graph.value(milestone, WF.milestoneOf)
         if isinstance(phase, URIRef) and (scope is None or workflow_scope(phase) == scope):
@@ -3041,8 +3578,12 @@ def build_readme(workflow_dir: Path, ttl_paths: list[Path], output_dir: Path) ->
     )
 
 
-def clean_generated_graph_views(output_dir: Path) -> None:
-    """Remove old generated graph files/directories before writing the current layout."""
+def clean_generated_graph_views(output_dir: Path, keep: Iterable[str] = ()) -> None:
+    """Remove old generated graph files/directories before writing the current layout.
+
+    `keep` names scope directories that an incremental run leaves in place.
+    """
+    keep = set(keep)
     legacy_files = {
         "workflow-topology.md",
         "process-map.md",
@@ -3061,6 +3602,8 @@ def clean_generated_graph_views(output_dir: Path) -> None:
         return
     for child in output_dir.iterdir():
         if child.is_dir():
+            if child.name in keep and child.name not in legacy_dirs:
+                continue
             if child.name in legacy_dirs or (
                 (child / "repository-graph.md").exists()
                 or (child / "workflow-graph.md").exists()
@@ -3072,15 +3615,108 @@ def clean_generated_graph_views(output_dir: Path) -> None:
             child.unlink()
 
 
-def main() -> int:
-    args = parse_args()
+def renderer_digest() -> str:
+    """Renderer 코드가 바뀌면 모든 출력 fingerprint가 무효화된다."""
+    script_dir = Path(__file__).resolve().parent
+    return json_digest(
+        [file_digest(script_dir / name) for name in ("observe_graph.py", "observe_v07.py")]
+    )
+
+
+def runtime_sources_digest(root: Path) -> str:
+    return json_digest(
+        {
+            scope: [(str(path), path.stat().st_size, path.stat().st_mtime_ns) for path in paths]
+            for scope, paths in discover_runtime_sources(root).items()
+        }
+    )
+
+
+def load_manifest(output_dir: Path) -> dict[str, Any]:
+    path = output_dir / MANIFEST_NAME
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def write_manifest(output_dir: Path, manifest: dict[str, Any]) -> None:
+    path = output_dir / MANIFEST_NAME
+    path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+# --jobs: scope 단위 process pool 렌더. worker는 initializer에서 TTL 입력을 한 번
+# 적재해(graph_cache warm hit) 전역으로 들고 있고, task에는 scope/view 식별자만 넘긴다.
+# Graph를 task마다 pickle하지 않는다. 같은 파일을 같은 순서로 적재하므로 그래프 순회
+# 순서가 부모와 같고, 렌더 결과도 serial 실행과 byte 동일하다.
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _init_render_worker(ttl_paths: list[str], data_registry: dict[str, dict[str, str]]) -> None:
+    _WORKER_STATE["graph"] = parse_graph(Path(path) for path in ttl_paths)
+    _WORKER_STATE["data_registry"] = DataRegistry(data_registry)  # locator 색인은 worker별로 1회 생성
+
+
+def render_scope_views(
+    graph: Graph,
+    data_registry: dict[str, dict[str, str]],
+    tasks: list[tuple],
+) -> list[str]:
+    """scope 하나의 view들을 렌더한다. task = ("v07", workflow, scope, view) | ("v06", scope, view)."""
+    topology: ScopeTopology | None = None
+    bodies: list[str] = []
+    for task in tasks:
+        if task[0] == "v07":
+            _, workflow, scope, view = task
+            bodies.append(observe_v07.build_view(graph, workflow, scope, view))
+        else:
+            _, scope, view = task
+            if topology is None:
+                topology = ScopeTopology(graph, scope, data_registry)
+            bodies.append(build_workflow_topology(graph, scope=scope, view=view, topology=topology))
+    return bodies
+
+
+def _render_scope_worker(tasks: list[tuple]) -> list[str]:
+    return render_scope_views(_WORKER_STATE["graph"], _WORKER_STATE["data_registry"], tasks)
+
+
+def render_scopes_parallel(
+    groups: dict[str, list[tuple[Path, str, tuple]]],
+    ttl_paths: list[Path],
+    data_registry: dict[str, dict[str, str]],
+    jobs: int,
+) -> None:
+    """scope별 렌더 묶음을 process pool로 돌리고, 결과는 serial 순서대로 기록한다."""
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(groups)),
+        initializer=_init_render_worker,
+        initargs=([str(path) for path in ttl_paths], dict(data_registry)),
+    ) as pool:
+        futures = [
+            (entries, pool.submit(_render_scope_worker, [task for _, _, task in entries]))
+            for entries in groups.values()
+        ]
+        for entries, future in futures:
+            for (path, title, _), body in zip(entries, future.result()):
+                write_markdown(path, title, body)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
     workflow_dir, output_dir, ttl_paths = resolve_paths(args)
     project_ttl_paths = [path for path in ttl_paths if is_workflow_abox(path)]
     if not project_ttl_paths:
         print("No TTL files found. Point --workflow-dir or --ontology at workflow TTL files.", file=sys.stderr)
         return 2
 
-    graph = parse_graph(ttl_paths)
+    # 증분 모드: 이전 manifest의 출력 fingerprint와 같으면 렌더를 건너뛴다.
+    # 전체 모드도 manifest를 갱신해 다음 증분 실행이 현재 출력 상태를 신뢰할 수 있게 한다.
+    previous = load_manifest(output_dir) if args.incremental else {}
+    graph, sources = parse_sources(ttl_paths, previous.get("sources"))
     data_registry = load_data_registry(args.root.resolve())
     output_dir.mkdir(parents=True, exist_ok=True)
     # 디렉토리 규약 (2026-07-02): observability/* = 분석 리포트, observability/graph/* =
@@ -3095,8 +3731,6 @@ def main() -> int:
             stale_path = output_dir / stale
             if stale_path.exists():
                 stale_path.unlink()
-    clean_generated_graph_views(output_dir)
-    ssot_report, legacy_yaml_count = build_workflow_ssot_report(workflow_dir, graph)
 
     # v0.7 Rail/Stream native 렌더 (A-phase): workflowType이 선언된 workflow는
     # observe_v07이 Rail/Stream을 직접 순회해 렌더하고, 같은 scope의 v0.6 경로는
@@ -3104,64 +3738,149 @@ def main() -> int:
     # 더 이상 필요하지 않다.
     v07_map = observe_v07.v07_workflows(graph)
     v07_scopes = set(v07_map.values())
+    v06_scopes = [scope for scope in workflow_scopes(graph) if scope not in v07_scopes]
+    clean_generated_graph_views(
+        output_dir,
+        keep={scope_dir_name(scope) for scope in (*v07_scopes, *v06_scopes)} if args.incremental else (),
+    )
+    ssot_report, legacy_yaml_count = build_workflow_ssot_report(workflow_dir, graph)
+
+    shared_inputs = {
+        "renderer": renderer_digest(),
+        "data_registry": json_digest(data_registry),
+    }
+    graph_fingerprint = json_digest({"sources": sources, **shared_inputs})
+
+    def scope_fingerprint(scope: str, kind: str) -> str:
+        inputs = sorted(
+            (path, entry["sha256"])
+            for path, entry in sources.items()
+            if not entry["scopes"] or scope in entry["scopes"]
+        )
+        return json_digest({"scope": scope, "kind": kind, "inputs": inputs, **shared_inputs})
+
+    previous_outputs: dict[str, str] = previous.get("outputs") or {}
+    outputs: dict[str, str] = {}
+    rendered = 0
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    scope_groups: dict[str, list[tuple[Path, str, tuple]]] = {}  # --jobs: scope → 보류된 렌더
+
+    def emit(path: Path, title: str, fingerprint: str, render, task: tuple | None = None) -> None:
+        nonlocal rendered
+        key = rel_path(path, report_dir)
+        outputs[key] = fingerprint
+        if args.incremental and previous_outputs.get(key) == fingerprint and path.exists():
+            return
+        rendered += 1
+        if task is not None and jobs > 1:
+            scope_groups.setdefault(task[-2], []).append((path, title, task))
+            return
+        write_markdown(path, title, render())
+
     for wf_uri, v07_scope in sorted(v07_map.items(), key=lambda kv: kv[1]):
         flow_dir = output_dir / scope_dir_name(v07_scope)
+        fingerprint = scope_fingerprint(v07_scope, "v07")
         for view, filename, view_title in (
             ("repository", "repository-graph.md", "Repository Graph"),
             ("execution-rail", "execution-rail.md", "Execution Rail"),
             ("artifact-stream", "artifact-stream-graph.md", "Artifact Stream Graph"),
         ):
-            write_markdown(
+            emit(
                 flow_dir / filename,
                 f"MSO {view_title} — {scope_label(v07_scope)} (v0.7)",
-                observe_v07.build_view(graph, wf_uri, v07_scope, view),
+                fingerprint,
+                lambda view=view: observe_v07.build_view(graph, wf_uri, v07_scope, view),
+                task=("v07", wf_uri, v07_scope, view),
             )
 
-    subgraph_index = build_workflow_subgraph_index(graph, data_registry=data_registry)
-    if v07_map:
-        v07_lines = "\n".join(
-            f"- `{scope_dir_name(scope)}/` — v0.7 Rail/Stream native ({scope_label(scope)})"
-            for scope in sorted(v07_scopes)
-        )
-        subgraph_index += f"\n\n## v0.7 Rail/Stream Scopes (native)\n\n{v07_lines}\n"
-    write_markdown(output_dir / "workflow-subgraph-index.md", "MSO Workflow Sub-Graph Index", subgraph_index)
-    artifact_report = build_artifact_stream_report(graph, data_registry=data_registry)
-    write_markdown(report_dir / "artifact-stream-report.md", "MSO Artifact Stream Report", artifact_report)
+    def subgraph_index() -> str:
+        body = build_workflow_subgraph_index(graph, data_registry=data_registry)
+        if v07_map:
+            v07_lines = "\n".join(
+                f"- `{scope_dir_name(scope)}/` — v0.7 Rail/Stream native ({scope_label(scope)})"
+                for scope in sorted(v07_scopes)
+            )
+            body += f"\n\n## v0.7 Rail/Stream Scopes (native)\n\n{v07_lines}\n"
+        return body
+
+    emit(output_dir / "workflow-subgraph-index.md", "MSO Workflow Sub-Graph Index", graph_fingerprint, subgraph_index)
+    emit(
+        report_dir / "artifact-stream-report.md",
+        "MSO Artifact Stream Report",
+        graph_fingerprint,
+        lambda: build_artifact_stream_report(graph, data_registry=data_registry),
+    )
     # v0.6.0 oracle layer view (SPEC §3.3 축 A): evolves/exercises/has_subWorkflow/target
     # edge-필터. workflow 간 self-improvement 관계라 scope 무관(전체 graph).
-    write_markdown(output_dir / "oracle-graph.md", "MSO Oracle Graph (self-improvement layer)", build_oracle_view(graph))
-    for scope in workflow_scopes(graph):
-        if scope in v07_scopes:
-            continue  # v0.7 native 출력이 우선한다
+    emit(
+        output_dir / "oracle-graph.md",
+        "MSO Oracle Graph (self-improvement layer)",
+        graph_fingerprint,
+        lambda: build_oracle_view(graph),
+    )
+    topologies: dict[str, ScopeTopology] = {}
+
+    def render_v06_view(scope: str, view: str) -> str:
+        # 같은 scope의 세 view가 ScopeTopology 하나를 공유한다 (렌더가 필요할 때만 생성).
+        if scope not in topologies:
+            topologies[scope] = ScopeTopology(graph, scope, data_registry)
+        return build_workflow_topology(graph, scope=scope, view=view, topology=topologies[scope])
+
+    for scope in v06_scopes:  # v0.7 native 출력이 우선한다
         flow_dir = output_dir / scope_dir_name(scope)
-        write_markdown(
-            flow_dir / "repository-graph.md",
-            f"MSO Repository Graph — {scope_label(scope)}",
-            build_workflow_topology(graph, scope=scope, data_registry=data_registry, view="integrated"),
-        )
-        write_markdown(
-            flow_dir / "execution-rail.md",
-            f"MSO Execution Rail — {scope_label(scope)}",
-            build_workflow_topology(graph, scope=scope, data_registry=data_registry, view="workflow"),
-        )
-        artifact_stream_view = build_workflow_topology(
-            graph,
-            scope=scope,
-            data_registry=data_registry,
-            view="artifact-stream",
-        )
-        write_markdown(
-            flow_dir / "artifact-stream-graph.md",
-            f"MSO Artifact Stream Graph — {scope_label(scope)}",
-            artifact_stream_view,
-        )
-    write_markdown(report_dir / "workflow-ssot-report.md", "MSO Workflow SSOT Report", ssot_report)
-    write_markdown(output_dir / "class-layer-map.md", "MSO Workflow Class Layer Map", build_class_layer_map(graph))
-    write_markdown(output_dir / "property-map.md", "MSO Workflow Property Map", build_property_map(graph))
-    write_markdown(report_dir / "runtime-analysis.md", "MSO Runtime Graph Analysis", build_runtime_analysis(args.root.resolve()))
-    write_markdown(output_dir / "README.md", "MSO Graph Observability Views", build_readme(workflow_dir, ttl_paths, output_dir))
+        fingerprint = scope_fingerprint(scope, "v06")
+        for view, filename, view_title in (
+            ("integrated", "repository-graph.md", "Repository Graph"),
+            ("workflow", "execution-rail.md", "Execution Rail"),
+            ("artifact-stream", "artifact-stream-graph.md", "Artifact Stream Graph"),
+        ):
+            emit(
+                flow_dir / filename,
+                f"MSO {view_title} — {scope_label(scope)}",
+                fingerprint,
+                lambda scope=scope, view=view: render_v06_view(scope, view),
+                task=("v06", scope, view),
+            )
+        topologies.pop(scope, None)
+    if scope_groups:
+        render_scopes_parallel(scope_groups, ttl_paths, data_registry, jobs)
+    emit(
+        report_dir / "workflow-ssot-report.md",
+        "MSO Workflow SSOT Report",
+        json_digest(ssot_report),
+        lambda: ssot_report,
+    )
+    emit(
+        output_dir / "class-layer-map.md",
+        "MSO Workflow Class Layer Map",
+        graph_fingerprint,
+        lambda: build_class_layer_map(graph),
+    )
+    emit(output_dir / "property-map.md", "MSO Workflow Property Map", graph_fingerprint, lambda: build_property_map(graph))
+    emit(
+        report_dir / "runtime-analysis.md",
+        "MSO Runtime Graph Analysis",
+        runtime_sources_digest(args.root.resolve()),
+        lambda: build_runtime_analysis(args.root.resolve()),
+    )
+    emit(
+        output_dir / "README.md",
+        "MSO Graph Observability Views",
+        json_digest([graph_fingerprint, str(workflow_dir), str(output_dir)]),
+        lambda: build_readme(workflow_dir, ttl_paths, output_dir),
+    )
+    write_manifest(
+        output_dir,
+        {"version": MANIFEST_VERSION, "sources": sources, "outputs": outputs},
+    )
 
-    print(f"Wrote graph observability views to {output_dir}")
+    if args.incremental:
+        print(
+            f"Wrote graph observability views to {output_dir} "
+            f"({rendered} rendered, {len(outputs) - rendered} unchanged)"
+        )
+    else:
+        print(f"Wrote graph observability views to {output_dir}")
     if legacy_yaml_count:
         print(
             f"WARNING: {legacy_yaml_count} legacy workflow YAML file/reference item(s) remain after TTL migration. Remove files after verifying sibling *.abox.ttl and replace YAML refs inside TTL. See workflow-ssot-report.md.",
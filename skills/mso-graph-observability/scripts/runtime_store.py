@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""runtime_store — 봉인된 runtime JSONL 을 DuckDB 컬럼 저장소로 압축한다.
+
+auditlog(`AU-YYYY-MM-DD.jsonl`)·worklog·`turns.jsonl` 은 append-only 라 오늘(UTC) 이전
+줄은 다시 바뀌지 않는다. `compact` 는 그 봉인된 구간을 `.mso-cache/runtime.duckdb` 로 옮긴다.
+
+  runtime_sources  파일별 (inode, size, offset, lines) — 압축이 끝난 byte 위치
+  runtime_records  observe_graph.runtime_dimensions 로 정규화한 집계 차원 + ts/day
+  turns            IntentTurn 컬럼 (mso-intent-analytics turn_writer 계약)
+
+독자는 저장소 + offset 이후 live tail 만 읽는다.
+
+  - observe_graph.build_runtime_analysis — checkpoint 없이 집계할 때 Counter 를 SQL 집계로 seed
+  - mso-conversation-analytics transitions.load_turns — `turns` 테이블 + tail
+
+봉인 기준: 파일 mtime 이 오늘 이전이면 파일 전체, 아니면 `timestamp`/`created_at` 이 오늘인
+첫 줄 직전까지. 파일이 교체(inode 변경)되거나 offset 보다 작아지면 해당 파일 행을 지우고
+처음부터 다시 압축한다. 단 turn_writer rotation 으로 `turns.<stamp>.jsonl` 봉인 구간이 된
+파일은 교체가 아니다 — 행을 그 경로로 옮기고 offset 이후만 이어 압축한다. 저장소는 파생 캐시다 — 원본 JSONL 은 건드리지 않는다.
+
+Usage:
+  python runtime_store.py --root . [--store PATH] [--today YYYY-MM-DD] [--parquet DIR]
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import duckdb
+
+STORE_NAME = "runtime.duckdb"
+# runtime_records 의 hotspot 차원 컬럼. observe_graph.RUNTIME_HOTSPOT_KEYS 와 같은 이름이다.
+HOTSPOT_DIMENSIONS = ("workflow", "phase", "node", "tool", "intent")
+PARSE_ERROR_LIMIT = 10
+
+# IntentTurn 레코드 컬럼 (mso-intent-analytics turn_writer.append_turn 계약).
+TURN_COLUMNS = """{
+    type:                         'VARCHAR',
+    turn_id:                      'VARCHAR',
+    session_id:                   'VARCHAR',
+    timestamp:                    'TIMESTAMPTZ',
+    utterance:                    'VARCHAR',
+    resolved_intent_id:           'VARCHAR',
+    resolved_target_entity_id:    'VARCHAR',
+    resolved_target_concepts:     'VARCHAR[]',
+    slots_filled:                 'VARCHAR',
+    reprompt_count:               'INTEGER',
+    success:                      'BOOLEAN',
+    duration_ms:                  'INTEGER',
+    prev_turn_id:                 'VARCHAR'
+}"""
+
+_RECORD_COLUMNS = """{
+    scope: 'VARCHAR', path: 'VARCHAR', line: 'BIGINT', ts: 'VARCHAR', parse_error: 'BOOLEAN',
+    status: 'VARCHAR', event: 'VARCHAR', workflow: 'VARCHAR', phase: 'VARCHAR', node: 'VARCHAR',
+    tool: 'VARCHAR', intent: 'VARCHAR', record_id: 'VARCHAR', id_prefix: 'VARCHAR', failure: 'BOOLEAN'
+}"""
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS runtime_sources (
+        path VARCHAR PRIMARY KEY,
+        scope VARCHAR,
+        inode BIGINT,
+        size BIGINT,
+        "offset" BIGINT,
+        lines BIGINT,
+        compacted_at TIMESTAMPTZ
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS runtime_records (
+        scope VARCHAR, path VARCHAR, line BIGINT, day DATE, ts TIMESTAMPTZ, parse_error BOOLEAN,
+        status VARCHAR, event VARCHAR, workflow VARCHAR, phase VARCHAR, node VARCHAR,
+        tool VARCHAR, intent VARCHAR, record_id VARCHAR, id_prefix VARCHAR, failure BOOLEAN
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS turns (
+        type VARCHAR, turn_id VARCHAR, session_id VARCHAR, timestamp TIMESTAMPTZ,
+        utterance VARCHAR, resolved_intent_id VARCHAR, resolved_target_entity_id VARCHAR,
+        resolved_target_concepts VARCHAR[], slots_filled VARCHAR, reprompt_count INTEGER,
+        success BOOLEAN, duration_ms INTEGER, prev_turn_id VARCHAR, _path VARCHAR
+    )
+    """,
+]
+
+
+def store_path(root: Path) -> Path:
+    """저장소 위치. `MSO_RUNTIME_STORE` > `MSO_CACHE_DIR/runtime.duckdb` > `<root>/.mso-cache/runtime.duckdb`."""
+    override = os.environ.get("MSO_RUNTIME_STORE")
+    if override:
+        return Path(override)
+    cache = os.environ.get("MSO_CACHE_DIR")
+    return (Path(cache) if cache else root / ".mso-cache") / STORE_NAME
+
+
+def connect(path: Path) -> duckdb.DuckDBPyConnection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    con = duckdb.connect(str(path))
+    con.execute("SET TimeZone = 'UTC'")
+    for statement in _SCHEMA:
+        con.execute(statement)
+    return con
+
+
+def record_day(record: dict[str, Any]) -> dt.date | None:
+    value = record.get("timestamp") or record.get("created_at")
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = dt.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(dt.timezone.utc)
+    return parsed.date()
+
+
+def drop_source(con: duckdb.DuckDBPyConnection, path: str) -> None:
+    con.execute("DELETE FROM runtime_records WHERE path = ?", [path])
+    con.execute("DELETE FROM turns WHERE _path = ?", [path])
+    con.execute("DELETE FROM runtime_sources WHERE path = ?", [path])
+
+
+def rename_source(con: duckdb.DuckDBPyConnection, old: str, new: str) -> None:
+    """rotate 로 봉인 구간이 된 파일의 압축 행을 새 경로로 옮긴다."""
+    con.execute("UPDATE runtime_records SET path = ? WHERE path = ?", [new, old])
+    con.execute("UPDATE turns SET _path = ? WHERE _path = ?", [new, old])
+    row = con.execute("SELECT * FROM runtime_sources WHERE path = ?", [old]).fetchone()
+    con.execute("DELETE FROM runtime_sources WHERE path = ?", [old])
+    con.execute("INSERT OR REPLACE INTO runtime_sources VALUES (?, ?, ?, ?, ?, ?, ?)", [new, *row[1:]])
+
+
+def compact_source(
+    con: duckdb.DuckDBPyConnection, observe_graph: Any, scope: str, path: Path, today: dt.date
+) -> int:
+    """파일 하나의 봉인 구간을 압축하고 새로 옮긴 줄 수를 돌려준다."""
+    key = str(path)
+    stat = path.stat()
+    row = con.execute('SELECT inode, "offset", lines FROM runtime_sources WHERE path = ?', [key]).fetchone()
+    if row and (row[0] != stat.st_ino or stat.st_size < row[1]):
+        drop_source(con, key)
+        row = None
+    start, start_line = (row[1], row[2]) if row else (0, 0)
+    sealed_file = dt.datetime.fromtimestamp(stat.st_mtime, dt.timezone.utc).date() < today
+
+    end, end_line = start, start_line
+    with tempfile.TemporaryDirectory(prefix="mso-runtime-") as tmp:
+        records_file = Path(tmp) / "records.jsonl"
+        with records_file.open("w", encoding="utf-8") as out:
+            for record, next_offset, next_line in observe_graph.iter_jsonl_tail(path, start, start_line):
+                if record is not None and not sealed_file and not record.get("_parse_error"):
+                    day = record_day(record)
+                    if day is not None and day >= today:
+                        break
+                end, end_line = next_offset, next_line
+                if record is None:
+                    continue
+                row_out: dict[str, Any] = {"scope": scope, "path": key, "line": next_line}
+                if record.get("_parse_error"):
+                    row_out["parse_error"] = True
+                else:
+                    value = record.get("timestamp") or record.get("created_at")
+                    row_out.update(observe_graph.runtime_dimensions(record))
+                    row_out.update(parse_error=False, ts=value if isinstance(value, str) else None)
+                out.write(json.dumps(row_out, ensure_ascii=False) + "\n")
+        if end == start:
+            return 0
+
+        con.begin()
+        con.execute(
+            f"""
+            INSERT INTO runtime_records
+            SELECT scope, path, line, CAST(TRY_CAST(ts AS TIMESTAMPTZ) AS DATE), TRY_CAST(ts AS TIMESTAMPTZ),
+                   COALESCE(parse_error, FALSE), status, event, workflow, phase, node, tool, intent,
+                   record_id, id_prefix, COALESCE(failure, FALSE)
+            FROM read_json(?, columns={_RECORD_COLUMNS}, format='newline_delimited')
+            ORDER BY line
+            """,
+            [str(records_file)],
+        )
+        if scope == "intent":
+            segment = Path(tmp) / "turns.jsonl"
+            with path.open("rb") as handle:
+                handle.seek(start)
+                segment.write_bytes(handle.read(end - start))
+            con.execute(
+                f"""
+                INSERT INTO turns
+                SELECT *, ? FROM read_json(?, columns={TURN_COLUMNS}, format='newline_delimited', ignore_errors=true)
+                WHERE type = 'turn'
+                """,
+                [key, str(segment)],
+            )
+        con.execute(
+            "INSERT OR REPLACE INTO runtime_sources VALUES (?, ?, ?, ?, ?, ?, now())",
+            [key, scope, stat.st_ino, stat.st_size, end, end_line],
+        )
+        con.commit()
+    return end_line - start_line
+
+
+def compact(root: Path, store: Path | None = None, today: dt.date | None = None) -> dict[str, int]:
+    """`discover_runtime_sources(root)` 의 봉인 구간을 저장소로 압축한다. 반환: scope 별 새 줄 수."""
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    import observe_graph
+
+    root = root.resolve()
+    today = today or dt.datetime.now(dt.timezone.utc).date()
+    sources = observe_graph.discover_runtime_sources(root)
+    current = {str(path) for paths in sources.values() for path in paths}
+    summary: dict[str, int] = {}
+    with connect(store or store_path(root)) as con:
+        # turns.jsonl rotation: 압축하던 활성 파일이 봉인 구간으로 rename 되었으면 행을 옮겨 이어 압축한다.
+        stored = {path: {"inode": inode} for path, inode in con.execute("SELECT path, inode FROM runtime_sources").fetchall()}
+        for old, new in observe_graph.follow_renames(stored, [Path(path) for path in current]).items():
+            con.begin()
+            rename_source(con, old, new)
+            con.commit()
+        for (path,) in con.execute("SELECT path FROM runtime_sources").fetchall():
+            if path not in current:
+                drop_source(con, path)
+        for scope, paths in sources.items():
+            summary[scope] = sum(compact_source(con, observe_graph, scope, path, today) for path in paths)
+    return summary
+
+
+def export_parquet(store: Path, target: Path) -> None:
+    """runtime_records 를 scope/day Hive 파티션 Parquet 으로 내보낸다."""
+    with duckdb.connect(str(store), read_only=True) as con:
+        con.execute(
+            "COPY (SELECT * FROM runtime_records ORDER BY scope, day, path, line) TO ? "
+            "(FORMAT PARQUET, PARTITION_BY (scope, day), OVERWRITE_OR_IGNORE)",
+            [str(target)],
+        )
+
+
+def seed_runtime_analysis(store: Path, aggregate: Any, sources: dict[str, list[Path]]) -> dict[str, dict[str, Any]]:
+    """압축된 봉인 구간의 집계를 `aggregate` 에 채우고 파일별 checkpoint entry 를 돌려준다.
+
+    inode 가 같고 offset 이 현재 크기 이내인 파일만 쓴다. 나머지는 빈 dict 로 남겨
+    호출자가 JSONL 을 처음부터 읽게 한다. 저장소가 없거나 열 수 없으면 아무것도 하지 않는다.
+    """
+    if not store.is_file():
+        return {}
+    current = {str(path.resolve()): (scope, path) for scope, paths in sources.items() for path in paths}
+    try:
+        con = duckdb.connect(str(store), read_only=True)
+    except duckdb.Error:
+        return {}
+    with con:
+        try:
+            stored = con.execute('SELECT path, scope, inode, "offset", lines FROM runtime_sources').fetchall()
+        except duckdb.Error:
+            return {}
+        files: dict[str, dict[str, Any]] = {}
+        names: dict[str, str] = {}
+        for key, scope, inode, offset, lines in stored:
+            if key not in current or current[key][0] != scope:
+                continue
+            path = current[key][1]
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if stat.st_ino != inode or stat.st_size < offset:
+                continue
+            names[key] = str(path)
+            files[str(path)] = {"scope": scope, "inode": inode, "size": stat.st_size, "offset": offset, "lines": lines}
+        if not files:
+            return {}
+
+        seeded = "WITH seeded AS (SELECT * FROM runtime_records WHERE list_contains(?, path))"
+        paths = [list(names)]
+
+        def counts(select: str, where: str = "TRUE") -> list[tuple]:
+            return con.execute(f"{seeded} SELECT {select}, count(*) FROM seeded WHERE {where} GROUP BY ALL", paths).fetchall()
+
+        aggregate.record_counts.update(dict(counts("scope")))
+        aggregate.status_counts.update(dict(counts("scope || ':' || status", "status IS NOT NULL")))
+        aggregate.event_counts.update(dict(counts("scope || ':' || event", "event IS NOT NULL")))
+        aggregate.workflow_counts.update(dict(counts("workflow", "workflow IS NOT NULL")))
+        aggregate.intent_counts.update(dict(counts("intent", "intent IS NOT NULL")))
+        aggregate.memory_prefixes.update(dict(counts("id_prefix", "id_prefix IS NOT NULL")))
+        aggregate.repeated_signals.update(
+            {(scope, value): n for scope, value, n in counts("scope, record_id", "record_id IS NOT NULL")}
+        )
+        for dimension in HOTSPOT_DIMENSIONS:
+            rows = counts(f"'{dimension}:' || {dimension}", f"failure AND {dimension} IS NOT NULL")
+            aggregate.failure_hotspots.update(dict(rows))
+        unknown = " AND ".join(f"{dimension} IS NULL" for dimension in HOTSPOT_DIMENSIONS)
+        aggregate.failure_hotspots.update(dict(counts("scope || ':unknown'", f"failure AND {unknown}")))
+        for key, line in con.execute(
+            f"{seeded} SELECT path, line FROM seeded WHERE parse_error "
+            f"QUALIFY row_number() OVER (PARTITION BY path ORDER BY line) <= {PARSE_ERROR_LIMIT} ORDER BY path, line",
+            paths,
+        ).fetchall():
+            aggregate.parse_errors.setdefault(names[key], []).append(line)
+    return files
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="봉인된 runtime JSONL 을 DuckDB 컬럼 저장소로 압축")
+    ap.add_argument("--root", type=Path, default=Path.cwd(), help="프로젝트 루트 (기본: cwd)")
+    ap.add_argument("--store", type=Path, default=None, help="저장소 경로 (기본: <root>/.mso-cache/runtime.duckdb)")
+    ap.add_argument("--today", type=dt.date.fromisoformat, default=None, help="봉인 기준일 (기본: 오늘 UTC)")
+    ap.add_argument("--parquet", type=Path, default=None, help="runtime_records 를 scope/day 파티션 Parquet 으로도 내보낼 디렉토리")
+    args = ap.parse_args(argv)
+
+    root = args.root.resolve()
+    store = args.store or store_path(root)
+    summary = compact(root, store, args.today)
+    for scope, count in summary.items():
+        print(f"{scope}: +{count} lines")
+    if args.parquet:
+        export_parquet(store, args.parquet)
+        print(f"parquet: {args.parquet}")
+    print(f"store: {store}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
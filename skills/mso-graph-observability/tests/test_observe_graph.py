@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import importlib.util
+import json
+import sqlite3
 import subprocess
 import sys
 from pathlib import Path
@@ -72,6 +74,32 @@ def test_workflow_topology_renders_execution_edges():
     assert '{{"Gate<br/>id: d<br/>Decision"}}' in markdown
 
 
+def test_scope_topology_is_shared_across_views_without_changing_output(monkeypatch):
+    examples = SCRIPT.resolve().parents[2] / "mso-workflow-design" / "assets" / "examples"
+    graph = observe_graph.parse_graph([examples / "root-workflow.abox.ttl"])
+    scope = max(
+        observe_graph.workflow_scopes(graph),
+        key=lambda name: len(observe_graph.ScopeTopology(graph, name).control_edges),
+    )
+    views = ("integrated", "workflow", "artifact-stream")
+    standalone = [observe_graph.build_workflow_topology(graph, scope=scope, view=view) for view in views]
+
+    topology = observe_graph.ScopeTopology(graph, scope)
+    assert topology.process_nodes and topology.control_edges
+    assert set(topology.node_data) == set(topology.process_nodes)
+
+    def no_rewalk(*args, **kwargs):
+        raise AssertionError("views must reuse the shared topology")
+
+    monkeypatch.setattr(observe_graph, "workflow_node_terms", no_rewalk)
+    monkeypatch.setattr(observe_graph, "directory_data_for_node", no_rewalk)
+    shared = [
+        observe_graph.build_workflow_topology(graph, scope=scope, view=view, topology=topology)
+        for view in views
+    ]
+    assert shared == standalone
+
+
 def test_oracle_view_normalizes_phase_target_ids_to_workflow():
     graph = Graph()
     wf = observe_graph.WF
@@ -833,6 +861,42 @@ def test_artifact_type_explicit_value_overrides_inference():
     assert ref["resource_kind"] == "file"
 
 
+def test_load_data_registry_locator_index_matches_prefix_and_suffix(tmp_path):
+    (tmp_path / "agent-context" / "index").mkdir(parents=True)
+    (tmp_path / "agent-context" / "index" / "index.yaml").write_text(
+        """
+modules:
+  - id: mod.a
+    path: 04.modules/a/
+    subdirs:
+      - path: data/
+      - path: data/raw/
+  - id: mod.b
+    path: 04.modules/b/
+    subdirs:
+      - path: mydata/
+""".strip(),
+        encoding="utf-8",
+    )
+    registry = observe_graph.load_data_registry(tmp_path)
+    assert registry.locator_index is not None
+
+    def ref_id(locator: str) -> str:
+        indexed = observe_graph.data_ref_for_locator(registry, data_type="local_file", locator=locator)
+        plain = observe_graph.data_ref_for_locator(dict(registry), data_type="local_file", locator=locator)
+        assert indexed == plain
+        return indexed["id"]
+
+    # longest `<locator>/` prefix
+    assert ref_id("04.modules/a/data/raw/2026.jsonl") == "mod.a.data.raw"
+    assert ref_id("04.modules/a/data/x.csv") == "mod.a.data"
+    assert ref_id("04.modules/a/notes.md") == "mod.a"
+    # longest character-level suffix (module-relative TTL paths)
+    assert ref_id("raw/") == "mod.a.data.raw"
+    assert ref_id("data/") == "mod.b.mydata"
+    assert ref_id("elsewhere/") == "local_file:elsewhere/"
+
+
 def test_artifact_type_inference_distinguishes_machine_hybrid_and_human_artifacts():
     assert (
         observe_graph.infer_artifact_type(
@@ -1046,3 +1110,177 @@ def test_invalid_explicit_artifact_type_falls_back_to_inference():
         "",
     )
     assert ref["artifact_type"] == "document"  # .md 추론 유지
+
+
+def _write_scope_abox(path: Path, scope: str, label: str) -> None:
+    path.write_text(
+        f"""
+@prefix wf: <https://mso.dev/ontology/workflow#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+<https://mso.dev/ontology/workflow#phase/{scope}/p> a wf:Phase ;
+  rdfs:label "Phase" ;
+  wf:hasNode <https://mso.dev/ontology/workflow#node/{scope}/producer> .
+
+<https://mso.dev/ontology/workflow#node/{scope}/producer> a wf:Step, wf:Node ;
+  rdfs:label "{label}" .
+""".strip(),
+        encoding="utf-8",
+    )
+
+
+def test_incremental_run_rerenders_only_changed_scopes(tmp_path):
+    workflow_dir = tmp_path / "agent-context" / "workflow"
+    workflow_dir.mkdir(parents=True)
+    _write_scope_abox(workflow_dir / "alpha.abox.ttl", "alpha", "Alpha Producer")
+    _write_scope_abox(workflow_dir / "beta.abox.ttl", "beta", "Beta Producer")
+    command = [sys.executable, str(SCRIPT), "--root", str(tmp_path), "--incremental"]
+
+    first = subprocess.run(command, check=True, capture_output=True, text=True)
+    output_dir = tmp_path / "agent-context" / "observability" / "graph"
+    assert (output_dir / observe_graph.MANIFEST_NAME).exists()
+    assert "0 unchanged" in first.stdout
+    alpha_view = output_dir / "alpha" / "repository-graph.md"
+    beta_view = output_dir / "beta" / "repository-graph.md"
+    alpha_mtime = alpha_view.stat().st_mtime_ns
+    beta_mtime = beta_view.stat().st_mtime_ns
+
+    second = subprocess.run(command, check=True, capture_output=True, text=True)
+    assert "(0 rendered," in second.stdout
+    assert alpha_view.stat().st_mtime_ns == alpha_mtime
+
+    _write_scope_abox(workflow_dir / "beta.abox.ttl", "beta", "Beta Producer v2")
+    subprocess.run(command, check=True, capture_output=True, text=True)
+    assert alpha_view.stat().st_mtime_ns == alpha_mtime
+    assert beta_view.stat().st_mtime_ns != beta_mtime
+    assert "Beta Producer v2" in beta_view.read_text(encoding="utf-8")
+
+    (workflow_dir / "beta.abox.ttl").unlink()
+    subprocess.run(command, check=True, capture_output=True, text=True)
+    assert not (output_dir / "beta").exists()
+    assert alpha_view.stat().st_mtime_ns == alpha_mtime
+
+
+def test_parallel_jobs_render_matches_serial_run(tmp_path):
+    examples = SCRIPT.resolve().parents[2] / "mso-workflow-design" / "assets" / "examples"
+    outputs = {}
+    for mode, extra in (("serial", []), ("parallel", ["--jobs", "2"])):
+        root = tmp_path / mode
+        workflow_dir = root / "agent-context" / "workflow"
+        workflow_dir.mkdir(parents=True)
+        for abox in examples.glob("*.abox.ttl"):
+            (workflow_dir / abox.name).write_text(abox.read_text(encoding="utf-8"), encoding="utf-8")
+        _write_scope_abox(workflow_dir / "alpha.abox.ttl", "alpha", "Alpha Producer")
+        subprocess.run([sys.executable, str(SCRIPT), "--root", str(root), *extra], check=True, capture_output=True)
+        graph_dir = root / "agent-context" / "observability" / "graph"
+        outputs[mode] = {
+            str(path.relative_to(graph_dir)): path.read_bytes()
+            for path in sorted(graph_dir.rglob("*.md"))
+            if path.name != "README.md"
+        }
+
+    assert "alpha/repository-graph.md" in outputs["serial"]
+    assert outputs["parallel"] == outputs["serial"]
+
+
+def test_runtime_analysis_streams_records_and_reports_parse_errors(tmp_path, monkeypatch):
+    monkeypatch.setenv("MSO_RUNTIME_CHECKPOINT", "0")
+    auditlog = tmp_path / "agent-context" / "work-memory" / "auditlog"
+    auditlog.mkdir(parents=True)
+    lines = [
+        '{"id": "AU-1", "status": "failed", "tool": "bash", "type": "call"}',
+        "{broken",
+        '{"id": "AU-1", "status": "ok", "workflow": "alpha", "type": "call"}',
+        "",
+        '{"id": "AU-2", "status": "error"}',
+    ]
+    (auditlog / "AU-2026-01-01.jsonl").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    aggregate = observe_graph.RuntimeAggregate()
+    aggregate.add_file("audit", auditlog / "AU-2026-01-01.jsonl")
+    report = observe_graph.build_runtime_analysis(tmp_path)
+
+    assert aggregate.record_counts == {"audit": 4}
+    assert aggregate.repeated_signals[("audit", "AU-1")] == 2
+    assert aggregate.failure_hotspots == {"tool:bash": 1, "audit:unknown": 1}
+    assert aggregate.parse_errors == {str(auditlog / "AU-2026-01-01.jsonl"): [2]}
+    assert "- `audit`: 4 records" in report
+    assert "| `audit` | `AU-1` | 2 |" in report
+    assert "- `AU`: 3" in report
+    assert f"`{auditlog / 'AU-2026-01-01.jsonl'}` line 2" in report
+
+
+def test_runtime_checkpoint_keeps_only_repeated_ids_in_state(tmp_path, monkeypatch):
+    monkeypatch.setenv("MSO_CACHE_DIR", str(tmp_path / "cache"))
+    auditlog = tmp_path / "agent-context" / "work-memory" / "auditlog"
+    auditlog.mkdir(parents=True)
+    log = auditlog / "AU-2026-01-01.jsonl"
+    log.write_text("".join(f'{{"id": "AU-{i}", "status": "ok"}}\n' for i in range(50)), encoding="utf-8")
+    checkpoint = tmp_path / "cache" / observe_graph.RUNTIME_CHECKPOINT_NAME
+
+    def stored():
+        con = sqlite3.connect(str(checkpoint))
+        state = json.loads(con.execute("SELECT value FROM meta WHERE key = 'state'").fetchone()[0])
+        seen = con.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+        con.close()
+        return state["counters"]["repeated_signals"], seen
+
+    observe_graph.build_runtime_analysis(tmp_path)
+    assert stored() == ([], 50)
+
+    # 지난 실행에 한 번 본 id 가 다시 나오면 seen 에서 꺼내 반복 신호로 올린다.
+    with log.open("a", encoding="utf-8") as handle:
+        handle.write('{"id": "AU-7", "status": "ok"}\n{"id": "AU-7", "status": "ok"}\n{"id": "AU-99", "status": "ok"}\n')
+    report = observe_graph.build_runtime_analysis(tmp_path)
+    assert "| `audit` | `AU-7` | 3 |" in report
+    assert stored() == ([["audit", "AU-7", 3]], 50)
+
+    # offset 이 그대로면 checkpoint 를 다시 쓰지 않는다.
+    def fail(*args, **kwargs):
+        raise AssertionError("unchanged sources must not rewrite the checkpoint")
+
+    monkeypatch.setattr(observe_graph, "write_runtime_checkpoint", fail)
+    assert observe_graph.build_runtime_analysis(tmp_path) == report
+    monkeypatch.undo()
+    monkeypatch.setenv("MSO_RUNTIME_CHECKPOINT", "0")
+    assert observe_graph.build_runtime_analysis(tmp_path) == report
+
+
+def test_runtime_analysis_checkpoint_reads_only_appended_tail(tmp_path, monkeypatch):
+    monkeypatch.setenv("MSO_CACHE_DIR", str(tmp_path / "cache"))
+    auditlog = tmp_path / "agent-context" / "work-memory" / "auditlog"
+    auditlog.mkdir(parents=True)
+    log = auditlog / "AU-2026-01-01.jsonl"
+    log.write_text('{"id": "AU-1", "status": "ok"}\n{"id": "AU-2", "status": "ok"}\n', encoding="utf-8")
+    checkpoint = tmp_path / "cache" / observe_graph.RUNTIME_CHECKPOINT_NAME
+
+    def full_report() -> str:
+        monkeypatch.setenv("MSO_RUNTIME_CHECKPOINT", "0")
+        report = observe_graph.build_runtime_analysis(tmp_path)
+        monkeypatch.delenv("MSO_RUNTIME_CHECKPOINT")
+        return report
+
+    observe_graph.build_runtime_analysis(tmp_path)
+    assert checkpoint.exists()
+
+    # 같은 inode·크기로 앞부분을 덮어써도 증분 실행은 offset 이후만 읽는다.
+    text = log.read_text(encoding="utf-8").replace('"AU-1"', '"ZZ-1"')
+    with log.open("r+", encoding="utf-8") as handle:
+        handle.write(text)
+        handle.write('{"id": "AU-2", "status": "failed"}\n{"id": "AU-3", "sta')
+    report = observe_graph.build_runtime_analysis(tmp_path)
+    assert "- `audit`: 3 records" in report
+    assert "- `AU`: 3" in report
+    assert "ZZ" not in report
+    assert "| `audit` | `AU-2` | 2 |" in report
+
+    # 쓰기 도중이던 마지막 줄은 완결된 뒤에 한 번만 센다.
+    with log.open("a", encoding="utf-8") as handle:
+        handle.write('tus": "ok"}\n')
+    assert "- `audit`: 4 records" in observe_graph.build_runtime_analysis(tmp_path)
+
+    # truncate 되면 전체 재집계한다.
+    log.write_text('{"id": "AU-9", "status": "ok"}\n', encoding="utf-8")
+    report = observe_graph.build_runtime_analysis(tmp_path)
+    assert "- `audit`: 1 records" in report
+    assert report == full_report()
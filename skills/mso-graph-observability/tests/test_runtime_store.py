@@ -0,0 +1,147 @@
+"""runtime_store — 봉인 runtime JSONL 압축 저장소 테스트."""
+
+import datetime as dt
+import json
+import os
+import sys
+from pathlib import Path
+
+import duckdb
+import pytest
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import observe_graph  # noqa: E402
+import runtime_store  # noqa: E402
+
+TODAY = dt.date(2026, 10, 17)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setenv("MSO_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("MSO_RUNTIME_CHECKPOINT", "0")
+    auditlog = tmp_path / "agent-context" / "work-memory" / "auditlog"
+    auditlog.mkdir(parents=True)
+    sealed = auditlog / "AU-2026-10-16.jsonl"
+    sealed.write_text(
+        "\n".join(
+            [
+                json.dumps({"id": "AU-1", "created_at": "2026-10-16T09:00:00Z", "metadata": {"tool": "Bash", "status": "failed"}}),
+                "{broken",
+                json.dumps({"id": "AU-1", "created_at": "2026-10-16T09:01:00Z", "error": "timeout"}),
+            ]
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    sealed_at = dt.datetime(2026, 10, 16, 23, 59, tzinfo=dt.timezone.utc).timestamp()
+    os.utime(sealed, (sealed_at, sealed_at))
+    turns = tmp_path / ".mso-context" / "conversation" / "turns.jsonl"
+    turns.parent.mkdir(parents=True)
+    turns.write_text(
+        "\n".join(
+            json.dumps({"type": "turn", "turn_id": turn_id, "timestamp": stamp, "resolved_intent_id": "query_audit_log"})
+            for turn_id, stamp in [("t1", "2026-10-15T10:00:00+00:00"), ("t2", "2026-10-17T00:10:00+00:00")]
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    live_at = dt.datetime(2026, 10, 17, 0, 10, tzinfo=dt.timezone.utc).timestamp()
+    os.utime(turns, (live_at, live_at))
+    return tmp_path
+
+
+def full_report(root: Path, monkeypatch) -> str:
+    with monkeypatch.context() as patch:
+        patch.setenv("MSO_RUNTIME_STORE", str(root / "missing.duckdb"))
+        return observe_graph.build_runtime_analysis(root)
+
+
+def test_compact_moves_only_sealed_lines(project):
+    summary = runtime_store.compact(project, today=TODAY)
+
+    assert summary == {"memory": 0, "audit": 3, "worklog": 0, "intent": 1}
+    with duckdb.connect(str(runtime_store.store_path(project)), read_only=True) as con:
+        assert con.execute("SELECT turn_id FROM turns").fetchall() == [("t1",)]
+        assert con.execute("SELECT count(*) FROM runtime_records WHERE parse_error").fetchone() == (1,)
+        turns_offset = con.execute(
+            "SELECT \"offset\" FROM runtime_sources WHERE scope = 'intent'"
+        ).fetchone()[0]
+    first_line = (project / ".mso-context" / "conversation" / "turns.jsonl").read_bytes().split(b"\n")[0]
+    assert turns_offset == len(first_line) + 1
+    assert runtime_store.compact(project, today=TODAY)["audit"] == 0
+
+
+def test_export_parquet_accepts_quoted_target(project, tmp_path):
+    runtime_store.compact(project, today=TODAY)
+    target = tmp_path / "it's parquet"
+    runtime_store.export_parquet(runtime_store.store_path(project), target)
+
+    assert sorted(p.name for p in target.iterdir()) == ["scope=audit", "scope=intent"]
+    with duckdb.connect() as con:
+        rows = con.execute(
+            "SELECT count(*) FROM read_parquet(?, hive_partitioning=true)", [str(target / "**" / "*.parquet")]
+        ).fetchone()
+    assert rows == (4,)
+
+def test_seeded_runtime_analysis_matches_full_scan(project, monkeypatch):
+    runtime_store.compact(project, today=TODAY)
+    seeded = observe_graph.build_runtime_analysis(project)
+
+    assert seeded == full_report(project, monkeypatch)
+    assert "- `tool:Bash`: 1" in seeded
+    assert "- `audit:unknown`: 1" in seeded
+    assert "| `audit` | `AU-1` | 2 |" in seeded
+
+
+def test_replaced_source_is_recompacted(project, monkeypatch):
+    runtime_store.compact(project, today=TODAY)
+    sealed = project / "agent-context" / "work-memory" / "auditlog" / "AU-2026-10-16.jsonl"
+    replacement = sealed.with_suffix(".tmp")
+    replacement.write_text(json.dumps({"id": "AU-9", "created_at": "2026-10-16T09:00:00Z"}) + "\n", encoding="utf-8")
+    replacement.replace(sealed)
+
+    # 압축 전: inode 가 달라진 파일은 seed 에서 빠지고 JSONL 을 처음부터 읽는다.
+    assert observe_graph.build_runtime_analysis(project) == full_report(project, monkeypatch)
+    runtime_store.compact(project, today=TODAY)
+    with duckdb.connect(str(runtime_store.store_path(project)), read_only=True) as con:
+        assert con.execute("SELECT record_id FROM runtime_records WHERE scope = 'audit'").fetchall() == [("AU-9",)]
+
+
+def test_rotated_turns_segment_keeps_compacted_history(project, monkeypatch):
+    turns = project / ".mso-context" / "conversation" / "turns.jsonl"
+    runtime_store.compact(project, today=TODAY)
+    monkeypatch.setenv("MSO_RUNTIME_CHECKPOINT", "1")
+    observe_graph.build_runtime_analysis(project)
+
+    # turn_writer rotation: 활성 파일을 봉인 구간으로 rename 하고 새 활성 파일에 이어 쓴다.
+    segment = turns.with_name("turns.20261017T001500000000Z.jsonl")
+    os.rename(turns, segment)
+    turns.write_text(
+        json.dumps({"type": "turn", "turn_id": "t3", "timestamp": "2026-10-17T00:20:00+00:00"}) + "\n",
+        encoding="utf-8",
+    )
+    assert observe_graph.discover_runtime_sources(project)["intent"] == [segment, turns]
+
+    # checkpoint 는 봉인 구간에서 이어 읽는다 (전체 재집계 없이 새 활성 파일만 처음부터).
+    assert observe_graph.follow_renames(
+        {str(turns): {"inode": segment.stat().st_ino}}, [segment, turns]
+    ) == {str(turns): str(segment)}
+    with monkeypatch.context() as patch:
+        patch.setattr(runtime_store, "seed_runtime_analysis", lambda *a: pytest.fail("checkpoint was discarded"))
+        report = observe_graph.build_runtime_analysis(project)
+    assert "- `intent`: 3 records" in report
+    monkeypatch.setenv("MSO_RUNTIME_CHECKPOINT", "0")
+    assert report == full_report(project, monkeypatch)
+
+    # 압축 행은 봉인 구간 경로로 옮겨지고 offset 이후만 이어 압축된다 (t1 재삽입 없음).
+    summary = runtime_store.compact(project, today=dt.date(2026, 10, 18))
+    assert summary["intent"] == 2
+    with duckdb.connect(str(runtime_store.store_path(project)), read_only=True) as con:
+        assert con.execute("SELECT turn_id, _path FROM turns ORDER BY turn_id").fetchall() == [
+            ("t1", str(segment)), ("t2", str(segment)), ("t3", str(turns)),
+        ]
+        assert con.execute("SELECT count(*) FROM runtime_sources WHERE scope = 'intent'").fetchone() == (2,)
+    assert observe_graph.build_runtime_analysis(project) == full_report(project, monkeypatch)
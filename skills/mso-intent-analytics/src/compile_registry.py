@@ -0,0 +1,173 @@
+"""
+mso-intent-analytics — registry snapshot 컴파일러
+intents / slot specs / taxonomy / matrix TTL → generated/registry.json (평탄 dict).
+lookup.py 는 이 snapshot 을 읽어 rdflib 없이 O(1) 조회한다. TTL 이 snapshot 보다
+새로우면 lookup.py 가 이 모듈로 다시 컴파일한다 (hot path 밖에서만 rdflib import).
+
+사용:
+  python src/compile_registry.py            # generated/registry.json 갱신
+  python src/compile_registry.py --out PATH
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+from rdflib import Graph, Namespace, URIRef
+from rdflib.namespace import RDF, SKOS
+
+_SRC_DIR = Path(__file__).resolve().parent
+if str(_SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(_SRC_DIR))
+
+from lookup import SNAPSHOT_PATH, SNAPSHOT_VERSION, SOURCES, source_signature  # type: ignore
+
+MSO = Namespace("https://mso.dev/ontology/")
+
+
+def compile_registry() -> dict:
+    """
+    TTL 4종 → snapshot dict.
+    {"version", "sources", "intents": {intent_id: record}, "matrix_cells": [...],
+     "taxonomy": {concept: {"scheme","label","notation","definition","broader"}}}
+    """
+    signature = source_signature()
+    intents_g = _parse(SOURCES["instances"])
+    matrix_g = _parse(SOURCES["matrix"])
+    taxonomy_g = _parse(SOURCES["target_taxonomy"], SOURCES["intent_taxonomy"])
+
+    intents = {}
+    for subj in intents_g.subjects(RDF.type, MSO.Intent):
+        record = _intent_to_dict(intents_g, subj)
+        intents[_short(subj)] = record
+    return {
+        "version":      SNAPSHOT_VERSION,
+        "sources":      signature,
+        "intents":      dict(sorted(intents.items(), key=lambda kv: kv[1]["intent_id"])),
+        "matrix_cells": _matrix_cells(matrix_g),
+        "taxonomy":     _taxonomy(taxonomy_g),
+    }
+
+
+def write_snapshot(snapshot: dict, out: Path = SNAPSHOT_PATH) -> Path:
+    """snapshot 을 tmp + os.replace 로 원자적으로 기록."""
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(f".{out.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(snapshot, ensure_ascii=False, indent=1), encoding="utf-8")
+    os.replace(tmp, out)
+    return out
+
+
+# ─── Graph → dict ────────────────────────────────────────────
+
+def _parse(*paths: Path) -> Graph:
+    g = Graph()
+    for path in paths:
+        g.parse(str(path), format="turtle")
+    return g
+
+
+def _intent_to_dict(g: Graph, subj: URIRef) -> dict:
+    slot_specs = []
+    for slot_node in _rdf_list_items(g, subj, MSO.slot_specs):
+        slot_specs.append({
+            "slot_name":     str(g.value(slot_node, MSO.slot_name) or ""),
+            "slot_type":     str(g.value(slot_node, MSO.slot_type) or ""),
+            "required":      str(g.value(slot_node, MSO.required) or "false").lower() == "true",
+            "fill_policy":   str(g.value(slot_node, MSO.fill_policy) or "ask"),
+            "default_value": str(g.value(slot_node, MSO.default_value) or "") or None,
+        })
+
+    return {
+        "intent_id":          str(g.value(subj, MSO.intent_id) or ""),
+        "verb_concept":       _short(g.value(subj, MSO.verb_concept)),
+        "target_concept":     _short(g.value(subj, MSO.target_concept)),
+        "trigger_keywords":   [str(v) for v in _rdf_list_items(g, subj, MSO.trigger_keywords)],
+        "example_utterances": [str(v) for v in _rdf_list_items(g, subj, MSO.example_utterances)],
+        "slot_specs":         slot_specs,
+    }
+
+
+def _matrix_cells(g: Graph) -> list[dict]:
+    cells = []
+    for subj in g.subjects(RDF.type, MSO.IntentMatrixCell):
+        cells.append({
+            "cell_id":           str(g.value(subj, MSO.cell_id) or ""),
+            "verb_concept":      _short(g.value(subj, MSO.verb_concept)),
+            "target_concept":    _short(g.value(subj, MSO.target_concept)),
+            "status":            str(g.value(subj, MSO.status) or ""),
+            "intent_id":         str(g.value(subj, MSO.intent_id) or ""),
+            "priority":          _int_or_none(g.value(subj, MSO.priority)),
+            "rejected_rationale":str(g.value(subj, MSO.rejected_rationale) or ""),
+        })
+    return sorted(cells, key=lambda x: x["cell_id"])
+
+
+def _taxonomy(g: Graph) -> dict[str, dict]:
+    concepts = {}
+    for subj in g.subjects(RDF.type, SKOS.Concept):
+        concepts[_short(subj)] = {
+            "scheme":     _short(g.value(subj, SKOS.inScheme)),
+            "label":      str(g.value(subj, SKOS.prefLabel) or ""),
+            "notation":   str(g.value(subj, SKOS.notation) or ""),
+            "definition": str(g.value(subj, SKOS.definition) or ""),
+            "broader":    sorted(_short(o) for o in g.objects(subj, SKOS.broader)),
+        }
+    return dict(sorted(concepts.items()))
+
+
+def _rdf_list_items(g: Graph, subj: URIRef, pred) -> list:
+    """RDF list (rdf:first/rdf:rest) 순회."""
+    raw = g.value(subj, pred)
+    if raw is None:
+        return []
+    items = []
+    node = raw
+    while node and node != RDF.nil:
+        first = g.value(node, RDF.first)
+        if first is not None:
+            items.append(first)
+        node = g.value(node, RDF.rest)
+        if node is None:
+            break
+    return items
+
+
+def _short(uri) -> str:
+    """URIRef → 로컬명 (예: mso:QueryVerb → 'QueryVerb')."""
+    if uri is None:
+        return ""
+    s = str(uri)
+    if "#" in s:
+        return s.split("#")[-1]
+    if "/" in s:
+        return s.split("/")[-1]
+    return s
+
+
+def _int_or_none(val) -> int | None:
+    if val is None:
+        return None
+    try:
+        return int(str(val))
+    except ValueError:
+        return None
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+
+    ap = argparse.ArgumentParser(description="intent registry TTL → JSON snapshot")
+    ap.add_argument("--out", type=Path, default=SNAPSHOT_PATH, help="snapshot 경로")
+    args = ap.parse_args(argv)
+    snapshot = compile_registry()
+    out = write_snapshot(snapshot, args.out)
+    print(f"  → {out} ({len(snapshot['intents'])} intents, "
+          f"{len(snapshot['matrix_cells'])} cells, {len(snapshot['taxonomy'])} concepts)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+dispatch client shim — `pipeline.py` 와 같은 CLI 계약, 상주 serve 프로세스 우선.
+
+  python src/dispatch_client.py ground --intent-id X --utterance "..." [--session-context JSON] [--no-write]
+
+MSO_DISPATCH_SOCKET(또는 --socket) 의 `pipeline.py serve --socket` 에 요청을 넘기고 응답을
+stdout 에 그대로 쓴다. 표준 라이브러리 json/socket 만 import 하므로 per-turn 비용은 인터프리터
+기동 + 소켓 왕복이다. 서버에 연결할 수 없거나 ground 외 명령이면 pipeline.main 으로 넘긴다.
+"""
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+
+
+def _parse_ground(argv: list[str]) -> dict | None:
+    """ground 인자만 최소 파싱. 모르는 옵션이 있으면 None (pipeline argparse 에 맡김)."""
+    if not argv or argv[0] != "ground":
+        return None
+    options = {"--socket": os.environ.get("MSO_DISPATCH_SOCKET")}
+    flags = {"--no-write": False}
+    rest = argv[1:]
+    while rest:
+        key = rest.pop(0)
+        key, eq, inline = key.partition("=")
+        if key in flags and not eq:
+            flags[key] = True
+        elif key in ("--intent-id", "--utterance", "--session-context", "--socket") and (eq or rest):
+            options[key] = inline if eq else rest.pop(0)
+        else:
+            return None
+    if not options["--socket"] or "--intent-id" not in options or "--utterance" not in options:
+        return None
+    context = options.get("--session-context")
+    return {
+        "socket": options["--socket"],
+        "request": {
+            "utterance":       options["--utterance"],
+            "intent_id":       options["--intent-id"],
+            "session_context": json.loads(context) if context else None,
+            "write_turn":      not flags["--no-write"],
+        },
+    }
+
+
+def _send(socket_path: str, request: dict) -> str | None:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(30.0)
+    try:
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            return None
+        sock.sendall((json.dumps(request, ensure_ascii=False) + "\n").encode("utf-8"))
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    finally:
+        sock.close()
+    return line.decode("utf-8").rstrip("\n") or None
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    parsed = _parse_ground(list(argv))
+    if parsed is not None:
+        line = _send(parsed["socket"], parsed["request"])
+        if line is not None:
+            response = json.loads(line)
+            if "error" in response:
+                print(response["error"], file=sys.stderr)
+                return 1
+            print(line)
+            return 0
+
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from pipeline import main as pipeline_main  # type: ignore
+
+    return pipeline_main(_without_socket(list(argv)))
+
+
+def _without_socket(argv: list[str]) -> list[str]:
+    """--socket 은 shim 전용 옵션 — pipeline argparse 로 넘기기 전에 뺀다."""
+    out = []
+    while argv:
+        arg = argv.pop(0)
+        if arg == "--socket":
+            if argv:
+                argv.pop(0)
+        elif not arg.startswith("--socket="):
+            out.append(arg)
+    return out
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,25 +1,32 @@
 """
 mso-intent-analytics — Lookup API
 UUG(uug-grounding) 멀티-레지스트리 브리지 + 뒷단 dispatch(pipeline.py) + conversation-analytics 에서 호출.
-RDFLib 기반, 별도 서버 없음.
+별도 서버 없음. intents / slot specs / taxonomy / matrix 는 compile_registry.py 가 만든
+generated/registry.json snapshot 에서 dict 조회한다. TTL 이 snapshot 보다 새로우면
+(또는 snapshot 이 없으면) 그때만 rdflib 로 다시 컴파일해 snapshot 을 갱신한다.
 """
 from __future__ import annotations
 
+import copy
+import json
 import re
-from functools import lru_cache
+import sys
 from pathlib import Path
 
-from rdflib import Graph, Namespace, URIRef
-from rdflib.namespace import RDF, SKOS
+_SRC_DIR = Path(__file__).resolve().parent
+if str(_SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(_SRC_DIR))
 
 # ─── 경로 설정 ───────────────────────────────────────────────
 _SKILL_DIR = Path(__file__).parent.parent
-_INSTANCES  = _SKILL_DIR / "instances"  / "intents.ttl"
-_TAXONOMY_T = _SKILL_DIR / "taxonomy"   / "target_taxonomy.ttl"
-_TAXONOMY_I = _SKILL_DIR / "taxonomy"   / "intent_taxonomy.ttl"
-_MATRIX     = _SKILL_DIR / "matrix"     / "intent_matrix.ttl"
-
-MSO = Namespace("https://mso.dev/ontology/")
+SNAPSHOT_PATH = _SKILL_DIR / "generated" / "registry.json"
+SNAPSHOT_VERSION = 1
+SOURCES: dict[str, Path] = {
+    "instances":       _SKILL_DIR / "instances" / "intents.ttl",
+    "target_taxonomy": _SKILL_DIR / "taxonomy"  / "target_taxonomy.ttl",
+    "intent_taxonomy": _SKILL_DIR / "taxonomy"  / "intent_taxonomy.ttl",
+    "matrix":          _SKILL_DIR / "matrix"    / "intent_matrix.ttl",
+}
 
 # ─── entity_ref 패턴 → target concepts ──────────────────────
 _ENTITY_PATTERNS: list[tuple[re.Pattern, list[str]]] = [
@@ -31,31 +38,47 @@ _ENTITY_PATTERNS: list[tuple[re.Pattern, list[str]]] = [
 ]
 
 
-# ─── Graph 로드 (mtime 캐시) ─────────────────────────────────
-_graph_cache: dict[str, tuple[float, Graph]] = {}
-
-def _load_graph(path: Path) -> Graph:
-    """파일 mtime 변경 시 자동 재로드."""
-    key = str(path)
-    mtime = path.stat().st_mtime
-    if key not in _graph_cache or _graph_cache[key][0] != mtime:
-        g = Graph()
-        g.parse(str(path), format="turtle")
-        _graph_cache[key] = (mtime, g)
-    return _graph_cache[key][1]
+# ─── Snapshot 로드 (source stat 캐시) ─────────────────────────
+_registry_cache: tuple[dict, dict] | None = None
 
-def _intents_graph() -> Graph:
-    return _load_graph(_INSTANCES)
+def source_signature() -> dict[str, list[int]]:
+    """source TTL 별 [mtime_ns, size] — snapshot 신선도 판정 키."""
+    signature = {}
+    for name, path in SOURCES.items():
+        stat = path.stat()
+        signature[name] = [stat.st_mtime_ns, stat.st_size]
+    return signature
 
-def _target_graph() -> Graph:
-    g = Graph()
-    g.parse(str(_TAXONOMY_T), format="turtle")
-    g.parse(str(_TAXONOMY_I), format="turtle")
-    return g
 
-def _matrix_graph() -> Graph:
-    return _load_graph(_MATRIX)
+def _registry() -> dict:
+    """
+    source TTL 의 (mtime_ns, size) 가 바뀌지 않았으면 process 메모를 그대로 쓴다.
+    snapshot 파일이 같은 signature 면 JSON 만 읽고, 아니면 rdflib 로 다시 컴파일한다.
+    """
+    global _registry_cache
+    signature = source_signature()
+    if _registry_cache is not None and _registry_cache[0] == signature:
+        return _registry_cache[1]
 
+    snapshot = None
+    try:
+        snapshot = json.loads(SNAPSHOT_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        pass
+    if (
+        not isinstance(snapshot, dict)
+        or snapshot.get("version") != SNAPSHOT_VERSION
+        or snapshot.get("sources") != signature
+    ):
+        from compile_registry import compile_registry, write_snapshot  # type: ignore
+
+        snapshot = compile_registry()
+        try:
+            write_snapshot(snapshot, SNAPSHOT_PATH)
+        except OSError:
+            pass  # 읽기 전용 설치본 — 이번 process 메모로만 사용
+    _registry_cache = (signature, snapshot)
+    return snapshot
 
 # ─── Public API ──────────────────────────────────────────────
 
@@ -65,11 +88,7 @@ def list_intents() -> list[dict]:
     Returns: [{"intent_id", "verb_concept", "target_concept",
                "trigger_keywords", "example_utterances", "slot_specs"}, ...]
     """
-    g = _intents_graph()
-    results = []
-    for subj in g.subjects(RDF.type, MSO.Intent):
-        results.append(_intent_to_dict(g, subj))
-    return sorted(results, key=lambda x: x["intent_id"])
+    return copy.deepcopy(list(_registry()["intents"].values()))
 
 
 def lookup_intent(intent_id: str) -> dict | None:
@@ -77,11 +96,8 @@ def lookup_intent(intent_id: str) -> dict | None:
     intent_id로 Intent 레코드 조회.
     Returns: intent dict | None
     """
-    g = _intents_graph()
-    subj = MSO[intent_id]
-    if (subj, RDF.type, MSO.Intent) not in g:
-        return None
-    return _intent_to_dict(g, subj)
+    record = _registry()["intents"].get(intent_id)
+    return copy.deepcopy(record) if record is not None else None
 
 
 def lookup_target(entity_ref: str) -> dict:
@@ -101,10 +117,10 @@ def lookup_target(entity_ref: str) -> dict:
 
 def get_trigger_keywords(intent_id: str) -> list[str]:
     """intent의 trigger_keywords 목록만 빠르게 반환."""
-    record = lookup_intent(intent_id)
+    record = _registry()["intents"].get(intent_id)
     if record is None:
         return []
-    return record.get("trigger_keywords", [])
+    return list(record.get("trigger_keywords", []))
 
 
 def list_matrix_cells(status: str = "filled") -> list[dict]:
@@ -112,94 +128,16 @@ def list_matrix_cells(status: str = "filled") -> list[dict]:
     status 필터로 matrix cell 목록 반환.
     status: "filled" | "planned" | "rejected" | "*"
     """
-    g = _matrix_graph()
-    results = []
-    for subj in g.subjects(RDF.type, MSO.IntentMatrixCell):
-        cell_status = str(g.value(subj, MSO.status) or "")
-        if status != "*" and cell_status != status:
-            continue
-        results.append({
-            "cell_id":           str(g.value(subj, MSO.cell_id) or ""),
-            "verb_concept":      _short(g.value(subj, MSO.verb_concept)),
-            "target_concept":    _short(g.value(subj, MSO.target_concept)),
-            "status":            cell_status,
-            "intent_id":         str(g.value(subj, MSO.intent_id) or ""),
-            "priority":          _int_or_none(g.value(subj, MSO.priority)),
-            "rejected_rationale":str(g.value(subj, MSO.rejected_rationale) or ""),
-        })
-    return sorted(results, key=lambda x: x["cell_id"])
-
-
-# ─── Internal helpers ────────────────────────────────────────
-
-def _intent_to_dict(g: Graph, subj: URIRef) -> dict:
-    def _list(pred):
-        raw = g.value(subj, pred)
-        if raw is None:
-            return []
-        # RDF list
-        items = []
-        node = raw
-        while node and node != RDF.nil:
-            first = g.value(node, RDF.first)
-            if first is not None:
-                items.append(str(first))
-            node = g.value(node, RDF.rest)
-        return items
-
-    slot_specs = []
-    for slot_node in _rdf_list_items(g, subj, MSO.slot_specs):
-        slot_specs.append({
-            "slot_name":     str(g.value(slot_node, MSO.slot_name) or ""),
-            "slot_type":     str(g.value(slot_node, MSO.slot_type) or ""),
-            "required":      str(g.value(slot_node, MSO.required) or "false").lower() == "true",
-            "fill_policy":   str(g.value(slot_node, MSO.fill_policy) or "ask"),
-            "default_value": str(g.value(slot_node, MSO.default_value) or "") or None,
-        })
-
-    return {
-        "intent_id":          str(g.value(subj, MSO.intent_id) or ""),
-        "verb_concept":       _short(g.value(subj, MSO.verb_concept)),
-        "target_concept":     _short(g.value(subj, MSO.target_concept)),
-        "trigger_keywords":   _list(MSO.trigger_keywords),
-        "example_utterances": _list(MSO.example_utterances),
-        "slot_specs":         slot_specs,
-    }
-
-
-def _rdf_list_items(g: Graph, subj: URIRef, pred) -> list:
-    """RDF list (rdf:first/rdf:rest) 순회."""
-    raw = g.value(subj, pred)
-    if raw is None:
-        return []
-    items = []
-    node = raw
-    while node and node != RDF.nil:
-        first = g.value(node, RDF.first)
-        if first is not None:
-            items.append(first)
-        node = g.value(node, RDF.rest)
-        if node is None:
-            break
-    return items
-
-
-def _short(uri) -> str:
-    """URIRef → 로컬명 (예: mso:QueryVerb → 'QueryVerb')."""
-    if uri is None:
-        return ""
-    s = str(uri)
-    if "#" in s:
-        return s.split("#")[-1]
-    if "/" in s:
-        return s.split("/")[-1]
-    return s
+    return [
+        dict(cell) for cell in _registry()["matrix_cells"]
+        if status == "*" or cell["status"] == status
+    ]
 
 
-def _int_or_none(val) -> int | None:
-    if val is None:
-        return None
-    try:
-        return int(str(val))
-    except ValueError:
-        return None
+def lookup_concept(concept: str) -> dict | None:
+    """
+    target / verb taxonomy 개념 조회 (예: "FailedTicket").
+    Returns: {"scheme","label","notation","definition","broader"} | None
+    """
+    record = _registry()["taxonomy"].get(concept)
+    return copy.deepcopy(record) if record is not None else None
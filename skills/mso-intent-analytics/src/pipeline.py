@@ -11,6 +11,7 @@ lookup 과 같은 스킬(mso-intent-analytics)에 co-located.
 from __future__ import annotations
 
 import sys
+import threading
 import time
 from pathlib import Path
 
@@ -23,8 +24,21 @@ from normalize   import normalize                # type: ignore
 from slot_filler import fill_slots               # type: ignore
 from resolver    import resolve_target           # type: ignore
 from validator   import validate                 # type: ignore
-from turn_writer import append_turn, new_turn_id # type: ignore
-from lookup      import lookup_intent            # type: ignore
+from turn_writer import (                         # type: ignore
+    append_spans, append_turn, append_turns, build_spans_record, build_turn_record, new_turn_id,
+)
+from lookup      import list_intents, lookup_intent  # type: ignore
+import validator as _validator                   # type: ignore
+
+# turns_spans.jsonl 에 기록하는 ground 단계 (ms, perf_counter 기준)
+STAGES = ("lookup", "normalize", "fill_slots", "resolve", "validate", "append")
+
+# 한 프로세스 안의 turn·span append 직렬화 (소켓 서버는 연결마다 thread 를 쓴다)
+_APPEND_LOCK = threading.Lock()
+
+
+def _elapsed_ms(t0: float) -> float:
+    return (time.perf_counter() - t0) * 1000
 
 
 def ground(
@@ -51,20 +65,64 @@ def ground(
     GroundedCommand dict (schemas/output.schema.json 준수). tier="UUG".
     """
     t_start = time.monotonic()
-    ctx = session_context or {}
+    spans: dict[str, float] = {}
+    t0 = time.perf_counter()
+    intent = lookup_intent(intent_id) if intent_id else None
+    spans["lookup"] = _elapsed_ms(t0)
+    grounded, duration_ms = _ground(
+        utterance, intent_id, intent, session_context or {}, validate, t_start, spans,
+    )
+
+    # ── 3. turns.jsonl append (+ stage span sidecar) ───────
+    if write_turn:
+        with _APPEND_LOCK:
+            t0 = time.perf_counter()
+            append_turn(
+                turn_id=grounded["turn_id"],
+                session_id=grounded["session_id"],
+                utterance=utterance,
+                grounded=grounded,
+                prev_turn_id=prev_turn_id,
+                duration_ms=duration_ms,
+            )
+            spans["append"] = _elapsed_ms(t0)
+            append_spans([build_spans_record(grounded["turn_id"], intent_id, spans)])
+
+    return grounded
+
+
+def _ground(
+    utterance: str,
+    intent_id: str,
+    intent: dict | None,
+    ctx: dict,
+    check,
+    t_start: float,
+    spans: dict[str, float],
+) -> tuple[dict, int]:
+    """
+    조회가 끝난 intent 로 slot→target→validate 를 돌려 (GroundedCommand, duration_ms).
+    단계별 소요 시간은 spans 에 채운다.
+    """
     session_id = ctx.get("session_id", "local:anonymous:0")
     turn_id    = new_turn_id()
 
     # ── 1. input_norm (slot 추출 전처리) ───────────────────
+    t0 = time.perf_counter()
     norm = normalize(utterance)
+    spans["normalize"] = _elapsed_ms(t0)
 
     # ── 2. 뒷단: slot_filler + resolver + validator ────────
-    intent = lookup_intent(intent_id) if intent_id else None
-
     if intent:
+        t0 = time.perf_counter()
         slots_filled, reprompt_needed, reprompt_slots = fill_slots(intent, norm, ctx)
+        t1 = time.perf_counter()
         target_id, target_concepts = resolve_target(intent, slots_filled, ctx)
-        conforms, violations = validate(intent, slots_filled, reprompt_slots)
+        t2 = time.perf_counter()
+        conforms, violations = check(intent, slots_filled, reprompt_slots)
+        spans["fill_slots"] = (t1 - t0) * 1000
+        spans["resolve"] = (t2 - t1) * 1000
+        spans["validate"] = _elapsed_ms(t2)
         if not conforms:
             # SHACL 실패도 reprompt로 처리
             reprompt_needed = True
@@ -93,19 +151,154 @@ def ground(
         "session_id":      session_id,
         "turn_id":         turn_id,
     }
+    return grounded, duration_ms
 
-    # ── 3. turns.jsonl append ──────────────────────────────
-    if write_turn:
-        append_turn(
-            turn_id=turn_id,
-            session_id=session_id,
-            utterance=utterance,
-            grounded=grounded,
-            prev_turn_id=prev_turn_id,
-            duration_ms=duration_ms,
+
+# ─── 배치 grounding (replay · backfill) ──────────────────────────
+
+_BATCH_CHUNK = 500
+
+
+def ground_batch(
+    requests,
+    write_turns: bool = True,
+    jobs: int = 1,
+) -> list[dict]:
+    """
+    [{"utterance", "intent_id", "session_context"?, "prev_turn_id"?}, ...] → GroundedCommand 목록 (입력 순서).
+    intent_id 별 lookup 과 같은 (intent, slots) 검증은 한 번만 하고, turn 은 끝에서
+    한 번의 buffered append 로 기록한다. jobs > 1 이면 chunk 를 process pool 에서 grounding 한다
+    (기록은 부모 프로세스가 입력 순서대로). stage span 의 append 는 일괄 append 시간을 turn 수로 나눈 값이다.
+    """
+    requests = list(requests)
+    if jobs > 1 and len(requests) > _BATCH_CHUNK:
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunks = [requests[i:i + _BATCH_CHUNK] for i in range(0, len(requests), _BATCH_CHUNK)]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = [pair for part in pool.map(_ground_chunk, chunks) for pair in part]
+    else:
+        results = _ground_chunk(requests)
+    if write_turns and results:
+        t0 = time.perf_counter()
+        append_turns([record for _, record, _ in results])
+        append_ms = _elapsed_ms(t0) / len(results)
+        append_spans([
+            build_spans_record(grounded["turn_id"], grounded["intent_id"], {**spans, "append": append_ms})
+            for grounded, _, spans in results
+        ])
+    return [grounded for grounded, _, _ in results]
+
+
+def _ground_chunk(requests: list[dict]) -> list[tuple[dict, dict, dict]]:
+    """chunk 안에서 lookup·검증 결과를 공유하며 (GroundedCommand, IntentTurn 레코드, spans) 를 만든다."""
+    intents: dict[str, dict | None] = {}
+    verdicts: dict[tuple, tuple[bool, list[str]]] = {}
+
+    def check(intent: dict, slots_filled: dict, reprompt_slots: list[str]) -> tuple[bool, list[str]]:
+        key = (intent["intent_id"], tuple(sorted(slots_filled.items())), tuple(reprompt_slots))
+        if key not in verdicts:
+            conforms, violations = validate(intent, slots_filled, reprompt_slots)
+            verdicts[key] = (conforms, list(violations))
+        conforms, violations = verdicts[key]
+        return conforms, list(violations)
+
+    results = []
+    for request in requests:
+        t_start = time.monotonic()
+        spans: dict[str, float] = {}
+        t0 = time.perf_counter()
+        intent_id = request["intent_id"]
+        if intent_id not in intents:
+            intents[intent_id] = lookup_intent(intent_id) if intent_id else None
+        spans["lookup"] = _elapsed_ms(t0)
+        grounded, duration_ms = _ground(
+            request["utterance"], intent_id, intents[intent_id],
+            request.get("session_context") or {}, check, t_start, spans,
+        )
+        record = build_turn_record(
+            grounded["turn_id"], grounded["session_id"], request["utterance"],
+            grounded, request.get("prev_turn_id"), duration_ms,
         )
+        results.append((grounded, record, spans))
+    return results
 
-    return grounded
+
+# ─── serve 모드 (프로세스 상주, JSON-lines) ──────────────────────
+# UUG 가 발화마다 subprocess 를 띄우면 Python 기동·registry 적재·SHACL parse 를
+# 매번 치른다. serve 는 이를 한 번만 하고 요청을 줄 단위로 받는다.
+#   요청: {"utterance", "intent_id", "session_context"?, "prev_turn_id"?, "write_turn"?}
+#   응답: GroundedCommand JSON 한 줄 | {"error": "..."}
+# turns.jsonl 은 서버 프로세스의 MSO_TURNS_PATH 에 기록된다.
+# 소켓 서버는 연결마다 thread 로 요청을 처리하고, turn append 만 _APPEND_LOCK 으로 직렬화한다
+# — 연결을 오래 잡고 있는 클라이언트가 다른 클라이언트를 막지 않는다.
+# 클라이언트 쪽 CLI 계약은 dispatch_client.py 가 유지한다.
+
+def warm() -> None:
+    """registry snapshot · SHACL shapes 를 미리 적재."""
+    list_intents()
+    _validator.warm()
+
+
+def handle_request(line: str) -> str:
+    """JSON 요청 한 줄 → JSON 응답 한 줄 (개행 없음). 요청 오류도 응답으로 돌려준다."""
+    import json
+
+    try:
+        request = json.loads(line)
+        grounded = ground(
+            request["utterance"],
+            intent_id=request["intent_id"],
+            session_context=request.get("session_context"),
+            prev_turn_id=request.get("prev_turn_id"),
+            write_turn=request.get("write_turn", True),
+        )
+    except Exception as e:  # noqa: BLE001 — 서버는 요청 하나 실패로 죽지 않는다
+        return json.dumps({"error": f"{type(e).__name__}: {e}"}, ensure_ascii=False)
+    return json.dumps(grounded, ensure_ascii=False)
+
+
+def serve_stdio(stdin=None, stdout=None) -> None:
+    """stdin JSON-lines → stdout JSON-lines. EOF 에서 종료."""
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    for line in stdin:
+        if not line.strip():
+            continue
+        stdout.write(handle_request(line) + "\n")
+        stdout.flush()
+
+
+def make_socket_server(socket_path: str | Path):
+    """Unix domain socket 서버 (연결당 thread, 연결당 여러 줄). 남아 있는 stale 소켓 파일은 지운다."""
+    import socketserver
+
+    class _Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            for raw in self.rfile:
+                line = raw.decode("utf-8")
+                if not line.strip():
+                    continue
+                self.wfile.write((handle_request(line) + "\n").encode("utf-8"))
+                self.wfile.flush()
+
+    path = Path(socket_path)
+    if path.exists() and not _socket_alive(path):
+        path.unlink()
+    server = socketserver.ThreadingUnixStreamServer(str(path), _Handler)
+    server.daemon_threads = True  # 종료 시 열린 연결을 기다리지 않는다
+    return server
+
+
+def _socket_alive(path: Path) -> bool:
+    import socket
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return False
+    return True
 
 
 # ─── CLI 진입점 (§11 배선: UUG→MSO subprocess 경계) ──────────────
@@ -122,13 +315,39 @@ def main(argv: list[str] | None = None) -> int:
     )
     sub = ap.add_subparsers(dest="cmd", required=True)
     g = sub.add_parser("ground", help="intent_id + 발화 → GroundedCommand JSON (stdout)")
-    g.add_argument("--intent-id", required=True, help="UUG 가 해석한 intent_id (필수)")
-    g.add_argument("--utterance", required=True, help="slot 추출용 원문 발화")
+    g.add_argument("--intent-id", help="UUG 가 해석한 intent_id (--batch 가 없으면 필수)")
+    g.add_argument("--utterance", help="slot 추출용 원문 발화 (--batch 가 없으면 필수)")
     g.add_argument("--session-context", default=None, help="SessionContext JSON (선택)")
     g.add_argument("--no-write", action="store_true", help="turns.jsonl append 생략(테스트)")
+    g.add_argument("--batch", type=Path, default=None,
+                   help="요청 JSON-lines 파일 — stdout 에 GroundedCommand JSON-lines, stderr 에 처리량")
+    g.add_argument("--jobs", type=int, default=1, help="--batch process pool 크기 (기본 1)")
+    sv = sub.add_parser("serve", help="상주 모드 — JSON-lines 요청을 stdin 또는 Unix 소켓으로 받는다")
+    sv.add_argument("--socket", default=None, help="Unix domain socket 경로 (없으면 stdin/stdout)")
     args = ap.parse_args(argv)
 
+    if args.cmd == "ground" and args.batch:
+        requests = []
+        with args.batch.open(encoding="utf-8") as f:
+            for lineno, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                request = json.loads(line)
+                if "utterance" not in request or "intent_id" not in request:
+                    ap.error(f"{args.batch}:{lineno}: utterance / intent_id 필요")
+                requests.append(request)
+        t_start = time.monotonic()
+        results = ground_batch(requests, write_turns=not args.no_write, jobs=args.jobs)
+        elapsed = time.monotonic() - t_start
+        for grounded in results:
+            print(json.dumps(grounded, ensure_ascii=False))
+        rate = len(results) / elapsed if elapsed > 0 else float("inf")
+        print(f"[ground --batch] {len(results)} turns in {elapsed:.2f}s "
+              f"({rate:.0f} turns/s, jobs={args.jobs})", file=sys.stderr)
+        return 0
     if args.cmd == "ground":
+        if not args.intent_id or args.utterance is None:
+            ap.error("ground: --intent-id 와 --utterance 가 필요하다 (또는 --batch)")
         ctx = json.loads(args.session_context) if args.session_context else None
         grounded = ground(
             args.utterance,
@@ -138,6 +357,20 @@ def main(argv: list[str] | None = None) -> int:
         )
         print(json.dumps(grounded, ensure_ascii=False))
         return 0
+    if args.cmd == "serve":
+        warm()
+        if not args.socket:
+            serve_stdio()
+            return 0
+        server = make_socket_server(args.socket)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            Path(args.socket).unlink(missing_ok=True)
+        return 0
     return 1
 
 
@@ -4,6 +4,7 @@ SessionContext + utterance token 추출로 SlotSpec 채움.
 required 미충족 시 reprompt_needed=True.
 """
 from __future__ import annotations
+import copy
 import re
 
 
@@ -20,6 +21,7 @@ def fill_slots(
     """
     slots_filled: dict    = {}
     reprompt_slots: list[str] = []
+    extracted = compile_extractor(intent).extract(utterance)
 
     for spec in intent.get("slot_specs", []):
         name   = spec["slot_name"]
@@ -27,7 +29,7 @@ def fill_slots(
         req    = spec.get("required", False)
 
         value = (
-            _extract_from_utterance(utterance, name, spec)
+            extracted.get(name)
             or _from_session(session_ctx, name)
             or (spec.get("default_value") if policy == "default" else None)
         )
@@ -40,7 +42,15 @@ def fill_slots(
     return slots_filled, bool(reprompt_slots), reprompt_slots
 
 
-# ─── 추출 헬퍼 ───────────────────────────────────────────────
+# ─── 추출 엔진 ───────────────────────────────────────────────
+# intent 의 entity 패턴 · keyword 어휘를 load 시점에 정규식 하나(슬롯별 named group
+# alternation)로 합친다. 추출은 결합 정규식 search 를 매치 시작 + 1 에서 이어 가는 한 번의
+# 스캔이다 — 다른 슬롯 매치 안에 숨은 매치(예: "ticket-217높여줘")도 놓치지 않고, 같은 위치에서
+# 시작하는 다른 슬롯 패턴은 그 위치에서만 match 로 확인한다. 슬롯별 결과는 슬롯별 개별 탐색과
+# 같다: entity 는 첫 매치, keyword 는 발화 위치와 무관하게 어휘 dict 순서상 가장 앞선 단어.
+# entity 는 원문, keyword 는 소문자화한 발화를 훑으므로 스캔은 (있으면) 두 번이다.
+# 각 패턴의 첫 글자 집합을 알 수 있으면 결합 정규식 앞에 `(?=[..])` guard 를 붙여 후보가 아닌
+# 위치를 건너뛴다 (모르면 guard 없이 — 결과는 같다).
 
 _ENTITY_PATTERNS = {
     "ticket_ref":   re.compile(r"\bticket-\w+\b", re.I),
@@ -56,29 +66,155 @@ _PRIORITY_WORDS = {
     "긴급": "urgent", "urgent": "urgent",
 }
 
+# slot → keyword 어휘 (dict 순서 = 우선순위, 발화 안 위치와 무관)
+_SLOT_VOCABULARIES = {
+    "new_priority": _PRIORITY_WORDS,
+}
 
-def _extract_from_utterance(utterance: str, slot_name: str, spec: dict) -> str | None:
-    slot_type = spec.get("slot_type", "free_text")
+# free_text 슬롯 중 정규화된 발화 전체를 값으로 쓰는 것
+_WHOLE_UTTERANCE_SLOTS = ("task_description",)
+
+
+class _Scan:
+    """group 별 패턴을 named group alternation 하나로 합친 정규식과, 매치 시작 글자별 확인할 group 표."""
+
+    def __init__(self, groups: dict[str, re.Pattern], leads: dict[str, frozenset[str] | None], flags: int) -> None:
+        self._groups = groups
+        body = "|".join(f"(?P<{group}>{pat.pattern})" for group, pat in groups.items())
+        if all(leads.values()):
+            first = frozenset().union(*leads.values())
+            body = f"(?=[{''.join(re.escape(c) for c in sorted(first))}])(?:{body})"
+        self.pattern = re.compile(body, flags)
+        # 매치 시작 글자 → 그 위치에서 확인할 group (첫 글자를 모르는 group 은 항상)
+        self._unknown_lead = tuple(g for g, lead in leads.items() if lead is None)
+        self._by_lead: dict[str, tuple[str, ...]] = {}
+        for c in frozenset().union(*(lead for lead in leads.values() if lead)):
+            self._by_lead[c] = tuple(g for g, lead in leads.items() if lead is None or c in lead)
+
+    def hits(self, text: str, pending: set[str]):
+        """text 를 한 번 훑으며 pending 에 남은 group 의 (group, 매치 문자열) 을 위치 순으로 낸다."""
+        search = self.pattern.search
+        pos = 0
+        while pending:
+            m = search(text, pos)
+            if m is None:
+                break
+            start = m.start()
+            for group in self._by_lead.get(text[start].lower(), self._unknown_lead):
+                if group not in pending:
+                    continue
+                hit = m if group == m.lastgroup else self._groups[group].match(text, start)
+                if hit is not None:
+                    yield group, hit.group(group) if hit is m else hit.group()
+            pos = start + 1
+
+
+class SlotExtractor:
+    """
+    intent 하나의 utterance 슬롯 추출기.
+    entity 패턴은 원문에 re.I 로, keyword 어휘는 소문자화한 발화에 대소문자 구분으로 맞춘다 —
+    개별 탐색(`word in utterance.lower()`)과 같은 case folding 이어야 "hİgh" 같은 발화가 어휘에 없는
+    매치를 내지 않는다.
+    """
 
-    if slot_type == "entity_ref":
-        pat = _ENTITY_PATTERNS.get(slot_name)
-        if pat:
-            m = pat.search(utterance)
-            return m.group(0).lower() if m else None
+    def __init__(self, specs: list[dict]) -> None:
+        entity_groups: dict[str, re.Pattern] = {}
+        entity_leads: dict[str, frozenset[str] | None] = {}
+        vocab_groups: dict[str, re.Pattern] = {}
+        vocab_leads: dict[str, frozenset[str] | None] = {}
+        self._entity: dict[str, str] = {}               # group → slot
+        self._vocab: dict[str, tuple[str, dict]] = {}   # group → (slot, {word: (rank, value)})
+        self._whole: list[str] = []
+        for i, spec in enumerate(specs):
+            name      = spec["slot_name"]
+            slot_type = spec.get("slot_type", "free_text")
+            group     = f"s{i}"
+            if slot_type == "entity_ref" and name in _ENTITY_PATTERNS:
+                self._entity[group] = name
+                entity_groups[group] = _ENTITY_PATTERNS[name]
+                entity_leads[group] = _lead_chars(_ENTITY_PATTERNS[name].pattern)
+            elif name in _SLOT_VOCABULARIES:
+                ranks = {
+                    w.lower(): (rank, val)
+                    for rank, (w, val) in enumerate(_SLOT_VOCABULARIES[name].items())
+                }
+                self._vocab[group] = (name, ranks)
+                words = sorted(ranks, key=len, reverse=True)
+                vocab_groups[group] = re.compile("|".join(re.escape(w) for w in words))
+                vocab_leads[group] = frozenset(w[0] for w in words if w)
+            elif slot_type == "free_text" and name in _WHOLE_UTTERANCE_SLOTS:
+                self._whole.append(name)
+        self._entity_scan = _Scan(entity_groups, entity_leads, re.I) if entity_groups else None
+        self._vocab_scan = _Scan(vocab_groups, vocab_leads, 0) if vocab_groups else None
+        self._single_entity = (
+            next(iter(self._entity.values())) if len(self._entity) == 1 and not self._vocab else None
+        )
 
-    if slot_name == "new_priority":
-        utt_lower = utterance.lower()
-        for word, val in _PRIORITY_WORDS.items():
-            if word in utt_lower:
-                return val
+    def extract(self, utterance: str) -> dict[str, str]:
+        found: dict[str, str] = {}
+        if self._single_entity is not None:
+            # entity 슬롯 하나뿐이면 첫 매치가 곧 답
+            m = self._entity_scan.pattern.search(utterance)
+            if m is not None:
+                found[self._single_entity] = m.group().lower()
+        elif self._entity_scan is not None:
+            pending = set(self._entity)
+            for group, text in self._entity_scan.hits(utterance, pending):
+                found[self._entity[group]] = text.lower()
+                pending.discard(group)
+        if self._vocab_scan is not None:
+            best: dict[str, tuple[int, str]] = {}
+            pending = set(self._vocab)   # 아직 더 앞선 단어가 나올 수 있는 group
+            for group, text in self._vocab_scan.hits(utterance.lower(), pending):
+                name, ranks = self._vocab[group]
+                rank = ranks[text]
+                if name not in best or rank < best[name]:
+                    best[name] = rank
+                if rank[0] == 0:
+                    pending.discard(group)
+            for name, (_, value) in best.items():
+                found[name] = value
+        for name in self._whole:
+            if utterance.strip():
+                found[name] = utterance.strip()
+        return found
+
+
+def _lead_chars(pattern: str) -> frozenset[str] | None:
+    """
+    `\\b` + 글자 또는 `[..]` 로 시작하는 단순 패턴(top-level `|` 허용)의 첫 글자 집합 (소문자).
+    그 밖의 형태는 None.
+    """
+    if "(" in pattern:
         return None
-
-    if slot_type == "free_text":
-        # task_description 등 — 전체 utterance를 fallback으로
-        if slot_name == "task_description":
-            return utterance.strip() or None
-
-    return None
+    leads: set[str] = set()
+    for branch in pattern.split("|"):
+        if branch.startswith(r"\b"):
+            branch = branch[2:]
+        if not branch or branch[0] in "\\.^$*+?{":
+            return None
+        if branch[0] == "[":
+            close = branch.find("]")
+            chars = branch[1:close]
+            if close < 0 or not chars or any(c in chars for c in "\\^-"):
+                return None
+            leads.update(chars.lower())
+        else:
+            leads.add(branch[0].lower())
+    return frozenset(leads)
+
+
+_extractors: dict[str, tuple[list, SlotExtractor]] = {}
+
+
+def compile_extractor(intent: dict) -> SlotExtractor:
+    """intent 의 SlotExtractor (intent_id 별 memo — slot_specs 가 같으면 재컴파일 없음)."""
+    specs = intent.get("slot_specs", [])
+    intent_id = intent.get("intent_id", "")
+    cached = _extractors.get(intent_id)
+    if cached is None or cached[0] != specs:
+        cached = _extractors[intent_id] = (copy.deepcopy(specs), SlotExtractor(specs))
+    return cached[1]
 
 
 def _from_session(session_ctx: dict, slot_name: str) -> str | None:
@@ -1,15 +1,41 @@
 """
 script slot — IntentTurn turns.jsonl append.
 MSO_TURNS_PATH 환경변수로 경로 오버라이드 가능 (테스트용).
+
+여러 dispatcher 프로세스가 같은 파일에 쓰므로 append 는 fcntl.flock 배타 잠금 안에서
+한 번의 write 로 한다 (줄 단위 interleave 없음). 빈 파일의 schema 헤더도 같은 잠금 안에서
+첫 batch 와 함께 쓰므로 헤더 경쟁이 없다.
+
+group commit: TurnWriter 는 레코드를 모아 flush_count 개가 차거나 flush_ms 가 지나면
+한 번에 append 한다 (기본 1개 = 즉시 기록, 프로세스 종료 시 남은 buffer flush).
+  MSO_TURNS_FLUSH_COUNT   group commit 레코드 수 (기본 1)
+  MSO_TURNS_FLUSH_MS      buffer 최대 체류 시간 ms (기본 200)
+
+rotation: 활성 파일이 MSO_TURNS_ROTATE_BYTES 이상이거나(MSO_TURNS_ROTATE_DAILY=1 이면)
+헤더 created_at 의 UTC 날짜가 지났으면, 잠금을 쥔 writer 가 파일을
+`<stem>.<UTC %Y%m%dT%H%M%S%fZ>.jsonl` 봉인 구간으로 rename 하고(읽기 전용) 새 파일을 연다.
+봉인 구간은 더 이상 바뀌지 않으므로 analytics 는 이름 순서대로 한 번씩만 ingest 한다.
+
+stage span sidecar: ground 단계별 소요 시간(ms)은 turn 레코드가 아니라 같은 디렉터리의
+`<stem>_spans.jsonl`(기본 turns_spans.jsonl) 에 같은 잠금·group commit·rotation 규칙으로 기록한다 (append 자체의 시간까지
+담기 위해 turn append 뒤에 쓴다).
+  MSO_TURN_SPANS_PATH     sidecar 경로 (기본: turns.jsonl 옆 turns_spans.jsonl, "off" 면 기록 안 함)
 """
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import threading
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows — 잠금 없이 O_APPEND 단일 write 에 의존
+    fcntl = None  # type: ignore[assignment]
+
 
 _DEFAULT_TURNS_PATH = Path("workspace/.mso-context/conversation/turns.jsonl")
 
@@ -19,19 +45,40 @@ SCHEMA_HEADER = {
     "intent_schema": "nlu_intent/0.1.0",
 }
 
+SPANS_HEADER = {
+    "type": "schema",
+    "version": "0.1.0",
+    "spans_schema": "turn_spans/0.1.0",
+}
+
+SEALED_STAMP = "%Y%m%dT%H%M%S%fZ"
+
 
 def _turns_path() -> Path:
     env = os.environ.get("MSO_TURNS_PATH")
     return Path(env) if env else _DEFAULT_TURNS_PATH
 
 
-def _ensure_file(path: Path) -> None:
-    """파일 없으면 schema 헤더 행 포함해 초기화."""
-    if not path.exists():
-        path.parent.mkdir(parents=True, exist_ok=True)
-        header = dict(SCHEMA_HEADER)
-        header["created_at"] = datetime.now(timezone.utc).isoformat()
-        path.write_text(json.dumps(header, ensure_ascii=False) + "\n")
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def spans_path() -> Path | None:
+    """stage span sidecar 경로 (MSO_TURN_SPANS_PATH=off 면 None)."""
+    env = os.environ.get("MSO_TURN_SPANS_PATH")
+    if env:
+        return None if env.lower() == "off" else Path(env)
+    turns = _turns_path()
+    return turns.with_name(f"{turns.stem}_spans{turns.suffix}")
+
+
+def _header_line(schema: dict = SCHEMA_HEADER) -> bytes:
+    header = dict(schema)
+    header["created_at"] = datetime.now(timezone.utc).isoformat()
+    return (json.dumps(header, ensure_ascii=False) + "\n").encode("utf-8")
 
 
 def new_turn_id() -> str:
@@ -39,22 +86,152 @@ def new_turn_id() -> str:
     return str(uuid.uuid4())
 
 
-def append_turn(
+def sealed_segments(path: Path) -> list[Path]:
+    """path 의 봉인 구간 목록 (오래된 순)."""
+    return sorted(path.parent.glob(f"{path.stem}.*{path.suffix}"))
+
+
+# ─── 잠금 append + rotation ──────────────────────────────────
+
+def write_locked(
+    path: Path,
+    payload: bytes,
+    rotate_bytes: int = 0,
+    rotate_daily: bool = False,
+    header: dict = SCHEMA_HEADER,
+) -> None:
+    """
+    payload (완결된 JSON-lines) 를 배타 잠금 안에서 한 번에 append (빈 파일이면 header 먼저).
+    잠금을 얻은 fd 가 더 이상 path 의 현재 파일이 아니면(다른 writer 가 rotate) 다시 연다.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    while True:
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            st = os.fstat(fd)
+            try:
+                current = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if current.st_ino != st.st_ino:
+                continue
+            if st.st_size and _should_rotate(fd, st.st_size, rotate_bytes, rotate_daily):
+                _seal(path)
+                continue
+            data = _header_line(header) + payload if st.st_size == 0 else payload
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            return
+        finally:
+            os.close(fd)  # close 가 flock 도 푼다
+
+
+def _should_rotate(fd: int, size: int, rotate_bytes: int, rotate_daily: bool) -> bool:
+    if rotate_bytes and size >= rotate_bytes:
+        return True
+    if rotate_daily:
+        first = os.pread(fd, 4096, 0).split(b"\n", 1)[0] if hasattr(os, "pread") else b""
+        try:
+            created = json.loads(first).get("created_at", "")
+        except ValueError:
+            return False
+        return created[:10] < datetime.now(timezone.utc).date().isoformat()
+    return False
+
+
+def _seal(path: Path) -> Path:
+    """활성 파일 → 읽기 전용 봉인 구간 (잠금 보유 중에만 호출)."""
+    stamp = datetime.now(timezone.utc).strftime(SEALED_STAMP)
+    sealed = path.with_name(f"{path.stem}.{stamp}{path.suffix}")
+    os.rename(path, sealed)
+    os.chmod(sealed, 0o444)
+    return sealed
+
+
+# ─── group commit ────────────────────────────────────────────
+
+class TurnWriter:
+    """레코드를 모아 count / 시간 기준으로 write_locked 한 번에 flush 하는 buffer."""
+
+    def __init__(
+        self,
+        path: Path,
+        flush_count: int | None = None,
+        flush_ms: int | None = None,
+        rotate_bytes: int | None = None,
+        rotate_daily: bool | None = None,
+        header: dict = SCHEMA_HEADER,
+    ) -> None:
+        self.path = path
+        self.header = header
+        self.flush_count = max(1, flush_count if flush_count is not None else _env_int("MSO_TURNS_FLUSH_COUNT", 1))
+        self.flush_ms = flush_ms if flush_ms is not None else _env_int("MSO_TURNS_FLUSH_MS", 200)
+        self.rotate_bytes = rotate_bytes if rotate_bytes is not None else _env_int("MSO_TURNS_ROTATE_BYTES", 0)
+        self.rotate_daily = (
+            rotate_daily if rotate_daily is not None
+            else os.environ.get("MSO_TURNS_ROTATE_DAILY", "") not in ("", "0")
+        )
+        self._buffer: list[bytes] = []
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+
+    def append(self, records: list[dict]) -> None:
+        lines = [(json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8") for record in records]
+        with self._lock:
+            self._buffer.extend(lines)
+            if len(self._buffer) >= self.flush_count:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_ms / 1000, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer:
+            return
+        payload = b"".join(self._buffer)
+        self._buffer.clear()
+        write_locked(self.path, payload, self.rotate_bytes, self.rotate_daily, self.header)
+
+
+_writers: dict[Path, TurnWriter] = {}
+
+
+def _writer(path: Path | None = None, header: dict = SCHEMA_HEADER) -> TurnWriter:
+    path = path or _turns_path()
+    writer = _writers.get(path)
+    if writer is None:
+        writer = _writers[path] = TurnWriter(path, header=header)
+    return writer
+
+
+@atexit.register
+def flush_all() -> None:
+    """buffer 에 남은 turn 을 모두 기록 (종료 시 자동 호출)."""
+    for writer in list(_writers.values()):
+        writer.flush()
+
+
+def build_turn_record(
     turn_id: str,
     session_id: str,
     utterance: str,
     grounded: dict,
     prev_turn_id: str | None,
     duration_ms: int,
-) -> None:
-    """
-    IntentTurn 레코드를 turns.jsonl에 append.
-    grounded: GroundedCommand dict
-    """
-    path = _turns_path()
-    _ensure_file(path)
-
-    record = {
+) -> dict:
+    """GroundedCommand → IntentTurn 레코드 (timestamp 는 지금)."""
+    return {
         "type":                         "turn",
         "turn_id":                      turn_id,
         "session_id":                   session_id,
@@ -70,5 +247,44 @@ def append_turn(
         "duration_ms":                  duration_ms,
         "prev_turn_id":                 prev_turn_id,
     }
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def append_turns(records: list[dict]) -> None:
+    """IntentTurn 레코드 여러 개를 group commit buffer 에 넣는다 (기본 설정은 즉시 한 번에 append)."""
+    if records:
+        _writer().append(records)
+
+
+def append_turn(
+    turn_id: str,
+    session_id: str,
+    utterance: str,
+    grounded: dict,
+    prev_turn_id: str | None,
+    duration_ms: int,
+) -> None:
+    """
+    IntentTurn 레코드를 turns.jsonl에 append.
+    grounded: GroundedCommand dict
+    """
+    append_turns([
+        build_turn_record(turn_id, session_id, utterance, grounded, prev_turn_id, duration_ms)
+    ])
+
+
+def build_spans_record(turn_id: str, intent_id: str | None, spans_ms: dict[str, float]) -> dict:
+    """ground 단계별 소요 시간 → turn_spans 레코드."""
+    return {
+        "type":      "spans",
+        "turn_id":   turn_id,
+        "intent_id": intent_id,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "spans_ms":  {stage: round(ms, 3) for stage, ms in spans_ms.items()},
+    }
+
+
+def append_spans(records: list[dict]) -> None:
+    """turn_spans 레코드를 sidecar 에 append (MSO_TURN_SPANS_PATH=off 면 무시)."""
+    path = spans_path()
+    if records and path is not None:
+        _writer(path, SPANS_HEADER).append(records)
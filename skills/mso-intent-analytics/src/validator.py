@@ -1,74 +1,207 @@
 """
-script slot — SHACL Validator (+ 직접 required-slot 검증 fallback)
-SHACL 파일 없으면 SlotSpec required 직접 확인으로 대체.
+script slot — slot Validator (precompiled SHACL 제약 + SlotSpec required).
+
+SHACL shapes(`generated/nlu_intent.shacl.ttl`)는 mtime 기준으로 한 번만 parse 하고,
+mso:GroundedCommand 대상 property shape 의 minCount / maxCount / datatype / sh:in 을
+평범한 Python 제약으로 컴파일한다. intent 별 validator = shapes 제약 + SlotSpec.required
+(minCount 1) 이며 per-turn 검증은 dict 조회뿐이다. shapes 파일이 없으면 SlotSpec 제약만 남는다.
+
+pyshacl 은 검증 모드(`validate(..., verify=True)` 또는 MSO_SHACL_VERIFY=1)에서만 쓴다 —
+같은 데이터 graph 를 shapes + intent shape 로 pyshacl 검증해 두 경로의 판정이 다르면
+ValidatorMismatch 를 던진다.
 """
 from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
 
 _SHACL_PATH = (
     Path(__file__).parent.parent / "generated" / "nlu_intent.shacl.ttl"
 )
 
+_MSO = "https://mso.dev/ontology/"
+_XSD_STRING = "http://www.w3.org/2001/XMLSchema#string"
+
+# (mtime, shapes Graph, {path: [PropertyConstraint]}) — 파일이 바뀌면 다시 parse·컴파일
+_shapes_cache: tuple[float, object, dict] | None = None
+# (shapes mtime, intent_id, required slots) → CompiledValidator
+_compiled: dict[tuple, "CompiledValidator"] = {}
+
+
+class ValidatorMismatch(RuntimeError):
+    """검증 모드에서 컴파일된 validator 와 pyshacl 의 판정이 다를 때."""
+
+
+@dataclass(frozen=True)
+class PropertyConstraint:
+    """property shape 하나 (sh:path 는 mso: 로컬명)."""
+    path: str
+    min_count: int = 0
+    max_count: int | None = None
+    datatype: str | None = None
+    allowed: frozenset[str] | None = None    # sh:in — 문자열 literal 의 lexical form
+
+
+@dataclass
+class CompiledValidator:
+    intent_id: str
+    constraints: dict[str, list[PropertyConstraint]] = field(default_factory=dict)
+
+    def __call__(self, slots_filled: dict) -> tuple[bool, list[str]]:
+        violations = []
+        for path, constraints in self.constraints.items():
+            if path == "intent_id":
+                values = [self.intent_id]
+            else:
+                values = [] if path not in slots_filled else [str(slots_filled[path])]
+            for c in constraints:
+                violations.extend(_check(self.intent_id, c, values))
+        return (len(violations) == 0), violations
+
+
+def warm() -> None:
+    """SHACL 파일이 있으면 shapes parse·컴파일을 미리 해 둔다 (dispatch serve 용)."""
+    if _SHACL_PATH.exists():
+        try:
+            _shapes()
+        except Exception:
+            pass
+
+
+def _shapes() -> tuple[float, object, dict]:
+    global _shapes_cache
+    from rdflib import Graph  # type: ignore
+
+    mtime = _SHACL_PATH.stat().st_mtime
+    if _shapes_cache is None or _shapes_cache[0] != mtime:
+        shapes_g = Graph()
+        shapes_g.parse(str(_SHACL_PATH), format="turtle")
+        _shapes_cache = (mtime, shapes_g, _compile_shapes(shapes_g))
+    return _shapes_cache
+
+
+def _shapes_graph():
+    return _shapes()[1]
+
+
+def _compile_shapes(shapes_g) -> dict[str, list[PropertyConstraint]]:
+    """mso:GroundedCommand 를 targetClass 로 하는 NodeShape 의 property 제약만 추린다."""
+    from rdflib import Literal, Namespace, URIRef  # type: ignore
+    from rdflib.collection import Collection  # type: ignore
+    from rdflib.namespace import SH  # type: ignore
+
+    mso = Namespace(_MSO)
+    constraints: dict[str, list[PropertyConstraint]] = {}
+    for shape in shapes_g.subjects(SH.targetClass, mso.GroundedCommand):
+        for prop in shapes_g.objects(shape, SH.property):
+            path = shapes_g.value(prop, SH.path)
+            if not isinstance(path, URIRef) or not str(path).startswith(_MSO):
+                continue
+            in_list = shapes_g.value(prop, SH["in"])
+            allowed = None
+            if in_list is not None:
+                allowed = frozenset(
+                    str(v) for v in Collection(shapes_g, in_list)
+                    if isinstance(v, Literal) and v.language is None
+                    and (v.datatype is None or str(v.datatype) == _XSD_STRING)
+                )
+            max_count = shapes_g.value(prop, SH.maxCount)
+            datatype = shapes_g.value(prop, SH.datatype)
+            name = str(path)[len(_MSO):]
+            constraints.setdefault(name, []).append(PropertyConstraint(
+                path=name,
+                min_count=int(shapes_g.value(prop, SH.minCount) or 0),
+                max_count=None if max_count is None else int(max_count),
+                datatype=None if datatype is None else str(datatype),
+                allowed=allowed,
+            ))
+    return constraints
+
+
+def _check(intent_id: str, c: PropertyConstraint, values: list[str]) -> list[str]:
+    # slot 값은 모두 plain 문자열 literal 로 graph 에 들어가므로 xsd:string 만 datatype 을 만족한다
+    if len(values) < c.min_count:
+        return [f"{intent_id} requires slot '{c.path}'"]
+    out = []
+    if c.max_count is not None and len(values) > c.max_count:
+        out.append(f"{intent_id} slot '{c.path}' allows at most {c.max_count} value(s)")
+    if values and c.datatype is not None and c.datatype != _XSD_STRING:
+        out.append(f"{intent_id} slot '{c.path}' must be {c.datatype}")
+    if values and c.allowed is not None and any(v not in c.allowed for v in values):
+        out.append(f"{intent_id} slot '{c.path}' must be one of {sorted(c.allowed)}")
+    return out
+
+
+def compiled_validator(intent: dict) -> CompiledValidator:
+    """intent 별 validator (shapes mtime · intent_id · required slot 기준 memo)."""
+    required = tuple(
+        spec["slot_name"] for spec in intent.get("slot_specs", []) if spec.get("required")
+    )
+    mtime, _, shape_constraints = _shapes() if _SHACL_PATH.exists() else (None, None, {})
+    key = (mtime, intent.get("intent_id", "unknown"), required)
+    if key not in _compiled:
+        if len(_compiled) > 1024:
+            _compiled.clear()
+        constraints = {path: list(cs) for path, cs in shape_constraints.items()}
+        for name in required:
+            constraints.setdefault(name, []).insert(0, PropertyConstraint(path=name, min_count=1))
+        _compiled[key] = CompiledValidator(key[1], constraints)
+    return _compiled[key]
+
 
 def validate(
     intent: dict,
     slots_filled: dict,
     reprompt_slots: list[str],
+    verify: bool | None = None,
 ) -> tuple[bool, list[str]]:
     """
     Returns: (conforms, violation_messages)
-    conforms=True  → SHACL OK
+    conforms=True  → 제약 OK
     conforms=False → violations 목록 반환
+    verify: True 면 pyshacl 로도 검증해 판정 불일치 시 ValidatorMismatch (기본: MSO_SHACL_VERIFY)
     """
-    # 방법 1: SHACL 파일 있으면 pyshacl 사용
-    if _SHACL_PATH.exists():
-        return _shacl_validate(intent, slots_filled, reprompt_slots)
-
-    # 방법 2: fallback — required 슬롯 직접 체크
-    return _direct_validate(intent, slots_filled)
-
-
-def _direct_validate(
-    intent: dict,
-    slots_filled: dict,
-) -> tuple[bool, list[str]]:
-    """SlotSpec.required 기반 직접 검증."""
-    violations = []
-    for spec in intent.get("slot_specs", []):
-        if spec.get("required") and spec["slot_name"] not in slots_filled:
-            violations.append(
-                f"{intent['intent_id']} requires slot '{spec['slot_name']}'"
+    conforms, violations = compiled_validator(intent)(slots_filled)
+    if verify is None:
+        verify = os.environ.get("MSO_SHACL_VERIFY", "") not in ("", "0")
+    if verify:
+        shacl_conforms, report = _shacl_validate(intent, slots_filled)
+        if shacl_conforms != conforms:
+            raise ValidatorMismatch(
+                f"{intent.get('intent_id')}: compiled={conforms} pyshacl={shacl_conforms}\n"
+                f"{violations}\n{report}"
             )
-    return (len(violations) == 0), violations
+    return conforms, violations
 
 
-def _shacl_validate(
-    intent: dict,
-    slots_filled: dict,
-    reprompt_slots: list[str],
-) -> tuple[bool, list[str]]:
-    """pyshacl 사용 검증. SHACL 파일이 존재할 때만 호출됨."""
-    try:
-        from pyshacl import validate as shacl_validate  # type: ignore
-        from rdflib import Graph, Literal, Namespace, RDF, URIRef  # type: ignore
-
-        MSO = Namespace("https://mso.dev/ontology/")
-        data_g = Graph()
-        intent_id = intent.get("intent_id", "unknown")
-        subj = URIRef(f"https://mso.dev/command/{intent_id}")
-        data_g.add((subj, RDF.type, MSO.GroundedCommand))
-        data_g.add((subj, MSO.intent_id, Literal(intent_id)))
-        for k, v in slots_filled.items():
-            data_g.add((subj, MSO[k], Literal(str(v))))
+def _shacl_validate(intent: dict, slots_filled: dict) -> tuple[bool, str]:
+    """검증 모드 전용 — shapes + intent SlotSpec shape 로 pyshacl 검증."""
+    from pyshacl import validate as shacl_validate  # type: ignore
+    from rdflib import BNode, Graph, Literal, Namespace, RDF, URIRef  # type: ignore
+    from rdflib.namespace import SH  # type: ignore
 
-        shapes_g = Graph()
-        shapes_g.parse(str(_SHACL_PATH), format="turtle")
+    MSO = Namespace(_MSO)
+    data_g = Graph()
+    intent_id = intent.get("intent_id", "unknown")
+    subj = URIRef(f"https://mso.dev/command/{intent_id}")
+    data_g.add((subj, RDF.type, MSO.GroundedCommand))
+    data_g.add((subj, MSO.intent_id, Literal(intent_id)))
+    for k, v in slots_filled.items():
+        data_g.add((subj, MSO[k], Literal(str(v))))
+
+    shapes_g = Graph()
+    if _SHACL_PATH.exists():
+        shapes_g += _shapes_graph()
+    intent_shape = URIRef(f"https://mso.dev/shape/{intent_id}")
+    shapes_g.add((intent_shape, RDF.type, SH.NodeShape))
+    shapes_g.add((intent_shape, SH.targetNode, subj))
+    for spec in intent.get("slot_specs", []):
+        if spec.get("required"):
+            prop = BNode()
+            shapes_g.add((intent_shape, SH.property, prop))
+            shapes_g.add((prop, SH.path, MSO[spec["slot_name"]]))
+            shapes_g.add((prop, SH.minCount, Literal(1)))
 
-        conforms, _, report = shacl_validate(data_g, shacl_graph=shapes_g)
-        if not conforms:
-            violations = [str(report)]
-            return False, violations
-        return True, []
-    except Exception as e:
-        # SHACL 실패 시 fallback
-        return _direct_validate(intent, slots_filled)
+    conforms, _, report = shacl_validate(data_g, shacl_graph=shapes_g)
+    return bool(conforms), str(report)
@@ -71,6 +71,54 @@ def test_slot_filler_default_value():
     assert slots.get("reason") == "manual_retry"
 
 
+def _reference_extract(utterance: str, spec: dict):
+    """슬롯별 개별 탐색 (결합 정규식 이전 동작) — 추출 엔진 동치성 기준."""
+    from slot_filler import _ENTITY_PATTERNS, _PRIORITY_WORDS  # type: ignore
+
+    name, slot_type = spec["slot_name"], spec.get("slot_type", "free_text")
+    if slot_type == "entity_ref" and name in _ENTITY_PATTERNS:
+        m = _ENTITY_PATTERNS[name].search(utterance)
+        return m.group(0).lower() if m else None
+    if name == "new_priority":
+        return next((v for w, v in _PRIORITY_WORDS.items() if w in utterance.lower()), None)
+    if slot_type == "free_text" and name == "task_description":
+        return utterance.strip() or None
+    return None
+
+
+def test_slot_extractor_matches_per_slot_search():
+    import random
+
+    from lookup import list_intents  # type: ignore
+    from slot_filler import compile_extractor  # type: ignore
+
+    specs = [
+        {"slot_name": n, "slot_type": "entity_ref"} for n in ("ticket_ref", "run_ref", "workflow_ref", "gate_ref")
+    ] + [
+        {"slot_name": "new_priority", "slot_type": "enum_value"},
+        {"slot_name": "task_description", "slot_type": "free_text"},
+    ]
+    intents = [{"intent_id": "all", "slot_specs": specs}, *list_intents()]
+    pieces = ["ticket-217", "TICKET-9", "run-abc", "wf-x1", "h1 gate", "H2gate", "gate-run-7",
+              "높여", "낮춰", "LOW", "긴급", "high", "보통", "재실행", "좀", " ", "-", "ticket-", "run",
+              "hİgh", "hıgh", "HIGH", "İ", "ı", "urgent", "NORMAL"]
+    rng = random.Random(19)
+    for _ in range(2000):
+        utterance = "".join(rng.choice(pieces) + rng.choice(["", " "]) for _ in range(rng.randint(0, 8)))
+        for intent in intents:
+            extracted = compile_extractor(intent).extract(utterance)
+            for spec in intent["slot_specs"]:
+                assert extracted.get(spec["slot_name"]) == _reference_extract(utterance, spec), (utterance, spec)
+
+
+    # re.I 의 Unicode case folding 으로만 맞는 발화는 개별 탐색처럼 매치 없음 (KeyError 없이)
+    from slot_filler import fill_slots  # type: ignore
+
+    priority = {"intent_id": "p", "slot_specs": [{"slot_name": "new_priority", "slot_type": "enum_value"}]}
+    for utterance in ("ticket-1 hİgh", "ticket-1 hıgh"):
+        assert fill_slots(priority, utterance, {}) == ({}, False, [])
+
+
 # ─── resolver ────────────────────────────────────────────────
 
 def test_resolver_ticket():
@@ -107,6 +155,49 @@ def test_validator_fail_missing_required():
     assert any("ticket_ref" in v for v in violations)
 
 
+_SHAPES_TTL = """
+@prefix sh:  <http://www.w3.org/ns/shacl#> .
+@prefix mso: <https://mso.dev/ontology/> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+mso:GroundedCommandShape a sh:NodeShape ;
+    sh:targetClass mso:GroundedCommand ;
+    sh:property [ sh:path mso:intent_id ; sh:minCount 1 ; sh:datatype xsd:string ] ;
+    sh:property [ sh:path mso:priority ; sh:datatype xsd:string ; sh:in ( "low" "high" ) ] ;
+    sh:property [ sh:path mso:retries ; sh:datatype xsd:integer ] .
+"""
+
+
+def test_compiled_validator_agrees_with_pyshacl(tmp_path, monkeypatch):
+    import validator  # type: ignore
+
+    shapes = tmp_path / "nlu_intent.shacl.ttl"
+    shapes.write_text(_SHAPES_TTL, encoding="utf-8")
+    monkeypatch.setattr(validator, "_SHACL_PATH", shapes)
+    intent = lookup_intent("dispatch_ticket")
+    cases = [
+        ({"ticket_ref": "ticket-217"}, True),
+        ({"ticket_ref": "ticket-217", "priority": "high"}, True),
+        ({"ticket_ref": "ticket-217", "priority": "urgent"}, False),
+        ({"ticket_ref": "ticket-217", "retries": 3}, False),
+        ({"priority": "low"}, False),
+    ]
+    for slots, expected in cases:
+        conforms, violations = vld(intent, slots, [], verify=True)
+        assert conforms is expected, (slots, violations)
+    _, violations = vld(intent, {"priority": "urgent"}, [])
+    assert any("ticket_ref" in v for v in violations)
+    assert any("priority" in v and "high" in v for v in violations)
+
+    # 검증 모드가 아니면 pyshacl 을 부르지 않는다
+    def _no_pyshacl(*_a, **_k):
+        raise AssertionError("pyshacl called on the hot path")
+
+    monkeypatch.setattr(validator, "_shacl_validate", _no_pyshacl)
+    monkeypatch.delenv("MSO_SHACL_VERIFY", raising=False)
+    assert vld(intent, {"ticket_ref": "ticket-1", "priority": "low"}, [])[0]
+
+
 # ─── turn_writer ─────────────────────────────────────────────
 
 def test_turn_writer_appends(tmp_path):
@@ -129,6 +220,58 @@ def test_turn_writer_appends(tmp_path):
     os.environ["MSO_TURNS_PATH"] = _TMP_TURNS
 
 
+def _concurrent_writer(path: str, worker: int) -> None:
+    from turn_writer import TurnWriter  # type: ignore
+
+    writer = TurnWriter(Path(path), flush_count=7, flush_ms=50, rotate_bytes=16_384)
+    for i in range(150):
+        writer.append([{"type": "turn", "turn_id": f"w{worker}-{i}", "utterance": "x" * (i % 40)}])
+    writer.flush()
+
+
+def test_turn_writer_concurrent_group_commit_with_rotation(tmp_path):
+    import multiprocessing
+
+    from turn_writer import sealed_segments  # type: ignore
+
+    path = tmp_path / "turns.jsonl"
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=_concurrent_writer, args=(str(path), w)) for w in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+        assert p.exitcode == 0
+
+    segments = sealed_segments(path)
+    assert segments and all(seg.stat().st_mode & 0o222 == 0 for seg in segments)
+    turn_ids = []
+    for part in [*segments, path]:
+        rows = [json.loads(line) for line in part.read_text(encoding="utf-8").splitlines()]
+        assert rows[0]["type"] == "schema"
+        assert all(r["type"] == "turn" for r in rows[1:])
+        turn_ids += [r["turn_id"] for r in rows[1:]]
+    assert sorted(turn_ids) == sorted(f"w{w}-{i}" for w in range(4) for i in range(150))
+
+
+def test_turn_writer_flushes_buffer_on_count_and_time(tmp_path):
+    import time
+
+    from turn_writer import TurnWriter  # type: ignore
+
+    path = tmp_path / "turns.jsonl"
+    writer = TurnWriter(path, flush_count=3, flush_ms=50)
+    writer.append([{"type": "turn", "turn_id": "a"}, {"type": "turn", "turn_id": "b"}])
+    assert not path.exists()
+    writer.append([{"type": "turn", "turn_id": "c"}])
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 4
+    writer.append([{"type": "turn", "turn_id": "d"}])
+    deadline = time.monotonic() + 5
+    while len(path.read_text(encoding="utf-8").splitlines()) < 5 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert json.loads(path.read_text(encoding="utf-8").splitlines()[-1])["turn_id"] == "d"
+
+
 # ─── E2E 뒷단 (intent_id 입력 — 앞단은 UUG) ──────────────────
 
 def test_e2e_with_intent_id_extracts_slots():
@@ -179,3 +322,162 @@ def test_cli_ground_reprompt_path():
     grounded = json.loads(out.stdout)
     assert grounded["reprompt_needed"] is True
     assert "ticket_ref" in grounded["reprompt_slots"]
+
+
+# ─── serve 모드 (상주 프로세스 + CLI shim) ─────────────────────
+
+def test_serve_stdio_handles_many_requests():
+    import subprocess
+
+    requests = [
+        {"utterance": "ticket-217 재실행", "intent_id": "dispatch_ticket", "write_turn": False},
+        {"utterance": "재실행해줘", "intent_id": "dispatch_ticket", "write_turn": False},
+        {"utterance": "missing intent_id"},
+    ]
+    out = subprocess.run(
+        [sys.executable, str(_SRC / "pipeline.py"), "serve"],
+        input="".join(json.dumps(r, ensure_ascii=False) + "\n" for r in requests),
+        capture_output=True, text=True, check=True,
+    )
+    responses = [json.loads(line) for line in out.stdout.splitlines()]
+    assert len(responses) == 3
+    assert responses[0]["slots"]["ticket_ref"] == "ticket-217"
+    assert responses[1]["reprompt_needed"] is True
+    assert "KeyError" in responses[2]["error"]
+
+
+def test_dispatch_client_uses_socket_server_and_falls_back(tmp_path, capsys):
+    import threading
+    import dispatch_client  # type: ignore
+    import pipeline  # type: ignore
+
+    sock = tmp_path / "dispatch.sock"
+    args = ["ground", "--intent-id", "dispatch_ticket", "--utterance", "ticket-217 재실행",
+            "--no-write", "--socket", str(sock)]
+
+    # 서버 없음 → pipeline.main (in-process) fallback
+    assert dispatch_client.main(args) == 0
+    local = json.loads(capsys.readouterr().out)
+
+    server = pipeline.make_socket_server(sock)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert dispatch_client.main(args) == 0
+        remote = json.loads(capsys.readouterr().out)
+        assert dispatch_client.main(["ground", "--intent-id", "dispatch_ticket", "--utterance", "재실행해줘",
+                                     "--no-write", f"--socket={sock}"]) == 0
+        again = json.loads(capsys.readouterr().out)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert {k: v for k, v in remote.items() if k != "turn_id"} == {k: v for k, v in local.items() if k != "turn_id"}
+    assert again["reprompt_slots"] == ["ticket_ref"]
+
+
+def test_socket_server_serves_connections_concurrently(tmp_path, monkeypatch):
+    import socket
+    import threading
+    import pipeline  # type: ignore
+    import turn_writer  # type: ignore
+
+    turns = tmp_path / "turns.jsonl"
+    monkeypatch.setenv("MSO_TURNS_PATH", str(turns))
+    monkeypatch.setenv("MSO_TURN_SPANS_PATH", "off")
+    sock = tmp_path / "dispatch.sock"
+    server = pipeline.make_socket_server(sock)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    request = json.dumps({"utterance": "ticket-217 재실행", "intent_id": "dispatch_ticket"}, ensure_ascii=False)
+
+    def ask(count: int) -> None:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(str(sock))
+            stream = conn.makefile("rwb")
+            for _ in range(count):
+                stream.write((request + "\n").encode("utf-8"))
+                stream.flush()
+                assert json.loads(stream.readline())["slots"]["ticket_ref"] == "ticket-217"
+
+    try:
+        # 요청 없이 연결만 잡고 있는 클라이언트가 있어도 다른 연결은 응답을 받는다
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as idle:
+            idle.connect(str(sock))
+            workers = [threading.Thread(target=ask, args=(5,)) for _ in range(4)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join(timeout=5)
+            assert not any(worker.is_alive() for worker in workers)
+    finally:
+        server.shutdown()
+        server.server_close()
+    turn_writer.flush_all()
+
+    records = [json.loads(line) for line in turns.read_text(encoding="utf-8").splitlines()]
+    assert sum(1 for r in records if r.get("type") == "turn") == 20
+
+# ─── ground_batch (replay · backfill) ───────────────────────────
+
+def test_ground_batch_matches_single_ground_and_appends_once(tmp_path, monkeypatch):
+    from pipeline import ground_batch  # type: ignore
+
+    turns = tmp_path / "turns.jsonl"
+    monkeypatch.setenv("MSO_TURNS_PATH", str(turns))
+    requests = [
+        {"utterance": "ticket-217 재실행", "intent_id": "dispatch_ticket"},
+        {"utterance": "재실행해줘", "intent_id": "dispatch_ticket", "prev_turn_id": "t-prev"},
+        {"utterance": "내 run 어떻게 돼?", "intent_id": "query_run_status",
+         "session_context": {"session_id": "s1", "run_ids": ["run-abc"]}},
+        {"utterance": "ticket-9 재실행", "intent_id": "dispatch_ticket"},
+    ]
+    results = ground_batch(requests)
+
+    def strip(r):
+        return {k: v for k, v in r.items() if k != "turn_id"}
+
+    expected = [ground(r["utterance"], intent_id=r["intent_id"], session_context=r.get("session_context"),
+                       write_turn=False) for r in requests]
+    assert [strip(r) for r in results] == [strip(r) for r in expected]
+    lines = [json.loads(line) for line in turns.read_text(encoding="utf-8").splitlines()]
+    assert lines[0]["type"] == "schema"
+    assert [t["turn_id"] for t in lines[1:]] == [r["turn_id"] for r in results]
+    assert lines[2]["prev_turn_id"] == "t-prev"
+
+
+def test_ground_records_stage_spans_sidecar(tmp_path, monkeypatch):
+    from pipeline import STAGES, ground_batch  # type: ignore
+
+    monkeypatch.setenv("MSO_TURNS_PATH", str(tmp_path / "turns.jsonl"))
+    monkeypatch.delenv("MSO_TURN_SPANS_PATH", raising=False)
+    single = ground("ticket-217 재실행", intent_id="dispatch_ticket")
+    batch = ground_batch([{"utterance": "run-abc 상태", "intent_id": "query_run_status"}])
+    lines = [json.loads(line) for line in (tmp_path / "turns_spans.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert lines[0]["spans_schema"] == "turn_spans/0.1.0"
+    assert [r["turn_id"] for r in lines[1:]] == [single["turn_id"], batch[0]["turn_id"]]
+    for record in lines[1:]:
+        assert tuple(record["spans_ms"]) == STAGES
+        assert all(ms >= 0 for ms in record["spans_ms"].values())
+    assert lines[1]["intent_id"] == "dispatch_ticket"
+
+    monkeypatch.setenv("MSO_TURN_SPANS_PATH", "off")
+    ground("ticket-1 재실행", intent_id="dispatch_ticket")
+    assert len((tmp_path / "turns_spans.jsonl").read_text(encoding="utf-8").splitlines()) == 3
+
+
+def test_cli_ground_batch_reports_throughput(tmp_path):
+    import subprocess
+
+    batch = tmp_path / "replay.jsonl"
+    batch.write_text("".join(
+        json.dumps({"utterance": f"ticket-{i} 재실행", "intent_id": "dispatch_ticket"}, ensure_ascii=False) + "\n"
+        for i in range(1200)
+    ), encoding="utf-8")
+    out = subprocess.run(
+        [sys.executable, str(_SRC / "pipeline.py"), "ground", "--batch", str(batch), "--jobs", "2", "--no-write"],
+        capture_output=True, text=True, check=True,
+    )
+    grounded = [json.loads(line) for line in out.stdout.splitlines()]
+    assert [g["target_id"] for g in grounded] == [f"ticket-{i}" for i in range(1200)]
+    assert "1200 turns in" in out.stderr and "jobs=2" in out.stderr
@@ -90,3 +90,43 @@ def test_matrix_sparql_equivalent():
         "update_ticket_priority", "cancel_run",
     }
     assert set(intent_ids) == expected, f"Missing: {expected - set(intent_ids)}"
+
+
+# ── Case 6: compiled registry snapshot ────────────────────────
+def test_snapshot_lookup_does_not_import_rdflib():
+    import subprocess
+    src = Path(__file__).parent.parent / "src"
+    subprocess.run([sys.executable, str(src / "compile_registry.py")], check=True, capture_output=True)
+    probe = (
+        "import sys; sys.path.insert(0, sys.argv[1]); import lookup; "
+        "assert lookup.lookup_intent('dispatch_ticket')['target_concept'] == 'TicketEvent'; "
+        "assert lookup.lookup_concept('FailedTicket')['broader'] == ['TicketEvent']; "
+        "assert 'rdflib' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", probe, str(src)], check=True)
+
+
+def test_stale_ttl_recompiles_snapshot(tmp_path, monkeypatch):
+    import json
+    import shutil
+    import lookup
+
+    for name, path in lookup.SOURCES.items():
+        copy = tmp_path / path.name
+        shutil.copy(path, copy)
+        monkeypatch.setitem(lookup.SOURCES, name, copy)
+    snapshot = tmp_path / "generated" / "registry.json"
+    monkeypatch.setattr(lookup, "SNAPSHOT_PATH", snapshot)
+    monkeypatch.setattr(lookup, "_registry_cache", None)
+
+    assert lookup.lookup_intent("retry_gate") is None
+    assert json.loads(snapshot.read_text(encoding="utf-8"))["sources"] == lookup.source_signature()
+
+    with lookup.SOURCES["instances"].open("a", encoding="utf-8") as handle:
+        handle.write(
+            '\nmso:retry_gate a mso:Intent ;\n    mso:intent_id "retry_gate" ;\n'
+            '    mso:verb_concept mso:UpdateVerb ;\n    mso:target_concept mso:RunContext ;\n'
+            '    mso:trigger_keywords ("gate 재시도") .\n'
+        )
+    assert lookup.get_trigger_keywords("retry_gate") == ["gate 재시도"]
+    assert "retry_gate" in json.loads(snapshot.read_text(encoding="utf-8"))["intents"]
@@ -1,5 +1,5 @@
 #!/usr/bin/env bash
-# tools/build.sh — LinkML 3종 빌드 (M1 DoD)
+# tools/build.sh — LinkML 3종 빌드 (M1 DoD) + lookup registry snapshot
 # 사용: cd repository/skills/mso-intent-analytics && bash tools/build.sh
 set -euo pipefail
 
@@ -11,18 +11,21 @@ mkdir -p "$OUT"
 echo "[linkml build] schema: $SCHEMA"
 echo ""
 
-echo "[1/3] gen-owl ..."
+echo "[1/4] gen-owl ..."
 gen-owl "$SCHEMA" > "$OUT/nlu_intent.owl.ttl"
 echo "  → $OUT/nlu_intent.owl.ttl"
 
-echo "[2/3] gen-shacl ..."
+echo "[2/4] gen-shacl ..."
 gen-shacl "$SCHEMA" > "$OUT/nlu_intent.shacl.ttl"
 echo "  → $OUT/nlu_intent.shacl.ttl"
 
-echo "[3/3] gen-json-schema ..."
+echo "[3/4] gen-json-schema ..."
 gen-json-schema "$SCHEMA" > "$OUT/nlu_intent.schema.json"
 echo "  → $OUT/nlu_intent.schema.json"
 
+echo "[4/4] compile registry snapshot ..."
+python "$SKILL_DIR/src/compile_registry.py" --out "$OUT/registry.json"
+
 echo ""
 echo "[verify] NodeShape count:"
 grep -c "sh:NodeShape" "$OUT/nlu_intent.shacl.ttl" || true
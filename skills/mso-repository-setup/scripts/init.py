@@ -18,7 +18,7 @@ init.py — MSO Repository Setup CLI
         ├── track-record/                             # <type>.jsonl  예: user-decision.jsonl
         └── insight-record/                           # <type>.jsonl  예: episode.jsonl, pattern.jsonl
 
-  <target>/.gitignore  (agent-context/work-memory/.zvec/, .claude/state/ 등록)
+  <target>/.gitignore  (agent-context/work-memory/.zvec/, .wm-index/, .claude/state/, .mso-cache/ 등록)
   <target>/.claude/settings.json  (--hook 시 Claude Code hook 등록)
   <target>/.codex/hooks.json      (--hook --provider codex 시 Codex hook 등록, compatibility)
   <target>/.codex/config.toml     (--hook --provider codex 시 Codex hook 등록)
@@ -52,8 +52,14 @@ GITIGNORE_LINES = [
     "# MSO work-memory zvec index (regenerable)",
     "agent-context/work-memory/.zvec/",
     "",
+    "# MSO work-memory read index (regenerable)",
+    "agent-context/work-memory/.wm-index/",
+    "",
     "# MSO hook runtime state (local)",
     ".claude/state/",
+    "",
+    "# MSO parsed-graph cache (regenerable)",
+    ".mso-cache/",
 ]
 
 
@@ -183,11 +189,18 @@ type_specific:
 
 def _ensure_gitignore(path: Path):
     existing = path.read_text() if path.exists() else ""
-    if "agent-context/work-memory/.zvec" in existing:
+    registered = {line.strip() for line in existing.splitlines()}
+    # 블록(빈 줄 + 주석 + 패턴) 단위로, 아직 없는 패턴만 추가한다 — 기존 repo 재실행 시 누락분 보강.
+    missing: list[str] = []
+    for i in range(0, len(GITIGNORE_LINES), 3):
+        block = GITIGNORE_LINES[i:i + 3]
+        if block[-1] not in registered:
+            missing.extend(block)
+    if not missing:
         print(f"  · .gitignore (이미 등록됨)")
         return
     with open(path, "a", encoding="utf-8") as f:
-        for line in GITIGNORE_LINES:
+        for line in missing:
             f.write(line + "\n")
     print(f"  + .gitignore 갱신")
 
@@ -345,13 +358,15 @@ def cmd_hook(target: Path, worthy_paths: str | None = None, provider: str = "cla
             shutil.copy(src, scripts_dst / fn)
             (scripts_dst / fn).chmod(0o755)
             copied.append(fn)
-    # release-context.sh 가 호출하는 wm_release.py (derived release view, stdlib only)
-    # 도 copy-form 으로 동봉한다 — 훅은 자기 옆의 wm_release.py 를 우선 탐색한다.
-    wm_release_src = hooks_dir.parent / "scripts" / "wm_release.py"
-    if wm_release_src.exists():
-        shutil.copy(wm_release_src, scripts_dst / "wm_release.py")
-        (scripts_dst / "wm_release.py").chmod(0o755)
-        copied.append("wm_release.py")
+    # release-context.sh 가 호출하는 wm_release.py (derived release view, stdlib only) 와
+    # auditlog.py 가 쓰는 wm_append.py (잠금 append primitive, stdlib only) 도 copy-form 으로
+    # 동봉한다 — 훅은 자기 옆의 사본을 우선 탐색한다.
+    for fn in ("wm_release.py", "wm_append.py"):
+        src = hooks_dir.parent / "scripts" / fn
+        if src.exists():
+            shutil.copy(src, scripts_dst / fn)
+            (scripts_dst / fn).chmod(0o755)
+            copied.append(fn)
     scaffold_hooks_dir = scaffold_skill_dir / "hooks"
     for fn in SCAFFOLD_HOOK_FILES:
         src = scaffold_hooks_dir / fn
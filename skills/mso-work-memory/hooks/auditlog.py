@@ -5,6 +5,9 @@ PostToolUse hook — 일별 auditlog 파일에 도구 호출 기록.
 Claude Code PostToolUse JSON 을 stdin 으로 받아
 WORKMEM_DIR/auditlog/AU-YYYY-MM-DD.jsonl 에 한 줄 append 한다.
 추적 대상: Bash, Edit, MultiEdit, Write
+
+append 는 wm_append.append_record (잠금 + 꼬리 중복 확인 + WORKMEM_FSYNC) 를 쓴다.
+copy-form 배포(같은 디렉토리) 우선, 스킬 레이아웃(../scripts) 폴백 — 둘 다 없으면 plain append.
 """
 import datetime
 import hashlib
@@ -13,6 +16,13 @@ import os
 import sys
 from pathlib import Path
 
+_SELF_DIR = Path(__file__).resolve().parent
+sys.path[:0] = [str(_SELF_DIR), str(_SELF_DIR.parent / "scripts")]
+try:
+    from wm_append import append_record
+except ImportError:
+    append_record = None
+
 TRACKED_TOOLS = {"Bash", "Edit", "MultiEdit", "Write"}
 
 
@@ -64,6 +74,9 @@ def main():
         },
     }
 
+    if append_record is not None:
+        append_record(file_path, entry)
+        return
     with open(file_path, "a", encoding="utf-8") as f:
         f.write(json.dumps(entry, ensure_ascii=False) + "\n")
 
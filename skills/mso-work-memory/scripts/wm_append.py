@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+wm_append.py — work-memory JSONL append primitive (stdlib only).
+
+wm_node.py new, hooks/auditlog.py 등 work-memory JSONL 에 쓰는 모든 writer 가 공유한다.
+
+  - 중복 확인은 파일 끝에서 거꾸로 읽은 마지막 record 하나만 본다 (파일 크기와 무관).
+  - 확인 + append 는 fcntl.flock 배타 잠금 안에서 한 번의 write 로 한다 — 동시 writer 끼리
+    줄이 섞이거나 같은 record 가 두 번 붙지 않는다 (fcntl 이 없으면 잠금 없이 O_APPEND).
+  - WORKMEM_FSYNC=1 (또는 fsync=True) 이면 write 뒤 fsync 한다.
+
+copy-form hook 배포 시 auditlog.py 옆에 같이 복사된다 (wm_release.py 와 같은 방식).
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows — 잠금 없이 O_APPEND 단일 write 에 의존
+    fcntl = None  # type: ignore[assignment]
+
+
+def _tail_line(f, block: int = 4096) -> bytes:
+    """열린 바이너리 파일의 마지막 비어 있지 않은 줄 (없으면 b"")."""
+    end = f.seek(0, os.SEEK_END)
+    buf = b""
+    while end > 0:
+        start = max(0, end - block)
+        f.seek(start)
+        buf = f.read(end - start) + buf
+        end = start
+        stripped = buf.rstrip()
+        cut = stripped.rfind(b"\n")
+        if cut >= 0:
+            return stripped[cut + 1:]
+    return buf.strip()
+
+
+def last_line(path: Path) -> bytes:
+    """파일 끝에서 거꾸로 읽어 마지막 비어 있지 않은 줄만 돌려준다 (파일이 없으면 b"")."""
+    try:
+        with open(path, "rb") as f:
+            return _tail_line(f)
+    except OSError:
+        return b""
+
+
+def last_record(path: Path) -> dict | None:
+    """마지막 record (JSON dict 가 아니면 None)."""
+    try:
+        obj = json.loads(last_line(path))
+    except ValueError:
+        return None
+    return obj if isinstance(obj, dict) else None
+
+
+def _fsync_default() -> bool:
+    return os.environ.get("WORKMEM_FSYNC", "") not in ("", "0")
+
+
+def append_record(
+    path: Path,
+    record: dict,
+    dedup_key: str | None = "id",
+    fsync: bool | None = None,
+) -> bool:
+    """
+    record 한 줄을 잠금 안에서 append. 파일 마지막 record 의 dedup_key 값이 같으면 skip.
+    Returns: append 했으면 True, 중복이라 건너뛰었으면 False
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)  # close 가 잠금도 푼다
+        if dedup_key is not None and record.get(dedup_key) is not None:
+            try:
+                last = json.loads(_tail_line(f))
+            except ValueError:
+                last = None
+            if isinstance(last, dict) and last.get(dedup_key) == record[dedup_key]:
+                return False
+        f.write(line)  # "a" 모드 — seek 위치와 무관하게 파일 끝에 쓴다
+        f.flush()
+        if fsync if fsync is not None else _fsync_default():
+            os.fsync(f.fileno())
+    return True
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+wm_index.py — work-memory 영속 읽기 인덱스 (stdlib sqlite3).
+
+`<WORKMEM_DIR>/.wm-index/index.sqlite` 에 JSONL entry 위치와 relation 을 기록해
+wm_node.py show / graph / stats 가 트리 전체를 다시 parse 하지 않게 한다.
+
+  files  (path, mtime_ns, size, ino, complete, tail)   — 파일별 색인 시점 상태
+  nodes  (id, path, offset, length, type, title, …)   — entry 1줄 = 1행 (byte offset, 줄 sha1 digest)
+  edges  (path, offset, ord, source, target, rel_type) — relation 1개 = 1행
+  postings (term, impact, doc, tf)                     — BM25 역색인 (wm_search.py, doc = nodes.doc,
+                                                          id 별 현재 줄만 — nodes.live = 1)
+
+refresh() 는 트리의 *.jsonl 을 stat 만 해서 (mtime_ns, size, inode) 가 바뀐 파일만 다시 읽는다.
+같은 inode 가 커졌고 이전 끝(마지막 256 byte)이 그대로면 append-only 로 보고 늘어난 꼬리만
+parse 하며, 그 밖의 변경(교체·truncate·중간 수정)은 그 파일만 재색인한다. 사라진 파일의 행은 지운다.
+dot-디렉토리(.migration-archive, .zvec, .wm-index 등)는 validate 와 같이 제외한다.
+
+같은 id 가 여러 줄에 있으면 (path, offset) 순서상 마지막 줄이 그 id 의 entry 다.
+인덱스 디렉토리를 만들 수 없으면(읽기 전용 등) 메모리 DB 에 전체 색인해 같은 결과를 낸다.
+인덱스는 언제든 지워도 되는 파생물이다 (.gitignore 대상).
+
+  sequences (prefix, value) — 시퀀스 id(IN-0001 …) 발급 카운터
+
+allocate() 는 `BEGIN IMMEDIATE` 잠금 안에서 카운터를 올려 id 를 상수 시간·원자적으로 발급한다
+(동시에 `new` 를 실행한 두 agent 가 같은 번호를 받지 않는다). 카운터가 없거나, aggregate 파일의
+마지막 record 번호가 카운터보다 크면(다른 도구가 직접 append 등) 그 자리에서 전체 스캔으로 다시
+맞춘다. 구버전 per-entry 파일(IN-0003.jsonl 등)은 이 확인에 들어가지 않으므로, 카운터 밖에서 그런
+파일을 새로 만들었다면 `wm_node.py reindex --repair` 로 모든 카운터를 전체 스캔 값으로 재설정한다.
+인덱스를 열 수 없으면 allocate() 는 메모리 DB 로 fallback 하지 않고 실패한다 (잠금이 없어 중복 발급).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import wm_append  # noqa: E402
+import wm_search  # noqa: E402
+
+INDEX_DIRNAME = ".wm-index"
+INDEX_FILENAME = "index.sqlite"
+SCHEMA_VERSION = 5
+
+_TAIL_BYTES = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path      TEXT PRIMARY KEY,
+    mtime_ns  INTEGER NOT NULL,
+    size      INTEGER NOT NULL,
+    ino       INTEGER NOT NULL,
+    complete  INTEGER NOT NULL,
+    tail      TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS nodes (
+    doc     INTEGER PRIMARY KEY,
+    id      TEXT NOT NULL,
+    path    TEXT NOT NULL,
+    offset  INTEGER NOT NULL,
+    length  INTEGER NOT NULL,
+    type        TEXT,
+    title       TEXT,
+    tags        TEXT,
+    created_at  TEXT,
+    len         REAL NOT NULL DEFAULT 0,
+    terms       TEXT NOT NULL DEFAULT '',
+    digest      TEXT NOT NULL DEFAULT '',
+    live        INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (path, offset)
+);
+CREATE INDEX IF NOT EXISTS nodes_id ON nodes (id, path, offset);
+CREATE TABLE IF NOT EXISTS edges (
+    path      TEXT NOT NULL,
+    offset    INTEGER NOT NULL,
+    ord       INTEGER NOT NULL,
+    source    TEXT NOT NULL,
+    target    TEXT NOT NULL,
+    rel_type  TEXT,
+    PRIMARY KEY (path, offset, ord)
+);
+CREATE INDEX IF NOT EXISTS edges_source ON edges (source, path, offset, ord);
+CREATE INDEX IF NOT EXISTS edges_target ON edges (target, path, offset, ord);
+CREATE TABLE IF NOT EXISTS postings (
+    term    TEXT NOT NULL,
+    impact  REAL NOT NULL,
+    doc     INTEGER NOT NULL,
+    tf      REAL NOT NULL,
+    PRIMARY KEY (term, impact DESC, doc)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key    TEXT PRIMARY KEY,
+    value
+);
+CREATE TABLE IF NOT EXISTS sequences (
+    prefix  TEXT PRIMARY KEY,
+    value   INTEGER NOT NULL
+);
+"""
+
+# id 별 마지막 줄 = 현재 entry
+_CURRENT = """
+    SELECT n.* FROM nodes n
+    WHERE n.id = ? ORDER BY n.path DESC, n.offset DESC LIMIT 1
+"""
+
+
+def index_path(root: Path) -> Path:
+    return root / INDEX_DIRNAME / INDEX_FILENAME
+
+
+def _connect(root: Path, fallback: bool = True) -> sqlite3.Connection:
+    """fallback=False 면 인덱스를 열 수 없을 때 메모리 DB 대신 원래 예외를 그대로 올린다."""
+    path = index_path(root)
+    try:
+        path.parent.mkdir(exist_ok=True)
+        con = sqlite3.connect(str(path), timeout=30, isolation_level=None)
+        con.execute("PRAGMA journal_mode=WAL")
+        con.execute("PRAGMA synchronous=NORMAL")  # 파생물 — WAL 에서 commit 마다 fsync 하지 않아도 된다
+        version = con.execute("PRAGMA user_version").fetchone()[0]
+    except (OSError, sqlite3.Error):
+        if not fallback:
+            raise
+        con = sqlite3.connect(":memory:", isolation_level=None)
+        version = 0
+    if version != SCHEMA_VERSION:
+        # 스키마가 다르면 파생물이므로 통째로 다시 만든다
+        for table in ("files", "nodes", "edges", "postings", "meta", "sequences"):
+            con.execute(f"DROP TABLE IF EXISTS {table}")
+        con.executescript(_SCHEMA)
+        con.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    con.execute("PRAGMA cache_size=-65536")
+    con.row_factory = sqlite3.Row
+    return con
+
+
+def _jsonl_files(root: Path):
+    """root 아래 *.jsonl (dot-디렉토리 제외) → (root 상대 posix 경로, 절대 경로)."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for name in filenames:
+            if name.endswith(".jsonl"):
+                full = Path(dirpath) / name
+                yield full.relative_to(root).as_posix(), full
+
+
+def _tail_digest(f, end: int) -> str:
+    start = max(0, end - _TAIL_BYTES)
+    f.seek(start)
+    return hashlib.sha1(f.read(end - start)).hexdigest()
+
+
+def _index_lines(con: sqlite3.Connection, rel: str, data: bytes, base: int) -> None:
+    """data(파일의 base 위치부터) 의 줄들을 nodes / edges / postings 에 추가."""
+    nodes, edges, fresh = [], [], {}
+    doc = con.execute("SELECT COALESCE(MAX(doc), 0) FROM nodes").fetchone()[0]
+    pos = 0
+    while pos < len(data):
+        end = data.find(b"\n", pos)
+        if end < 0:
+            end = len(data)
+        raw = data[pos:end]
+        offset = base + pos
+        pos = end + 1
+        line = raw.decode("utf-8", errors="replace").strip()
+        if not line:
+            continue
+        try:
+            e = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        # JSONL 불변식: 한 줄 = 한 객체. 비-dict 라인은 색인하지 않는다 (색인할 때 한 번만 경고).
+        if not isinstance(e, dict):
+            print(f"[WARN] {Path(rel).name} @{offset} 비-dict jsonl 라인 skip "
+                  f"({type(e).__name__}): {line[:60]}", file=sys.stderr)
+            continue
+        eid = e.get("id")
+        if not eid:
+            continue
+        eid = str(eid)
+        etype = e.get("type", "?")
+        title = e.get("title", "(unknown)")
+        terms, doc_len = wm_search.entry_terms(e)
+        created = e.get("created_at")
+        doc += 1
+        nodes.append((doc, eid, rel, offset, len(raw),
+                      None if etype is None else str(etype),
+                      None if title is None else str(title),
+                      wm_search.tags_key(e),
+                      None if created is None else str(created),
+                      doc_len,
+                      wm_search.encode_terms(terms),
+                      hashlib.sha1(raw.strip()).hexdigest(),
+                      0))
+        fresh[doc] = terms
+        for ord_, rel_ in enumerate(e.get("relations", []) or []):
+            if not isinstance(rel_, dict) or not rel_.get("target"):
+                continue
+            rt = rel_.get("type")
+            edges.append((rel, offset, ord_, eid, str(rel_["target"]),
+                          None if rt is None else str(rt)))
+    con.executemany("INSERT OR REPLACE INTO nodes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", nodes)
+    con.executemany("INSERT OR REPLACE INTO edges VALUES (?, ?, ?, ?, ?, ?)", edges)
+    # 새 줄이 id 의 현재 줄이 되면 이전 줄의 posting 을 내리고 새 줄을 올린다
+    wm_search.sync_ids(con, {n[1] for n in nodes}, fresh)
+
+
+def _forget(con: sqlite3.Connection, rel: str) -> None:
+    ids = wm_search.unlist_path(con, rel)
+    con.execute("DELETE FROM nodes WHERE path = ?", (rel,))
+    # 지운 줄이 현재 줄이던 id 는 다른 파일의 이전 줄이 다시 현재 줄이 된다
+    wm_search.sync_ids(con, ids)
+    con.execute("DELETE FROM edges WHERE path = ?", (rel,))
+    con.execute("DELETE FROM files WHERE path = ?", (rel,))
+
+
+def refresh(con: sqlite3.Connection, root: Path) -> dict:
+    """
+    바뀐 파일만 인덱스에 반영. Returns: {"files", "appended", "reindexed", "removed"}
+    """
+    stats = {"files": 0, "appended": 0, "reindexed": 0, "removed": 0}
+    seen = set()
+    con.execute("BEGIN IMMEDIATE")
+    try:
+        known = {r["path"]: r for r in con.execute("SELECT * FROM files")}
+        for rel, full in _jsonl_files(root):
+            seen.add(rel)
+            stats["files"] += 1
+            try:
+                st = full.stat()
+            except OSError:
+                continue
+            prev = known.get(rel)
+            if (prev is not None and prev["mtime_ns"] == st.st_mtime_ns
+                    and prev["size"] == st.st_size and prev["ino"] == st.st_ino):
+                continue
+            with open(full, "rb") as f:
+                base = 0
+                if (prev is not None and prev["ino"] == st.st_ino and prev["complete"]
+                        and st.st_size > prev["size"]
+                        and _tail_digest(f, prev["size"]) == prev["tail"]):
+                    base = prev["size"]
+                    stats["appended"] += 1
+                else:
+                    if prev is not None:
+                        _forget(con, rel)
+                    stats["reindexed"] += 1
+                f.seek(base)
+                data = f.read()
+                size = base + len(data)
+                tail = _tail_digest(f, size)
+            _index_lines(con, rel, data, base)
+            con.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                (rel, st.st_mtime_ns, size, st.st_ino, int(not data or data.endswith(b"\n")), tail),
+            )
+        for rel in set(known) - seen:
+            _forget(con, rel)
+            stats["removed"] += 1
+        wm_search.rebalance(con)
+        con.execute("COMMIT")
+    except BaseException:
+        con.execute("ROLLBACK")
+        raise
+    return stats
+
+
+def open_index(root: Path) -> sqlite3.Connection:
+    """최신 상태로 갱신된 인덱스 연결."""
+    con = _connect(root)
+    refresh(con, root)
+    return con
+
+
+def rebuild(root: Path) -> dict:
+    """읽기 인덱스를 비우고 트리 전체를 다시 색인."""
+    con = _connect(root)
+    try:
+        for table in ("files", "nodes", "edges", "postings", "meta"):
+            con.execute(f"DELETE FROM {table}")
+        return refresh(con, root)
+    finally:
+        con.close()
+
+
+# ─── 조회 ────────────────────────────────────────────────
+
+def lookup(con: sqlite3.Connection, entry_id: str) -> sqlite3.Row | None:
+    """id 의 현재 entry 위치 (path, offset, length, type, title)."""
+    return con.execute(_CURRENT, (entry_id,)).fetchone()
+
+
+def read_raw(root: Path, row) -> bytes:
+    """seek + 한 줄 read 로 node 행의 원본 줄(bytes) 을 읽는다."""
+    with open(root / row["path"], "rb") as f:
+        f.seek(row["offset"])
+        return f.read(row["length"])
+
+
+def read_entry(con: sqlite3.Connection, root: Path, entry_id: str) -> dict | None:
+    """seek + 한 줄 read 로 entry 를 읽는다."""
+    row = lookup(con, entry_id)
+    if row is None:
+        return None
+    raw = read_raw(root, row)
+    try:
+        e = json.loads(raw.decode("utf-8", errors="replace").strip())
+    except json.JSONDecodeError:
+        return None
+    return e if isinstance(e, dict) else None
+
+
+def out_edges(con: sqlite3.Connection, entry_id: str) -> list[tuple[str, str | None]]:
+    return [tuple(r) for r in con.execute(
+        "SELECT target, rel_type FROM edges WHERE source = ? ORDER BY path, offset, ord",
+        (entry_id,),
+    )]
+
+
+def in_edges(con: sqlite3.Connection, entry_id: str) -> list[tuple[str, str | None]]:
+    return [tuple(r) for r in con.execute(
+        "SELECT source, rel_type FROM edges WHERE target = ? ORDER BY path, offset, ord",
+        (entry_id,),
+    )]
+
+
+def type_counts(con: sqlite3.Connection) -> dict[str, int]:
+    """현재 entry(id 별 마지막 줄) 의 type → 개수."""
+    rows = con.execute("""
+        SELECT COALESCE(type, 'None') AS type, COUNT(*) AS n FROM (
+            SELECT type, ROW_NUMBER() OVER (
+                PARTITION BY id ORDER BY path DESC, offset DESC
+            ) AS rn
+            FROM nodes
+        )
+        WHERE rn = 1
+        GROUP BY 1
+    """)
+    return {r["type"]: r["n"] for r in rows}
+
+
+def current_entries(con: sqlite3.Connection, skip_dirs=()) -> dict[str, sqlite3.Row]:
+    """
+    현재 entry(id 별 마지막 줄) → 행 (id, path, offset, length, digest).
+    skip_dirs: 제외할 디렉토리 (root 상대 posix 경로, 예: auditlog, worklog)
+    """
+    rows = con.execute("""
+        SELECT id, path, offset, length, digest FROM (
+            SELECT id, path, offset, length, digest, ROW_NUMBER() OVER (
+                PARTITION BY id ORDER BY path DESC, offset DESC
+            ) AS rn
+            FROM nodes
+        )
+        WHERE rn = 1
+    """)
+    prefixes = tuple(f"{d.strip('/')}/" for d in skip_dirs)
+    return {r["id"]: r for r in rows if not (prefixes and r["path"].startswith(prefixes))}
+
+
+# ─── 시퀀스 id 발급 ──────────────────────────────────────
+
+def _tail_seq(agg: Path, prefix: str) -> int:
+    """aggregate 파일 마지막 record 의 시퀀스 번호 (없거나 형식이 다르면 0)."""
+    try:
+        obj = json.loads(wm_append.last_line(agg))
+    except ValueError:
+        return 0
+    eid = obj.get("id", "") if isinstance(obj, dict) else ""
+    head, _, num = str(eid).rpartition("-")
+    return int(num) if head == prefix and num.isdigit() and len(num) == 4 else 0
+
+
+def allocate(root: Path, prefix: str, agg: Path, scan) -> int:
+    """
+    prefix 의 다음 시퀀스 번호를 잠금 안에서 발급.
+    scan: 카운터를 다시 맞출 때 쓸 전체 스캔 함수 (() → 현재 최대 번호)
+    Raises: OSError / sqlite3.Error — 인덱스를 열 수 없을 때. 메모리 DB 는 프로세스 사이를 잠그지
+    못하므로 fallback 하지 않는다.
+    """
+    con = _connect(root, fallback=False)
+    try:
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            row = con.execute("SELECT value FROM sequences WHERE prefix = ?", (prefix,)).fetchone()
+            value = row["value"] if row is not None else None
+            if value is None or _tail_seq(agg, prefix) > value:
+                value = scan()
+            value += 1
+            con.execute("INSERT OR REPLACE INTO sequences VALUES (?, ?)", (prefix, value))
+            con.execute("COMMIT")
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+    finally:
+        con.close()
+    return value
+
+
+def repair_sequences(root: Path, scans: dict) -> dict[str, int]:
+    """모든 카운터를 전체 스캔 값으로 재설정. scans: {prefix: () → 최대 번호}"""
+    con = _connect(root, fallback=False)
+    try:
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            values = {prefix: scan() for prefix, scan in scans.items()}
+            con.execute("DELETE FROM sequences")
+            con.executemany("INSERT INTO sequences VALUES (?, ?)", values.items())
+            con.execute("COMMIT")
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+    finally:
+        con.close()
+    return values
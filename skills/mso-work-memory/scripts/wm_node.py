@@ -5,10 +5,12 @@ wm_node.py — Work Memory CLI
 사용법:
   wm_node.py new <type> --title "..." [--tags a,b] [--related ID:rel-type] [--module M]
   wm_node.py validate <path>                # 단일 파일 또는 디렉토리 트리
-  wm_node.py search "<query>" [--type T] [--tag X] [--limit 10]
+  wm_node.py search "<query>" [--type T] [--tag X] [--since D] [--until D] [--limit 10] [--json]
+  wm_node.py search "<query>" --semantic [--tag X] [--limit 10]   # zvec 시맨틱 검색
   wm_node.py graph <id> [--depth 3] [--direction in|out|both]
   wm_node.py stats
-  wm_node.py reindex                        # zvec 인덱스 재빌드
+  wm_node.py reindex [--full] [--include-runtime]   # zvec 인덱스 증분 갱신 (바뀐 entry 만)
+  wm_node.py reindex --repair               # .wm-index 시퀀스 카운터·읽기 인덱스 재구축
   wm_node.py show <id>                      # 단일 entry 출력
 
 type ∈ {issue-note, agent-decision, user-decision, trouble-shooting,
@@ -23,11 +25,18 @@ import datetime as dt
 import json
 import os
 import re
+import sqlite3
 import sys
 from pathlib import Path
 
 import yaml
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import wm_append  # 잠금 append + 꼬리 중복 확인
+import wm_index  # show / graph / stats 영속 인덱스
+import wm_search  # 내장 BM25 검색
+import wm_zvec  # zvec 증분 reindex journal
+
 # ─── 타입·relation 어휘 (schema-driven, 하위호환) ────────────────────────
 # 기본값 = work-memory 표준(7 entry + auditlog/worklog). WORKMEM_DIR/schema.yaml 에
 # 머신리더블 `types:` / `relation_types:` 가 있으면 그것으로 override → 같은 엔진을
@@ -159,8 +168,14 @@ def next_id(entry_type: str) -> str:
         # 시각 기반 id
         now = dt.datetime.now(dt.timezone.utc)
         return f"{prefix}-{now.strftime('%Y%m%d-%H%M%S')}"
-    # 시퀀스 기반 (aggregate + 구버전 per-entry 모두 스캔)
-    return f"{prefix}-{_scan_max_seq(entry_type) + 1:04d}"
+    # 시퀀스 기반 — .wm-index 카운터에서 잠금 발급 (없거나 어긋나면 aggregate + 구버전 per-entry 전체 스캔)
+    try:
+        seq = wm_index.allocate(
+            workmem_root(), prefix, entry_file(entry_type, ""), lambda: _scan_max_seq(entry_type)
+        )
+    except (OSError, sqlite3.Error) as e:
+        sys.exit(f"[ERROR] 시퀀스 카운터를 잠글 수 없음 ({workmem_root() / wm_index.INDEX_DIRNAME}): {e}")
+    return f"{prefix}-{seq:04d}"
 
 
 # ─── new ─────────────────────────────────────────────────
@@ -206,23 +221,10 @@ def cmd_new(args):
         entry["metadata"]["module"] = args.module
 
     # aggregate append-only JSONL (한 줄 = 한 entry). 같은 id 가 파일 끝에 이미
-    # 있으면(중복 append) skip — auditlog/worklog 의 EOF dedup 과 동일한 안전장치.
-    if file_path.exists():
-        existing = file_path.read_text(encoding="utf-8").splitlines()
-        for ln in reversed(existing):
-            ln = ln.strip()
-            if not ln:
-                continue
-            try:
-                if json.loads(ln).get("id") == new_id:
-                    print(f"[WARN] {new_id} 가 이미 {file_path} 끝에 있음 — append skip")
-                    return
-            except (json.JSONDecodeError, AttributeError):
-                pass
-            break
-    with open(file_path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(entry, ensure_ascii=False))
-        f.write("\n")
+    # 있으면(중복 append) skip — 마지막 record 만 거꾸로 읽어 잠금 안에서 확인한다 (wm_append).
+    if not wm_append.append_record(file_path, entry):
+        print(f"[WARN] {new_id} 가 이미 {file_path} 끝에 있음 — append skip")
+        return
     print(f"✓ append: {file_path}")
     print(f"  id={new_id}")
     if args.print:
@@ -310,9 +312,32 @@ def cmd_validate(args):
     return 1
 
 
-# ─── search (zvec) ───────────────────────────────────────
+# ─── search ─────────────────────────────────────────────
+# 기본은 .wm-index 안의 BM25 역색인(wm_search.py) — 외부 의존·네트워크 없이 동작하고, 인덱스는
+# show / graph 와 같은 refresh 로 append 된 entry 만 증분 색인된다. --semantic 은 zvec 경로.
 
 def cmd_search(args):
+    if args.semantic:
+        return _search_zvec(args)
+    import time
+
+    started = time.perf_counter()
+    con = wm_index.open_index(workmem_root())
+    hits = wm_search.search(
+        con, args.query, limit=args.limit, entry_type=args.type,
+        tag=args.tag, since=args.since, until=args.until,
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if args.json:
+        print(json.dumps(hits, ensure_ascii=False, indent=2))
+        return 0
+    for h in hits:
+        print(f"  {h['score']:7.3f}  {h['id']:<14} [{h['type']}] {str(h['title'])[:60]}")
+    print(f"\n  {len(hits)} 건 ({elapsed_ms:.0f} ms)")
+    return 0
+
+
+def _search_zvec(args):
     """zvec 인덱스를 통한 시맨틱 검색. simple-knowledge-zvec 의 simple_kb.py 호출."""
     import shutil
     import subprocess
@@ -344,50 +369,13 @@ def cmd_search(args):
 
 
 # ─── graph traversal ─────────────────────────────────────
-
-def _build_graph():
-    """전체 entry 를 읽어 id → entry, id → outgoing, id → incoming 맵 구성."""
-    root = workmem_root()
-    entries_by_id = {}
-    out_edges = {}  # id → [(target, type)]
-    in_edges = {}   # id → [(source, type)]
-
-    for jf in root.rglob("*.jsonl"):
-        # dot-디렉토리(.migration-archive, .zvec 등)는 그래프/검색 대상에서 제외
-        if any(p.startswith(".") for p in jf.relative_to(root).parts[:-1]):
-            continue
-        for line_num, line in enumerate(jf.read_text(encoding="utf-8").splitlines(), 1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                e = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            # JSONL 불변식: 한 줄 = 한 객체. bare string/숫자/배열 라인(예: pretty-print
-            # 으로 멀티라인 분해된 entry 의 잔여 줄)은 dict 가 아니므로 skip + 경고.
-            if not isinstance(e, dict):
-                print(f"[WARN] {jf.name}:{line_num} 비-dict jsonl 라인 skip "
-                      f"({type(e).__name__}): {line[:60]}", file=sys.stderr)
-                continue
-            eid = e.get("id")
-            if not eid:
-                continue
-            entries_by_id[eid] = e
-            for rel in e.get("relations", []) or []:
-                tgt = rel.get("target")
-                rt = rel.get("type")
-                if not tgt:
-                    continue
-                out_edges.setdefault(eid, []).append((tgt, rt))
-                in_edges.setdefault(tgt, []).append((eid, rt))
-    return entries_by_id, out_edges, in_edges
-
+# show / graph / stats 는 .wm-index/ 영속 인덱스(wm_index.py)를 조회한다. 인덱스는 호출마다
+# 바뀐 파일만 (mtime, size, inode) 기준으로 갱신되므로 트리 전체를 다시 parse 하지 않는다.
 
 def cmd_graph(args):
-    entries, out_e, in_e = _build_graph()
+    con = wm_index.open_index(workmem_root())
     start = args.id
-    if start not in entries:
+    if wm_index.lookup(con, start) is None:
         print(f"[WARN] {start} entry 미존재 (참조만 있을 수 있음)")
     print(f"\nGraph traversal from {start} (depth={args.depth}, direction={args.direction})")
     print()
@@ -398,16 +386,16 @@ def cmd_graph(args):
         if depth < 0 or node in visited:
             return
         visited.add(node)
-        e = entries.get(node, {})
-        title = e.get("title", "(unknown)")
-        etype = e.get("type", "?")
+        row = wm_index.lookup(con, node)
+        title = "(unknown)" if row is None else str(row["title"])
+        etype = "?" if row is None else row["type"]
         print(f"{'  ' * indent}- {node} [{etype}] {title[:60]}")
         if direction in ("out", "both"):
-            for tgt, rt in out_e.get(node, []):
+            for tgt, rt in wm_index.out_edges(con, node):
                 print(f"{'  ' * (indent + 1)}─[{rt}]→")
                 walk(tgt, depth - 1, direction, indent + 2)
         if direction in ("in", "both"):
-            for src, rt in in_e.get(node, []):
+            for src, rt in wm_index.in_edges(con, node):
                 print(f"{'  ' * (indent + 1)}←[{rt}]─")
                 walk(src, depth - 1, direction, indent + 2)
 
@@ -418,8 +406,8 @@ def cmd_graph(args):
 # ─── show ────────────────────────────────────────────────
 
 def cmd_show(args):
-    entries, _, _ = _build_graph()
-    e = entries.get(args.id)
+    con = wm_index.open_index(workmem_root())
+    e = wm_index.read_entry(con, workmem_root(), args.id)
     if not e:
         sys.exit(f"[ERROR] {args.id} 없음")
     print(json.dumps(e, ensure_ascii=False, indent=2))
@@ -429,23 +417,39 @@ def cmd_show(args):
 # ─── stats ──────────────────────────────────────────────
 
 def cmd_stats(args):
-    entries, _, _ = _build_graph()
-    by_type = {}
-    for e in entries.values():
-        t = e.get("type", "?")
-        by_type[t] = by_type.get(t, 0) + 1
+    con = wm_index.open_index(workmem_root())
+    by_type = wm_index.type_counts(con)
     print(f"\nWork Memory Stats — {workmem_root()}")
-    print(f"  총 entry: {len(entries)}\n")
+    print(f"  총 entry: {sum(by_type.values())}\n")
     for t in sorted(by_type):
         print(f"  {t:<22} {by_type[t]}")
     return 0
 
 
 # ─── reindex (zvec) ─────────────────────────────────────
+# zvec 에 넣은 entry 는 .zvec/wm-journal.jsonl (wm_zvec.py) 에 {id, digest} 로 기록된다.
+# reindex 는 읽기 인덱스의 현재 entry digest 와 비교해 추가·변경분만 batch 로 add 하고,
+# 변경 전 버전과 사라진 entry 만 delete 한다. auditlog/worklog 는 --include-runtime 일 때만 색인.
 
 def cmd_reindex(args):
     import subprocess
 
+    if args.repair:
+        # 로컬 인덱스(.wm-index) 복구 — 시퀀스 카운터와 읽기 인덱스를 전체 스캔으로 다시 만든다
+        seq_types = [t for t in TYPE_PREFIX if t not in _TIME_SERIES_TYPES]
+        try:
+            values = wm_index.repair_sequences(
+                workmem_root(), {TYPE_PREFIX[t]: (lambda t=t: _scan_max_seq(t)) for t in seq_types}
+            )
+        except (OSError, sqlite3.Error) as e:
+            sys.exit(f"[ERROR] 시퀀스 카운터를 열 수 없음 ({workmem_root() / wm_index.INDEX_DIRNAME}): {e}")
+        stats = wm_index.rebuild(workmem_root())
+        print(f"▶ 시퀀스 카운터 재설정: {workmem_root() / wm_index.INDEX_DIRNAME}")
+        for prefix in sorted(values):
+            print(f"  {prefix:<6} {values[prefix]:04d}")
+        print(f"✓ 읽기 인덱스 재구축 ({stats['files']} 파일)")
+        return 0
+
     candidates = [
         Path.home() / ".claude" / "skills" / "simple-knowledge-zvec" / "scripts" / "simple_kb.py",
     ]
@@ -453,29 +457,67 @@ def cmd_reindex(args):
     if not simple_kb:
         sys.exit("[ERROR] simple_kb.py 를 찾을 수 없음. simple-knowledge-zvec 스킬 설치 필요.")
 
-    kb_path = workmem_root() / ".zvec"
+    def kb(*cmd_args: str) -> int:
+        return subprocess.run(["python3", str(simple_kb), *cmd_args], capture_output=False).returncode
+
+    root = workmem_root()
+    kb_path = root / ".zvec"
     print(f"▶ zvec 인덱스 위치: {kb_path}")
 
-    # init (없을 때만)
-    if not kb_path.exists():
-        print("▶ init...")
-        subprocess.run(
-            ["python3", str(simple_kb), "init", "--path", str(kb_path), "--dimension", "384"],
-            check=False,
-        )
+    # 현재 entry 와 줄 digest — 읽기 인덱스(.wm-index) 에서 바로 얻는다 (바뀐 파일만 refresh)
+    skip_dirs = () if args.include_runtime else [TYPE_DIR[t] for t in _TIME_SERIES_TYPES if t in TYPE_DIR]
+    con = wm_index.open_index(root)
+    rows = wm_index.current_entries(con, skip_dirs)
+    current = {eid: row["digest"] for eid, row in rows.items()}
+    batch = kb_path / wm_zvec.BATCH_NAME
+
+    indexed = None if args.full else wm_zvec.load(kb_path)
+    if indexed is not None:
+        added, changed, removed = wm_zvec.plan(current, indexed)
+        print(f"▶ 증분: 추가 {len(added)} · 변경 {len(changed)} · 삭제 {len(removed)} "
+              f"(유지 {len(current) - len(added) - len(changed)})")
+        stale = changed + removed
+        if stale and kb("delete", "--path", str(kb_path), "--ids", ",".join(stale)) != 0:
+            # simple_kb 가 id 삭제를 지원하지 않거나 실패 → 내용을 알 수 없으므로 전체 재빌드
+            print("[WARN] zvec delete 실패 — 전체 재빌드로 전환", file=sys.stderr)
+            indexed = None
+        else:
+            upserts = added + changed
+            if upserts:
+                wm_zvec.write_batch(batch, (wm_index.read_raw(root, rows[i]) for i in upserts))
+                rc = kb("add", "--path", str(kb_path), "--input", str(batch), "--embedder", "hash")
+                batch.unlink(missing_ok=True)
+                if rc != 0:
+                    # 삭제는 이미 반영됐으므로 journal 에 남긴다 — 다음 reindex 가 추가·변경분을 다시 시도
+                    wm_zvec.append(kb_path, {}, stale)
+                    print("[ERROR] reindex 실패", file=sys.stderr)
+                    return rc
+            wm_zvec.append(kb_path, {i: current[i] for i in upserts}, removed)
+            wm_zvec.maybe_compact(kb_path)
+            print("✓ reindex 완료")
+            return 0
+
+    # 전체 재빌드 — journal 이 없거나(첫 실행·구버전 인덱스) --full
+    import shutil
 
-    print(f"▶ ingest: {workmem_root()}")
-    result = subprocess.run(
-        ["python3", str(simple_kb), "add",
-         "--path", str(kb_path),
-         "--input", str(workmem_root()),
-         "--recursive",
-         "--embedder", "hash"],
-        capture_output=False,
-    )
-    if result.returncode != 0:
+    if kb_path.exists():
+        shutil.rmtree(kb_path)
+    print("▶ init...")
+    rc = kb("init", "--path", str(kb_path), "--dimension", "384")
+    if rc != 0:
+        # journal 을 남기지 않는다 — 다음 reindex 도 전체 재빌드부터 다시 시도한다
+        print("[ERROR] zvec init 실패", file=sys.stderr)
+        return rc
+    kb_path.mkdir(parents=True, exist_ok=True)
+    ids = sorted(current)
+    print(f"▶ ingest: {len(ids)} entries")
+    wm_zvec.write_batch(batch, (wm_index.read_raw(root, rows[i]) for i in ids))
+    rc = kb("add", "--path", str(kb_path), "--input", str(batch), "--embedder", "hash")
+    batch.unlink(missing_ok=True)
+    if rc != 0:
         print("[ERROR] reindex 실패", file=sys.stderr)
-        return result.returncode
+        return rc
+    wm_zvec.reset(kb_path, current)
     print("✓ reindex 완료")
     return 0
 
@@ -505,11 +547,16 @@ def main():
     p_val.add_argument("path", help="파일 또는 디렉토리")
     p_val.set_defaults(func=cmd_validate)
 
-    p_search = sub.add_parser("search", help="zvec 시맨틱 검색")
+    p_search = sub.add_parser("search", help="entry 검색 (기본: 내장 BM25, --semantic: zvec)")
     p_search.add_argument("query")
-    p_search.add_argument("--type", help="filter by type (현재 미구현, zvec 측 필터 사용)")
+    p_search.add_argument("--type", help="entry type 필터")
     p_search.add_argument("--tag", help="tag 필터")
+    p_search.add_argument("--since", help="created_at 시작일 YYYY-MM-DD (포함)")
+    p_search.add_argument("--until", help="created_at 종료일 YYYY-MM-DD (포함)")
     p_search.add_argument("--limit", type=int, default=10)
+    p_search.add_argument("--json", action="store_true", help="결과를 JSON 으로 출력")
+    p_search.add_argument("--semantic", action="store_true",
+                          help="zvec 시맨틱 검색 (simple-knowledge-zvec + `reindex` 필요)")
     p_search.set_defaults(func=cmd_search)
 
     p_graph = sub.add_parser("graph", help="relations 그래프 traversal")
@@ -525,7 +572,12 @@ def main():
     p_stats = sub.add_parser("stats", help="통계")
     p_stats.set_defaults(func=cmd_stats)
 
-    p_rei = sub.add_parser("reindex", help="zvec 인덱스 재빌드")
+    p_rei = sub.add_parser("reindex", help="zvec 인덱스 증분 갱신")
+    p_rei.add_argument("--full", action="store_true", help="journal 을 무시하고 zvec 인덱스를 전체 재빌드")
+    p_rei.add_argument("--include-runtime", action="store_true",
+                       help="auditlog/worklog 런타임 로그도 zvec 에 색인")
+    p_rei.add_argument("--repair", action="store_true",
+                       help="zvec 대신 로컬 .wm-index(시퀀스 카운터·읽기 인덱스)를 전체 스캔으로 재구축")
     p_rei.set_defaults(func=cmd_reindex)
 
     args = parser.parse_args()
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+wm_search.py — work-memory 내장 lexical 검색 (BM25 역색인, stdlib only, offline).
+
+역색인은 wm_index 의 `.wm-index/index.sqlite` 안 `postings (term, doc, tf, impact)` 테이블이다.
+doc = nodes.doc 이므로 wm_index.refresh() 가 entry 를 색인하는 순간 같은 transaction 으로
+posting 도 붙는다 — append 된 entry 만 토큰화하는 증분 갱신이고, 별도 재빌드 단계가 없다.
+posting 은 id 별 현재 줄(nodes.live = 1)에만 둔다. 같은 id 의 새 줄이 색인되면 옛 줄의 posting 을
+내리므로, 자주 고친 entry 도 df·문서 수·평균 길이에 한 번만 들어간다.
+
+impact = BM25 의 tf·문서 길이 정규화 항 tf·(k1+1) / (tf + k1·(1 - b + b·len/avgdl)) 를 색인 시점에
+계산해 둔 값이고, 점수 = Σ idf(term) · impact 다. avgdl 은 `meta.avgdl` 기준값을 쓰며, 실제 평균이
+기준값에서 20% 넘게 벗어나면 refresh 끝에서 기준값을 갱신하고 impact 를 다시 계산한다.
+질의 term 들의 posting 수 합이 작으면 (_EXHAUSTIVE_POSTINGS 이하) 전부 채점하고, 크면 term 별
+impact 내림차순 posting 을 번갈아 읽는 Threshold Algorithm 으로 상위 k 개를 구한다 —
+읽지 않은 문서의 점수 상한(Σ idf · 마지막 impact)이 k 번째 점수 이하가 되면 멈추므로, 흔한 term
+이라도 posting 전체를 훑지 않는다. 결과는 전체 채점과 같다.
+다만 흔한 term 여럿의 impact 가 고르게 퍼진 질의(흔한 한글 단어 3개 ≈ bigram 9개)는 멈추기까지
+수천 문서를 채점해야 해서 10만 entry 에서 100 ms 를 넘는다 (SKILL.md '검색 지연 한계').
+
+토큰화 (색인·질의 공통):
+  - 한글 연속 구간 → 글자 bigram ("타임아웃이" → 타임·임아·아웃·웃이, 한 글자면 그대로).
+    조사·어미가 붙은 어절도 어간 bigram 이 겹쳐 매치된다.
+  - 그 밖의 문자·숫자 연속 구간 → 소문자 단어 ("TS-0017" → ts·0017).
+필드 가중치: title ×2, tags ×2, text ×1 (tf 와 문서 길이에 가중 합산 — BM25F 근사).
+점수: BM25 (k1=1.2, b=0.75, idf = ln(1 + (N - df + 0.5) / (df + 0.5))).
+
+auditlog / worklog (자동 런타임 로그) 는 색인하지 않는다 — 검색 대상은 curated record 다.
+"""
+from __future__ import annotations
+
+import math
+import re
+import sqlite3
+from collections import Counter
+
+K1 = 1.2
+B = 0.75
+
+FIELD_WEIGHTS = {"title": 2.0, "tags": 2.0, "text": 1.0}
+
+# 검색 색인에서 제외하는 타입 (wm_node._TIME_SERIES_TYPES)
+UNINDEXED_TYPES = ("auditlog", "worklog")
+
+_HANGUL = "가-힣ㄱ-ㅎㅏ-ㅣ"
+_TOKEN_RE = re.compile(rf"[{_HANGUL}]+|[^\W_{_HANGUL}]+")
+_HANGUL_RE = re.compile(rf"[{_HANGUL}]")
+
+
+def tokenize(text: str) -> list[str]:
+    out: list[str] = []
+    for tok in _TOKEN_RE.findall(text.lower()):
+        if len(tok) > 2 and _HANGUL_RE.match(tok):
+            out += [tok[i:i + 2] for i in range(len(tok) - 1)]
+        else:
+            out.append(tok)
+    return out
+
+
+def entry_terms(entry: dict) -> tuple[dict[str, float], float]:
+    """entry → ({term: 가중 tf}, 가중 문서 길이). 색인 대상이 아니면 ({}, 0)."""
+    if entry.get("type") in UNINDEXED_TYPES:
+        return {}, 0.0
+    tags = entry.get("tags") or []
+    fields = {
+        "title": str(entry.get("title") or ""),
+        "tags": " ".join(str(t) for t in tags) if isinstance(tags, list) else str(tags),
+        "text": str(entry.get("text") or ""),
+    }
+    tf: dict[str, float] = {}
+    length = 0.0
+    for field, value in fields.items():
+        tokens = tokenize(value)
+        if not tokens:
+            continue
+        weight = FIELD_WEIGHTS[field]
+        for term, n in Counter(tokens).items():
+            tf[term] = tf.get(term, 0.0) + n * weight
+        length += weight * len(tokens)
+    return tf, length
+
+
+def tags_key(entry: dict) -> str:
+    """tag 필터용 구분자 문자열 ("|a|b|")."""
+    tags = entry.get("tags") or []
+    if not isinstance(tags, list):
+        tags = [tags]
+    return "|" + "|".join(str(t) for t in tags) + "|" if tags else ""
+
+
+_DRIFT = 0.2
+
+
+# ─── 색인 (wm_index.refresh 가 호출) ───────────────────────
+
+def _impact(tf: float, length: float, avgdl: float) -> float:
+    return tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / avgdl))
+
+
+def _meta(con: sqlite3.Connection, key: str, default=None):
+    row = con.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return default if row is None else row[0]
+
+
+def _avgdl_ref(con: sqlite3.Connection) -> float | None:
+    ref = _meta(con, "avgdl")
+    return None if ref is None else float(ref)
+
+
+def _add_corpus(con: sqlite3.Connection, n_docs: int, total_len: float) -> None:
+    """색인 문서 수·가중 길이 합 (meta) 갱신 — 질의가 nodes 를 훑지 않게."""
+    con.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", [
+        ("n_docs", _meta(con, "n_docs", 0) + n_docs),
+        ("sum_len", _meta(con, "sum_len", 0.0) + total_len),
+    ])
+
+
+def encode_terms(terms: dict[str, float]) -> str:
+    """nodes.terms 저장 형식 (" term:tf term:tf … ") — 질의 시 random access 로 쓴다."""
+    return " " + " ".join(f"{term}:{tf:g}" for term, tf in terms.items()) + " " if terms else ""
+
+
+def _decode_terms(encoded: str) -> dict[str, float]:
+    out = {}
+    for item in encoded.split():
+        term, _, tf = item.rpartition(":")
+        out[term] = float(tf)
+    return out
+
+
+def _add_postings(con: sqlite3.Connection, docs: list[tuple[int, dict[str, float], float]]) -> None:
+    """문서 [(doc, {term: tf}, len)] 의 posting 추가 + live 표시."""
+    if not docs:
+        return
+    _add_corpus(con, len(docs), sum(length for _, _, length in docs))
+    avgdl = _avgdl_ref(con)
+    if avgdl is None:
+        avgdl = _current_avgdl(con)
+        con.execute("INSERT OR REPLACE INTO meta VALUES ('avgdl', ?)", (avgdl,))
+    rows = [
+        (term, _impact(tf, length, avgdl), doc, tf)
+        for doc, terms, length in docs
+        for term, tf in terms.items()
+    ]
+    rows.sort()  # term 순서로 넣어야 B-tree 삽입이 국소적이다
+    con.executemany("INSERT OR REPLACE INTO postings VALUES (?, ?, ?, ?)", rows)
+    con.executemany("UPDATE nodes SET live = 1 WHERE doc = ?", [(doc,) for doc, _, _ in docs])
+
+
+def _drop_postings(con: sqlite3.Connection, docs: list[tuple[int, float]]) -> None:
+    """문서 [(doc, len)] 의 posting 삭제 + live 해제."""
+    if not docs:
+        return
+    _add_corpus(con, -len(docs), -sum(length for _, length in docs))
+    con.executemany("DELETE FROM postings WHERE doc = ?", [(doc,) for doc, _ in docs])
+    con.executemany("UPDATE nodes SET live = 0 WHERE doc = ?", [(doc,) for doc, _ in docs])
+
+
+def sync_ids(con: sqlite3.Connection, ids, fresh: dict[int, dict[str, float]] | None = None) -> None:
+    """
+    id 별로 현재 줄((path, offset) 마지막)만 posting 을 갖게 맞춘다 — 같은 id 의 옛 줄은 df·문서 수·
+    평균 길이에 들어가지 않는다. fresh: 방금 토큰화한 {doc: terms} (없으면 nodes.terms 에서 복원)
+    """
+    fresh = fresh or {}
+    adds, drops = [], []
+    for eid in ids:
+        rows = con.execute(
+            "SELECT doc, live, len, terms FROM nodes WHERE id = ? ORDER BY path DESC, offset DESC", (eid,)
+        ).fetchall()
+        for i, (doc, live, length, encoded) in enumerate(rows):
+            if i == 0 and not live and encoded:
+                terms = fresh.get(doc)
+                adds.append((doc, terms if terms is not None else _decode_terms(encoded), length))
+            elif i > 0 and live:
+                drops.append((doc, length))
+    _drop_postings(con, drops)
+    _add_postings(con, adds)
+
+
+def unlist_path(con: sqlite3.Connection, path: str) -> set[str]:
+    """path 파일 문서의 posting 삭제 (nodes 행을 지우기 전에 호출). Returns: 현재 줄이던 id"""
+    rows = con.execute("SELECT doc, len, id FROM nodes WHERE path = ? AND live = 1", (path,)).fetchall()
+    _drop_postings(con, [(doc, length) for doc, length, _ in rows])
+    return {eid for _, _, eid in rows}
+
+
+def _current_avgdl(con: sqlite3.Connection) -> float:
+    n_docs = _meta(con, "n_docs", 0)
+    return _meta(con, "sum_len", 0.0) / n_docs if n_docs else 1.0
+
+
+def rebalance(con: sqlite3.Connection) -> bool:
+    """평균 문서 길이가 기준값에서 _DRIFT 넘게 벗어났으면 기준값 갱신 + impact 재계산."""
+    ref = _avgdl_ref(con)
+    if ref is None:
+        return False
+    avgdl = _current_avgdl(con)
+    if abs(avgdl - ref) <= _DRIFT * ref:
+        return False
+    con.execute("INSERT OR REPLACE INTO meta VALUES ('avgdl', ?)", (avgdl,))
+    con.execute(f"""
+        UPDATE postings SET impact = tf * {K1 + 1} / (
+            tf + {K1} * (1 - {B} + {B} * (SELECT len FROM nodes WHERE nodes.doc = postings.doc) / ?)
+        )
+    """, (avgdl,))
+    return True
+
+
+# ─── 질의 ────────────────────────────────────────────────
+
+_BATCH = 256
+# 질의 term 의 posting 합이 이 이하면 전부 SQL 로 채점한다 (그 이상이면 Threshold Algorithm)
+_EXHAUSTIVE_POSTINGS = 50000
+
+_NODE_COLUMNS = "doc, id, type, title, created_at, tags, path, offset"
+
+
+def search(
+    con: sqlite3.Connection,
+    query: str,
+    limit: int = 10,
+    entry_type: str | None = None,
+    tag: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+) -> list[dict]:
+    """
+    BM25 상위 limit 개 (id 별 현재 entry 만). since/until 은 created_at 날짜(YYYY-MM-DD, 양끝 포함).
+    Returns: [{"id","type","title","created_at","tags","score"}, ...] (점수 내림차순, 동점은 id 순)
+    """
+    qtf = Counter(tokenize(query))
+    n_docs = _meta(con, "n_docs", 0)
+    if not qtf or not n_docs or limit <= 0:
+        return []
+    weights: dict[str, float] = {}
+    total = 0
+    for term, count in qtf.items():
+        df = con.execute("SELECT COUNT(*) FROM postings WHERE term = ?", (term,)).fetchone()[0]
+        if df:
+            weights[term] = count * math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            total += df
+    if not weights:
+        return []
+
+    def accept(row) -> bool:
+        _, _, etype, _, created, tags, _, _ = row
+        if entry_type and etype != entry_type:
+            return False
+        if tag and f"|{tag}|" not in (tags or ""):
+            return False
+        day = (created or "")[:10]
+        # posting 은 id 별 현재 줄에만 있으므로 옛 버전 확인이 필요 없다
+        return not ((since and day < since) or (until and day > until))
+
+    if total <= _EXHAUSTIVE_POSTINGS:
+        top = _score_all(con, weights, limit, accept)
+    else:
+        top = _threshold(con, weights, limit, accept)
+    return [
+        {
+            "id": row[1],
+            "type": row[2],
+            "title": row[3],
+            "created_at": row[4],
+            "tags": [t for t in (row[5] or "").split("|") if t],
+            "score": round(score, 4),
+        }
+        for score, row in top
+    ]
+
+
+def _order(item: tuple[float, tuple]) -> tuple[float, str]:
+    """(score, node row) 의 정렬 키 — 점수 내림차순, 동점은 id 순."""
+    return -item[0], item[1][1]
+
+
+def _fetch_nodes(con, docs: list[int]) -> list[tuple]:
+    rows = []
+    for i in range(0, len(docs), 500):
+        chunk = docs[i:i + 500]
+        rows += con.execute(
+            f"SELECT {_NODE_COLUMNS} FROM nodes WHERE doc IN ({', '.join('?' * len(chunk))})",
+            chunk,
+        ).fetchall()
+    return rows
+
+
+def _score_all(con, weights: dict[str, float], limit: int, accept) -> list[tuple[float, tuple]]:
+    """
+    질의 term posting 전체를 SQL 로 합산 (posting 이 적을 때). node 행은 점수 순으로 필요한 만큼만
+    읽고, limit 번째 점수와 동점인 문서까지 본 뒤 id 순으로 자른다.
+    """
+    values = ", ".join("(?, ?)" for _ in weights)
+    ranked = sorted(con.execute(f"""
+        WITH q(term, w) AS (VALUES {values})
+        SELECT p.doc, SUM(q.w * p.impact) FROM q JOIN postings p ON p.term = q.term
+        GROUP BY p.doc
+    """, [v for pair in weights.items() for v in pair]).fetchall(), key=lambda x: -x[1])
+    top: list[tuple[float, tuple]] = []
+    for i in range(0, len(ranked), 64):
+        chunk = ranked[i:i + 64]
+        if len(top) >= limit and chunk[0][1] < top[limit - 1][0]:
+            break
+        rows = {row[0]: row for row in _fetch_nodes(con, [doc for doc, _ in chunk])}
+        for doc, score in chunk:
+            if len(top) >= limit and score < top[limit - 1][0]:
+                break
+            if doc in rows and accept(rows[doc]):
+                top.append((score, rows[doc]))
+    return sorted(top, key=_order)[:limit]
+
+
+def _threshold(con, weights: dict[str, float], limit: int, accept) -> list[tuple[float, tuple]]:
+    """
+    Threshold Algorithm: term 별 impact 내림차순 posting 을 batch 단위로 번갈아 읽고, 처음 본 문서는
+    nodes.terms 로 나머지 term 의 tf 를 채워(random access) 정확한 점수를 낸다. 아직 안 읽은 문서의
+    점수 상한 Σ w · (term 별 마지막 impact) 가 현재 limit 번째 점수보다 작아지면 멈춘다.
+    """
+    terms = list(weights)
+    avgdl = _avgdl_ref(con) or 1.0
+    cursors = {
+        term: con.execute(
+            "SELECT doc, impact FROM postings WHERE term = ? ORDER BY impact DESC, doc", (term,)
+        )
+        for term in terms
+    }
+    # 질의 term 의 " term:tf" 항목만 한 번에 뽑는다 (term 은 공백·':' 가 없는 토큰)
+    pick = re.compile(" (" + "|".join(map(re.escape, terms)) + r"):(\S+)").findall
+    bound = dict.fromkeys(terms, math.inf)   # term 별 아직 안 읽은 posting 의 impact 상한
+    seen: set[int] = set()
+    top: list[tuple[float, tuple]] = []      # accept 통과, 점수 내림차순·id 순 상위 limit
+    while cursors:
+        fresh: list[int] = []
+        for term in list(cursors):
+            batch = cursors[term].fetchmany(_BATCH)
+            if len(batch) < _BATCH:
+                del cursors[term]
+                bound[term] = 0.0
+            else:
+                bound[term] = batch[-1][1]
+            for doc, _ in batch:
+                if doc not in seen:
+                    seen.add(doc)
+                    fresh.append(doc)
+        scored = []
+        for i in range(0, len(fresh), 500):
+            chunk = fresh[i:i + 500]
+            for doc, length, encoded in con.execute(
+                f"SELECT doc, len, terms FROM nodes WHERE doc IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            ):
+                score = 0.0
+                for t, tf in pick(encoded):
+                    score += weights[t] * _impact(float(tf), length, avgdl)
+                if len(top) < limit or score >= top[-1][0]:
+                    scored.append((doc, score))
+        if scored:
+            rows = {row[0]: row for row in _fetch_nodes(con, [doc for doc, _ in scored])}
+            for score, row in sorted(((score, rows[doc]) for doc, score in scored), key=_order):
+                if len(top) >= limit and _order((score, row)) >= _order(top[-1]):
+                    break
+                if accept(row):
+                    top.append((score, row))
+                    top.sort(key=_order)
+                    del top[limit:]
+        threshold = sum(weights[t] * bound[t] for t in terms)
+        if len(top) >= limit and top[-1][0] > threshold:
+            break
+    return top
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+wm_zvec.py — zvec 증분 reindex 용 append journal (stdlib only).
+
+`<WORKMEM_DIR>/.zvec/wm-journal.jsonl` 에 zvec 에 들어간 entry 를 한 줄씩 append 한다.
+
+  {"id": "IN-0001", "digest": "<줄 sha1>"}   — 추가·변경
+  {"id": "IN-0001", "digest": null}           — 삭제
+
+journal 을 끝까지 재생(마지막 줄 우선)한 {id: digest} 가 zvec 의 현재 내용이다. reindex 는 이를
+wm_index 의 현재 entry digest 와 비교해 새로 생기거나 바뀐 entry 만 batch 파일로 모아 넘기고,
+사라진 entry 만 지운다 — 시간은 지난 reindex 이후 바뀐 양에 비례한다.
+
+journal 은 zvec 디렉토리 안에 있으므로 `.zvec` 을 지우면 함께 사라지고, 그때는 전체 재빌드한다.
+재생한 상태보다 줄이 훨씬 많아지면 상태만 남기도록 다시 쓴다 (tmp + os.replace).
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+JOURNAL_NAME = "wm-journal.jsonl"
+BATCH_NAME = "wm-batch.jsonl"
+
+# 재생 상태 대비 이 배수(+ 여유)를 넘으면 compact
+_COMPACT_RATIO = 2
+_COMPACT_SLACK = 1000
+
+
+def journal_path(kb_path: Path) -> Path:
+    return kb_path / JOURNAL_NAME
+
+
+def load(kb_path: Path) -> dict[str, str] | None:
+    """journal 재생 → {id: digest}. journal 이 없으면 None (zvec 내용을 알 수 없음)."""
+    path = journal_path(kb_path)
+    if not path.exists():
+        return None
+    state: dict[str, str] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue  # 중단된 마지막 줄 등
+            if not isinstance(rec, dict) or not rec.get("id"):
+                continue
+            if rec.get("digest"):
+                state[rec["id"]] = rec["digest"]
+            else:
+                state.pop(rec["id"], None)
+    return state
+
+
+def plan(current: dict[str, str], indexed: dict[str, str]) -> tuple[list[str], list[str], list[str]]:
+    """
+    현재 {id: digest} 와 journal 상태 비교.
+    Returns: (added, changed, removed) id 목록 (각각 정렬)
+    """
+    added = sorted(i for i in current if i not in indexed)
+    changed = sorted(i for i in current if i in indexed and indexed[i] != current[i])
+    removed = sorted(i for i in indexed if i not in current)
+    return added, changed, removed
+
+
+def append(kb_path: Path, upserts: dict[str, str], removed=()) -> None:
+    """반영이 끝난 변경을 journal 에 append (한 번의 write)."""
+    lines = [json.dumps({"id": i, "digest": None}) for i in removed]
+    lines += [json.dumps({"id": i, "digest": d}) for i, d in upserts.items()]
+    if not lines:
+        return
+    with open(journal_path(kb_path), "a", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def reset(kb_path: Path, state: dict[str, str]) -> None:
+    """journal 을 state 만 담도록 다시 쓴다 (전체 재빌드 직후·compact)."""
+    path = journal_path(kb_path)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        for i in sorted(state):
+            f.write(json.dumps({"id": i, "digest": state[i]}) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def maybe_compact(kb_path: Path) -> bool:
+    """journal 줄 수가 재생 상태보다 훨씬 많으면 compact. Returns: compact 했으면 True"""
+    state = load(kb_path)
+    if state is None:
+        return False
+    with open(journal_path(kb_path), "rb") as f:
+        lines = sum(1 for _ in f)
+    if lines <= _COMPACT_RATIO * len(state) + _COMPACT_SLACK:
+        return False
+    reset(kb_path, state)
+    return True
+
+
+def write_batch(dest: Path, raws) -> int:
+    """entry 원본 줄(bytes) 들을 simple_kb `add --input` 용 JSONL batch 파일로 쓴다. Returns: 줄 수"""
+    n = 0
+    with open(dest, "wb") as f:
+        for raw in raws:
+            f.write(raw.strip() + b"\n")
+            n += 1
+    return n
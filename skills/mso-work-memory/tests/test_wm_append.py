@@ -0,0 +1,59 @@
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import wm_append  # noqa: E402
+
+
+def _writer(path: str, worker: int, count: int) -> None:
+    for i in range(count):
+        wm_append.append_record(Path(path), {"id": f"W{worker}-{i:03d}", "text": "x" * 2000})
+
+
+def test_append_record_dedups_tail_and_serializes_writers(tmp_path):
+    path = tmp_path / "track-record" / "issue-note.jsonl"
+    assert wm_append.last_record(path) is None
+    assert wm_append.append_record(path, {"id": "IN-0001", "title": "a"})
+    # 같은 id 가 파일 끝에 있으면 skip, 끝이 아니면 (꼬리만 보므로) append
+    assert not wm_append.append_record(path, {"id": "IN-0001", "title": "a"})
+    assert wm_append.append_record(path, {"id": "IN-0002", "title": "b"}, fsync=True)
+    assert wm_append.append_record(path, {"id": "IN-0001", "title": "a again"})
+    # 꼬리의 빈 줄·긴 record 를 넘어 마지막 record 를 찾는다
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"id": "IN-0003", "text": "긴 본문 " * 2000}, ensure_ascii=False) + "\n\n\n")
+    assert wm_append.last_record(path)["id"] == "IN-0003"
+    assert not wm_append.append_record(path, {"id": "IN-0003"})
+
+    shared = tmp_path / "auditlog" / "AU-2026-07-01.jsonl"
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=_writer, args=(str(shared), w, 50)) for w in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+        assert p.exitcode == 0
+    ids = [json.loads(line)["id"] for line in shared.read_text(encoding="utf-8").splitlines()]
+    assert sorted(ids) == sorted(f"W{w}-{i:03d}" for w in range(4) for i in range(50))
+
+
+def test_auditlog_hook_appends_through_shared_primitive(tmp_path):
+    workmem = tmp_path / "work-memory"
+    workmem.mkdir()
+    payload = {"tool_name": "Bash", "tool_input": {"command": "ls"}, "session_id": "s1"}
+    for _ in range(2):
+        subprocess.run(
+            [sys.executable, str(ROOT / "hooks" / "auditlog.py")],
+            input=json.dumps(payload), text=True, check=True,
+            env={**os.environ, "WORKMEM_DIR": str(workmem), "WORKMEM_FSYNC": "1"},
+        )
+    (log,) = (workmem / "auditlog").glob("AU-*.jsonl")
+    records = [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+    assert len(records) == 2
+    assert wm_append.last_record(log)["metadata"] == {"tool": "Bash", "session_id": "s1"}
@@ -0,0 +1,134 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import wm_index  # noqa: E402
+
+
+def _entry(eid: str, etype: str, title: str, relations=()):
+    return {
+        "id": eid,
+        "type": etype,
+        "title": title,
+        "text": f"{title} 본문",
+        "tags": ["test"],
+        "created_at": "2026-07-01T00:00:00Z",
+        "relations": [{"type": rt, "target": tgt} for tgt, rt in relations],
+    }
+
+
+def _append(path: Path, *entries: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        for e in entries:
+            f.write(json.dumps(e, ensure_ascii=False) + "\n")
+
+
+def _wm(workmem: Path, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(SCRIPTS / "wm_node.py"), *args],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "WORKMEM_DIR": str(workmem)},
+    )
+
+
+def test_index_refreshes_incrementally_and_serves_show_graph_stats(tmp_path):
+    workmem = tmp_path / "work-memory"
+    issues = workmem / "track-record" / "issue-note.jsonl"
+    fixes = workmem / "track-record" / "trouble-shooting.jsonl"
+    _append(issues, _entry("IN-0001", "issue-note", "타임아웃 발생", [("TS-0001", "resolved-by")]))
+    _append(fixes, _entry("TS-0001", "trouble-shooting", "재시도 추가", [("IN-0001", "caused-by")]))
+    _append(workmem / "auditlog" / "AU-20260701.jsonl",
+            {"id": "AU-20260701-000000-abcdef", "type": "auditlog", "title": "Edit", "relations": []})
+    # dot-디렉토리는 색인 대상이 아니다
+    _append(workmem / ".migration-archive" / "IN-0009.jsonl", _entry("IN-0009", "issue-note", "old"))
+
+    con = wm_index.open_index(workmem)
+    assert wm_index.type_counts(con) == {"issue-note": 1, "trouble-shooting": 1, "auditlog": 1}
+    assert wm_index.out_edges(con, "IN-0001") == [("TS-0001", "resolved-by")]
+    assert wm_index.in_edges(con, "IN-0001") == [("TS-0001", "caused-by")]
+    assert wm_index.refresh(con, workmem)["reindexed"] == 0
+
+    # append 는 꼬리만 읽는다
+    _append(issues, _entry("IN-0002", "issue-note", "재발", [("IN-0001", "references")]))
+    stats = wm_index.refresh(con, workmem)
+    assert (stats["appended"], stats["reindexed"]) == (1, 0)
+    assert wm_index.read_entry(con, workmem, "IN-0002")["title"] == "재발"
+    assert wm_index.in_edges(con, "IN-0001") == [("IN-0002", "references"), ("TS-0001", "caused-by")]
+
+    # 중간 수정(같은 크기 이상) 은 그 파일만 재색인, 삭제된 파일의 행은 지운다
+    lines = issues.read_text(encoding="utf-8").splitlines()
+    first = json.loads(lines[0])
+    first["title"] = "타임아웃 발생 (수정됨)"
+    issues.write_text("\n".join([json.dumps(first, ensure_ascii=False), lines[1]]) + "\n", encoding="utf-8")
+    (workmem / "auditlog" / "AU-20260701.jsonl").unlink()
+    stats = wm_index.refresh(con, workmem)
+    assert (stats["reindexed"], stats["removed"]) == (1, 1)
+    assert wm_index.read_entry(con, workmem, "IN-0001")["title"] == "타임아웃 발생 (수정됨)"
+    assert wm_index.type_counts(con) == {"issue-note": 2, "trouble-shooting": 1}
+    con.close()
+
+    show = _wm(workmem, "show", "TS-0001")
+    assert show.returncode == 0, show.stderr
+    assert json.loads(show.stdout)["relations"] == [{"type": "caused-by", "target": "IN-0001"}]
+    assert _wm(workmem, "show", "IN-0009").returncode != 0
+
+    stats_out = _wm(workmem, "stats").stdout
+    assert "총 entry: 3" in stats_out
+    assert "issue-note" in stats_out and "trouble-shooting" in stats_out
+
+    graph = _wm(workmem, "graph", "IN-0001", "--depth", "1", "--direction", "out").stdout
+    assert "- IN-0001 [issue-note] 타임아웃 발생 (수정됨)" in graph
+    assert "─[resolved-by]→" in graph
+    assert "- TS-0001 [trouble-shooting] 재시도 추가" in graph
+    assert (workmem / ".wm-index" / "index.sqlite").exists()
+
+
+def test_sequence_allocation_is_atomic_and_repairable(tmp_path):
+    workmem = tmp_path / "work-memory"
+    issues = workmem / "track-record" / "issue-note.jsonl"
+    # 구버전 per-entry 파일명도 첫 발급 시 전체 스캔에 포함된다
+    _append(workmem / "track-record" / "legacy" / "IN-0003.jsonl", _entry("IN-0003", "issue-note", "legacy"))
+
+    env = {**os.environ, "WORKMEM_DIR": str(workmem)}
+    procs = [
+        subprocess.Popen(
+            [sys.executable, str(SCRIPTS / "wm_node.py"), "new", "issue-note", "--title", f"동시 {i}"],
+            env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+        )
+        for i in range(6)
+    ]
+    for p in procs:
+        assert p.wait() == 0, p.stderr.read()
+    ids = sorted(json.loads(line)["id"] for line in issues.read_text(encoding="utf-8").splitlines())
+    assert ids == [f"IN-{n:04d}" for n in range(4, 10)]
+
+    # 다른 도구가 카운터를 거치지 않고 append 하면 마지막 record 를 보고 다시 스캔한다
+    _append(issues, _entry("IN-0042", "issue-note", "직접 append"))
+    assert _wm(workmem, "new", "issue-note", "--title", "다음").returncode == 0
+    assert wm_index._tail_seq(issues, "IN") == 43
+
+    # --repair 는 카운터를 전체 스캔 값으로 되돌린다 (꼬리가 아닌 중간 record 도 반영)
+    con = wm_index._connect(workmem)
+    con.execute("UPDATE sequences SET value = 1 WHERE prefix = 'IN'")
+    con.close()
+    repair = _wm(workmem, "reindex", "--repair")
+    assert repair.returncode == 0, repair.stderr
+    assert "IN     0043" in repair.stdout
+    assert _wm(workmem, "new", "issue-note", "--title", "복구 후").returncode == 0
+    assert wm_index._tail_seq(issues, "IN") == 44
+
+    # 인덱스를 열 수 없으면 잠금 없는 메모리 DB 로 발급하지 않고 실패한다
+    shutil.rmtree(workmem / ".wm-index")
+    (workmem / ".wm-index").write_text("", encoding="utf-8")
+    blocked = _wm(workmem, "new", "issue-note", "--title", "잠금 불가")
+    assert blocked.returncode != 0 and "시퀀스 카운터" in blocked.stderr
+    assert wm_index._tail_seq(issues, "IN") == 44
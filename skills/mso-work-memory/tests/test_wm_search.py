@@ -0,0 +1,139 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import wm_index  # noqa: E402
+import wm_search  # noqa: E402
+
+
+def _entry(eid: str, etype: str, title: str, text: str, tags=("test",), day="2026-07-01"):
+    return {
+        "id": eid,
+        "type": etype,
+        "title": title,
+        "text": text,
+        "tags": list(tags),
+        "created_at": f"{day}T00:00:00Z",
+        "relations": [],
+    }
+
+
+def _append(path: Path, *entries: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        for e in entries:
+            f.write(json.dumps(e, ensure_ascii=False) + "\n")
+
+
+def _ids(hits):
+    return [h["id"] for h in hits]
+
+
+def test_tokenize_splits_hangul_bigrams_and_words():
+    assert wm_search.tokenize("타임아웃이 TS-0017") == ["타임", "임아", "아웃", "웃이", "ts", "0017"]
+    assert wm_search.tokenize("큐") == ["큐"]
+
+
+def test_bm25_search_filters_and_refreshes_incrementally(tmp_path):
+    workmem = tmp_path / "work-memory"
+    issues = workmem / "track-record" / "issue-note.jsonl"
+    episodes = workmem / "insight-record" / "episode.jsonl"
+    _append(
+        issues,
+        _entry("IN-0001", "issue-note", "결제 API 타임아웃", "재시도 없이 실패했다", tags=("payment",)),
+        _entry("IN-0002", "issue-note", "빌드 캐시 누락", "CI 에서 캐시가 비었다", day="2026-07-05"),
+    )
+    _append(episodes, _entry("EP-0001", "episode", "배포 회고", "타임아웃으로 배포가 지연되었다", day="2026-07-10"))
+    _append(workmem / "auditlog" / "AU-20260701.jsonl",
+            _entry("AU-20260701-000000-abcdef", "auditlog", "타임아웃", "타임아웃 타임아웃"))
+
+    con = wm_index.open_index(workmem)
+    # 조사가 붙은 어절도 bigram 으로 매치되고, title 매치가 본문 매치보다 앞선다. auditlog 는 제외.
+    assert _ids(wm_search.search(con, "타임아웃이")) == ["IN-0001", "EP-0001"]
+    assert _ids(wm_search.search(con, "타임아웃", entry_type="episode")) == ["EP-0001"]
+    assert _ids(wm_search.search(con, "타임아웃", tag="payment")) == ["IN-0001"]
+    assert _ids(wm_search.search(con, "타임아웃", since="2026-07-02")) == ["EP-0001"]
+    assert _ids(wm_search.search(con, "타임아웃", until="2026-07-02")) == ["IN-0001"]
+    assert wm_search.search(con, "존재하지않는말") == []
+
+    # append 된 entry 만 색인, 같은 id 의 옛 줄은 결과에서 빠진다
+    _append(issues, _entry("IN-0001", "issue-note", "결제 API 지연", "원인은 커넥션 풀", tags=("payment",)))
+    assert wm_index.refresh(con, workmem)["appended"] == 1
+    assert _ids(wm_search.search(con, "타임아웃")) == ["EP-0001"]
+    assert _ids(wm_search.search(con, "커넥션 풀")) == ["IN-0001"]
+
+    # 파일 재작성 후에도 posting 이 남지 않는다
+    episodes.write_text("", encoding="utf-8")
+    wm_index.refresh(con, workmem)
+    assert wm_search.search(con, "배포") == []
+    con.close()
+
+
+def test_superseded_lines_do_not_count_in_corpus_statistics(tmp_path):
+    workmem = tmp_path / "work-memory"
+    issues = workmem / "track-record" / "issue-note.jsonl"
+    archive = workmem / "track-record" / "archive" / "issue-note.jsonl"
+    _append(archive, _entry("IN-0001", "issue-note", "캐시 장애", "옛 버전"))
+    _append(issues, _entry("IN-0002", "issue-note", "배포 지연", "큐 적체"))
+    for i in range(5):
+        _append(issues, _entry("IN-0001", "issue-note", "캐시 장애", f"수정 {i}"))
+    con = wm_index.open_index(workmem)
+
+    def df(term):
+        return con.execute("SELECT COUNT(*) FROM postings WHERE term = ?", (term,)).fetchone()[0]
+
+    # 같은 id 의 여러 줄 중 현재 줄 하나만 문서 수·df 에 들어간다
+    assert wm_search._meta(con, "n_docs") == 2
+    assert df("캐시") == 1
+    assert _ids(wm_search.search(con, "캐시 수정")) == ["IN-0001"]
+
+    # 현재 줄이 있던 파일이 사라지면 남은 파일의 이전 줄이 다시 현재 줄이 된다
+    issues.unlink()
+    wm_index.refresh(con, workmem)
+    assert wm_search._meta(con, "n_docs") == 1
+    assert (df("캐시"), df("배포")) == (1, 0)
+    assert _ids(wm_search.search(con, "옛 버전")) == ["IN-0001"]
+    con.close()
+
+
+def test_threshold_algorithm_matches_exhaustive_scoring(tmp_path, monkeypatch):
+    workmem = tmp_path / "work-memory"
+    words = ["장애", "복구", "캐시", "배포", "지연", "큐", "재시도", "로그"]
+    entries = [
+        _entry(
+            f"IN-{i:04d}", "issue-note", f"{words[i % 8]} {words[i % 3]}",
+            " ".join(words[(i * k) % 8] for k in range(1, 2 + i % 7)),
+        )
+        for i in range(1, 400)
+    ]
+    _append(workmem / "track-record" / "issue-note.jsonl", *entries)
+    con = wm_index.open_index(workmem)
+    for query in ("장애 복구", "캐시 지연 로그", "재시도"):
+        monkeypatch.setattr(wm_search, "_EXHAUSTIVE_POSTINGS", 10**9)
+        exhaustive = wm_search.search(con, query, limit=15)
+        monkeypatch.setattr(wm_search, "_EXHAUSTIVE_POSTINGS", -1)
+        monkeypatch.setattr(wm_search, "_BATCH", 16)
+        assert wm_search.search(con, query, limit=15) == exhaustive
+    con.close()
+
+
+def test_cli_search_defaults_to_builtin_engine(tmp_path):
+    workmem = tmp_path / "work-memory"
+    _append(workmem / "track-record" / "issue-note.jsonl",
+            _entry("IN-0001", "issue-note", "결제 API 타임아웃", "재시도 없이 실패"))
+    env = {**os.environ, "WORKMEM_DIR": str(workmem)}
+    run = lambda *a: subprocess.run(  # noqa: E731
+        [sys.executable, str(SCRIPTS / "wm_node.py"), "search", *a], capture_output=True, text=True, env=env,
+    )
+    out = run("결제 타임아웃")
+    assert out.returncode == 0, out.stderr
+    assert "IN-0001" in out.stdout and "1 건" in out.stdout
+    hits = json.loads(run("결제", "--json", "--type", "issue-note").stdout)
+    assert [h["id"] for h in hits] == ["IN-0001"]
+    assert hits[0]["tags"] == ["test"]
@@ -0,0 +1,120 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import wm_zvec  # noqa: E402
+
+
+# simple_kb.py 대역 — 호출을 calls.jsonl 에 남기고 add 는 입력 JSONL 의 id 를 기록한다
+_FAKE_KB = '''
+import json, os, sys
+from pathlib import Path
+cmd, args = sys.argv[1], sys.argv[2:]
+opts = dict(zip(args[::2], args[1::2]))
+call = {"cmd": cmd}
+if cmd == "add":
+    text = Path(opts["--input"]).read_text(encoding="utf-8")
+    call["ids"] = [json.loads(line)["id"] for line in text.splitlines()]
+    call["recursive"] = "--recursive" in args
+if cmd == "delete":
+    if os.environ.get("FAKE_KB_NO_DELETE"):
+        sys.exit(2)
+    call["ids"] = opts["--ids"].split(",")
+if cmd == "init":
+    if os.environ.get("FAKE_KB_NO_INIT"):
+        sys.exit(2)
+    Path(opts["--path"]).mkdir(parents=True, exist_ok=True)
+with open(os.environ["FAKE_KB_LOG"], "a") as f:
+    f.write(json.dumps(call) + "\\n")
+'''
+
+
+def _entry(eid: str, etype: str, title: str):
+    return {"id": eid, "type": etype, "title": title, "text": f"{title} 본문", "tags": ["test"],
+            "created_at": "2026-07-01T00:00:00Z", "relations": []}
+
+
+def _append(path: Path, *entries: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        for e in entries:
+            f.write(json.dumps(e, ensure_ascii=False) + "\n")
+
+
+def test_reindex_submits_only_changes_since_last_run(tmp_path):
+    home = tmp_path / "home"
+    fake = home / ".claude" / "skills" / "simple-knowledge-zvec" / "scripts" / "simple_kb.py"
+    fake.parent.mkdir(parents=True)
+    fake.write_text(_FAKE_KB, encoding="utf-8")
+    log = tmp_path / "calls.jsonl"
+    workmem = tmp_path / "work-memory"
+    issues = workmem / "track-record" / "issue-note.jsonl"
+    episodes = workmem / "insight-record" / "episode.jsonl"
+    _append(issues, _entry("IN-0001", "issue-note", "a"), _entry("IN-0002", "issue-note", "b"))
+    _append(episodes, _entry("EP-0001", "episode", "c"))
+    _append(workmem / "auditlog" / "AU-20260701.jsonl", _entry("AU-20260701-000000-abcdef", "auditlog", "Edit"))
+    env = {**os.environ, "HOME": str(home), "WORKMEM_DIR": str(workmem), "FAKE_KB_LOG": str(log)}
+
+    def reindex(*args, **extra_env):
+        log.unlink(missing_ok=True)
+        out = subprocess.run([sys.executable, str(SCRIPTS / "wm_node.py"), "reindex", *args],
+                             capture_output=True, text=True, env={**env, **extra_env})
+        assert out.returncode == 0, out.stderr
+        return [json.loads(line) for line in log.read_text().splitlines()] if log.exists() else []
+
+    # 첫 실행(journal 없음) = 전체 빌드, auditlog 는 기본 제외
+    calls = reindex()
+    assert [c["cmd"] for c in calls] == ["init", "add"]
+    assert calls[1]["ids"] == ["EP-0001", "IN-0001", "IN-0002"] and not calls[1]["recursive"]
+    assert set(wm_zvec.load(workmem / ".zvec")) == {"EP-0001", "IN-0001", "IN-0002"}
+
+    # 변경 없음 → simple_kb 호출 없음
+    assert reindex() == []
+
+    # 추가 1 · 변경 1 · 삭제 1 → 변경 전 버전과 삭제분만 delete, 추가·변경분만 add
+    _append(issues, _entry("IN-0003", "issue-note", "d"), _entry("IN-0001", "issue-note", "a (수정)"))
+    episodes.unlink()
+    calls = reindex()
+    assert calls == [{"cmd": "delete", "ids": ["IN-0001", "EP-0001"]},
+                     {"cmd": "add", "ids": ["IN-0003", "IN-0001"], "recursive": False}]
+    assert set(wm_zvec.load(workmem / ".zvec")) == {"IN-0001", "IN-0002", "IN-0003"}
+
+    # --include-runtime 은 런타임 로그를 추가분으로 본다
+    assert reindex("--include-runtime")[0]["ids"] == ["AU-20260701-000000-abcdef"]
+
+    # delete 를 지원하지 않는 simple_kb → 전체 재빌드로 복구
+    _append(issues, _entry("IN-0002", "issue-note", "b (수정)"))
+    calls = reindex(FAKE_KB_NO_DELETE="1")
+    assert [c["cmd"] for c in calls] == ["init", "add"]
+    assert calls[1]["ids"] == ["IN-0001", "IN-0002", "IN-0003"]
+    assert reindex() == []
+
+    # init 실패 → add·journal 없이 실패, 다음 실행은 다시 전체 재빌드
+    failed = subprocess.run([sys.executable, str(SCRIPTS / "wm_node.py"), "reindex", "--full"],
+                            capture_output=True, text=True, env={**env, "FAKE_KB_NO_INIT": "1"})
+    assert failed.returncode != 0 and "init 실패" in failed.stderr
+    assert not log.exists() and wm_zvec.load(workmem / ".zvec") is None
+    assert [c["cmd"] for c in reindex()] == ["init", "add"]
+
+
+def test_journal_replays_last_record_and_compacts(tmp_path, monkeypatch):
+    kb = tmp_path / ".zvec"
+    kb.mkdir()
+    assert wm_zvec.load(kb) is None
+    wm_zvec.reset(kb, {})
+    wm_zvec.append(kb, {"IN-0001": "a", "IN-0002": "b"})
+    wm_zvec.append(kb, {"IN-0001": "c"}, removed=["IN-0002"])
+    assert wm_zvec.load(kb) == {"IN-0001": "c"}
+    assert wm_zvec.plan({"IN-0001": "d", "IN-0003": "e"}, {"IN-0001": "c", "IN-0002": "b"}) == (
+        ["IN-0003"], ["IN-0001"], ["IN-0002"])
+
+    monkeypatch.setattr(wm_zvec, "_COMPACT_SLACK", 0)
+    assert wm_zvec.maybe_compact(kb)
+    assert wm_zvec.journal_path(kb).read_text().splitlines() == ['{"id": "IN-0001", "digest": "c"}']
+    assert not wm_zvec.maybe_compact(kb)
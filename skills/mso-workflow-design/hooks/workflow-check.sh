@@ -5,15 +5,25 @@
 # Runs validate_abox.py on agent-context/workflow/*.abox.ttl after
 # workflow-sensitive changes, then regenerates observability views via
 # mso-graph-observability's observe_graph.py. Validation (design gate) runs
-# first; observation is projection-only and never judges.
+# first; observation is projection-only and never judges. Observation runs
+# with --incremental so only scopes whose TTL inputs changed are re-rendered.
+#
+# When mso_check.py is available the whole chain (validate → materialize →
+# trust → observe) runs in a single python3 process that decodes each TTL once.
+# Otherwise the per-script chain below is used.
 #
 # It warns by default and exits non-zero only when MSO_WORKFLOW_CHECK_STRICT=1.
 #
 # Environment:
 #   PROJECT_DIR / CODEX_PROJECT_DIR / CLAUDE_PROJECT_DIR  project root
 #   WORKFLOW_DIR                 optional workflow dir (default agent-context/workflow)
+#   MSO_CHECK_TOOL               optional mso_check.py path (single-process pipeline)
 #   MSO_WORKFLOW_VALIDATE_TOOL   optional validate_abox.py path
+#   MSO_MATERIALIZE_TOOL         optional materialize_v07.py path
+#   MSO_TRUST_TOOL               optional trust_v07.py path
 #   MSO_OBSERVE_TOOL             optional observe_graph.py path
+#   (stage overrides are honoured on both paths; with mso_check.py an
+#    overridden stage runs as its own python3 process)
 #   MSO_WORKFLOW_CHECK_STRICT=1  fail on validation error
 #   MSO_WORKFLOW_CHECK_NO_OBSERVE=1  skip observability regeneration
 set -uo pipefail
@@ -73,9 +83,6 @@ find_tool() {
   return 1
 }
 
-VALIDATE_TOOL="$(find_tool "${MSO_WORKFLOW_VALIDATE_TOOL:-}" "mso-workflow-design" "validate_abox.py" || true)"
-[ -n "$VALIDATE_TOOL" ] || exit 0
-
 # Avoid repeated hook noise when there is no workflow-sensitive activity.
 # Manual execution still runs because HOOK_EVENT is empty.
 if [ -n "$HOOK_EVENT" ]; then
@@ -83,6 +90,51 @@ if [ -n "$HOOK_EVENT" ]; then
   [ "${dirty_count:-0}" -eq 0 ] && exit 0
 fi
 
+CHECK_TOOL="$(find_tool "${MSO_CHECK_TOOL:-}" "mso-workflow-design" "mso_check.py" || true)"
+if [ -n "$CHECK_TOOL" ]; then
+  check_args=("$WF_DIR" --root "$ROOT" --trust-report "$ROOT/agent-context/observability/trust-report.md")
+  [ "${MSO_WORKFLOW_CHECK_NO_MATERIALIZE:-0}" = "1" ] && check_args+=(--no-materialize)
+  [ "${MSO_WORKFLOW_CHECK_NO_TRUST:-0}" = "1" ] && check_args+=(--no-trust)
+  [ "${MSO_WORKFLOW_CHECK_NO_OBSERVE:-0}" = "1" ] && check_args+=(--no-observe)
+  # Per-stage overrides are forwarded; mso_check runs an overridden stage as its own process.
+  for override in \
+    "--validate-tool:${MSO_WORKFLOW_VALIDATE_TOOL:-}" \
+    "--materialize-tool:${MSO_MATERIALIZE_TOOL:-}" \
+    "--trust-tool:${MSO_TRUST_TOOL:-}" \
+    "--observe-tool:${MSO_OBSERVE_TOOL:-}"
+  do
+    flag="${override%%:*}"
+    tool="${override#*:}"
+    if [ -n "$tool" ] && [ -f "$tool" ]; then
+      check_args+=("$flag" "$tool")
+    fi
+  done
+  check_out="$(python3 "$CHECK_TOOL" "${check_args[@]}" 2>&1)"
+  check_status=$?
+  case "$check_status" in
+    0) : ;;
+    1)
+      cat <<EOF
+[workflow-check] workflow TTL ABox validation failed.
+
+Run:
+  python3 "$CHECK_TOOL" "$WF_DIR"
+
+$check_out
+EOF
+      [ "${MSO_WORKFLOW_CHECK_STRICT:-0}" = "1" ] && exit 1
+      ;;
+    *)
+      echo "[workflow-check] mso_check.py stage failed (non-blocking):"
+      echo "$check_out"
+      ;;
+  esac
+  exit 0
+fi
+
+VALIDATE_TOOL="$(find_tool "${MSO_WORKFLOW_VALIDATE_TOOL:-}" "mso-workflow-design" "validate_abox.py" || true)"
+[ -n "$VALIDATE_TOOL" ] || exit 0
+
 validate_out="$(python3 "$VALIDATE_TOOL" "$WF_DIR" 2>&1)"
 validate_status=$?
 
@@ -126,7 +178,7 @@ fi
 if [ "${MSO_WORKFLOW_CHECK_NO_OBSERVE:-0}" != "1" ]; then
   OBSERVE_TOOL="$(find_tool "${MSO_OBSERVE_TOOL:-}" "mso-graph-observability" "observe_graph.py" || true)"
   if [ -n "$OBSERVE_TOOL" ]; then
-    observe_out="$(python3 "$OBSERVE_TOOL" --root "$ROOT" 2>&1)" || {
+    observe_out="$(python3 "$OBSERVE_TOOL" --root "$ROOT" --incremental 2>&1)" || {
       echo "[workflow-check] observe_graph.py failed (non-blocking):"
       echo "$observe_out"
     }
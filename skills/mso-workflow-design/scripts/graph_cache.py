@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""graph_cache — 파싱된 workflow TTL 그래프의 공용 on-disk 캐시.
+
+validate_abox / trust_v07 / observe_graph / compile_workflow 는 같은 `*.abox.ttl` 을
+hook 체인마다 각자 Turtle 파서로 다시 읽는다. 이 모듈은 파일 단위 파싱 결과를
+`.mso-cache/graphs/` 에 JSON triple dump 로 저장해, 두 번째 진입점부터는
+Turtle 파서를 건너뛴다.
+
+캐시 규약:
+  - key      : 파일 경로 + mtime_ns + size → content sha256 (stat 불일치 시 내용 재해시)
+  - blob     : `<sha256>.triples.json` — content-addressed. touch 만 된 파일은 재파싱 없이 hit.
+               데이터 전용 포맷이다 — term 표(`["u", iri]` / `["b", id]` / `["l", lexical, datatype,
+               lang]`) + triple 별 term 번호. 로드 시 term 을 다시 만들고, 디코드에 실패하거나 모양이
+               다른 blob 은 miss 로 본다 (clone·압축 해제로 들어온 캐시를 실행하지 않는다).
+  - 순서     : 파서가 emit 한 순서 그대로 triple 을 기록·재생한다. 같은 입력이면
+               cold parse 와 warm load 의 그래프 순회 순서가 같다 (관측 출력 byte 동일).
+  - blank node: 로드마다 새 BNode 로 재매핑한다 (재파싱과 같은 의미).
+  - 무효화   : 포맷 버전 또는 rdflib 버전이 다르면 miss 로 보고 다시 파싱한다.
+  - 위치     : `MSO_CACHE_DIR` > 파일 상위의 프로젝트 루트(`.git`/`agent-context` 보유)
+               `/.mso-cache` > 파일 디렉토리 `/.mso-cache`
+  - 프로세스 메모: 한 프로세스 안에서는 stat 이 같은 파일의 hash·blob 을 다시 읽지 않는다
+               (mso_check 처럼 여러 단계가 같은 파일을 적재할 때 디코드 1회).
+  - 비활성   : `MSO_GRAPH_CACHE=0`
+
+캐시는 파생물이다. 삭제해도 다음 실행이 다시 채운다. 손상·쓰기 실패는 조용히
+실제 파싱으로 fallback 한다 (hook 은 캐시 때문에 실패하지 않는다).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable
+
+import rdflib
+from rdflib import BNode, Graph, Literal, URIRef
+
+CACHE_FORMAT = 2
+CACHE_SUBDIR = "graphs"
+
+# 프로세스 메모 — {resolved path: (mtime_ns, size, sha256)}, {sha256: blob}
+_HASH_MEMO: dict[str, tuple[int, int, str]] = {}
+_BLOB_MEMO: dict[str, dict] = {}
+
+
+class _RecordingGraph(Graph):
+    """파서가 emit 하는 triple 순서를 기록하는 Graph."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.emitted: list[tuple] = []
+
+    def add(self, triple):
+        self.emitted.append(triple)
+        return super().add(triple)
+
+    def addN(self, quads):
+        quads = list(quads)
+        self.emitted.extend(quad[:3] for quad in quads)
+        return super().addN(quads)
+
+
+def enabled() -> bool:
+    return os.environ.get("MSO_GRAPH_CACHE", "1") != "0"
+
+
+def cache_dir_for(path: Path) -> Path:
+    override = os.environ.get("MSO_CACHE_DIR")
+    if override:
+        return Path(override) / CACHE_SUBDIR
+    resolved = path.resolve()
+    for parent in resolved.parents:
+        if (parent / ".git").exists() or (parent / "agent-context").is_dir():
+            return parent / ".mso-cache" / CACHE_SUBDIR
+    return resolved.parent / ".mso-cache" / CACHE_SUBDIR
+
+
+def _entry_path(cache_dir: Path, path: Path) -> Path:
+    key = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()
+    return cache_dir / f"{key}.json"
+
+
+def _atomic_write(target: Path, data: bytes) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp, target)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def content_hash(path: Path, cache_dir: Path | None = None) -> str:
+    """stat(mtime_ns, size)가 기록과 같으면 저장된 hash, 아니면 내용을 다시 해시한다."""
+    cache_dir = cache_dir or cache_dir_for(path)
+    stat = path.stat()
+    memo_key = str(path.resolve())
+    memo = _HASH_MEMO.get(memo_key)
+    if memo and memo[:2] == (stat.st_mtime_ns, stat.st_size):
+        return memo[2]
+    entry_path = _entry_path(cache_dir, path)
+    try:
+        entry = json.loads(entry_path.read_text(encoding="utf-8"))
+        if entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+            _HASH_MEMO[memo_key] = (stat.st_mtime_ns, stat.st_size, str(entry["sha256"]))
+            return str(entry["sha256"])
+    except (OSError, ValueError, KeyError):
+        pass
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    _HASH_MEMO[memo_key] = (stat.st_mtime_ns, stat.st_size, digest)
+    try:
+        _atomic_write(
+            entry_path,
+            json.dumps(
+                {
+                    "path": str(path.resolve()),
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "sha256": digest,
+                },
+                ensure_ascii=False,
+            ).encode("utf-8"),
+        )
+    except OSError:
+        pass
+    return digest
+
+
+BLOB_SUFFIX = ".triples.json"
+
+
+def _encode_term(term) -> list:
+    if isinstance(term, URIRef):
+        return ["u", str(term)]
+    if isinstance(term, BNode):
+        return ["b", str(term)]
+    if isinstance(term, Literal):
+        return [
+            "l",
+            str(term),
+            None if term.datatype is None else str(term.datatype),
+            term.language,
+        ]
+    raise TypeError(f"unsupported term: {type(term).__name__}")
+
+
+def _decode_term(item):
+    kind = item[0]
+    if kind == "u" and len(item) == 2 and isinstance(item[1], str):
+        return URIRef(item[1])
+    if kind == "b" and len(item) == 2 and isinstance(item[1], str):
+        return BNode(item[1])
+    if kind == "l" and len(item) == 4 and isinstance(item[1], str):
+        _, lexical, datatype, lang = item
+        if not (datatype is None or isinstance(datatype, str)) or not (lang is None or isinstance(lang, str)):
+            raise ValueError("bad literal")
+        return Literal(lexical, datatype=None if datatype is None else URIRef(datatype), lang=lang)
+    raise ValueError(f"bad term: {item!r}")
+
+
+def _dump_blob(namespaces: list[tuple[str, str]], triples: list[tuple]) -> bytes:
+    index: dict = {}
+    terms: list[list] = []
+    flat: list[int] = []
+    for triple in triples:
+        for term in triple:
+            pos = index.get(term)
+            if pos is None:
+                pos = index[term] = len(terms)
+                terms.append(_encode_term(term))
+            flat.append(pos)
+    return json.dumps(
+        {
+            "format": CACHE_FORMAT,
+            "rdflib": rdflib.__version__,
+            "namespaces": namespaces,
+            "terms": terms,
+            "triples": flat,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _load_blob(blob_path: Path) -> dict | None:
+    """blob 을 디코드해 {"namespaces", "triples"} 로 돌려준다. 손상·형식 불일치는 None (miss)."""
+    try:
+        raw = json.loads(blob_path.read_bytes())
+        if not isinstance(raw, dict):
+            return None
+        if raw.get("format") != CACHE_FORMAT or raw.get("rdflib") != rdflib.__version__:
+            return None
+        terms = [_decode_term(item) for item in raw["terms"]]
+        flat = raw["triples"]
+        if len(flat) % 3:
+            return None
+        triples = [
+            (terms[flat[i]], terms[flat[i + 1]], terms[flat[i + 2]])
+            for i in range(0, len(flat), 3)
+        ]
+        namespaces = [(str(prefix), str(namespace)) for prefix, namespace in raw["namespaces"]]
+    except (OSError, ValueError, KeyError, IndexError, TypeError):
+        return None
+    return {"namespaces": namespaces, "triples": triples}
+
+
+def _replay(graph: Graph, blob: dict) -> None:
+    bnodes: dict[BNode, BNode] = {}
+
+    def fresh(term):
+        if isinstance(term, BNode):
+            if term not in bnodes:
+                bnodes[term] = BNode()
+            return bnodes[term]
+        return term
+
+    for prefix, namespace in blob["namespaces"]:
+        graph.bind(prefix, namespace, override=False)
+    for s, p, o in blob["triples"]:
+        graph.add((fresh(s), p, fresh(o)))
+
+
+def parse_ttl(graph: Graph, path: Path | str, *, format: str = "turtle") -> Graph:
+    """`path` 를 `graph` 에 적재한다. warm hit 이면 캐시에서, miss 면 실제 파싱 후 캐시를 채운다."""
+    path = Path(path)
+    if not enabled():
+        graph.parse(str(path), format=format)
+        return graph
+
+    cache_dir = cache_dir_for(path)
+    try:
+        digest = content_hash(path, cache_dir)
+    except OSError:
+        graph.parse(str(path), format=format)
+        return graph
+    blob_path = cache_dir / f"{digest}{BLOB_SUFFIX}"
+    blob = _BLOB_MEMO.get(digest)
+    if blob is None and blob_path.exists():
+        blob = _load_blob(blob_path)
+    if blob is None:
+        recording = _RecordingGraph()
+        recording.parse(str(path), format=format)
+        baseline = {prefix for prefix, _ in Graph().namespaces()}
+        blob = {
+            "namespaces": [
+                (prefix, str(namespace))
+                for prefix, namespace in recording.namespaces()
+                if prefix not in baseline
+            ],
+            "triples": recording.emitted,
+        }
+        try:
+            _atomic_write(blob_path, _dump_blob(blob["namespaces"], blob["triples"]))
+        except (OSError, TypeError):
+            pass
+    _BLOB_MEMO[digest] = blob
+    _replay(graph, blob)
+    return graph
+
+
+def clear_memo() -> None:
+    """프로세스 메모를 비운다 (테스트·장수 프로세스용)."""
+    _HASH_MEMO.clear()
+    _BLOB_MEMO.clear()
+
+
+def load_graph(paths: Iterable[Path | str], *, format: str = "turtle") -> Graph:
+    """여러 TTL 파일을 순서대로 하나의 Graph 로 적재한다 (`Graph().parse` 반복과 동등)."""
+    graph = Graph()
+    for path in paths:
+        parse_ttl(graph, path, format=format)
+    return graph
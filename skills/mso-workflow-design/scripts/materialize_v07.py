@@ -31,6 +31,7 @@ from rdflib.namespace import XSD
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 from wf_v07 import WF, is_v07_graph  # noqa: E402
+import graph_cache  # noqa: E402
 
 
 def _streams(g: Graph, stream_type: str) -> list[tuple[URIRef, URIRef, URIRef]]:
@@ -112,8 +113,7 @@ def collect_abox_paths(targets: list[Path]) -> list[Path]:
 
 
 def materialize_file(path: Path) -> tuple[Path | None, int]:
-    g = Graph()
-    g.parse(str(path), format="turtle")
+    g = graph_cache.load_graph([path])
     if not is_v07_graph(g):
         return None, 0
     inferred = materialize(g)
@@ -149,8 +149,7 @@ def main(argv=None) -> int:
     status = 0
     for path in paths:
         if args.check:
-            g = Graph()
-            g.parse(str(path), format="turtle")
+            g = graph_cache.load_graph([path])
             if not is_v07_graph(g):
                 continue
             expected = materialize(g).serialize(format="turtle")
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""mso_check — workflow hook 단일 프로세스 파이프라인.
+
+workflow-check.sh 는 validate_abox → materialize_v07 → trust_v07 → observe_graph 를
+각각 별도 python3 프로세스로 띄워, 인터프리터 기동·rdflib import·TTL 파싱을 단계마다
+다시 치렀다. mso_check 는 네 단계를 한 프로세스에서 순서대로 실행한다. 각 `.ttl` 은
+graph_cache 프로세스 메모를 통해 한 번만 디코드되고, 단계별 그래프(v06/v07 검증 그래프,
+abox+inferred trust 그래프, observe 전체 그래프)는 메모에서 재생해 조립한다.
+
+각 단계는 기존 스크립트의 `main(argv)` 를 그대로 호출한다 — 단독 CLI 와 hook 이 같은
+코드 경로를 쓴다. `--validate-tool`/`--materialize-tool`/`--trust-tool` 로 스크립트 경로를
+재정의하면 그 단계만 기존 체인처럼 별도 python3 프로세스로 실행한다 (재정의 스크립트의
+내부 API 를 가정하지 않는다). 단계 규약은 workflow-check.sh 와 같다:
+
+  1) validate    — 설계 게이트. 실패하면 이후 단계를 건너뛴다.
+  2) materialize — property chain 파생 (`*.inferred.ttl` 갱신)
+  3) trust       — `observability/trust-report.md` (계산 전용, D-25)
+  4) observe     — observe_graph 투영 (`--incremental`, 판정 없음)
+
+exit status:
+  0  모든 단계 통과
+  1  검증 실패 (이후 단계 생략)
+  2  경로 오류
+  3  검증 통과, 비차단 단계(materialize/trust/observe) 실패
+
+Usage:
+  python mso_check.py <workflow-dir> [--root ROOT] [--trust-report PATH]
+                      [--validate-tool PATH] [--materialize-tool PATH] [--trust-tool PATH]
+                      [--observe-tool PATH]
+                      [--no-materialize] [--no-trust] [--no-observe] [--full] [--verbose]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import subprocess
+import sys
+import traceback
+from pathlib import Path
+from types import ModuleType
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import graph_cache  # noqa: E402,F401 - 단계 간 공유 프로세스 메모
+import materialize_v07  # noqa: E402
+import trust_v07  # noqa: E402
+import validate_abox  # noqa: E402
+
+OBSERVE_SCRIPT = Path(__file__).resolve().parents[2] / "mso-graph-observability" / "scripts" / "observe_graph.py"
+
+EXIT_OK = 0
+EXIT_INVALID = 1
+EXIT_USAGE = 2
+EXIT_STAGE_FAILED = 3
+
+
+def load_observe(path: Path | None = None) -> ModuleType | None:
+    """observe_graph 모듈을 적재한다. 관측 스킬이 설치되지 않았으면 None."""
+    path = path or OBSERVE_SCRIPT
+    if not path.is_file():
+        return None
+    if "observe_graph" in sys.modules and Path(sys.modules["observe_graph"].__file__).resolve() == path.resolve():
+        return sys.modules["observe_graph"]
+    spec = importlib.util.spec_from_file_location("observe_graph", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["observe_graph"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_stage(name: str, entry: Callable[[list[str]], int], argv: list[str]) -> dict:
+    """단계 하나를 실행하고 {name, status, output} 을 돌려준다 (stdout/stderr 캡처)."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        try:
+            status = entry(argv)
+        except SystemExit as exc:
+            status = exc.code if isinstance(exc.code, int) else 1
+        except Exception:  # noqa: BLE001 - 비차단 단계는 예외도 리포트로 남긴다
+            traceback.print_exc(file=buffer)
+            status = 1
+    return {"name": name, "status": int(status or 0), "output": buffer.getvalue()}
+
+
+def run_tool_stage(name: str, tool: Path, argv: list[str]) -> dict:
+    """재정의된 단계 스크립트를 별도 python3 프로세스로 실행한다 (기존 스크립트별 체인과 같은 호출)."""
+    proc = subprocess.run([sys.executable, str(tool), *argv], capture_output=True, text=True)
+    return {"name": name, "status": proc.returncode, "output": proc.stdout + proc.stderr}
+
+
+def _stage(name: str, entry: Callable[[list[str]], int], tool: Path | None, argv: list[str]) -> dict:
+    return run_tool_stage(name, tool, argv) if tool is not None else run_stage(name, entry, argv)
+
+
+def run_pipeline(
+    workflow_dir: Path,
+    root: Path,
+    *,
+    trust_report: Path | None = None,
+    materialize: bool = True,
+    trust: bool = True,
+    observe: bool = True,
+    incremental: bool = True,
+    observe_script: Path | None = None,
+    validate_script: Path | None = None,
+    materialize_script: Path | None = None,
+    trust_script: Path | None = None,
+) -> tuple[int, list[dict]]:
+    """validate → materialize → trust → observe 를 한 프로세스에서 실행한다.
+
+    `*_script` 로 재정의된 단계는 그 스크립트를 별도 프로세스로 실행한다.
+    """
+    stages = [_stage("validate_abox", validate_abox.main, validate_script, [str(workflow_dir)])]
+    if stages[0]["status"] != 0:
+        return EXIT_INVALID, stages
+
+    if materialize:
+        stages.append(_stage("materialize_v07", materialize_v07.main, materialize_script, [str(workflow_dir)]))
+    if trust:
+        report = trust_report or root / "agent-context" / "observability" / "trust-report.md"
+        stages.append(
+            _stage("trust_v07", trust_v07.main, trust_script, [str(workflow_dir), "--report", str(report)])
+        )
+    if observe:
+        observe_graph = load_observe(observe_script)
+        if observe_graph is not None:
+            argv = ["--root", str(root)]
+            if incremental:
+                argv.append("--incremental")
+            stages.append(run_stage("observe_graph", observe_graph.main, argv))
+
+    failed = any(stage["status"] != 0 for stage in stages[1:])
+    return (EXIT_STAGE_FAILED if failed else EXIT_OK), stages
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(
+        prog="mso_check",
+        description="workflow hook 파이프라인 (validate → materialize → trust → observe, 단일 프로세스)",
+    )
+    ap.add_argument("workflow_dir", type=Path, help="*.abox.ttl 이 있는 workflow 디렉토리")
+    ap.add_argument("--root", type=Path, default=None, help="프로젝트 루트 (기본: workflow-dir 의 상위 2단계)")
+    ap.add_argument("--trust-report", type=Path, default=None,
+                    help="trust 리포트 경로 (기본: <root>/agent-context/observability/trust-report.md)")
+    ap.add_argument("--validate-tool", type=Path, default=None, help="validate_abox.py 경로 재정의 (별도 프로세스)")
+    ap.add_argument("--materialize-tool", type=Path, default=None,
+                    help="materialize_v07.py 경로 재정의 (별도 프로세스)")
+    ap.add_argument("--trust-tool", type=Path, default=None, help="trust_v07.py 경로 재정의 (별도 프로세스)")
+    ap.add_argument("--observe-tool", type=Path, default=None, help="observe_graph.py 경로 재정의")
+    ap.add_argument("--no-materialize", action="store_true")
+    ap.add_argument("--no-trust", action="store_true")
+    ap.add_argument("--no-observe", action="store_true")
+    ap.add_argument("--full", action="store_true", help="observe 를 증분 없이 전체 재렌더")
+    ap.add_argument("--verbose", action="store_true", help="통과한 단계 출력도 표시")
+    args = ap.parse_args(argv)
+
+    workflow_dir = args.workflow_dir.resolve()
+    if not workflow_dir.is_dir():
+        print(f"경로 없음: {workflow_dir}", file=sys.stderr)
+        return EXIT_USAGE
+    root = args.root.resolve() if args.root else workflow_dir.parent.parent
+
+    status, stages = run_pipeline(
+        workflow_dir,
+        root,
+        trust_report=args.trust_report,
+        materialize=not args.no_materialize,
+        trust=not args.no_trust,
+        observe=not args.no_observe,
+        incremental=not args.full,
+        observe_script=args.observe_tool.resolve() if args.observe_tool else None,
+        validate_script=args.validate_tool.resolve() if args.validate_tool else None,
+        materialize_script=args.materialize_tool.resolve() if args.materialize_tool else None,
+        trust_script=args.trust_tool.resolve() if args.trust_tool else None,
+    )
+    for stage in stages:
+        mark = "✓" if stage["status"] == 0 else "✗"
+        print(f"{mark} {stage['name']} (exit {stage['status']})")
+        if stage["output"] and (stage["status"] != 0 or args.verbose):
+            print(f"--- {stage['name']} ---")
+            print(stage["output"].rstrip())
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -26,6 +26,7 @@ from rdflib import Graph, Literal, RDF, URIRef
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 from wf_v07 import WF, execution_subject, is_v07_graph  # noqa: E402
+import graph_cache  # noqa: E402
 
 PROVENANCE_PROPS = (WF.author, WF.version, WF.timestamp, WF.validation, WF.coverage, WF.confidence)
 METADATA_PROPS = (WF.method, WF.policy, WF.timestamp)
@@ -246,9 +247,7 @@ class TrustCalculator:
 
 
 def compute(paths: list[Path], policy: dict) -> dict:
-    g = Graph()
-    for path in paths:
-        g.parse(str(path), format="turtle")
+    g = graph_cache.load_graph(paths)
     if not is_v07_graph(g):
         return {"error": "v0.7 그래프 아님 (Rail/Stream/Execution 없음)"}
     calc = TrustCalculator(g, policy)
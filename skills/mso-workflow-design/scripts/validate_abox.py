@@ -47,6 +47,7 @@ from wf_to_ttl import (  # noqa: E402
     run_shacl,
 )
 from wf_v07 import execution_subject, is_v07_graph  # noqa: E402
+import graph_cache  # noqa: E402
 
 SHAPES_V07 = Path(__file__).resolve().parent.parent / "references" / "shapes" / "workflow-shapes-v07.ttl"
 
@@ -70,10 +71,7 @@ def collect_abox_paths(targets: list[Path]) -> list[Path]:
 
 
 def parse_graph(paths: list[Path]) -> Graph:
-    g = Graph()
-    for path in paths:
-        g.parse(str(path), format="turtle")
-    return g
+    return graph_cache.load_graph(paths)
 
 
 # ═══════════════════════════════ v0.6 검사 ═══════════════════════════════
@@ -351,8 +349,7 @@ def validate_abox(targets: list[Path]) -> dict:
     v06_paths: list[Path] = []
     v07_paths: list[Path] = []
     for path in paths:
-        single = Graph()
-        single.parse(str(path), format="turtle")
+        single = graph_cache.load_graph([path])
         (v07_paths if is_v07_graph(single) else v06_paths).append(path)
 
     result: dict = {
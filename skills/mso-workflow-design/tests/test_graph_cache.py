@@ -0,0 +1,114 @@
+"""graph_cache.py — 파싱 그래프 on-disk 캐시 테스트."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from rdflib import BNode, Graph
+from rdflib.compare import isomorphic
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+ASSETS = Path(__file__).resolve().parent.parent / "assets"
+sys.path.insert(0, str(SCRIPTS))
+
+import graph_cache  # noqa: E402
+
+EXAMPLE = ASSETS / "examples" / "root-workflow.abox.ttl"
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("MSO_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("MSO_GRAPH_CACHE", raising=False)
+    graph_cache.clear_memo()
+    return tmp_path / "cache" / graph_cache.CACHE_SUBDIR
+
+
+def _shape(graph: Graph) -> list[tuple]:
+    return [tuple("_:b" if isinstance(term, BNode) else term for term in triple) for triple in graph]
+
+
+def test_warm_hit_skips_turtle_parser_and_preserves_order(cache_dir, monkeypatch):
+    cold = graph_cache.load_graph([EXAMPLE])
+    assert list(cache_dir.glob(f"*{graph_cache.BLOB_SUFFIX}"))
+
+    def fail_parse(self, *args, **kwargs):
+        raise AssertionError("warm hit must not invoke the Turtle parser")
+
+    monkeypatch.setattr(Graph, "parse", fail_parse)
+    warm = graph_cache.load_graph([EXAMPLE])
+    monkeypatch.undo()
+
+    direct = Graph().parse(str(EXAMPLE), format="turtle")
+    assert isomorphic(warm, direct)
+    assert _shape(warm) == _shape(cold) == _shape(direct)
+    assert dict(warm.namespaces())["wf"] == dict(direct.namespaces())["wf"]
+
+
+def test_blank_nodes_are_fresh_per_load(tmp_path):
+    path = tmp_path / "dirs.abox.ttl"
+    path.write_text(
+        "@prefix wf: <https://mso.dev/ontology/workflow#> .\n"
+        '<urn:step> wf:directory [ wf:dirPath "out/" ; wf:dirRole "output" ] .\n',
+        encoding="utf-8",
+    )
+    first = graph_cache.load_graph([path])
+    second = graph_cache.load_graph([path])
+    first_bnodes = {term for triple in first for term in triple if isinstance(term, BNode)}
+    second_bnodes = {term for triple in second for term in triple if isinstance(term, BNode)}
+    assert first_bnodes and second_bnodes
+    assert not first_bnodes & second_bnodes
+
+
+def test_content_change_invalidates_and_touch_reuses_blob(tmp_path, cache_dir):
+    path = tmp_path / "w.abox.ttl"
+    prefix = "@prefix wf: <https://mso.dev/ontology/workflow#> .\n"
+    path.write_text(prefix + '<urn:a> wf:label "one" .\n', encoding="utf-8")
+    assert len(graph_cache.load_graph([path])) == 1
+
+    path.write_text(prefix + '<urn:a> wf:label "one" .\n<urn:b> wf:label "two" .\n', encoding="utf-8")
+    assert len(graph_cache.load_graph([path])) == 2
+    assert len(list(cache_dir.glob(f"*{graph_cache.BLOB_SUFFIX}"))) == 2
+
+    path.touch()
+    assert len(graph_cache.load_graph([path])) == 2
+    assert len(list(cache_dir.glob(f"*{graph_cache.BLOB_SUFFIX}"))) == 2
+
+
+def test_corrupt_blob_falls_back_to_parse(tmp_path, cache_dir):
+    graph_cache.load_graph([EXAMPLE])
+    for blob in cache_dir.glob(f"*{graph_cache.BLOB_SUFFIX}"):
+        blob.write_bytes(b"not a blob")
+    graph = graph_cache.load_graph([EXAMPLE])
+    assert isomorphic(graph, Graph().parse(str(EXAMPLE), format="turtle"))
+
+
+def test_disabled_cache_writes_nothing(cache_dir, monkeypatch):
+    monkeypatch.setenv("MSO_GRAPH_CACHE", "0")
+    graph = graph_cache.load_graph([EXAMPLE])
+    assert len(graph) > 0
+    assert not cache_dir.exists()
+
+
+def test_blob_is_data_only_and_bad_shapes_are_misses(tmp_path, cache_dir):
+    path = tmp_path / "lit.abox.ttl"
+    path.write_text(
+        "@prefix wf: <https://mso.dev/ontology/workflow#> .\n"
+        "@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .\n"
+        '<urn:a> wf:label "안녕"@ko ; wf:order "3"^^xsd:integer ; wf:note "it\'s \\"q\\"" .\n',
+        encoding="utf-8",
+    )
+    direct = Graph().parse(str(path), format="turtle")
+    graph_cache.load_graph([path])
+    graph_cache.clear_memo()
+    assert _shape(graph_cache.load_graph([path])) == _shape(direct)
+
+    (blob,) = cache_dir.glob(f"*{graph_cache.BLOB_SUFFIX}")
+    pickle_payload = b"\x80\x04cos\nsystem\n(S'touch pwned'\ntR."
+    crafted = ['{"format": 2}', '{"format": 2, "rdflib": "%s", "namespaces": [], "terms": [["x", 1]], '
+               '"triples": [0, 0, 0]}' % graph_cache.rdflib.__version__]
+    for payload in (pickle_payload, *(c.encode() for c in crafted)):
+        blob.write_bytes(payload)
+        graph_cache.clear_memo()
+        assert graph_cache._load_blob(blob) is None
+        assert isomorphic(graph_cache.load_graph([path]), direct)
@@ -0,0 +1,113 @@
+"""mso_check.py — 단일 프로세스 hook 파이프라인 테스트."""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+from rdflib import Graph
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+ASSETS = Path(__file__).resolve().parent.parent / "assets"
+sys.path.insert(0, str(SCRIPTS))
+
+import graph_cache  # noqa: E402
+import mso_check  # noqa: E402
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setenv("MSO_CACHE_DIR", str(tmp_path / "cache"))
+    graph_cache.clear_memo()
+    workflow_dir = tmp_path / "agent-context" / "workflow"
+    workflow_dir.mkdir(parents=True)
+    for abox in (ASSETS / "examples").glob("*.abox.ttl"):
+        shutil.copy(abox, workflow_dir / abox.name)
+    return tmp_path
+
+
+def test_pipeline_runs_all_stages_and_parses_each_file_once(project, monkeypatch):
+    parsed: list[str] = []
+    original_parse = Graph.parse
+
+    def counting_parse(self, source=None, *args, **kwargs):
+        parsed.append(str(source))
+        return original_parse(self, source, *args, **kwargs)
+
+    monkeypatch.setattr(Graph, "parse", counting_parse)
+    status = mso_check.main([str(project / "agent-context" / "workflow"), "--root", str(project)])
+
+    assert status == mso_check.EXIT_OK
+    observability = project / "agent-context" / "observability"
+    assert (observability / "trust-report.md").exists()
+    assert (observability / "graph" / "README.md").exists()
+    assert list((project / "agent-context" / "workflow").glob("*.inferred.ttl"))
+    workflow_parses = [p for p in parsed if p.endswith(".abox.ttl")]
+    assert len(workflow_parses) == len(set(workflow_parses)) == 2
+
+
+def test_validation_failure_skips_downstream_stages(project, capsys):
+    workflow_dir = project / "agent-context" / "workflow"
+    (workflow_dir / "workflow-bad.abox.ttl").write_text(
+        "@prefix wf: <https://mso.dev/ontology/workflow#> .\n"
+        '<https://mso.dev/ontology/workflow#node/t/bad-d-001> a wf:Decision, wf:Node ; wf:label "x" .\n',
+        encoding="utf-8",
+    )
+    status = mso_check.main([str(workflow_dir), "--root", str(project)])
+
+    assert status == mso_check.EXIT_INVALID
+    out = capsys.readouterr().out
+    assert "✗ validate_abox" in out
+    assert "trust_v07" not in out
+    assert not (project / "agent-context" / "observability").exists()
+
+
+def test_missing_workflow_dir_is_usage_error(tmp_path):
+    assert mso_check.main([str(tmp_path / "missing")]) == mso_check.EXIT_USAGE
+
+
+def test_stage_tool_overrides_run_as_separate_processes(project, tmp_path):
+    """hook 의 MSO_*_TOOL 재정의가 mso_check 경로에서도 지켜진다."""
+    import os
+    import subprocess
+
+    log = tmp_path / "override.log"
+    tools = {}
+    for name, status in (("validate", 0), ("materialize", 0), ("trust", 1)):
+        tool = tmp_path / f"{name}_override.py"
+        tool.write_text(
+            "import sys\n"
+            f"open({str(log)!r}, 'a').write({name!r} + ' ' + ' '.join(sys.argv[1:2]) + '\\n')\n"
+            f"print({name!r} + ' override')\n"
+            f"sys.exit({status})\n",
+            encoding="utf-8",
+        )
+        tools[name] = tool
+    workflow_dir = project / "agent-context" / "workflow"
+
+    status, stages = mso_check.run_pipeline(
+        workflow_dir, project, observe=False,
+        validate_script=tools["validate"], materialize_script=tools["materialize"], trust_script=tools["trust"],
+    )
+    assert status == mso_check.EXIT_STAGE_FAILED
+    assert [(s["name"], s["status"], s["output"].strip()) for s in stages] == [
+        ("validate_abox", 0, "validate override"),
+        ("materialize_v07", 0, "materialize override"),
+        ("trust_v07", 1, "trust override"),
+    ]
+
+    log.unlink()
+    hook = Path(__file__).resolve().parent.parent / "hooks" / "workflow-check.sh"
+    env = {
+        **os.environ,
+        "PROJECT_DIR": str(project),
+        "MSO_WORKFLOW_VALIDATE_TOOL": str(tools["validate"]),
+        "MSO_MATERIALIZE_TOOL": str(tools["materialize"]),
+        "MSO_TRUST_TOOL": str(tools["trust"]),
+        "MSO_WORKFLOW_CHECK_NO_OBSERVE": "1",
+    }
+    out = subprocess.run(["bash", str(hook)], env=env, capture_output=True, text=True, stdin=subprocess.DEVNULL)
+    assert out.returncode == 0, out.stderr
+    assert log.read_text().split() == ["validate", str(workflow_dir), "materialize", str(workflow_dir),
+                                       "trust", str(workflow_dir)]
+    assert "trust override" in out.stdout
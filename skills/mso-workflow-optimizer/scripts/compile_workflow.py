@@ -22,6 +22,13 @@ from typing import Any
 
 from rdflib import Graph, Namespace, RDF, URIRef
 
+# 파싱 그래프 캐시는 mso-workflow-design 소유. 단독 설치 환경에서는 직접 파싱한다.
+sys.path.append(str(Path(__file__).resolve().parents[2] / "mso-workflow-design" / "scripts"))
+try:
+    import graph_cache
+except ImportError:  # pragma: no cover - standalone optimizer install
+    graph_cache = None
+
 WF = Namespace("https://mso.dev/ontology/workflow#")
 
 DEFAULT_POLICY: dict[str, Any] = {
@@ -423,7 +430,10 @@ def _context_index_hash(entries: list[MemoryEntry]) -> str:
 
 def parse_ttl(ttl_path: Path, policy: dict[str, Any], workmem_dir: Path | None = None) -> dict[str, Any]:
     g = Graph()
-    g.parse(ttl_path, format="turtle")
+    if graph_cache is not None:
+        graph_cache.parse_ttl(g, ttl_path)
+    else:
+        g.parse(ttl_path, format="turtle")
 
     project = next(g.subjects(RDF.type, WF.Project), None)
     workflow_id = _safe_id(_literal(g, project, WF.label) if isinstance(project, URIRef) else ttl_path.stem)